@@ -0,0 +1,41 @@
+# Kubeflow Pipeline Definition: Dataset Version (prebuilt components)
+
+import kfp.compiler as compiler
+import kfp.dsl as dsl
+from netapp_dataops.k8s.kfp import load_component
+
+# Container image with the NetApp DataOps Toolkit preinstalled; build it using the Dockerfile that is included with
+# the toolkit and push it to a registry that your cluster can pull from
+image = "registry.example.com/netapp-dataops-k8s:2.5.0" # Replace with your image
+
+# Load prebuilt NetApp DataOps components
+create_volume_snapshot_op = load_component("create-volume-snapshot", image=image)
+clone_volumes_op = load_component("clone-volumes", image=image)
+
+# Define Kubeflow pipeline
+@dsl.pipeline(
+    name="Dataset Version",
+    description="Template for snapshotting a dataset volume and cloning the snapshot for multiple experiments."
+)
+def dataset_version(
+    # Define variables that the user can set in the pipelines UI; set default values
+    dataset_volume_pvc_existing: str = "dataset-vol",
+    dataset_version: str = "v1",
+    experiment_volume_pvc_names: list = ["dataset-exp1", "dataset-exp2"]
+) :
+    # Pipeline Steps:
+
+    # Create a snapshot of the dataset volume/pvc for traceability; its name is passed to the clone step
+    dataset_snapshot = create_volume_snapshot_op(
+        pvc_name=dataset_volume_pvc_existing,
+        dataset_version=dataset_version
+    )
+
+    # Create a clone of the snapshot for each experiment
+    clone_volumes_op(
+        new_pvc_names=experiment_volume_pvc_names,
+        source_snapshot_name=dataset_snapshot.outputs["snapshot"]
+    )
+
+if __name__ == '__main__' :
+    compiler.Compiler().compile(dataset_version, __file__ + '.yaml')
@@ -0,0 +1,752 @@
+"""Latency-simulating fake Kubernetes API server for benchmarking the NetApp DataOps Toolkit.
+
+The fake API server implements the subset of the Kubernetes API that is used by the toolkit
+(PersistentVolumeClaims, VolumeSnapshots, Deployments, StatefulSets, Pods, Services, Nodes, Jobs,
+ConfigMaps, and Secrets), including list, watch, get, create, patch, and delete requests, label and
+field selectors, paginated lists, and namespace-scoped and cluster-scoped lists. Namespaces are
+listed as those that contain objects. Simple simulated controllers bind PVCs, mark VolumeSnapshots
+as ready to use, create the pods (and StatefulSet PVCs) of Deployments and StatefulSets, and mark
+them as ready after configurable delays. Resource versions can be expired, so that watches which resume
+from them fail with 410 Gone. Every request can be delayed by a configurable amount of
+latency, and every request is counted so that the number of API calls made by a toolkit operation
+can be reported.
+
+The server only uses the Python standard library and is not intended to be used for anything
+other than benchmarking and testing.
+"""
+
+import copy
+from collections import Counter
+from datetime import datetime, timezone
+import heapq
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import random
+import re
+import string
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+
+# Resource type definitions: plural -> (API prefix, kind, namespaced)
+_RESOURCES = {
+    "persistentvolumeclaims": ("/api/v1", "PersistentVolumeClaim", True),
+    "services": ("/api/v1", "Service", True),
+    "configmaps": ("/api/v1", "ConfigMap", True),
+    "secrets": ("/api/v1", "Secret", True),
+    "nodes": ("/api/v1", "Node", False),
+    "namespaces": ("/api/v1", "Namespace", False),
+    "pods": ("/api/v1", "Pod", True),
+    "deployments": ("/apis/apps/v1", "Deployment", True),
+    "statefulsets": ("/apis/apps/v1", "StatefulSet", True),
+    "jobs": ("/apis/batch/v1", "Job", True),
+    "volumesnapshots": ("/apis/snapshot.storage.k8s.io/v1", "VolumeSnapshot", True),
+}
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _is_named_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, dict) and "name" in item for item in value)
+
+
+def _merge(target: dict, patch: dict) -> dict:
+    # Strategic merge patch, approximated: lists of named objects (containers, volumes, ports...) are merged by name
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif value and _is_named_list(value) and _is_named_list(target.get(key)):
+            items = {item["name"]: item for item in target[key]}
+            for item in value:
+                if item["name"] in items:
+                    _merge(items[item["name"]], item)
+                else:
+                    target[key].append(copy.deepcopy(item))
+        else:
+            target[key] = copy.deepcopy(value)
+    return target
+
+
+def _parse_selector(selector: str) -> list:
+    requirements = list()
+    if not selector:
+        return requirements
+    # Split on commas outside of the value sets of set-based requirements, e.g. 'app in (a,b),tier'
+    for term in re.findall(r"[^,(]+(?:\([^)]*\))?", selector):
+        term = term.strip()
+        if not term:
+            continue
+        setMatch = re.match(r"^(\S+)\s+(in|notin)\s*\((.*)\)$", term)
+        if setMatch:
+            values = frozenset(value.strip() for value in setMatch.group(3).split(","))
+            requirements.append((setMatch.group(1), values, setMatch.group(2) == "in"))
+        elif "!=" in term:
+            key, value = term.split("!=", 1)
+            requirements.append((key.strip(), value.strip(), False))
+        elif "=" in term:
+            key, value = term.replace("==", "=").split("=", 1)
+            requirements.append((key.strip(), value.strip(), True))
+        elif term.startswith("!"):
+            requirements.append((term[1:].strip(), None, False))
+        else:
+            requirements.append((term, None, True))
+    return requirements
+
+
+def _get_field(obj: dict, path: str):
+    for part in path.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(part)
+    return obj
+
+
+class FakeKubernetesState:
+    """In-memory object store, event log, and simulated controllers of the fake API server."""
+
+    def __init__(self, latency: float = 0.0, bind_delay: float = 0.0, snapshot_ready_delay: float = 0.0,
+                 deployment_ready_delay: float = 0.0, deletion_delay: float = 0.0, cluster_scoped_lists: bool = True):
+        """Initialize the FakeKubernetesState object.
+
+        :param latency: Number of seconds by which every API request is delayed.
+        :param bind_delay: Number of seconds after creation at which a PVC is bound to a volume.
+        :param snapshot_ready_delay: Number of seconds after creation at which a VolumeSnapshot becomes ready to use.
+        :param deployment_ready_delay: Number of seconds after creation or scaling, and after every PVC mounted by its pods is bound, at which a Deployment is ready.
+        :param deletion_delay: Number of seconds after a delete request at which an object is removed.
+        :param cluster_scoped_lists: If False, cluster-scoped lists of namespaced resources are forbidden, as for a
+            user whose RBAC permissions are limited to individual namespaces.
+        """
+        self.latency = latency
+        self.bind_delay = bind_delay
+        self.snapshot_ready_delay = snapshot_ready_delay
+        self.deployment_ready_delay = deployment_ready_delay
+        self.deletion_delay = deletion_delay
+        self.cluster_scoped_lists = cluster_scoped_lists
+
+        self.objects = {plural: dict() for plural in _RESOURCES}
+        self.events = list()
+        self.resource_version = 0
+        self.expired_resource_version = 0
+        self.calls = Counter()
+        self.condition = threading.Condition()
+
+        self._timers = list()
+        self._timer_sequence = 0
+        self._timer_condition = threading.Condition()
+        self._stopped = False
+        self._timer_thread = threading.Thread(target=self._run_timers, daemon=True)
+        self._timer_thread.start()
+
+    #
+    # Simulated controllers
+    #
+
+    def _schedule(self, delay: float, action):
+        # Actions always run on the controller thread, asynchronously to the request that triggered them
+        with self._timer_condition:
+            self._timer_sequence += 1
+            heapq.heappush(self._timers, (time.monotonic() + max(0, delay), self._timer_sequence, action))
+            self._timer_condition.notify()
+
+    def _run_timers(self):
+        while True:
+            with self._timer_condition:
+                while not self._stopped and (not self._timers or self._timers[0][0] > time.monotonic()):
+                    timeout = None if not self._timers else self._timers[0][0] - time.monotonic()
+                    self._timer_condition.wait(timeout=timeout)
+                if self._stopped:
+                    return
+                _, _, action = heapq.heappop(self._timers)
+            action()
+
+    def stop(self):
+        """Stop the simulated controllers."""
+        with self._timer_condition:
+            self._stopped = True
+            self._timer_condition.notify()
+
+    def _update_status(self, plural: str, namespace: str, name: str, status_func):
+        with self.condition:
+            obj = self.objects[plural].get((namespace, name))
+            if obj is None or obj["metadata"].get("deletionTimestamp"):
+                return
+            status_func(obj)
+            self._record("MODIFIED", plural, obj)
+
+    def _bind_pvc(self, pvc: dict):
+        pvc["status"] = {
+            "phase": "Bound",
+            "accessModes": pvc["spec"].get("accessModes", []),
+            "capacity": {"storage": _get_field(pvc, "spec.resources.requests.storage") or "1Gi"}
+        }
+        pvc["spec"]["volumeName"] = "pvc-" + pvc["metadata"]["uid"]
+
+    def _mark_snapshot_ready(self, snapshot: dict):
+        sourcePvc = self.objects["persistentvolumeclaims"].get(
+            (snapshot["metadata"]["namespace"], _get_field(snapshot, "spec.source.persistentVolumeClaimName")))
+        restoreSize = _get_field(sourcePvc, "status.capacity.storage") if sourcePvc else None
+        snapshot["status"] = {
+            "readyToUse": True,
+            "creationTime": _timestamp(),
+            "restoreSize": restoreSize or "1Gi",
+            "boundVolumeSnapshotContentName": "snapcontent-" + snapshot["metadata"]["uid"]
+        }
+
+    def _get_owned_pods(self, plural: str, namespace: str, name: str) -> list:
+        # Must be called with self.condition held
+        kind = _RESOURCES[plural][1]
+        return [pod for (podNamespace, _), pod in self.objects["pods"].items() if podNamespace == namespace and
+                any(owner.get("kind") == kind and owner.get("name") == name
+                    for owner in pod["metadata"].get("ownerReferences") or [])]
+
+    def _remove_pods(self, plural: str, workload: dict, podNames: set):
+        # Must be called with self.condition held. Also applies the StatefulSet PVC retention policy.
+        namespace = workload["metadata"]["namespace"]
+        deleteClaims = plural == "statefulsets" and _get_field(
+            workload, "spec.persistentVolumeClaimRetentionPolicy.whenScaled") == "Delete"
+        for podName in podNames:
+            pod = self.objects["pods"].pop((namespace, podName), None)
+            if pod is not None:
+                self._record("DELETED", "pods", pod)
+            if deleteClaims:
+                for template in workload["spec"].get("volumeClaimTemplates") or []:
+                    self.remove("persistentvolumeclaims", namespace, template["metadata"]["name"] + "-" + podName)
+
+    def _sync_pods(self, plural: str, workload: dict) -> list:
+        # Must be called with self.condition held. (Re)creates the workload's pods, which start out Pending, and the
+        # PVCs of StatefulSet pods, and returns the names of the PVCs that the pods mount.
+        namespace = workload["metadata"]["namespace"]
+        name = workload["metadata"]["name"]
+        template = workload["spec"].get("template") or dict()
+        podNames = [name + "-" + str(ordinal) for ordinal in range(workload["spec"].get("replicas", 1))]
+        existing = {pod["metadata"]["name"] for pod in self._get_owned_pods(plural, namespace, name)}
+        self._remove_pods(plural, workload, existing - set(podNames))
+
+        claimNames = list()
+        for podName in podNames:
+            pod = {
+                "metadata": {
+                    "name": podName,
+                    "labels": dict(_get_field(template, "metadata.labels") or dict()),
+                    "ownerReferences": [{"apiVersion": "apps/v1", "kind": _RESOURCES[plural][1], "name": name,
+                                         "uid": workload["metadata"]["uid"]}]
+                },
+                "spec": copy.deepcopy(template.get("spec") or dict()),
+                "status": {"phase": "Pending"}
+            }
+            pod["spec"]["nodeName"] = "node-" + str(random.randint(0, 2))
+            if plural == "statefulsets":
+                pod["metadata"]["labels"]["statefulset.kubernetes.io/pod-name"] = podName
+                for claimTemplate in workload["spec"].get("volumeClaimTemplates") or []:
+                    claimName = claimTemplate["metadata"]["name"] + "-" + podName
+                    if (namespace, claimName) not in self.objects["persistentvolumeclaims"]:
+                        claim = copy.deepcopy(claimTemplate)
+                        claim["metadata"]["name"] = claimName
+                        self.add("persistentvolumeclaims", claim, namespace=namespace, simulate=True)
+                    pod["spec"].setdefault("volumes", list()).append(
+                        {"name": claimTemplate["metadata"]["name"], "persistentVolumeClaim": {"claimName": claimName}})
+            claimNames.extend(_get_field(volume, "persistentVolumeClaim.claimName")
+                              for volume in pod["spec"].get("volumes") or [])
+            if podName in existing:
+                self.objects["pods"][(namespace, podName)].update(pod)
+                self._record("MODIFIED", "pods", self.objects["pods"][(namespace, podName)])
+            else:
+                self.add("pods", pod, namespace=namespace)
+        return [claimName for claimName in claimNames if claimName]
+
+    def _start_deployment(self, namespace: str, name: str, plural: str = "deployments"):
+        # Like a kubelet, only start the pods once every PVC that they mount is bound
+        with self.condition:
+            workload = self.objects[plural].get((namespace, name))
+            if workload is None:
+                return
+            claimNames = self._sync_pods(plural, workload)
+
+        def _start():
+            with self.condition:
+                if (namespace, name) not in self.objects[plural]:
+                    return
+                for claimName in claimNames:
+                    pvc = self.objects["persistentvolumeclaims"].get((namespace, claimName))
+                    if _get_field(pvc, "status.phase") != "Bound":
+                        self._schedule(0.01, _start)
+                        return
+            self._schedule(self.deployment_ready_delay,
+                           lambda: self._update_status(plural, namespace, name, self._mark_deployment_ready))
+
+        self._schedule(0, _start)
+
+    def _mark_deployment_ready(self, deployment: dict):
+        replicas = deployment["spec"].get("replicas", 1)
+        deployment["status"] = {"replicas": replicas, "observedGeneration": deployment["metadata"].get("generation", 1)}
+        if replicas:
+            deployment["status"].update({"readyReplicas": replicas, "availableReplicas": replicas,
+                                         "updatedReplicas": replicas})
+        plural = "statefulsets" if deployment["kind"] == "StatefulSet" else "deployments"
+        for pod in self._get_owned_pods(plural, deployment["metadata"]["namespace"], deployment["metadata"]["name"]):
+            podIp = "10.244." + str(random.randint(0, 255)) + "." + str(random.randint(1, 254))
+            pod["status"] = {"phase": "Running", "podIP": podIp, "conditions": [{"type": "Ready", "status": "True"}]}
+            self._record("MODIFIED", "pods", pod)
+
+    def _on_created(self, plural: str, obj: dict):
+        namespace = obj["metadata"].get("namespace")
+        name = obj["metadata"]["name"]
+        if plural == "persistentvolumeclaims":
+            obj["status"] = {"phase": "Pending"}
+            self._schedule(self.bind_delay, lambda: self._update_status(plural, namespace, name, self._bind_pvc))
+        elif plural == "volumesnapshots":
+            obj["status"] = {"readyToUse": False}
+            self._schedule(self.snapshot_ready_delay,
+                           lambda: self._update_status(plural, namespace, name, self._mark_snapshot_ready))
+        elif plural in ("deployments", "statefulsets"):
+            obj["status"] = {"replicas": obj["spec"].get("replicas", 1)}
+            self._schedule(0, lambda: self._start_deployment(namespace, name, plural=plural))
+        elif plural == "services":
+            obj["spec"]["clusterIP"] = "10.96." + str(random.randint(0, 255)) + "." + str(random.randint(1, 254))
+            if obj["spec"].get("type") in ("NodePort", "LoadBalancer"):
+                for port in obj["spec"].get("ports", []):
+                    port.setdefault("nodePort", random.randint(30000, 32767))
+            if obj["spec"].get("type") == "LoadBalancer":
+                obj["status"] = {"loadBalancer": {"ingress": [{"ip": "192.0.2." + str(random.randint(1, 254))}]}}
+        elif plural == "jobs":
+            obj["status"] = {}
+
+    #
+    # Object store
+    #
+
+    def _record(self, eventType: str, plural: str, obj: dict):
+        # Must be called with self.condition held
+        self.resource_version += 1
+        obj["metadata"]["resourceVersion"] = str(self.resource_version)
+        self.events.append((self.resource_version, eventType, plural, copy.deepcopy(obj)))
+        self.condition.notify_all()
+
+    def add(self, plural: str, obj: dict, namespace: str = "default", simulate: bool = False) -> dict:
+        """Add an object directly to the store (e.g. to populate the server before a benchmark).
+
+        :param plural: The resource type, e.g. 'persistentvolumeclaims'.
+        :param obj: The object to add. The object should already contain any status that it requires.
+        :param namespace: The namespace of the object (ignored for cluster-scoped resources).
+        :param simulate: If True, run the simulated controllers for the object as if it had been created via the API.
+        :return: The stored object.
+        """
+        obj = copy.deepcopy(obj)
+        metadata = obj.setdefault("metadata", dict())
+        if _RESOURCES[plural][2]:
+            metadata["namespace"] = namespace
+        else:
+            metadata.pop("namespace", None)
+            namespace = None
+        if not metadata.get("name"):
+            metadata["name"] = metadata.get("generateName", "obj-") + "".join(
+                random.choices(string.ascii_lowercase + string.digits, k=5))
+        metadata.setdefault("uid", "%032x" % random.getrandbits(128))
+        metadata.setdefault("creationTimestamp", _timestamp())
+        metadata.setdefault("generation", 1)
+        obj.setdefault("apiVersion", _RESOURCES[plural][0].replace("/apis/", "").replace("/api/", ""))
+        obj.setdefault("kind", _RESOURCES[plural][1])
+        if plural not in ("configmaps", "secrets"):
+            obj.setdefault("spec", dict())
+        with self.condition:
+            if (namespace, metadata["name"]) in self.objects[plural]:
+                raise KeyError(metadata["name"])
+            if simulate:
+                self._on_created(plural, obj)
+            self.objects[plural][(namespace, metadata["name"])] = obj
+            self._record("ADDED", plural, obj)
+            return copy.deepcopy(obj)
+
+    def remove(self, plural: str, namespace: str, name: str):
+        with self.condition:
+            obj = self.objects[plural].pop((namespace, name), None)
+            if obj is not None:
+                self._record("DELETED", plural, obj)
+                if plural in ("deployments", "statefulsets"):
+                    podNames = {pod["metadata"]["name"] for pod in self._get_owned_pods(plural, namespace, name)}
+                    if _get_field(obj, "spec.persistentVolumeClaimRetentionPolicy.whenDeleted") == "Delete":
+                        obj = copy.deepcopy(obj)
+                        obj["spec"]["persistentVolumeClaimRetentionPolicy"]["whenScaled"] = "Delete"
+                    self._remove_pods(plural, obj, podNames)
+
+    def expire_resource_versions(self):
+        """Expire every resource version up to the current one, as compaction of the etcd history does, so that
+        watches which resume from an earlier resource version fail with 410 Gone and clients have to list again."""
+        with self.condition:
+            self.resource_version += 1
+            self.expired_resource_version = self.resource_version
+            self.condition.notify_all()
+
+    def reset_calls(self):
+        """Reset the API call counters."""
+        with self.condition:
+            self.calls = Counter()
+
+    def list(self, plural: str, namespace: str = None, labelSelector: str = None, fieldSelector: str = None) -> tuple:
+        labelRequirements = _parse_selector(labelSelector)
+        fieldRequirements = _parse_selector(fieldSelector)
+        with self.condition:
+            if plural == "namespaces":
+                # Namespaces are not stored, but derived from the objects that they contain
+                names = sorted({objNamespace for objects in self.objects.values() for objNamespace, _ in objects if objNamespace})
+                items = [{"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name}, "status": {"phase": "Active"}}
+                         for name in names]
+                return [item for item in items if self._matches(item, labelRequirements, fieldRequirements)], self.resource_version
+            items = [copy.deepcopy(obj) for (objNamespace, _), obj in sorted(self.objects[plural].items(), key=lambda item: (item[0][0] or "", item[0][1]))
+                     if (namespace is None or objNamespace == namespace) and self._matches(obj, labelRequirements, fieldRequirements)]
+            return items, self.resource_version
+
+    def _matches(self, obj: dict, labelRequirements: list, fieldRequirements: list) -> bool:
+        labels = obj["metadata"].get("labels") or dict()
+        for key, value, equal in labelRequirements:
+            if value is None:
+                if (key in labels) != equal:
+                    return False
+            elif isinstance(value, frozenset):
+                if (labels.get(key) in value) != equal:
+                    return False
+            elif (labels.get(key) == value) != equal:
+                return False
+        for key, value, equal in fieldRequirements:
+            if (str(_get_field(obj, key)) == value) != equal:
+                return False
+        return True
+
+
+class _FakeApiRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Clients send request headers and bodies in separate packets; without TCP_NODELAY, delayed ACKs add ~40ms to
+    # every request with a body.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> FakeKubernetesState:
+        return self.server.state
+
+    def _parse_path(self):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        for plural, (prefix, _, namespaced) in _RESOURCES.items():
+            if not url.path.startswith(prefix + "/"):
+                continue
+            rest = url.path[len(prefix) + 1:].split("/")
+            if namespaced and len(rest) >= 3 and rest[0] == "namespaces" and rest[2] == plural:
+                return plural, rest[1], (rest[3] if len(rest) > 3 else None), query
+            if namespaced and rest and rest[0] == plural:
+                return plural, None, None, query
+            if not namespaced and rest[0] == plural and len(rest) <= 2:
+                return plural, None, (rest[1] if len(rest) > 1 else None), query
+        return None, None, None, query
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length))
+
+    def _send(self, code: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_status(self, code: int, reason: str, message: str):
+        self._send(code, {"kind": "Status", "apiVersion": "v1", "metadata": {}, "status": "Failure",
+                          "message": message, "reason": reason, "code": code})
+
+    def _count(self, verb: str, plural: str):
+        with self.state.condition:
+            self.state.calls[verb + " " + plural] += 1
+
+    def _handle(self, method: str):
+        plural, namespace, name, query = self._parse_path()
+        if plural is None:
+            self._send_status(404, "NotFound", "the server could not find the requested resource")
+            return
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        try:
+            if method == "GET" and name is None and query.get("watch", "").lower() == "true":
+                self._count("watch", plural)
+                self._watch(plural, namespace, query)
+            elif method == "GET" and name is None and namespace is None and _RESOURCES[plural][2] and \
+                    not self.state.cluster_scoped_lists:
+                self._count("list", plural)
+                self._send_status(403, "Forbidden", plural + " is forbidden: cannot list resource \"" + plural +
+                                  "\" at the cluster scope")
+            elif method == "GET" and name is None:
+                self._count("list", plural)
+                self._list(plural, namespace, query)
+            elif method == "GET":
+                self._count("get", plural)
+                self._get(plural, namespace, name)
+            elif method == "POST":
+                self._count("create", plural)
+                self._create(plural, namespace)
+            elif method == "PATCH":
+                self._count("patch", plural)
+                self._patch(plural, namespace, name)
+            elif method == "DELETE" and name is None:
+                self._count("deletecollection", plural)
+                self._delete_collection(plural, namespace, query)
+            elif method == "DELETE":
+                self._count("delete", plural)
+                self._delete(plural, namespace, name)
+            else:
+                self._send_status(405, "MethodNotAllowed", "method not allowed")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _list(self, plural: str, namespace: str, query: dict):
+        items, resourceVersion = self.state.list(plural=plural, namespace=namespace,
+                                                 labelSelector=query.get("labelSelector"),
+                                                 fieldSelector=query.get("fieldSelector"))
+        metadata = {"resourceVersion": str(resourceVersion)}
+        offset = int(query.get("continue") or 0)
+        limit = int(query.get("limit") or 0)
+        if offset or limit:
+            end = offset + limit if limit else len(items)
+            if end < len(items):
+                metadata["continue"] = str(end)
+                metadata["remainingItemCount"] = len(items) - end
+            items = items[offset:end]
+        self._send(200, {"kind": _RESOURCES[plural][1] + "List", "apiVersion": "v1", "metadata": metadata,
+                         "items": items})
+
+    def _watch(self, plural: str, namespace: str, query: dict):
+        labelRequirements = _parse_selector(query.get("labelSelector"))
+        fieldRequirements = _parse_selector(query.get("fieldSelector"))
+        resourceVersion = int(query.get("resourceVersion") or 0)
+        deadline = time.monotonic() + float(query.get("timeoutSeconds") or 300)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def _write(event: dict):
+            data = (json.dumps(event) + "\n").encode()
+            self.wfile.write(("%x\r\n" % len(data)).encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        # Resuming from an expired resource version fails, as the API server reports it: as an event of the stream
+        if resourceVersion and resourceVersion < self.state.expired_resource_version:
+            _write({"type": "ERROR", "object": {"kind": "Status", "apiVersion": "v1", "metadata": {},
+                                                "status": "Failure", "reason": "Expired", "code": 410,
+                                                "message": "too old resource version: " + str(resourceVersion)}})
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+            return
+
+        position = 0
+        while True:
+            with self.state.condition:
+                while True:
+                    events = self.state.events
+                    # Skip events that the client has already seen
+                    while position < len(events) and events[position][0] <= resourceVersion:
+                        position += 1
+                    if position < len(events) or self.server.stopping:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.state.condition.wait(timeout=remaining)
+                newEvents = events[position:]
+                position = len(events)
+            for eventResourceVersion, eventType, eventPlural, obj in newEvents:
+                resourceVersion = eventResourceVersion
+                if eventPlural != plural:
+                    continue
+                if namespace is not None and obj["metadata"].get("namespace") != namespace:
+                    continue
+                if not self.state._matches(obj, labelRequirements, fieldRequirements):
+                    continue
+                _write({"type": eventType, "object": obj})
+            if time.monotonic() >= deadline or self.server.stopping:
+                break
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _get(self, plural: str, namespace: str, name: str):
+        with self.state.condition:
+            obj = self.state.objects[plural].get((namespace, name))
+            obj = copy.deepcopy(obj) if obj is not None else None
+        if obj is None:
+            self._send_status(404, "NotFound", plural + ' "' + name + '" not found')
+            return
+        self._send(200, obj)
+
+    def _create(self, plural: str, namespace: str):
+        body = self._read_body() or dict()
+        try:
+            obj = self.state.add(plural=plural, obj=body, namespace=namespace, simulate=True)
+        except KeyError as err:
+            self._send_status(409, "AlreadyExists", plural + ' "' + str(err.args[0]) + '" already exists')
+            return
+        self._send(201, obj)
+
+    def _patch(self, plural: str, namespace: str, name: str):
+        body = self._read_body() or dict()
+        conflict = False
+        with self.state.condition:
+            obj = self.state.objects[plural].get((namespace, name))
+            resourceVersion = _get_field(body, "metadata.resourceVersion")
+            if obj is not None and resourceVersion and resourceVersion != obj["metadata"]["resourceVersion"]:
+                conflict = True
+            elif obj is not None:
+                previousSpec = copy.deepcopy(obj.get("spec") or dict())
+                _merge(obj, body)
+                if obj.get("spec") != previousSpec:
+                    obj["metadata"]["generation"] = obj["metadata"].get("generation", 1) + 1
+                    # Scaling a Deployment, or changing its pod template, (re)starts its pods
+                    if plural in ("deployments", "statefulsets") and (
+                            obj["spec"].get("replicas") != previousSpec.get("replicas") or
+                            obj["spec"].get("template") != previousSpec.get("template")):
+                        obj["status"] = {"replicas": obj["spec"].get("replicas", 1)}
+                        self.state._schedule(0, lambda: self.state._start_deployment(namespace, name, plural=plural))
+                self.state._record("MODIFIED", plural, obj)
+                obj = copy.deepcopy(obj)
+        if obj is None:
+            self._send_status(404, "NotFound", plural + ' "' + name + '" not found')
+            return
+        if conflict:
+            self._send_status(409, "Conflict", "Operation cannot be fulfilled on " + plural + ' "' + name +
+                              '": the object has been modified; please apply your changes to the latest version and try again')
+            return
+        self._send(200, obj)
+
+    def _delete_object(self, plural: str, namespace: str, name: str) -> dict:
+        with self.state.condition:
+            obj = self.state.objects[plural].get((namespace, name))
+            if obj is None:
+                return None
+            if self.state.deletion_delay > 0:
+                obj["metadata"]["deletionTimestamp"] = _timestamp()
+                self.state._record("MODIFIED", plural, obj)
+            result = copy.deepcopy(obj)
+        self.state._schedule(self.state.deletion_delay, lambda: self.state.remove(plural, namespace, name))
+        return result
+
+    def _delete(self, plural: str, namespace: str, name: str):
+        obj = self._delete_object(plural=plural, namespace=namespace, name=name)
+        if obj is None:
+            self._send_status(404, "NotFound", plural + ' "' + name + '" not found')
+            return
+        if plural in ("deployments", "statefulsets", "jobs", "configmaps", "secrets"):
+            self._send(200, {"kind": "Status", "apiVersion": "v1", "metadata": {}, "status": "Success",
+                             "details": {"name": name, "kind": plural}})
+            return
+        self._send(200, obj)
+
+    def _delete_collection(self, plural: str, namespace: str, query: dict):
+        items, _ = self.state.list(plural=plural, namespace=namespace, labelSelector=query.get("labelSelector"),
+                                   fieldSelector=query.get("fieldSelector"))
+        for obj in items:
+            self._delete_object(plural=plural, namespace=obj["metadata"].get("namespace"),
+                                name=obj["metadata"]["name"])
+        self._send(200, {"kind": _RESOURCES[plural][1] + "List", "apiVersion": "v1", "metadata": {},
+                         "items": items})
+
+
+class FakeKubernetesApiServer:
+    """A fake Kubernetes API server that runs in a background thread.
+
+    Example:
+        with FakeKubernetesApiServer(latency=0.005, bind_delay=0.05) as server:
+            session = DataOpsSession(config_file=server.kubeconfig)
+            list_volumes(session=session)
+            print(server.state.calls)
+    """
+
+    def __init__(self, latency: float = 0.0, bind_delay: float = 0.0, snapshot_ready_delay: float = 0.0,
+                 deployment_ready_delay: float = 0.0, deletion_delay: float = 0.0, num_nodes: int = 3,
+                 cluster_scoped_lists: bool = True):
+        """Initialize the FakeKubernetesApiServer object.
+
+        :param latency: Number of seconds by which every API request is delayed.
+        :param bind_delay: Number of seconds after creation at which a PVC is bound to a volume.
+        :param snapshot_ready_delay: Number of seconds after creation at which a VolumeSnapshot becomes ready to use.
+        :param deployment_ready_delay: Number of seconds after creation or scaling, and after every PVC mounted by its pods is bound, at which a Deployment is ready.
+        :param deletion_delay: Number of seconds after a delete request at which an object is removed.
+        :param num_nodes: Number of Nodes to create.
+        :param cluster_scoped_lists: If False, cluster-scoped lists of namespaced resources are forbidden.
+        """
+        self.state = FakeKubernetesState(latency=latency, bind_delay=bind_delay,
+                                         snapshot_ready_delay=snapshot_ready_delay,
+                                         deployment_ready_delay=deployment_ready_delay,
+                                         deletion_delay=deletion_delay,
+                                         cluster_scoped_lists=cluster_scoped_lists)
+        for index in range(num_nodes):
+            self.state.add("nodes", {"metadata": {"name": "node-" + str(index)},
+                                     "status": {"addresses": [{"type": "InternalIP", "address": "192.0.2." + str(index + 10)},
+                                                              {"type": "Hostname", "address": "node-" + str(index)}]}})
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeApiRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self._httpd.stopping = False
+        self._thread = None
+        self.kubeconfig = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the fake API server."""
+        return "http://127.0.0.1:" + str(self._httpd.server_address[1])
+
+    def start(self):
+        """Start serving requests and write a kubeconfig file that points to the server."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        fd, self.kubeconfig = tempfile.mkstemp(prefix="fake-kubeconfig-", suffix=".yaml")
+        with os.fdopen(fd, "w") as kubeconfigFile:
+            json.dump({
+                "apiVersion": "v1",
+                "kind": "Config",
+                "clusters": [{"name": "fake", "cluster": {"server": self.url}}],
+                "users": [{"name": "fake", "user": {"token": "fake"}}],
+                "contexts": [{"name": "fake", "context": {"cluster": "fake", "user": "fake"}}],
+                "current-context": "fake"
+            }, kubeconfigFile)
+        return self
+
+    def stop(self):
+        """Stop serving requests and remove the kubeconfig file."""
+        self._httpd.stopping = True
+        with self.state.condition:
+            self.state.condition.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self.state.stop()
+        if self.kubeconfig and os.path.exists(self.kubeconfig):
+            os.remove(self.kubeconfig)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,120 @@
+"""Fake NVIDIA Triton Inference Server metrics endpoint for exercising the Triton autoscaler.
+
+The fake metrics endpoint serves the inference request and queue time counters that Triton exposes on its
+metrics port (8002) in the Prometheus text format. The counters only change when record() is called, so that
+load can be simulated deterministically, and reset() simulates a restart of the server.
+
+Example:
+    with FakeKubernetesApiServer() as server, FakeTritonMetricsServer() as metricsServer:
+        session = DataOpsSession(config_file=server.kubeconfig)
+        create_triton_server(server_name="test", model_pvc_name="models", session=session)
+        autoscaler = TritonServerAutoscaler(server_name="test", metrics_endpoints=[metricsServer.endpoint],
+                                            session=session)
+        autoscaler.evaluate()
+        metricsServer.record(requests=1000, queue_time_ms=250)
+        autoscaler.evaluate()
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+
+class _FakeTritonMetricsRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeTritonMetrics:
+    """Inference request and queue time counters of a fake Triton Inference Server."""
+
+    def __init__(self, models: tuple = ("model",)):
+        self.models = models
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero, as if the server had been restarted."""
+        with self._lock:
+            self._counters = {model: {"nv_inference_request_success": 0, "nv_inference_request_failure": 0,
+                                      "nv_inference_queue_duration_us": 0} for model in self.models}
+
+    def record(self, requests: int, queue_time_ms: float = 0, failures: int = 0, model: str = None):
+        """Record inference requests.
+
+        :param requests: Number of successful requests.
+        :param queue_time_ms: Average number of milliseconds that each request (successful or failed) spent queued.
+        :param failures: Number of failed requests.
+        :param model: Name of the model that served the requests. Defaults to the first model.
+        """
+        with self._lock:
+            counters = self._counters[model or self.models[0]]
+            counters["nv_inference_request_success"] += requests
+            counters["nv_inference_request_failure"] += failures
+            counters["nv_inference_queue_duration_us"] += int((requests + failures) * queue_time_ms * 1000)
+
+    def render(self) -> str:
+        """Render the counters in the Prometheus text format."""
+        with self._lock:
+            lines = list()
+            for name in ("nv_inference_request_success", "nv_inference_request_failure",
+                         "nv_inference_queue_duration_us"):
+                lines.append("# TYPE " + name + " counter")
+                for model, counters in self._counters.items():
+                    lines.append(name + '{model="' + model + '",version="1"} ' + str(counters[name]))
+            return "\n".join(lines) + "\n"
+
+
+class FakeTritonMetricsServer:
+    """A fake Triton Inference Server metrics endpoint that runs in a background thread."""
+
+    def __init__(self, models: tuple = ("model",)):
+        """Initialize the FakeTritonMetricsServer object.
+
+        :param models: Names of the models that the fake server reports metrics for.
+        """
+        self.metrics = FakeTritonMetrics(models=models)
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeTritonMetricsRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.metrics = self.metrics
+        self._thread = None
+
+    @property
+    def endpoint(self) -> str:
+        """The metrics endpoint (host:port) of the fake server."""
+        return "127.0.0.1:" + str(self._httpd.server_address[1])
+
+    def record(self, requests: int, queue_time_ms: float = 0, failures: int = 0, model: str = None):
+        """Record inference requests. See FakeTritonMetrics.record()."""
+        self.metrics.record(requests=requests, queue_time_ms=queue_time_ms, failures=failures, model=model)
+
+    def reset(self):
+        """Reset all counters to zero, as if the server had been restarted."""
+        self.metrics.reset()
+
+    def start(self):
+        """Start serving requests."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
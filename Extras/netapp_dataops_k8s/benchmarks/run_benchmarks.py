@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the NetApp DataOps Toolkit for Kubernetes.
+
+Each benchmark runs a toolkit operation against a fresh latency-simulating fake Kubernetes API
+server (see fake_api_server.py) that has been populated with a given number of objects, and
+reports the wall time of the operation and the number of Kubernetes API calls that it made.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py [--scales 10,100,1000] [--benchmarks list_volumes,...]
+        [--latency SECONDS] [--output results.json] [--baseline baseline.json]
+
+API call counts are deterministic, so a baseline file (the --output of a previous run) can be
+used in CI to fail the run when an operation starts making more API calls than before. Wall
+times can optionally be compared against the baseline as well (see --max-time-ratio).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabulate import tabulate
+
+from fake_api_server import FakeKubernetesApiServer
+from netapp_dataops.k8s import (
+    _get_jupyter_lab_labels,
+    _get_jupyter_lab_prefix,
+    clone_jupyter_lab,
+    clone_volume,
+    DataOpsSession,
+    delete_volume,
+    iter_volumes,
+    list_jupyter_labs,
+    list_volume_snapshots,
+    list_volumes,
+)
+from netapp_dataops.k8s.data_movers.s3 import S3DataMover
+
+
+NAMESPACE = "benchmark"
+
+
+#
+# Object factories
+#
+
+
+def _pvc(name: str, labels: dict = None, source_snapshot: str = None, size: str = "10Gi") -> dict:
+    pvc = {
+        "metadata": {"name": name, "labels": labels or {"created-by": "ntap-dsutil", "created-by-operation": "create-volume"}},
+        "spec": {"accessModes": ["ReadWriteMany"], "resources": {"requests": {"storage": size}},
+                 "storageClassName": "ontap-flexvol"},
+        "status": {"phase": "Bound", "accessModes": ["ReadWriteMany"], "capacity": {"storage": size}}
+    }
+    if source_snapshot:
+        pvc["spec"]["dataSource"] = {"apiGroup": "snapshot.storage.k8s.io", "kind": "VolumeSnapshot",
+                                     "name": source_snapshot}
+    return pvc
+
+
+def _volume_snapshot(name: str, pvc_name: str) -> dict:
+    return {
+        "metadata": {"name": name},
+        "spec": {"volumeSnapshotClassName": "csi-snapclass", "source": {"persistentVolumeClaimName": pvc_name}},
+        "status": {"readyToUse": True, "restoreSize": "10Gi", "creationTime": "2024-01-01T00:00:00Z"}
+    }
+
+
+def _populate_volumes(server: FakeKubernetesApiServer, count: int):
+    # Every tenth volume is a clone of the previous volume
+    for index in range(count):
+        if index % 10 == 9:
+            source = "pvc-" + str(index - 1)
+            server.state.add("volumesnapshots", _volume_snapshot("snap-" + str(index), source), namespace=NAMESPACE)
+            labels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": source}
+            server.state.add("persistentvolumeclaims", _pvc("pvc-" + str(index), labels=labels,
+                                                            source_snapshot="snap-" + str(index)), namespace=NAMESPACE)
+        else:
+            server.state.add("persistentvolumeclaims", _pvc("pvc-" + str(index)), namespace=NAMESPACE)
+
+
+def _populate_snapshots(server: FakeKubernetesApiServer, count: int, pvc_names: list):
+    for index in range(count):
+        server.state.add("volumesnapshots", _volume_snapshot("snapshot-" + str(index), pvc_names[index % len(pvc_names)]),
+                         namespace=NAMESPACE)
+
+
+def _populate_workspaces(server: FakeKubernetesApiServer, count: int):
+    for index in range(count):
+        workspace_name = "ws-" + str(index)
+        name = _get_jupyter_lab_prefix() + workspace_name
+        labels = _get_jupyter_lab_labels(workspaceName=workspace_name)
+        server.state.add("persistentvolumeclaims", _pvc(name, labels=labels), namespace=NAMESPACE)
+        server.state.add("services", {
+            "metadata": {"name": name, "labels": labels},
+            "spec": {"type": "NodePort", "selector": {"app": labels["app"]}, "clusterIP": "10.96.0.1",
+                     "ports": [{"name": "http", "port": 8888, "targetPort": 8888, "protocol": "TCP",
+                                "nodePort": 30000 + index % 2000}]}
+        }, namespace=NAMESPACE)
+        server.state.add("deployments", {
+            "metadata": {"name": name, "labels": labels},
+            "spec": {"replicas": 1, "selector": {"matchLabels": {"app": labels["app"]}},
+                     "template": {"metadata": {"labels": labels},
+                                  "spec": {"containers": [{"name": "jupyterlab",
+                                                           "image": "nvcr.io/nvidia/tensorflow:22.05-tf2-py3"}]}}},
+            "status": {"replicas": 1, "readyReplicas": 1, "availableReplicas": 1}
+        }, namespace=NAMESPACE)
+
+
+#
+# Benchmarks
+#
+# Each benchmark populates the server with objects (which is not measured) and returns the
+# operation to be measured.
+#
+
+
+def _benchmark_list_volumes(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    _populate_volumes(server, scale)
+    return lambda: list_volumes(namespace=NAMESPACE, session=session)
+
+
+def _benchmark_iter_volumes(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    # Paged retrieval; clone sources are resolved individually rather than by listing the namespace
+    _populate_volumes(server, scale)
+    return lambda: sum(1 for _ in iter_volumes(namespace=NAMESPACE, session=session))
+
+
+def _benchmark_list_volume_snapshots(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    _populate_volumes(server, max(1, scale // 10))
+    _populate_snapshots(server, scale, ["pvc-" + str(index) for index in range(max(1, scale // 10))])
+    return lambda: list_volume_snapshots(namespace=NAMESPACE, session=session)
+
+
+def _benchmark_list_jupyter_labs(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    _populate_workspaces(server, scale)
+    return lambda: list_jupyter_labs(namespace=NAMESPACE, session=session)
+
+
+def _benchmark_clone_volume(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    _populate_volumes(server, scale)
+    return lambda: clone_volume(new_pvc_name="pvc-clone", source_pvc_name="pvc-0", namespace=NAMESPACE,
+                                timeout=60, session=session)
+
+
+def _benchmark_clone_jupyter_lab(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    _populate_workspaces(server, scale)
+    return lambda: clone_jupyter_lab(new_workspace_name="ws-clone", source_workspace_name="ws-0",
+                                     new_workspace_password="benchmark", namespace=NAMESPACE, timeout=60,
+                                     session=session)
+
+
+def _benchmark_delete_volume(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    # Delete a volume that has 'scale' snapshots
+    _populate_volumes(server, 1)
+    _populate_snapshots(server, scale, ["pvc-0"])
+    return lambda: delete_volume(pvc_name="pvc-0", namespace=NAMESPACE, timeout=60, session=session)
+
+
+def _benchmark_s3_get_bucket(server: FakeKubernetesApiServer, session: DataOpsSession, scale: int):
+    # Create 'scale' data mover jobs
+    _populate_volumes(server, 1)
+    data_mover = S3DataMover(credentials_secret="s3-credentials", s3_host="s3.example.com", namespace=NAMESPACE,
+                             session=session)
+
+    def _run():
+        for index in range(scale):
+            data_mover.get_bucket(bucket="bucket-" + str(index), pvc="pvc-0")
+
+    return _run
+
+
+BENCHMARKS = {
+    "clone_volume": _benchmark_clone_volume,
+    "clone_jupyter_lab": _benchmark_clone_jupyter_lab,
+    "list_volumes": _benchmark_list_volumes,
+    "iter_volumes": _benchmark_iter_volumes,
+    "list_volume_snapshots": _benchmark_list_volume_snapshots,
+    "list_jupyter_labs": _benchmark_list_jupyter_labs,
+    "delete_volume": _benchmark_delete_volume,
+    "s3_get_bucket": _benchmark_s3_get_bucket,
+}
+
+
+def run_benchmark(name: str, scale: int, latency: float = 0.002, bind_delay: float = 0.05,
+                  snapshot_ready_delay: float = 0.1, deployment_ready_delay: float = 0.1,
+                  deletion_delay: float = 0.02) -> dict:
+    """Run a single benchmark against a fresh fake API server.
+
+    :param name: The name of the benchmark (one of the keys of BENCHMARKS).
+    :param scale: The number of objects to populate the fake API server with.
+    :param latency: Number of seconds by which every API request is delayed.
+    :param bind_delay: Number of seconds after creation at which a PVC is bound to a volume.
+    :param snapshot_ready_delay: Number of seconds after creation at which a VolumeSnapshot becomes ready to use.
+    :param deployment_ready_delay: Number of seconds after creation at which a Deployment is ready.
+    :param deletion_delay: Number of seconds after a delete request at which an object is removed.
+    :return: A dictionary containing the benchmark name, scale, wall time, and API call counts.
+    """
+    with FakeKubernetesApiServer(latency=latency, bind_delay=bind_delay, snapshot_ready_delay=snapshot_ready_delay,
+                                 deployment_ready_delay=deployment_ready_delay,
+                                 deletion_delay=deletion_delay) as server:
+        with DataOpsSession(config_file=server.kubeconfig) as session:
+            operation = BENCHMARKS[name](server, session, scale)
+            server.state.reset_calls()
+            start = time.perf_counter()
+            operation()
+            wall_time = time.perf_counter() - start
+            calls = dict(sorted(server.state.calls.items()))
+
+    return {
+        "benchmark": name,
+        "scale": scale,
+        "wall_time": round(wall_time, 4),
+        "api_calls": sum(calls.values()),
+        "calls": calls
+    }
+
+
+def compare_to_baseline(results: list, baseline: list, max_time_ratio: float = None) -> list:
+    """Compare benchmark results to a baseline.
+
+    :param results: The benchmark results.
+    :param baseline: The baseline benchmark results.
+    :param max_time_ratio: If specified, the maximum allowed ratio of wall time to baseline wall time.
+    :return: A list of regression messages. The list is empty if there are no regressions.
+    """
+    baseline_index = {(result["benchmark"], result["scale"]): result for result in baseline}
+    regressions = list()
+    for result in results:
+        previous = baseline_index.get((result["benchmark"], result["scale"]))
+        if previous is None:
+            continue
+        if result["api_calls"] > previous["api_calls"]:
+            regressions.append(result["benchmark"] + " @ " + str(result["scale"]) + ": " + str(result["api_calls"]) +
+                               " API calls (baseline: " + str(previous["api_calls"]) + ")")
+        if max_time_ratio and result["wall_time"] > previous["wall_time"] * max_time_ratio:
+            regressions.append(result["benchmark"] + " @ " + str(result["scale"]) + ": " + str(result["wall_time"]) +
+                               "s wall time (baseline: " + str(previous["wall_time"]) + "s)")
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the NetApp DataOps Toolkit for Kubernetes against a fake Kubernetes API server.")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS),
+                        help="Comma-separated list of benchmarks to run. Default: all (" + ",".join(BENCHMARKS) + ").")
+    parser.add_argument("--scales", default="10,100,1000", help="Comma-separated list of object counts. Default: 10,100,1000.")
+    parser.add_argument("--latency", type=float, default=0.002, help="Per-request API latency in seconds. Default: 0.002.")
+    parser.add_argument("--bind-delay", type=float, default=0.05, help="PVC binding delay in seconds. Default: 0.05.")
+    parser.add_argument("--snapshot-delay", type=float, default=0.1, help="VolumeSnapshot readyToUse delay in seconds. Default: 0.1.")
+    parser.add_argument("--deployment-delay", type=float, default=0.1, help="Deployment readiness delay in seconds. Default: 0.1.")
+    parser.add_argument("--deletion-delay", type=float, default=0.02, help="Object deletion delay in seconds. Default: 0.02.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare results to this JSON file (the output of a previous run) and exit with status 1 on regressions.")
+    parser.add_argument("--max-time-ratio", type=float, default=None,
+                        help="When comparing to a baseline, also fail if wall time exceeds the baseline by more than this factor.")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.benchmarks.split(",") if name.strip()]
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error("Unknown benchmark: " + name)
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+
+    results = list()
+    for name in names:
+        for scale in scales:
+            result = run_benchmark(name=name, scale=scale, latency=args.latency, bind_delay=args.bind_delay,
+                                   snapshot_ready_delay=args.snapshot_delay,
+                                   deployment_ready_delay=args.deployment_delay, deletion_delay=args.deletion_delay)
+            results.append(result)
+            print(name + " @ " + str(scale) + ": " + str(result["wall_time"]) + "s, " + str(result["api_calls"]) + " API calls",
+                  file=sys.stderr)
+
+    print(tabulate([[result["benchmark"], result["scale"], result["wall_time"], result["api_calls"],
+                     ", ".join(call + "=" + str(count) for call, count in result["calls"].items())]
+                    for result in results],
+                   headers=["Benchmark", "Scale", "Wall Time (s)", "API Calls", "Calls"]))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_to_baseline(results, json.load(baseline_file), max_time_ratio=args.max_time_ratio)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print("  " + regression)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Startup benchmark for the NetApp DataOps Toolkit for Kubernetes CLI.
+
+Each benchmark runs a CLI command under 'python3 -X importtime' and reports the time that the
+command spends importing modules, on top of the imports of a bare interpreter. Commands are run
+with -h, so that they import everything that they need without contacting a Kubernetes cluster.
+
+Usage:
+    python3 benchmarks/run_startup_benchmark.py [--commands help,create-volume-snapshot,...]
+        [--repeat 5] [--output results.json]
+
+The Kubernetes client library is only imported when the first session is created, so none of the
+commands should import it, and the total import time of a command is counted against its budget.
+The time spent importing the Kubernetes client is still reported in its own column. The run exits
+with status 1 when the import time of a command exceeds its budget (see --budget-scale), or when a
+command imports a module that it should not need (e.g. pandas for snapshot commands).
+"""
+
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+from tabulate import tabulate
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(PACKAGE_ROOT, "netapp_dataops", "netapp_dataops_k8s_cli.py")
+
+# Modules that are only needed to print tables or to create workspaces
+TABLE_MODULES = ("pandas", "tabulate", "notebook")
+
+# Modules that are only needed once a command talks to a Kubernetes cluster
+CLIENT_MODULES = ("kubernetes", "urllib3")
+
+# name: (CLI arguments, budget in milliseconds, modules that must not be imported)
+COMMANDS = {
+    "help": (["help"], 30, ("netapp_dataops.k8s",) + CLIENT_MODULES + TABLE_MODULES),
+    "create-volume-snapshot": (["create", "volume-snapshot", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+    "delete-volume-snapshot": (["delete", "volume-snapshot", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+    "restore-volume-snapshot": (["restore", "volume-snapshot", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+    "list-volume-snapshots": (["list", "volume-snapshots", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+    "prune-volume-snapshots": (["prune", "volume-snapshots", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+    "create-volume": (["create", "volume", "-h"], 100, CLIENT_MODULES + TABLE_MODULES),
+}
+
+
+def parse_import_times(stderr: str) -> dict:
+    """Parse the output of 'python3 -X importtime' into a dict of module name: cumulative microseconds.
+
+    Top-level imports (i.e. imports that were not triggered by another import) are stored under their
+    name as well as being summed under the '' key.
+    """
+    importTimes = {"": 0}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        importTimes[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "):
+            importTimes[""] += int(cumulative)
+    return importTimes
+
+
+def measure(arguments: list) -> dict:
+    """Run a Python command under -X importtime and return its import times (see parse_import_times())."""
+    env = dict(os.environ, PYTHONPATH=PACKAGE_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    completed = subprocess.run([sys.executable, "-X", "importtime"] + arguments, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True)
+    return parse_import_times(completed.stderr)
+
+
+def run_benchmark(name: str, repeat: int, interpreterTime: int) -> dict:
+    arguments, budget, forbiddenModules = COMMANDS[name]
+
+    # Keep the fastest run, since slower runs only measure noise (e.g. other processes competing for the CPU)
+    runs = [measure([CLI] + arguments) for _ in range(repeat)]
+    importTimes = min(runs, key=lambda run: run[""])
+
+    importTime = max(importTimes[""] - interpreterTime, 0)
+    kubernetesTime = importTimes.get("kubernetes", 0)
+    return {
+        "command": name,
+        "import_time_ms": round(importTime / 1000, 1),
+        "kubernetes_ms": round(kubernetesTime / 1000, 1),
+        "toolkit_ms": round((importTime - kubernetesTime) / 1000, 1),
+        "budget_ms": budget,
+        "forbidden_imports": [module for module in forbiddenModules if module in importTimes],
+    }
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of NetApp DataOps Toolkit for Kubernetes CLI commands.")
+    parser.add_argument("--commands", default=",".join(COMMANDS),
+                        help="Comma-separated list of commands to benchmark. Default: all (" + ", ".join(COMMANDS) + ").")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per command; the fastest run is reported. Default: 5.")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Multiply every budget by this factor, e.g. on slow CI machines. Default: 1.0.")
+    parser.add_argument("--output", help="Write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    names = [name for name in args.commands.split(",") if name]
+    unknown = [name for name in names if name not in COMMANDS]
+    if unknown:
+        parser.error("unknown commands: " + ", ".join(unknown))
+
+    # Byte-compile the toolkit first, as pip does when it installs it, so that compiling the sources is not measured
+    compileall.compile_dir(os.path.join(PACKAGE_ROOT, "netapp_dataops"), quiet=1)
+
+    interpreterTime = min(measure(["-c", "pass"])[""] for _ in range(args.repeat))
+
+    results = list()
+    for name in names:
+        result = run_benchmark(name=name, repeat=args.repeat, interpreterTime=interpreterTime)
+        result["budget_ms"] = round(result["budget_ms"] * args.budget_scale, 1)
+        results.append(result)
+        print(name + ": " + str(result["import_time_ms"]) + "ms", file=sys.stderr)
+
+    print(tabulate([[result["command"], result["import_time_ms"], result["kubernetes_ms"], result["toolkit_ms"],
+                     result["budget_ms"], ", ".join(result["forbidden_imports"])]
+                    for result in results],
+                   headers=["Command", "Import Time (ms)", "Kubernetes Client (ms)", "Toolkit (ms)", "Budget (ms)",
+                            "Forbidden Imports"]))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    failures = list()
+    for result in results:
+        if result["import_time_ms"] > result["budget_ms"]:
+            failures.append(result["command"] + ": " + str(result["import_time_ms"]) + "ms exceeds budget of " +
+                            str(result["budget_ms"]) + "ms")
+        if result["forbidden_imports"]:
+            failures.append(result["command"] + ": imports " + ", ".join(result["forbidden_imports"]))
+    if failures:
+        print("\nOver budget:")
+        for failure in failures:
+            print("  " + failure)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,26 +4,68 @@ This module provides the public functions available to be imported directly
 by applications using the import method of utilizing the toolkit.
 """
 
+from __future__ import annotations
+
 __version__ = "2.5.0"
 
 import base64
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import csv
 from datetime import datetime
 import functools
 from getpass import getpass
-from time import sleep
+import itertools
+import json
+from time import monotonic, sleep
 import warnings
 import os
+import re
+import socket
+import sys
+import threading
+
+from netapp_dataops.k8s import tracing
+
+
+#
+# Kubernetes client library
+#
+# The Kubernetes client library takes several hundred milliseconds to import, so it is imported when the first
+# session is created (or when one of its classes is first needed) instead of when the toolkit is imported.
+#
+
+
+class _LazyKubernetesModule:
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        _import_kubernetes_client()
+        return getattr(globals()[self._name], attribute)
+
+
+client = _LazyKubernetesModule("client")
+config = _LazyKubernetesModule("config")
+watch = _LazyKubernetesModule("watch")
+
+
+class ApiException(Exception):
+    '''Stand-in for kubernetes.client.rest.ApiException until the Kubernetes client library has been imported.
+
+    Kubernetes API calls are only made through a session, and creating a session imports the library, which replaces
+    this class with the real one. Other modules therefore import ApiException from kubernetes.client.rest.
+    '''
+    pass
 
-from notebook import auth as jupyter_auth
-from kubernetes import client, config
-from kubernetes.client import (
-    V1ConfigMap,
-    V1Secret,
-)
-from kubernetes.client.models.v1_object_meta import V1ObjectMeta
-from kubernetes.client.rest import ApiException
-from tabulate import tabulate
-import pandas as pd
+
+def _import_kubernetes_client():
+    global client, config, watch, ApiException
+    if not isinstance(client, _LazyKubernetesModule):
+        return
+    from kubernetes import client as kubernetesClient, config as kubernetesConfig, watch as kubernetesWatch
+    from kubernetes.client.rest import ApiException as KubernetesApiException
+    config, watch, ApiException = kubernetesConfig, kubernetesWatch, KubernetesApiException
+    client = kubernetesClient
 
 
 # Using this decorator in lieu of using a dependency to manage deprecation
@@ -57,11 +99,209 @@ class ServiceUnavailableError(Exception):
     pass
 
 
+class WaitTimeoutError(Exception):
+    '''Error that will be raised when a Kubernetes object does not reach the desired state before the timeout expires'''
+    pass
+
+
+class DataOpsSession:
+    """Reusable Kubernetes API session.
+
+    A session loads the Kubernetes configuration once, holds a single ApiClient whose urllib3 connection pool
+    keeps connections to the API server alive between requests, and hands out cached typed API objects.
+
+    Every toolkit function accepts an optional session parameter. If no session is passed, the process-wide
+    default session is used (see get_default_session()), so a long-running process only pays for loading the
+    configuration and establishing TLS connections once.
+    """
+
+    def __init__(self, config_file: str = None, context: str = None, connection_pool_maxsize: int = 32,
+                 print_output: bool = False, ingress_host: str = None, node_address_ttl: float = 300):
+        """Initialize the DataOpsSession object.
+
+        :param config_file: Path to a kubeconfig file. If not specified, the in-cluster configuration is used when
+            running inside a pod, otherwise the default kubeconfig location ($HOME/.kube/config or $KUBECONFIG).
+        :param context: The kubeconfig context to use. If not specified, the current context is used.
+        :param connection_pool_maxsize: The maximum number of connections to keep open to the API server.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param ingress_host: Host name or IP address to use in the URLs of NodePort services instead of the address
+            of a Kubernetes node. If not specified, the NETAPP_DATAOPS_K8S_INGRESS_HOST environment variable is used.
+        :param node_address_ttl: Number of seconds for which a Kubernetes node address is cached.
+        :raises InvalidConfigError: When the Kubernetes configuration is missing or invalid.
+        """
+        _import_kubernetes_client()
+        from urllib3.connection import HTTPConnection
+
+        self.configuration = client.Configuration()
+        configured = False
+        if not config_file and not context:
+            try:
+                config.load_incluster_config(client_configuration=self.configuration)
+                configured = True
+            except:
+                configured = False
+        if not configured:
+            try:
+                config.load_kube_config(config_file=config_file, context=context,
+                                        client_configuration=self.configuration)
+            except:
+                if print_output:
+                    _print_invalid_config_error()
+                raise InvalidConfigError()
+
+        # Size the connection pool and keep idle connections alive
+        self.configuration.connection_pool_maxsize = connection_pool_maxsize
+        socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options += [(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+                               (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+                               (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 6)]
+        self.configuration.socket_options = socket_options
+
+        self.api_client = tracing.instrument_api_client(client.ApiClient(configuration=self.configuration))
+        self._apis = dict()
+        self._lock = threading.Lock()
+
+        # Optional local resource cache (see netapp_dataops.k8s.cache.enable_cache())
+        self.cache = None
+
+        # Resource kinds that RBAC does not allow to be listed across all namespaces (discovered on first attempt)
+        self._cluster_list_forbidden = set()
+
+        # Resolver for the externally reachable endpoints of services
+        self.endpoint_resolver = EndpointResolver(session=self, ingress_host=ingress_host,
+                                                  node_address_ttl=node_address_ttl)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_api(self, api_class):
+        with self._lock:
+            if api_class not in self._apis:
+                self._apis[api_class] = api_class(api_client=self.api_client)
+            return self._apis[api_class]
+
+    def apps_v1_api(self) -> client.AppsV1Api:
+        """Get the session's AppsV1Api object."""
+        return self._get_api(client.AppsV1Api)
+
+    def batch_v1_api(self) -> client.BatchV1Api:
+        """Get the session's BatchV1Api object."""
+        return self._get_api(client.BatchV1Api)
+
+    def core_v1_api(self) -> client.CoreV1Api:
+        """Get the session's CoreV1Api object."""
+        return self._get_api(client.CoreV1Api)
+
+    def custom_objects_api(self) -> client.CustomObjectsApi:
+        """Get the session's CustomObjectsApi object."""
+        return self._get_api(client.CustomObjectsApi)
+
+    def close(self):
+        """Stop the session's resource cache, if enabled, and close the session's connection pool."""
+        if self.cache is not None:
+            self.cache.stop()
+            self.cache = None
+        self.api_client.close()
+
+
+class EndpointResolver:
+    """Resolves the externally reachable endpoints of Kubernetes services.
+
+    LoadBalancer services are reached through their load balancer ingress. NodePort services are reached through
+    the address of a Kubernetes node, which is looked up with a single-item node list and cached for
+    node_address_ttl seconds, or through a pinned ingress host (e.g. a load balancer or DNS name that fronts the
+    cluster's nodes), in which case nodes are never listed.
+
+    Every DataOpsSession owns a resolver (session.endpoint_resolver).
+    """
+
+    def __init__(self, session: DataOpsSession, ingress_host: str = None, node_address_ttl: float = 300):
+        """Initialize the EndpointResolver object.
+
+        :param session: The Kubernetes API session used to look up nodes and services.
+        :param ingress_host: Host name or IP address to use instead of a node address. If not specified, the
+            NETAPP_DATAOPS_K8S_INGRESS_HOST environment variable is used.
+        :param node_address_ttl: Number of seconds for which a node address is cached.
+        """
+        self.session = session
+        self.ingress_host = ingress_host or os.environ.get("NETAPP_DATAOPS_K8S_INGRESS_HOST") or None
+        self.node_address_ttl = node_address_ttl
+        self._node_address = None
+        self._node_address_expiry = 0
+        self._lock = threading.Lock()
+
+    def node_address(self) -> str:
+        """Get the host to use for NodePort services.
+
+        :return: The pinned ingress host or the (cached) address of a Kubernetes node, or None if no node address
+            could be retrieved.
+        """
+        if self.ingress_host:
+            return self.ingress_host
+        with self._lock:
+            if self._node_address and monotonic() < self._node_address_expiry:
+                return self._node_address
+        try:
+            nodes = self.session.core_v1_api().list_node(limit=1)
+            address = _select_node_address(nodes.items[0].status.addresses)
+        except:
+            return None
+        with self._lock:
+            self._node_address = address
+            self._node_address_expiry = monotonic() + self.node_address_ttl
+        return address
+
+    def invalidate(self):
+        """Discard the cached node address."""
+        with self._lock:
+            self._node_address = None
+            self._node_address_expiry = 0
+
+    def resolve(self, service) -> dict:
+        """Resolve the endpoints of a service.
+
+        :param service: A V1Service object.
+        :return: A dictionary mapping the name (or the target port, if unnamed) of each service port to its
+            "host:port" endpoint. Endpoints of LoadBalancer services whose ingress is not available yet are omitted.
+        """
+        if service.spec.type == "LoadBalancer":
+            host = _retrieve_load_balancer_host(service)
+            if not host:
+                return dict()
+            return {_get_service_port_key(port): host + ":" + str(port.port) for port in service.spec.ports}
+        host = self.node_address() or "<IP address of Kubernetes node>"
+        return {_get_service_port_key(port): host + ":" + str(port.node_port)
+                for port in service.spec.ports if port.node_port}
+
+    def resolve_namespace(self, namespace: str = "default", label_selector: str = None) -> dict:
+        """Resolve the endpoints of all services in a namespace with a single service list call.
+
+        :param namespace: Kubernetes namespace.
+        :param label_selector: Optional label selector to filter the services by.
+        :return: A dictionary mapping each service name to its endpoints (see resolve()).
+        :raises APIConnectionError: The Kubernetes API returned an error.
+        """
+        try:
+            services = _list_namespaced_objects(kind="services", namespace=namespace, labelSelector=label_selector,
+                                                session=self.session)
+        except ApiException as err:
+            raise APIConnectionError(err)
+        return {service.metadata.name: self.resolve(service) for service in services}
+
+
 #
 # Private functions
 #
 
 
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
 def _get_jupyter_lab_prefix() -> str:
     return "ntap-dsutil-jupyterlab-"
 
@@ -106,315 +346,1747 @@ def _get_labels(operation: str) -> dict:
     }
 
 
-def _load_kube_config():
-    try:
-        config.load_incluster_config()
-    except:
-        config.load_kube_config()
+def _get_volume_snapshot_labels(pvcName: str, operation: str, workspaceName: str = None,
+                                datasetVersion: str = None) -> dict:
+    labels = _get_labels(operation=operation)
+    # Label values are limited to 63 characters; VolumeSnapshots of PVCs with longer names are selected client-side
+    if len(pvcName) <= 63:
+        labels["source-pvc"] = pvcName
+    if workspaceName:
+        labels["jupyterlab-workspace-name"] = workspaceName
+    if datasetVersion:
+        labels["dataset-version"] = datasetVersion
+    return labels
+
+
+def _get_session(session: DataOpsSession = None, print_output: bool = False) -> DataOpsSession:
+    if session:
+        return session
+    return get_default_session(print_output=print_output)
+
+
+def _get_resource_kinds() -> tuple:
+    return ("deployments", "jobs", "persistentvolumeclaims", "services", "volumesnapshots")
+
+
+def _get_resource_list_function(kind: str, session: DataOpsSession) -> tuple:
+    """Get the namespaced list function for a resource kind.
+
+    :param kind: The resource kind, one of the values returned by _get_resource_kinds(), "pods" or "statefulsets".
+    :param session: The DataOpsSession whose API objects should be used.
+    :return: A tuple containing the list function and any additional keyword arguments that it requires.
+    """
+    if kind == "deployments":
+        return session.apps_v1_api().list_namespaced_deployment, dict()
+    if kind == "jobs":
+        return session.batch_v1_api().list_namespaced_job, dict()
+    if kind == "persistentvolumeclaims":
+        return session.core_v1_api().list_namespaced_persistent_volume_claim, dict()
+    if kind == "pods":
+        return session.core_v1_api().list_namespaced_pod, dict()
+    if kind == "services":
+        return session.core_v1_api().list_namespaced_service, dict()
+    if kind == "statefulsets":
+        return session.apps_v1_api().list_namespaced_stateful_set, dict()
+    if kind == "volumesnapshots":
+        return session.custom_objects_api().list_namespaced_custom_object, {"group": _get_snapshot_api_group(),
+                                                                            "version": _get_snapshot_api_version(),
+                                                                            "plural": "volumesnapshots"}
+    raise ValueError("Unsupported resource kind: " + kind)
+
+
+def _get_resource_cluster_list_function(kind: str, session: DataOpsSession) -> tuple:
+    """Get the cluster-scoped (all namespaces) list function for a resource kind.
+
+    :param kind: The resource kind, one of the values accepted by _get_resource_list_function().
+    :param session: The DataOpsSession whose API objects should be used.
+    :return: A tuple containing the list function and any additional keyword arguments that it requires.
+    """
+    if kind == "deployments":
+        return session.apps_v1_api().list_deployment_for_all_namespaces, dict()
+    if kind == "jobs":
+        return session.batch_v1_api().list_job_for_all_namespaces, dict()
+    if kind == "persistentvolumeclaims":
+        return session.core_v1_api().list_persistent_volume_claim_for_all_namespaces, dict()
+    if kind == "pods":
+        return session.core_v1_api().list_pod_for_all_namespaces, dict()
+    if kind == "services":
+        return session.core_v1_api().list_service_for_all_namespaces, dict()
+    if kind == "statefulsets":
+        return session.apps_v1_api().list_stateful_set_for_all_namespaces, dict()
+    if kind == "volumesnapshots":
+        return session.custom_objects_api().list_cluster_custom_object, {"group": _get_snapshot_api_group(),
+                                                                         "version": _get_snapshot_api_version(),
+                                                                         "plural": "volumesnapshots"}
+    raise ValueError("Unsupported resource kind: " + kind)
+
+
+def _list_namespaced_objects(kind: str, namespace: str = "default", labelSelector: str = None,
+                             session: DataOpsSession = None) -> list:
+    # Serve from local resource cache if enabled
+    session = _get_session(session=session)
+    if session.cache is not None:
+        items = session.cache.list(kind=kind, namespace=namespace, label_selector=labelSelector)
+        if items is not None:
+            return items
+
+    # Retrieve from Kubernetes API
+    listFunc, listKwargs = _get_resource_list_function(kind=kind, session=session)
+    if labelSelector:
+        listKwargs["label_selector"] = labelSelector
+    objectList = listFunc(namespace=namespace, **listKwargs)
+    if isinstance(objectList, dict):
+        return objectList["items"]
+    return objectList.items
+
+
+def _list_objects_by_namespace(kind: str, namespaces: list = None, labelSelector: str = None,
+                               session: DataOpsSession = None) -> dict:
+    # Retrieve objects from several namespaces (all namespaces if namespaces is None), grouped by namespace. A single
+    # cluster-scoped list call is made where RBAC allows it; otherwise the namespaces are listed concurrently, which
+    # only requires permissions within each namespace.
+    session = _get_session(session=session)
+    if namespaces is not None and not namespaces:
+        return dict()
+    if (namespaces is None or len(namespaces) > 1) and kind not in session._cluster_list_forbidden:
+        listFunc, listKwargs = _get_resource_cluster_list_function(kind=kind, session=session)
+        if labelSelector:
+            listKwargs["label_selector"] = labelSelector
+        try:
+            objectList = listFunc(**listKwargs)
+        except ApiException as err:
+            if err.status != 403:
+                raise
+            session._cluster_list_forbidden.add(kind)
+        else:
+            objectsByNamespace = {namespace: list() for namespace in namespaces or []}
+            for obj in (objectList["items"] if isinstance(objectList, dict) else objectList.items):
+                objNamespace = obj["metadata"]["namespace"] if isinstance(obj, dict) else obj.metadata.namespace
+                if namespaces is None or objNamespace in objectsByNamespace:
+                    objectsByNamespace.setdefault(objNamespace, list()).append(obj)
+            return objectsByNamespace
+
+    # Fall back to listing each namespace
+    if namespaces is None:
+        try:
+            namespaces = [namespace.metadata.name for namespace in session.core_v1_api().list_namespace().items]
+        except ApiException as err:
+            if err.status != 403:
+                raise
+            raise ApiException(status=err.status, reason="Listing " + kind + " in all namespaces requires either "
+                               "permission to list " + kind + " cluster-wide or permission to list namespaces. "
+                               "Specify the namespaces to list instead.") from err
+    with ThreadPoolExecutor(max_workers=min(8, len(namespaces)) or 1) as executor:
+        futures = {namespace: executor.submit(tracing.propagate(_list_namespaced_objects), kind=kind,
+                                              namespace=namespace, labelSelector=labelSelector, session=session)
+                   for namespace in namespaces}
+    return {namespace: future.result() for namespace, future in futures.items()}
+
+
+def _iter_namespaced_object_pages(kind: str, namespace: str = "default", labelSelector: str = None,
+                                  pageSize: int = 500, session: DataOpsSession = None):
+    # Serve from local resource cache if enabled (the cache already holds every object, so there is nothing to page)
+    session = _get_session(session=session)
+    if session.cache is not None:
+        items = session.cache.list(kind=kind, namespace=namespace, label_selector=labelSelector)
+        if items is not None:
+            if items:
+                yield items
+            return
+
+    # Retrieve from Kubernetes API one page at a time, so that memory use is bounded by the page size rather than by
+    # the number of objects in the namespace
+    listFunc, listKwargs = _get_resource_list_function(kind=kind, session=session)
+    if labelSelector:
+        listKwargs["label_selector"] = labelSelector
+    while True:
+        objectList = listFunc(namespace=namespace, limit=pageSize, **listKwargs)
+        if isinstance(objectList, dict):
+            items = objectList["items"]
+            continueToken = objectList["metadata"].get("continue")
+        else:
+            items = objectList.items
+            continueToken = objectList.metadata._continue
+        if items:
+            yield items
+        if not continueToken:
+            return
+        listKwargs["_continue"] = continueToken
+
+
+def _skip_forbidden_pages(pages):
+    # Yield the pages of a list, or nothing if listing the resource kind is forbidden
+    try:
+        yield from pages
+    except ApiException as err:
+        if err.status != 403:
+            raise
+
+
+def _get_page_label_selector(labelSelector: str, key: str, values: list, session: DataOpsSession) -> str:
+    # Restrict a label selector to the objects that belong to one page of results. The resource cache only evaluates
+    # equality-based selectors, and already holds every object, so the selector is left unrestricted when it is enabled.
+    if session.cache is not None:
+        return labelSelector
+    return labelSelector + "," + key + " in (" + ",".join(sorted(set(values))) + ")"
+
+
+def _get_volume_snapshot_label_selectors(pvcName: str = None, jupyterLabWorkspacesOnly: bool = False,
+                                         datasetVersion: str = None) -> list:
+    # Select VolumeSnapshots server-side by the labels that create_volume_snapshot() applies, so that the cost of a
+    # query scales with the number of matching VolumeSnapshots rather than with the number in the namespace
+    requirements = list()
+    if pvcName and len(pvcName) <= 63:
+        requirements.append("source-pvc=" + pvcName)
+    if jupyterLabWorkspacesOnly:
+        requirements.append("jupyterlab-workspace-name")
+    if datasetVersion:
+        requirements.append("dataset-version=" + datasetVersion)
+    if not requirements:
+        return [None]
+
+    # VolumeSnapshots that were created before snapshots were labeled are selected client-side until their labels
+    # are backfilled (see backfill_volume_snapshot_labels()); dataset versions only ever exist as labels. The
+    # selectors are disjoint, so that results can be streamed without tracking which VolumeSnapshots were seen.
+    if datasetVersion:
+        return [",".join(requirements)]
+    if jupyterLabWorkspacesOnly:
+        return [",".join(requirements), "!source-pvc,!jupyterlab-workspace-name"]
+    return [",".join(requirements), "!source-pvc"]
+
+
+def _list_volume_snapshots(pvcName: str = None, jupyterLabWorkspacesOnly: bool = False, datasetVersion: str = None,
+                           namespace: str = "default", session: DataOpsSession = None) -> list:
+    volumeSnapshots = dict()
+    for labelSelector in _get_volume_snapshot_label_selectors(pvcName=pvcName,
+                                                              jupyterLabWorkspacesOnly=jupyterLabWorkspacesOnly,
+                                                              datasetVersion=datasetVersion):
+        for volumeSnapshot in _list_namespaced_objects(kind="volumesnapshots", namespace=namespace,
+                                                       labelSelector=labelSelector, session=session):
+            volumeSnapshots[volumeSnapshot["metadata"]["name"]] = volumeSnapshot
+    return list(volumeSnapshots.values())
+
+
+def _read_namespaced_object(kind: str, name: str, namespace: str = "default", session: DataOpsSession = None):
+    # Serve from local resource cache if enabled
+    session = _get_session(session=session)
+    if session.cache is not None:
+        obj = session.cache.get(kind=kind, name=name, namespace=namespace)
+        if obj is not None:
+            return obj
+
+    # Retrieve from Kubernetes API
+    if kind == "deployments":
+        return session.apps_v1_api().read_namespaced_deployment(name=name, namespace=namespace)
+    if kind == "jobs":
+        return session.batch_v1_api().read_namespaced_job(name=name, namespace=namespace)
+    if kind == "persistentvolumeclaims":
+        return session.core_v1_api().read_namespaced_persistent_volume_claim(name=name, namespace=namespace)
+    if kind == "services":
+        return session.core_v1_api().read_namespaced_service(name=name, namespace=namespace)
+    if kind == "volumesnapshots":
+        return session.custom_objects_api().get_namespaced_custom_object(group=_get_snapshot_api_group(),
+                                                                         version=_get_snapshot_api_version(),
+                                                                         namespace=namespace, plural="volumesnapshots",
+                                                                         name=name)
+    raise ValueError("Unsupported resource kind: " + kind)
+
+
+class _LazyObjectIndex:
+    """Index of the Kubernetes objects of one kind in a namespace by name, retrieved on first lookup.
+
+    Used in place of a set or dict of every object in the namespace when results are streamed, so that references
+    between objects (e.g. from a clone to its source PVC) can be resolved without retrieving anything when nothing is
+    referenced, and otherwise with one paged list call rather than one read per referenced object. Only names (and
+    the values returned by valueFunc) are retained, not the objects themselves.
+    """
+
+    def __init__(self, kind: str, namespace: str = "default", valueFunc=None, pageSize: int = 500,
+                 session: DataOpsSession = None):
+        # valueFunc maps a retrieved object to the value to index, so that only the needed fields are retained
+        self.kind = kind
+        self.namespace = namespace
+        self.valueFunc = valueFunc
+        self.pageSize = pageSize
+        self.session = session
+        self._values = None
+
+    def _load(self) -> dict:
+        if self._values is None:
+            values = dict()
+            try:
+                for objects in _iter_namespaced_object_pages(kind=self.kind, namespace=self.namespace,
+                                                             pageSize=self.pageSize, session=self.session):
+                    for obj in objects:
+                        name = obj["metadata"]["name"] if isinstance(obj, dict) else obj.metadata.name
+                        values[name] = self.valueFunc(obj) if self.valueFunc else None
+            except ApiException as err:
+                # VolumeSnapshot CRD is not installed (e.g. BeeGFS-only clusters)
+                if err.status != 404:
+                    raise
+            self._values = values
+        return self._values
+
+    def __contains__(self, name) -> bool:
+        return bool(name) and name in self._load()
+
+    def __getitem__(self, name):
+        if not name:
+            raise KeyError(name)
+        return self._load()[name]
+
+
+def _astra_not_supported_message(print_output: bool = False) :
+    error_text = "Error: Astra Control functionality within the DataOps Toolkit is no longer supported. Please use the Astra SDK and/or toolkit. For details, visit https://github.com/NetApp/netapp-astra-toolkits."
+    if print_output :
+        print(error_text)
+    raise APIConnectionError(error_text)
+
+
+def _print_invalid_config_error():
+    print(
+        "Error: Missing or invalid kubeconfig file. The NetApp DataOps Toolkit for Kubernetes requires that a valid kubeconfig file be present on the host, located at $HOME/.kube or at another path specified by the KUBECONFIG environment variable.")
+
+
+def _construct_jupyter_lab_service(workspaceName: str, labels: dict, loadBalancerService: bool = False) -> client.V1Service:
+    if loadBalancerService:
+        service = client.V1Service(
+            metadata=client.V1ObjectMeta(
+                name=_get_jupyter_lab_service(workspaceName=workspaceName),
+                labels=labels
+            ),
+            spec=client.V1ServiceSpec(
+                type="LoadBalancer",
+                selector={
+                    "app": labels["app"]
+                },
+                ports=[
+                    client.V1ServicePort(
+                        name="http",
+                        port=80,
+                        target_port=8888,
+                        protocol="TCP"
+                    )
+                ]
+            )
+        )
+    else:
+        service = client.V1Service(
+            metadata=client.V1ObjectMeta(
+                name=_get_jupyter_lab_service(workspaceName=workspaceName),
+                labels=labels
+            ),
+            spec=client.V1ServiceSpec(
+                type="NodePort",
+                selector={
+                    "app": labels["app"]
+                },
+                ports=[
+                    client.V1ServicePort(
+                        name="http",
+                        port=8888,
+                        target_port=8888,
+                        protocol="TCP"
+                    )
+                ]
+            )
+        )
+
+    return service
+
+
+def _construct_jupyter_lab_deployment(workspaceName: str, labels: dict, hashedPassword: str, workspaceImage: str,
+                                      mountPvc: str = None, requestCpu: str = None, requestMemory: str = None,
+                                      requestNvidiaGpu: str = None, allocateResource: str = None) -> client.V1Deployment:
+    deployment = client.V1Deployment(
+        metadata=client.V1ObjectMeta(
+            name=_get_jupyter_lab_deployment(workspaceName=workspaceName),
+            labels=labels
+        ),
+        spec=client.V1DeploymentSpec(
+            replicas=1,
+            selector={
+                "matchLabels": {
+                    "app": labels["app"]
+                }
+            },
+            template=client.V1PodTemplateSpec(
+                metadata=client.V1ObjectMeta(
+                    labels=labels
+                ),
+                spec=client.V1PodSpec(
+                    volumes=[
+                        client.V1Volume(
+                            name="workspace",
+                            persistent_volume_claim={
+                                "claimName": _get_jupyter_lab_workspace_pvc_name(workspaceName=workspaceName)
+                            }
+                        )
+                    ],
+                    init_containers=[
+                        client.V1Container(
+                            name="init-jupyterlab",
+                            image=workspaceImage,
+                            command=["/bin/bash", "-c"],
+                            args=["cp -au /workspace/. /vol/ || true"],
+                            volume_mounts=[
+                                client.V1VolumeMount(
+                                    name="workspace",
+                                    mount_path="/vol"
+                                )
+                            ]
+                        )
+                    ],
+                    containers=[
+                        client.V1Container(
+                            name="jupyterlab",
+                            image=workspaceImage,
+                            env=[
+                                client.V1EnvVar(
+                                    name="JUPYTER_ENABLE_LAB",
+                                    value="yes"
+                                ),
+                                client.V1EnvVar(
+                                    name="RESTARTABLE",
+                                    value="yes"
+                                ),
+                                client.V1EnvVar(
+                                    name="CHOWN_HOME",
+                                    value="yes"
+                                )
+                            ],
+                            command=["jupyter", "lab", "--LabApp.password=" + hashedPassword, "--LabApp.ip='0.0.0.0'",
+                                  "--no-browser", "--notebook-dir=/workspace"],
+                            ports=[
+                                client.V1ContainerPort(container_port=8888)
+                            ],
+                            volume_mounts=[
+                                client.V1VolumeMount(
+                                    name="workspace",
+                                    mount_path="/workspace"
+                                )
+                            ],
+                            resources={
+                                "limits": dict(),
+                                "requests": dict()
+                            }
+                        )
+                    ]
+                )
+            )
+        )
+    )
+
+    # Mount Additional pvc if needed
+    if mountPvc:
+
+        divider_index = mountPvc.find(":")
+        user_pvc_name = mountPvc[:divider_index]
+        user_pvc_mountpoint = mountPvc[divider_index+1:]
+
+        # Add user-specified PVC
+        deployment.spec.template.spec.volumes.append(
+            client.V1Volume(
+                name="uservol",
+                persistent_volume_claim={
+                    "claimName": user_pvc_name
+                    }
+                )
+            )
+
+        # Add mountpoint for user-specified PVC
+        deployment.spec.template.spec.containers[0].volume_mounts.append(
+            client.V1VolumeMount(
+                name="uservol",
+                mount_path=user_pvc_mountpoint
+                )
+            )
+
+    # Apply resource requests/limits
+    if requestCpu:
+        deployment.spec.template.spec.containers[0].resources["requests"]["cpu"] = requestCpu
+        deployment.spec.template.spec.containers[0].resources["limits"]["cpu"] = requestCpu
+    if requestMemory:
+        deployment.spec.template.spec.containers[0].resources["requests"]["memory"] = requestMemory
+        deployment.spec.template.spec.containers[0].resources["limits"]["memory"] = requestMemory
+    if requestNvidiaGpu:
+        deployment.spec.template.spec.containers[0].resources["requests"]["nvidia.com/gpu"] = requestNvidiaGpu
+        deployment.spec.template.spec.containers[0].resources["limits"]["nvidia.com/gpu"] = requestNvidiaGpu
+    if allocateResource:
+        allocate = (allocateResource.partition('='))[0]
+        allocate_limit = allocateResource.split("=",1)[1]
+        deployment.spec.template.spec.containers[0].resources["requests"][allocate] = allocate_limit
+        deployment.spec.template.spec.containers[0].resources["limits"][allocate] = allocate_limit
+
+    return deployment
+
+
+def _construct_pvc(pvcName: str, volumeSize: str, storageClass: str = None, pvcLabels: dict = None,
+                   sourceSnapshot: str = None, sourcePvc: str = None) -> client.V1PersistentVolumeClaim:
+    # Construct PVC
+    pvc = client.V1PersistentVolumeClaim(
+        metadata=client.V1ObjectMeta(
+            name=pvcName,
+            labels=pvcLabels
+        ),
+        spec=client.V1PersistentVolumeClaimSpec(
+            access_modes=["ReadWriteMany"],
+            resources=client.V1ResourceRequirements(
+                requests={
+                    'storage': volumeSize
+                }
+            )
+        )
+    )
+
+    # Apply custom storageClass if specified
+    if storageClass:
+        pvc.spec.storage_class_name = storageClass
+
+    # Apply source snapshot if specified
+    if sourceSnapshot:
+        pvc.spec.data_source = {
+            'name': sourceSnapshot,
+            'kind': 'VolumeSnapshot',
+            'apiGroup': _get_snapshot_api_group()
+        }
+    # Apply source PVC if specified
+    elif sourcePvc:
+        pvc.metadata.annotations = {
+            'trident.netapp.io/cloneFromPVC': sourcePvc
+        }
+
+    return pvc
+
+
+def _construct_volume_snapshot(snapshotName: str, pvcName: str, volumeSnapshotClass: str = "csi-snapclass",
+                               labels: dict = None) -> dict:
+    return {
+        "apiVersion": _get_snapshot_api_group() + "/" + _get_snapshot_api_version(),
+        "kind": "VolumeSnapshot",
+        "metadata": {
+            "name": snapshotName,
+            "labels": labels or dict()
+        },
+        "spec": {
+            "volumeSnapshotClassName": volumeSnapshotClass,
+            "source": {
+                "persistentVolumeClaimName": pvcName
+            }
+        }
+    }
+
+
+def _construct_jupyter_labs_list(deployments: list, pvcs: list, services: list, nodeIp: str = None,
+                                 volumeSnapshotNames: set = None, deploymentNames: set = None) -> list:
+    # Index PVCs, Services and Deployments by name
+    pvcIndex = {pvc.metadata.name: pvc for pvc in pvcs}
+    serviceIndex = {service.metadata.name: service for service in services}
+    if deploymentNames is None:
+        deploymentNames = {deployment.metadata.name for deployment in deployments}
+    if volumeSnapshotNames is None:
+        volumeSnapshotNames = set()
+
+    # Construct list of workspaces
+    workspacesList = list()
+    for deployment in deployments:
+        # Construct dict containing workspace details
+        workspaceDict = dict()
+
+        # Retrieve workspace name
+        workspaceName = deployment.metadata.labels["jupyterlab-workspace-name"]
+        workspaceDict["Workspace Name"] = workspaceName
+
+        # Determine readiness status
+        if deployment.status.ready_replicas == 1:
+            workspaceDict["Status"] = "Ready"
+        else:
+            workspaceDict["Status"] = "Not Ready"
+
+        # Retrieve PVC size and StorageClass
+        pvc = pvcIndex.get(_get_jupyter_lab_workspace_pvc_name(workspaceName=workspaceName))
+        try:
+            workspaceDict["Size"] = pvc.status.capacity["storage"]
+            workspaceDict["StorageClass"] = pvc.spec.storage_class_name
+        except:
+            workspaceDict["Size"] = ""
+            workspaceDict["StorageClass"] = ""
+
+        # Retrieve access URL
+        try :
+            serviceStatus = serviceIndex[_get_jupyter_lab_service(workspaceName=workspaceName)]
+            workspaceDict["Access URL"] = _construct_jupyter_lab_url(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=False)
+        except (KeyError, ServiceUnavailableError) :
+            workspaceDict["Access URL"] = "unavailable"
+
+        # Retrieve clone details
+        try:
+            if deployment.metadata.labels["created-by-operation"] == "clone-jupyterlab":
+                workspaceDict["Clone"] = "Yes"
+                workspaceDict["Source Workspace"] = pvc.metadata.labels["source-jupyterlab-workspace"]
+                if _get_jupyter_lab_deployment(workspaceName=workspaceDict["Source Workspace"]) not in deploymentNames:
+                    workspaceDict["Source Workspace"] = "*deleted*"
+                try:
+                    workspaceDict["Source VolumeSnapshot"] = pvc.spec.data_source.name
+                    if workspaceDict["Source VolumeSnapshot"] not in volumeSnapshotNames:  # Confirm that VolumeSnapshot still exists
+                        workspaceDict["Source VolumeSnapshot"] = "*deleted*"
+                except:
+                    workspaceDict["Source VolumeSnapshot"] = "n/a"
+            else:
+                workspaceDict["Clone"] = "No"
+                workspaceDict["Source Workspace"] = ""
+                workspaceDict["Source VolumeSnapshot"] = ""
+        except:
+            workspaceDict["Clone"] = "No"
+            workspaceDict["Source Workspace"] = ""
+            workspaceDict["Source VolumeSnapshot"] = ""
+
+        # Append dict to list of workspaces
+        workspacesList.append(workspaceDict)
+
+    return workspacesList
+
+
+def _retrieve_image_for_jupyter_lab_deployment(workspaceName: str, namespace: str = "default",
+                                         printOutput: bool = False, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve image
+    try:
+        deployment = _read_namespaced_object(kind="deployments", namespace=namespace,
+                                             name=_get_jupyter_lab_deployment(workspaceName=workspaceName), session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    return deployment.spec.template.spec.containers[0].image
+
+
+def _construct_jupyter_lab_url(serviceStatus, nodeIp: str = None, printOutput: bool = False) -> str:
+    # Check if service type is LoadBalancer
+    if serviceStatus.spec.type == "LoadBalancer":
+        # Construct and return url
+        loadBalancerIP = _retrieve_load_balancer_host(serviceStatus)
+        if not loadBalancerIP :
+            if printOutput :
+                print("Error: Kubernetes Service for workspace is not available.")
+            raise ServiceUnavailableError()
+        return "http://" + loadBalancerIP
+    else:
+        # Retrieve access port
+        port = serviceStatus.spec.ports[0].node_port
+
+        # Construct and return url
+        if not nodeIp:
+            nodeIp = "<IP address of Kubernetes node>"
+        return "http://" + nodeIp + ":" + str(port)
+
+
+def _retrieve_node_ip(session: DataOpsSession = None) -> str:
+    # Retrieve node IP (random node, cached) or the pinned ingress host
+    try:
+        session = _get_session(session=session)
+    except:
+        return None
+    return session.endpoint_resolver.node_address()
+
+
+def _select_node_address(addresses: list) -> str:
+    # Prefer externally reachable addresses
+    for addressType in ("ExternalIP", "InternalIP"):
+        for address in addresses:
+            if address.type == addressType:
+                return address.address
+    return addresses[0].address
+
+
+def _retrieve_load_balancer_host(serviceStatus) -> str:
+    try:
+        ingress = serviceStatus.status.load_balancer.ingress[0]
+    except:
+        return None
+    return ingress.ip or ingress.hostname
+
+
+def _get_service_port_key(port) -> str:
+    return port.name or str(port.target_port)
+
+
+def _retrieve_jupyter_lab_url(workspaceName: str, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    try:
+        serviceStatus = _read_namespaced_object(kind="services", namespace=namespace,
+                                                name=_get_jupyter_lab_service(workspaceName=workspaceName), session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve node IP for NodePort services
+    nodeIp = None
+    if serviceStatus.spec.type != "LoadBalancer":
+        nodeIp = _retrieve_node_ip(session=session)
+
+    return _construct_jupyter_lab_url(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=printOutput)
+
+
+def _get_triton_dev_prefix() -> str:
+    return "ntap-dsutil-triton-"
+
+
+def _get_triton_deployment(server_name: str) -> str:
+    return _get_triton_dev_prefix() + server_name
+
+
+
+def _get_triton_dev_labels(server_name: str) -> dict:
+    labels = {
+        "app": _get_jupyter_lab_prefix() + server_name,
+        "created-by": "ntap-dsutil",
+        "entity-type": "triton_server",
+        "created-by-operation": "create-triton-server",
+        "triton-server-name": server_name
+    }
+    return labels
+
+
+def _get_triton_dev_service(server_name: str) -> str:
+    return _get_triton_dev_prefix() + server_name
+
+
+def _get_triton_dev_replica_service(server_name: str) -> str:
+    return _get_triton_dev_prefix() + server_name + "-replicas"
+
+
+def _get_triton_dev_label_selector() -> str:
+    labels = _get_triton_dev_labels(server_name="triton_temp")
+    return "created-by=" + labels["created-by"] + ",entity-type=" + labels["entity-type"]
+
+
+def _construct_triton_service(server_name: str, labels: dict, loadBalancerService: bool = False) -> client.V1Service:
+    if loadBalancerService:
+        service = client.V1Service(
+            metadata=client.V1ObjectMeta(
+                name=_get_triton_dev_service(server_name=server_name),
+                labels=labels
+            ),
+            spec=client.V1ServiceSpec(
+                type="LoadBalancer",
+                selector={
+                    "app": labels["app"]
+                },
+                ports=[
+                    client.V1ServicePort(
+                        name="http-inference-server",
+                        port=8000,
+                        target_port="http",
+                    ),
+                    client.V1ServicePort(
+                        name="grpc-inference-server",
+                        port=8001,
+                        target_port="grpc",
+                    ),
+                    client.V1ServicePort(
+                        name="metrics-inference-server",
+                        port=8002,
+                        target_port="metrics",
+                    )
+                ]
+            )
+        )
+    else:
+        service = client.V1Service(
+            metadata=client.V1ObjectMeta(
+                name=_get_triton_dev_service(server_name=server_name),
+                labels=labels
+            ),
+            spec=client.V1ServiceSpec(
+                type="NodePort",
+                selector={
+                    "app": labels["app"]
+                },
+                ports=[
+                    client.V1ServicePort(
+                        name="http-inference-server",
+                        port=8000,
+                        target_port="http",
+                    ),
+                    client.V1ServicePort(
+                        name="grpc-inference-server",
+                        port=8001,
+                        target_port="grpc",
+                    ),
+                    client.V1ServicePort(
+                        name="metrics-inference-server",
+                        port=8002,
+                        target_port="metrics",
+                    )
+                ]
+            )
+        )
+
+    return service
+
+
+def _construct_triton_pod_template(labels: dict, serverImage: str, modelPvcName: str = None, requestCpu: str = None,
+                                   requestMemory: str = None, requestNvidiaGpu: str = None,
+                                   allocateResource: str = None) -> client.V1PodTemplateSpec:
+    template = client.V1PodTemplateSpec(
+        metadata=client.V1ObjectMeta(
+            labels=labels
+        ),
+        spec=client.V1PodSpec(
+            volumes=list(),
+            containers=[
+                client.V1Container(
+                    name="triton-server",
+                    image=serverImage,
+                    args=["tritonserver", "--model-store=/models", "--model-control-mode=poll", "--repository-poll-secs=5"],
+                    ports=[
+                        client.V1ContainerPort(
+                            name="http",
+                            container_port=8000
+                            ),
+                        client.V1ContainerPort(
+                            name="grpc",
+                            container_port=8001
+                            ),
+                        client.V1ContainerPort(
+                            name="metrics",
+                            container_port=8002
+                            ),
+                    ],
+                    volume_mounts=[
+                        client.V1VolumeMount(
+                            name="model-repo",
+                            mount_path="/models"
+                        )
+                    ],
+                    liveness_probe ={
+                        "httpGet" : {
+                            "path" : "/v2/health/live",
+                            "port" : "http"
+                        }
+                    },
+                    readiness_probe ={
+                        "initialDelaySeconds" : 5,
+                        "periodSeconds" : 5,
+                        "httpGet" : {
+                            "path" : "/v2/health/ready",
+                            "port" : "http"
+                        }
+                    },
+                    resources={
+                        "limits": dict(),
+                        "requests": dict()
+                    }
+                )
+
+            ]
+
+        )
+
+    )
+
+    # Mount model repository PVC (StatefulSet pods instead mount the PVC that is created from the volume claim template)
+    if modelPvcName:
+        template.spec.volumes.append(
+            client.V1Volume(
+                name="model-repo",
+                persistent_volume_claim={
+                    "claimName": modelPvcName
+                }
+            )
+        )
+
+    # Apply resource requests/limits
+    if requestCpu:
+        template.spec.containers[0].resources["requests"]["cpu"] = requestCpu
+        template.spec.containers[0].resources["limits"]["cpu"] = requestCpu
+    if requestMemory:
+        template.spec.containers[0].resources["requests"]["memory"] = requestMemory
+        template.spec.containers[0].resources["limits"]["memory"] = requestMemory
+    if requestNvidiaGpu:
+        template.spec.containers[0].resources["requests"]["nvidia.com/gpu"] = requestNvidiaGpu
+        template.spec.containers[0].resources["limits"]["nvidia.com/gpu"] = requestNvidiaGpu
+    if allocateResource:
+        allocate = (allocateResource.partition('='))[0]
+        allocate_limit = allocateResource.split("=",1)[1]
+        template.spec.containers[0].resources["requests"][allocate] = allocate_limit
+        template.spec.containers[0].resources["limits"][allocate] = allocate_limit
+
+    return template
+
+
+def _construct_triton_deployment(server_name: str, labels: dict, modelPvcName: str, serverImage: str,
+                                 requestCpu: str = None, requestMemory: str = None, requestNvidiaGpu: str = None,
+                                 allocateResource: str = None, replicas: int = 1) -> client.V1Deployment:
+    deployment = client.V1Deployment(
+        metadata=client.V1ObjectMeta(
+            name=_get_triton_deployment(server_name=server_name),
+            labels=labels
+        ),
+        spec=client.V1DeploymentSpec(
+            replicas=replicas,
+            selector={
+                "matchLabels": {
+                    "app": labels["app"]
+                }
+            },
+            template=_construct_triton_pod_template(labels=labels, serverImage=serverImage, modelPvcName=modelPvcName,
+                                                    requestCpu=requestCpu, requestMemory=requestMemory,
+                                                    requestNvidiaGpu=requestNvidiaGpu, allocateResource=allocateResource)
+        )
+    )
+
+    return deployment
+
+
+def _construct_triton_stateful_set(server_name: str, labels: dict, modelSnapshotName: str, modelVolumeSize: str,
+                                   serverImage: str, storageClass: str = None, requestCpu: str = None,
+                                   requestMemory: str = None, requestNvidiaGpu: str = None,
+                                   allocateResource: str = None, replicas: int = 1) -> client.V1StatefulSet:
+    # Each replica mounts its own clone of the model repository VolumeSnapshot. The clones are deleted along with the
+    # replicas when the StatefulSet is scaled down or deleted.
+    statefulSet = client.V1StatefulSet(
+        metadata=client.V1ObjectMeta(
+            name=_get_triton_deployment(server_name=server_name),
+            labels=labels
+        ),
+        spec=client.V1StatefulSetSpec(
+            replicas=replicas,
+            service_name=_get_triton_dev_replica_service(server_name=server_name),
+            pod_management_policy="Parallel",
+            selector={
+                "matchLabels": {
+                    "app": labels["app"]
+                }
+            },
+            template=_construct_triton_pod_template(labels=labels, serverImage=serverImage, requestCpu=requestCpu,
+                                                    requestMemory=requestMemory, requestNvidiaGpu=requestNvidiaGpu,
+                                                    allocateResource=allocateResource),
+            volume_claim_templates=[
+                _construct_pvc(pvcName="model-repo", volumeSize=modelVolumeSize, storageClass=storageClass,
+                               pvcLabels=labels, sourceSnapshot=modelSnapshotName)
+            ],
+            persistent_volume_claim_retention_policy=client.V1StatefulSetPersistentVolumeClaimRetentionPolicy(
+                when_deleted="Delete",
+                when_scaled="Delete"
+            )
+        )
+    )
+
+    return statefulSet
+
+
+def _construct_triton_replica_service(server_name: str, labels: dict) -> client.V1Service:
+    # Headless service that gives each StatefulSet replica a stable DNS name
+    service = client.V1Service(
+        metadata=client.V1ObjectMeta(
+            name=_get_triton_dev_replica_service(server_name=server_name),
+            labels=labels
+        ),
+        spec=client.V1ServiceSpec(
+            cluster_ip="None",
+            selector={
+                "app": labels["app"]
+            },
+            ports=[
+                client.V1ServicePort(
+                    name="http-inference-server",
+                    port=8000,
+                    target_port="http",
+                ),
+                client.V1ServicePort(
+                    name="grpc-inference-server",
+                    port=8001,
+                    target_port="grpc",
+                ),
+                client.V1ServicePort(
+                    name="metrics-inference-server",
+                    port=8002,
+                    target_port="metrics",
+                )
+            ]
+        )
+    )
+
+    return service
+
+
+def _construct_triton_endpoints(serviceStatus, nodeIp: str = None, printOutput: bool = False) -> list:
+    # Check if service type is LoadBalancer
+    if serviceStatus.spec.type == "LoadBalancer":
+        try :
+            # retrieve IP (or host name)
+            loadBalancerIP = _retrieve_load_balancer_host(serviceStatus)
+            if not loadBalancerIP :
+                raise ServiceUnavailableError()
+
+            # retrieve ports
+            # set default port values
+            http_port = "8000"
+            grpc_port = "8001"
+            metrics_port = "8002"
+
+            # handle non-default port values
+            # note: the user currently has no way to set non-default port values, but we will likely want to add this in the future, so we should handle it.
+            for port in serviceStatus.spec.ports :
+                if port.target_port == "http" :
+                    http_port = port.port
+                if port.target_port == "grpc" :
+                    grpc_port = port.port
+                if port.target_port == "metrics" :
+                    metrics_port = port.port
+        except :
+            if printOutput :
+                print("Error: Kubernetes Service for workspace is not available.")
+            raise ServiceUnavailableError()
+
+        # Construct and return urls
+        http_uri = loadBalancerIP + ":" + str(http_port)
+        grpc_uri = loadBalancerIP + ":" + str(grpc_port)
+        metrics_uri = loadBalancerIP + ":" + str(metrics_port)
+
+        return [http_uri, grpc_uri, metrics_uri]
+    else:
+        # Retrieve access port
+        for port in serviceStatus.spec.ports :
+            if port.target_port == "http" :
+                http_port = port.node_port
+            if port.target_port == "grpc" :
+                grpc_port = port.node_port
+            if port.target_port == "metrics" :
+                metrics_port = port.node_port
+
+        # Construct and return urls
+        if not nodeIp:
+            nodeIp = "<IP address of Kubernetes node>"
+        http_uri = nodeIp + ":" + str(http_port)
+        grpc_uri = nodeIp + ":" + str(grpc_port)
+        metrics_uri = nodeIp + ":" + str(metrics_port)
+
+        return [http_uri, grpc_uri, metrics_uri]
+
+
+def _construct_triton_replica_endpoints(pod, server_name: str, namespace: str = "default",
+                                        statefulSet: bool = False) -> list:
+    # StatefulSet replicas are addressed by their stable DNS names; Deployment replicas by their pod IPs
+    if statefulSet:
+        host = pod.metadata.name + "." + _get_triton_dev_replica_service(server_name=server_name) + "." + namespace + ".svc"
+    else:
+        host = pod.status.pod_ip if pod.status else None
+        if not host:
+            raise ServiceUnavailableError()
+    return [host + ":8000", host + ":8001", host + ":8002"]
+
+
+def _list_triton_stateful_sets(namespace: str = "default", labelSelector: str = None,
+                               session: DataOpsSession = None) -> list:
+    # Servers whose replicas mount their own model repository clones are StatefulSets. Roles that predate them may not
+    # grant access to StatefulSets; such roles cannot have created any, so a 403 is treated as there being none.
+    try:
+        return _list_namespaced_objects(kind="statefulsets", namespace=namespace, labelSelector=labelSelector,
+                                        session=session)
+    except ApiException as err:
+        if err.status != 403:
+            raise
+        return list()
+
+
+def _construct_triton_servers_list(deployments: list, statefulSets: list, pods: list, services: list,
+                                   nodeIp: str = None, namespace: str = "default") -> list:
+    # Index Services by name and pods by the app label that the server selects them by
+    serviceIndex = {service.metadata.name: service for service in services}
+    podIndex = dict()
+    for pod in pods:
+        podIndex.setdefault((pod.metadata.labels or dict()).get("app"), list()).append(pod)
+
+    # Construct list of servers
+    serversList = list()
+    workloads = [(deployment, False) for deployment in deployments] + \
+                [(statefulSet, True) for statefulSet in statefulSets]
+    for workload, statefulSet in workloads:
+        # Construct dict containing server details
+        serverDict = dict()
+
+        # Retrieve server name
+        server_name = workload.metadata.labels["triton-server-name"]
+        serverDict["Server Name"] = server_name
+
+        # Determine readiness status
+        if _is_triton_server_ready(workload):
+            serverDict["Status"] = "Ready"
+        else:
+            serverDict["Status"] = "Not Ready"
+        desiredReplicas = workload.spec.replicas if workload.spec.replicas is not None else 1
+        readyReplicas = workload.status.ready_replicas if workload.status and workload.status.ready_replicas else 0
+        serverDict["Replicas"] = str(readyReplicas) + "/" + str(desiredReplicas)
+        serverDict["Model Repository"] = "per-replica clones" if statefulSet else "shared"
+
+        # Retrieve service endpoints
+        try :
+            serviceStatus = serviceIndex[_get_triton_dev_service(server_name=server_name)]
+            endpoints = _construct_triton_endpoints(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=False)
+            serverDict["HTTP Endpoint"] = endpoints[0]
+            serverDict["gRPC Endpoint"] = endpoints[1]
+            serverDict["Metrics Endpoint"] = endpoints[2]
+        except (KeyError, ServiceUnavailableError) :
+            serverDict["HTTP Endpoint"] = "unavailable"
+            serverDict["gRPC Endpoint"] = "unavailable"
+            serverDict["Metrics Endpoint"] = "unavailable"
+
+        # Retrieve per-replica readiness, endpoints and model repository PVCs
+        replicasList = list()
+        selector = workload.spec.selector.match_labels or dict()
+        for pod in sorted(podIndex.get(selector.get("app"), list()), key=lambda pod: pod.metadata.name):
+            replicaDict = {"Replica": pod.metadata.name, "Status": "Ready" if _is_pod_ready(pod) else "Not Ready"}
+            try:
+                endpoints = _construct_triton_replica_endpoints(pod=pod, server_name=server_name, namespace=namespace,
+                                                                statefulSet=statefulSet)
+            except ServiceUnavailableError:
+                endpoints = ["unavailable"] * 3
+            replicaDict["HTTP Endpoint"] = endpoints[0]
+            replicaDict["gRPC Endpoint"] = endpoints[1]
+            replicaDict["Metrics Endpoint"] = endpoints[2]
+            replicaDict["Model PVC"] = ""
+            for volume in pod.spec.volumes or []:
+                if volume.name == "model-repo" and volume.persistent_volume_claim:
+                    replicaDict["Model PVC"] = volume.persistent_volume_claim.claim_name
+            replicasList.append(replicaDict)
+        serverDict["Replica Details"] = replicasList
+
+        # Append dict to list of servers
+        serversList.append(serverDict)
+
+    return serversList
+
+
+_OUTPUT_FORMATS = ("table", "json", "ndjson", "csv")
+_LABEL_VALUE_PATTERN = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
+
+
+def _validate_output_format(outputFormat: str):
+    if outputFormat not in _OUTPUT_FORMATS:
+        raise ValueError("Unsupported output format: " + str(outputFormat) + ". Supported formats: " +
+                         ", ".join(_OUTPUT_FORMATS) + ".")
+
+
+def _validate_dataset_version(datasetVersion: str):
+    # Dataset versions are stored in the 'dataset-version' label, so they must be valid label values
+    if datasetVersion and (len(datasetVersion) > 63 or not _LABEL_VALUE_PATTERN.match(datasetVersion)):
+        raise ValueError("Invalid dataset version: '" + datasetVersion + "'. A dataset version must be at most 63 " +
+                         "characters, must consist of alphanumeric characters, '-', '_' or '.', and must start and " +
+                         "end with an alphanumeric character.")
+
+
+def _print_table(rowsList: list, outputFormat: str = "table"):
+    if outputFormat != "table":
+        for _ in _print_rows(rowsList, outputFormat=outputFormat):
+            pass
+        return
+
+    # tabulate is imported on first use rather than at module import time, so that commands that do not print a table
+    # (e.g. snapshot commands) are not slowed down by importing it
+    from tabulate import tabulate
+    print(tabulate(rowsList, headers="keys", disable_numparse=True))
+
+
+def _print_triton_servers_list(serversList: list, outputFormat: str = "table"):
+    # Machine-readable formats include per-replica details in each server
+    if outputFormat != "table":
+        _print_table(serversList, outputFormat=outputFormat)
+        return
+
+    # Print servers, without per-replica details
+    _print_table([{key: value for key, value in serverDict.items() if key != "Replica Details"}
+                  for serverDict in serversList])
+
+    # Print per-replica details for horizontally scaled servers
+    replicasList = [dict({"Server Name": serverDict["Server Name"]}, **replicaDict) for serverDict in serversList
+                    if len(serverDict["Replica Details"]) > 1 or serverDict["Model Repository"] != "shared"
+                    for replicaDict in serverDict["Replica Details"]]
+    if replicasList:
+        print("\nReplicas:")
+        _print_table(replicasList)
+
+
+def _print_table_rows(rows, bufferSize: int = 100):
+    # Print rows as a table while passing them through, so that the table is printed as results are retrieved rather
+    # than once every row has been assembled. Columns are sized to fit the first bufferSize rows (callers pass the
+    # page size, so that the header is printed as soon as the first page has been retrieved); a longer value in a
+    # later row shifts the remainder of its line. Columns that hold lists (e.g. replica details) are not printed.
+    rows = iter(rows)
+    firstRows = list(itertools.islice(rows, bufferSize))
+    if not firstRows:
+        return
+    columns = [column for column, value in firstRows[0].items() if not isinstance(value, list)]
+    widths = {column: max([len(column)] + [len(str(row.get(column, ""))) for row in firstRows]) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns).rstrip())
+    print("  ".join("-" * widths[column] for column in columns), flush=True)
+    for row in itertools.chain(firstRows, rows):
+        print("  ".join(str(row.get(column, "")).ljust(widths[column]) for column in columns).rstrip(), flush=True)
+        yield row
+
+
+def _print_rows(rows, outputFormat: str = "table", bufferSize: int = 100):
+    # Print rows in the requested output format while passing them through, so that each row is printed as soon as it
+    # has been retrieved. JSON output is a single array that is closed after the last row. CSV columns are taken from
+    # the first row, and lists (e.g. replica details) are written as JSON.
+    _validate_output_format(outputFormat)
+    if outputFormat == "table":
+        yield from _print_table_rows(rows, bufferSize=bufferSize)
+    elif outputFormat == "ndjson":
+        for row in rows:
+            print(json.dumps(row, default=str), flush=True)
+            yield row
+    elif outputFormat == "json":
+        separator = "["
+        for row in rows:
+            print(separator + "\n  " + json.dumps(row, default=str), end="", flush=True)
+            separator = ","
+            yield row
+        print("[]" if separator == "[" else "\n]", flush=True)
+    elif outputFormat == "csv":
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(sys.stdout, fieldnames=list(row.keys()), extrasaction="ignore",
+                                        lineterminator="\n")
+                writer.writeheader()
+            writer.writerow({key: json.dumps(value, default=str) if isinstance(value, (list, dict)) else value
+                             for key, value in row.items()})
+            sys.stdout.flush()
+            yield row
+
+
+def _print_triton_servers_rows(serverRows, bufferSize: int = 100, outputFormat: str = "table"):
+    # Machine-readable formats include per-replica details in each server
+    if outputFormat != "table":
+        yield from _print_rows(serverRows, outputFormat=outputFormat, bufferSize=bufferSize)
+        return
+
+    # Print servers as they are retrieved, followed by per-replica details for horizontally scaled servers
+    replicasList = list()
+    for serverDict in _print_table_rows(serverRows, bufferSize=bufferSize):
+        if len(serverDict["Replica Details"]) > 1 or serverDict["Model Repository"] != "shared":
+            replicasList.extend(dict({"Server Name": serverDict["Server Name"]}, **replicaDict)
+                                for replicaDict in serverDict["Replica Details"])
+        yield serverDict
+    if replicasList:
+        print("\nReplicas:")
+        _print_table(replicasList)
+
+
+def _retrieve_triton_endpoints(server_name: str, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> list:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    try:
+        serviceStatus = _read_namespaced_object(kind="services", namespace=namespace,
+                                                name=_get_triton_dev_service(server_name=server_name), session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve node IP for NodePort services
+    nodeIp = None
+    if serviceStatus.spec.type != "LoadBalancer":
+        nodeIp = _retrieve_node_ip(session=session)
+
+    return _construct_triton_endpoints(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=printOutput)
+
+
+def _retrieve_jupyter_lab_workspace_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve workspace name
+    try:
+        pvc = _read_namespaced_object(kind="persistentvolumeclaims", name=pvcName, namespace=namespace, session=session)
+        workspaceName = pvc.metadata.labels["jupyterlab-workspace-name"]
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    return workspaceName
+
+
+def _retrieve_size_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve size
+    try:
+        pvc = _read_namespaced_object(kind="persistentvolumeclaims", name=pvcName, namespace=namespace, session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    pvcSize = pvc.status.capacity["storage"]
+
+    return pvcSize
+
+
+def _retrieve_source_volume_details_for_volume_snapshot(snapshotName: str, namespace: str = "default",
+                                                 printOutput: bool = False, session: DataOpsSession = None) -> (str, str):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve source PVC and restoreSize
+    try:
+        volumeSnapshot = _read_namespaced_object(kind="volumesnapshots", name=snapshotName, namespace=namespace,
+                                                 session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    sourcePvcName = volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"]
+    restoreSize = volumeSnapshot["status"]["restoreSize"]
+
+    return sourcePvcName, restoreSize
+
+
+def _retrieve_storage_class_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve StorageClass
+    try:
+        pvc = _read_namespaced_object(kind="persistentvolumeclaims", name=pvcName, namespace=namespace, session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    storageClass = pvc.spec.storage_class_name
+
+    return storageClass
+
+
+def _retrieve_pvc_labels_index(pvcName: str = None, namespace: str = "default", printOutput: bool = False,
+                               session: DataOpsSession = None) -> dict:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Retrieve PVCs (only the named PVC if specified)
+    try:
+        if pvcName:
+            try:
+                pvcs = [_read_namespaced_object(kind="persistentvolumeclaims", name=pvcName, namespace=namespace,
+                                                session=session)]
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+                pvcs = []
+        else:
+            pvcs = _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace, session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Map PVC name to PVC labels
+    return {pvc.metadata.name: (pvc.metadata.labels or dict()) for pvc in pvcs}
+
+
+def _construct_volumes_list(pvcList: list, volumeSnapshotNames: set = None, pvcNames: set = None) -> list:
+    # Index PVC names so that clone sources can be checked without additional API calls
+    if pvcNames is None:
+        pvcNames = {pvc.metadata.name for pvc in pvcList}
+    if volumeSnapshotNames is None:
+        volumeSnapshotNames = set()
+
+    # Construct list of volumes
+    volumesList = list()
+    for pvc in pvcList:
+        # Construct dict containing volume details
+        volumeDict = dict()
+        volumeDict["PersistentVolumeClaim (PVC) Name"] = pvc.metadata.name
+        volumeDict["Status"] = pvc.status.phase
+        try:
+            volumeDict["Size"] = pvc.status.capacity["storage"]
+        except:
+            volumeDict["Size"] = ""
+        try:
+            volumeDict["StorageClass"] = pvc.spec.storage_class_name
+        except:
+            volumeDict["StorageClass"] = ""
+        try:
+            if (pvc.metadata.labels["created-by-operation"] == "clone-volume") or (
+                    pvc.metadata.labels["created-by-operation"] == "clone-jupyterlab"):
+                volumeDict["Clone"] = "Yes"
+                volumeDict["Source PVC"] = pvc.metadata.labels["source-pvc"]
+                if volumeDict["Source PVC"] not in pvcNames:  # Confirm that source PVC still exists
+                    volumeDict["Source PVC"] = "*deleted*"
+                try:
+                    volumeDict["Source VolumeSnapshot"] = pvc.spec.data_source.name
+                    if volumeDict["Source VolumeSnapshot"] not in volumeSnapshotNames:  # Confirm that VolumeSnapshot still exists
+                        volumeDict["Source VolumeSnapshot"] = "*deleted*"
+                except:
+                    volumeDict["Source VolumeSnapshot"] = "n/a"
+            else:
+                volumeDict["Clone"] = "No"
+                volumeDict["Source PVC"] = ""
+                volumeDict["Source VolumeSnapshot"] = ""
+        except:
+            volumeDict["Clone"] = "No"
+            volumeDict["Source PVC"] = ""
+            volumeDict["Source VolumeSnapshot"] = ""
+
+        # Append dict to list of volumes
+        volumesList.append(volumeDict)
+
+    return volumesList
+
+
+def _construct_volume_snapshots_list(volumeSnapshotList: list, pvcLabels: dict, pvcName: str = None,
+                                    jupyterLabWorkspacesOnly: bool = False) -> list:
+    # Construct list of snapshots
+    snapshotsList = list()
+    for volumeSnapshot in volumeSnapshotList:
+        # Retrieve source PVC for snapshot
+        try :
+            source_pvc_name = volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"]
+        except :
+            source_pvc_name = None
+        # Construct dict containing snapshot details
+        if (not pvcName) or (source_pvc_name == pvcName):
+            snapshotDict = dict()
+            snapshotDict["VolumeSnapshot Name"] = volumeSnapshot["metadata"]["name"]
+            snapshotDict["Ready to Use"] = volumeSnapshot["status"]["readyToUse"]
+            try:
+                snapshotDict["Creation Time"] = volumeSnapshot["status"]["creationTime"]
+            except:
+                snapshotDict["Creation Time"] = ""
+            if source_pvc_name in pvcLabels:
+                snapshotDict["Source PersistentVolumeClaim (PVC)"] = source_pvc_name
+                snapshotDict["Source JupyterLab workspace"] = pvcLabels[source_pvc_name].get("jupyterlab-workspace-name", "")
+                jupyterLabWorkspace = bool(snapshotDict["Source JupyterLab workspace"])
+            elif source_pvc_name :
+                snapshotDict["Source PersistentVolumeClaim (PVC)"] = "*deleted*"
+                snapshotDict["Source JupyterLab workspace"] = ""
+                jupyterLabWorkspace = False
+            else :
+                snapshotDict["Source PersistentVolumeClaim (PVC)"] = ""
+                snapshotDict["Source JupyterLab workspace"] = ""
+                jupyterLabWorkspace = False
+            try:
+                snapshotDict["VolumeSnapshotClass"] = volumeSnapshot["spec"]["volumeSnapshotClassName"]
+            except:
+                snapshotDict["VolumeSnapshotClass"] = ""
+            snapshotDict["Dataset Version"] = (volumeSnapshot["metadata"].get("labels") or dict()).get("dataset-version", "")
+
+            # Append dict to list of snapshots
+            if jupyterLabWorkspacesOnly:
+                if jupyterLabWorkspace:
+                    snapshotsList.append(snapshotDict)
+            else:
+                snapshotsList.append(snapshotDict)
+
+    return snapshotsList
+
 
+def _retrieve_volume_snapshot_names(namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None) -> set:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
-def _load_kube_config2(print_output: bool = False):
+    # Retrieve names of all VolumeSnapshots in namespace
     try:
-        config.load_incluster_config()
-        configured = True
-    except:
-        configured = False
-    if not configured:
-        try:
-            config.load_kube_config()
-        except:
-            if print_output:
-                _print_invalid_config_error()
-            raise InvalidConfigError()
-        
-        
-def _astra_not_supported_message(print_output: bool = False) :
-    error_text = "Error: Astra Control functionality within the DataOps Toolkit is no longer supported. Please use the Astra SDK and/or toolkit. For details, visit https://github.com/NetApp/netapp-astra-toolkits."
-    if print_output :
-        print(error_text)
-    raise APIConnectionError(error_text)
+        volumeSnapshotList = _list_namespaced_objects(kind="volumesnapshots", namespace=namespace, session=session)
+    except ApiException as err:
+        # VolumeSnapshot CRD is not installed (e.g. BeeGFS-only clusters)
+        if err.status == 404:
+            return set()
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
 
+    return {volumeSnapshot["metadata"]["name"] for volumeSnapshot in volumeSnapshotList}
 
-def _print_invalid_config_error():
-    print(
-        "Error: Missing or invalid kubeconfig file. The NetApp DataOps Toolkit for Kubernetes requires that a valid kubeconfig file be present on the host, located at $HOME/.kube or at another path specified by the KUBECONFIG environment variable.")
 
+def _iter_jupyter_labs(namespace: str = "default", pageSize: int = 500, printOutput: bool = False,
+                       session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
-def _retrieve_image_for_jupyter_lab_deployment(workspaceName: str, namespace: str = "default",
-                                         printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+    # Index the Deployments and VolumeSnapshots in the namespace by name only once a page contains a clone, so that
+    # clone sources are resolved with one paged list per kind rather than one read per clone
+    deploymentNames = _LazyObjectIndex(kind="deployments", namespace=namespace, pageSize=pageSize, session=session)
+    volumeSnapshotNames = _LazyObjectIndex(kind="volumesnapshots", namespace=namespace, pageSize=pageSize,
+                                           session=session)
 
-    # Retrieve image
     try:
-        api = client.AppsV1Api()
-        deployment = api.read_namespaced_deployment(namespace=namespace,
-                                                    name=_get_jupyter_lab_deployment(workspaceName=workspaceName))
+        labelSelector = _get_jupyter_lab_label_selector()
+        for deployments in _iter_namespaced_object_pages(kind="deployments", namespace=namespace,
+                                                         labelSelector=labelSelector, pageSize=pageSize,
+                                                         session=session):
+            # Retrieve the PVCs and Services of the workspaces in this page
+            pageSelector = _get_page_label_selector(labelSelector=labelSelector, key="jupyterlab-workspace-name",
+                                                    values=[deployment.metadata.labels["jupyterlab-workspace-name"]
+                                                            for deployment in deployments], session=session)
+            pvcs = _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace,
+                                            labelSelector=pageSelector, session=session)
+            services = _list_namespaced_objects(kind="services", namespace=namespace, labelSelector=pageSelector,
+                                                session=session)
+
+            # Retrieve node IP (only needed for NodePort services)
+            nodeIp = None
+            if any(service.spec.type != "LoadBalancer" for service in services):
+                nodeIp = _retrieve_node_ip(session=session)
+
+            yield from _construct_jupyter_labs_list(deployments=deployments, pvcs=pvcs, services=services,
+                                                    nodeIp=nodeIp, volumeSnapshotNames=volumeSnapshotNames,
+                                                    deploymentNames=deploymentNames)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
-    return deployment.spec.template.spec.containers[0].image
-
 
-def _retrieve_jupyter_lab_url(workspaceName: str, namespace: str = "default", printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+def _iter_triton_servers(namespace: str = "default", pageSize: int = 500, printOutput: bool = False,
+                         session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
     try:
-        api = client.CoreV1Api()
-        serviceStatus = api.read_namespaced_service(namespace=namespace,
-                                                    name=_get_jupyter_lab_service(workspaceName=workspaceName))
-
-        # Check if service type is LoadBalancer
-        if serviceStatus.spec.type == "LoadBalancer":
-            # Construct and return url
-            try :
-                loadBalancerIP = serviceStatus.status.load_balancer.ingress[0].ip
-            except :
-                if printOutput :
-                    print("Error: Kubernetes Service for workspace is not available.")
-                raise ServiceUnavailableError()
-            return "http://" + loadBalancerIP
-        else:
-            # Retrieve access port
-            port = serviceStatus.spec.ports[0].node_port
-
-            # Retrieve node IP (random node)
-            try:
-                api = client.CoreV1Api()
-                nodes = api.list_node()
-                ip = nodes.items[0].status.addresses[0].address
-            except:
-                ip = "<IP address of Kubernetes node>"
-                pass
-            # Construct and return url
-            return "http://" + ip + ":" + str(port)
+        labelSelector = _get_triton_dev_label_selector()
+        for kind in ("deployments", "statefulsets"):
+            workloadPages = _iter_namespaced_object_pages(kind=kind, namespace=namespace, labelSelector=labelSelector,
+                                                          pageSize=pageSize, session=session)
+            if kind == "statefulsets":
+                # See _list_triton_stateful_sets()
+                workloadPages = _skip_forbidden_pages(workloadPages)
+            for workloads in workloadPages:
+                # Retrieve the pods and Services of the servers in this page
+                pageSelector = _get_page_label_selector(labelSelector=labelSelector, key="triton-server-name",
+                                                        values=[workload.metadata.labels["triton-server-name"]
+                                                                for workload in workloads], session=session)
+                pods = _list_namespaced_objects(kind="pods", namespace=namespace, labelSelector=pageSelector,
+                                                session=session)
+                services = _list_namespaced_objects(kind="services", namespace=namespace, labelSelector=pageSelector,
+                                                    session=session)
+
+                # Retrieve node IP (only needed for NodePort services)
+                nodeIp = None
+                if any(service.spec.type == "NodePort" for service in services):
+                    nodeIp = _retrieve_node_ip(session=session)
+
+                yield from _construct_triton_servers_list(deployments=workloads if kind == "deployments" else [],
+                                                          statefulSets=workloads if kind == "statefulsets" else [],
+                                                          pods=pods, services=services, nodeIp=nodeIp,
+                                                          namespace=namespace)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
 
+def _iter_volumes(namespace: str = "default", pageSize: int = 500, printOutput: bool = False,
+                  session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
-def _get_triton_dev_prefix() -> str:
-    return "ntap-dsutil-triton-"
-
-
-def _get_triton_deployment(server_name: str) -> str:
-    return _get_triton_dev_prefix() + server_name
-
-
-
-def _get_triton_dev_labels(server_name: str) -> dict:
-    labels = {
-        "app": _get_jupyter_lab_prefix() + server_name,
-        "created-by": "ntap-dsutil",
-        "entity-type": "triton_server",
-        "created-by-operation": "create-triton-server",
-        "triton-server-name": server_name
-    }
-    return labels
-
-
-def _get_triton_dev_service(server_name: str) -> str:
-    return _get_triton_dev_prefix() + server_name
-
-
-def _get_triton_dev_label_selector() -> str:
-    labels = _get_triton_dev_labels(server_name="triton_temp")
-    return "created-by=" + labels["created-by"] + ",entity-type=" + labels["entity-type"]
-
+    # Index the PVCs and VolumeSnapshots in the namespace by name only once a page contains a clone, so that clone
+    # sources are resolved with one paged list per kind rather than one read per clone
+    pvcNames = _LazyObjectIndex(kind="persistentvolumeclaims", namespace=namespace, pageSize=pageSize,
+                                session=session)
+    volumeSnapshotNames = _LazyObjectIndex(kind="volumesnapshots", namespace=namespace, pageSize=pageSize,
+                                           session=session)
 
-def _retrieve_triton_endpoints(server_name: str, namespace: str = "default", printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
     try:
-        _load_kube_config()
-    except:
+        for pvcList in _iter_namespaced_object_pages(kind="persistentvolumeclaims", namespace=namespace,
+                                                     pageSize=pageSize, session=session):
+            yield from _construct_volumes_list(pvcList=pvcList, volumeSnapshotNames=volumeSnapshotNames,
+                                               pvcNames=pvcNames)
+    except ApiException as err:
         if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
-
-    try:
-        api = client.CoreV1Api()
-        serviceStatus = api.read_namespaced_service(namespace=namespace,
-                                                    name=_get_triton_dev_service(server_name=server_name))
-
-        # Check if service type is LoadBalancer
-        if serviceStatus.spec.type == "LoadBalancer":
-            try :
-                # retrieve IP
-                loadBalancerIP = serviceStatus.status.load_balancer.ingress[0].ip
-
-                # retrieve ports
-                # set default port values
-                http_port = "8000"
-                grpc_port = "8001"
-                metrics_port = "8002"
-
-                # handle non-default port values
-                # note: the user currently has no way to set non-default port values, but we will likely want to add this in the future, so we should handle it.
-                for port in serviceStatus.spec.ports :
-                    if port.target_port == "http" :
-                        http_port = port.port
-                    if port.target_port == "grpc" :
-                        grpc_port = port.port
-                    if port.target_port == "metrics" :
-                        metrics_port = port.port
-            except :
-                if printOutput :
-                    print("Error: Kubernetes Service for workspace is not available.")
-                raise ServiceUnavailableError()
-
-            # Construct and return urls
-            http_uri = loadBalancerIP + ":" + str(http_port)
-            grpc_uri = loadBalancerIP + ":" + str(grpc_port)
-            metrics_uri = loadBalancerIP + ":" + str(metrics_port)
-
-            return [http_uri, grpc_uri, metrics_uri]
-        else:
-            # Retrieve access port
-            for port in serviceStatus.spec.ports :
-                if port.target_port == "http" :
-                    http_port = port.node_port
-                if port.target_port == "grpc" :
-                    grpc_port = port.node_port
-                if port.target_port == "metrics" :
-                    metrics_port = port.node_port
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
 
-            # Retrieve node IP (random node)
-            try:
-                api = client.CoreV1Api()
-                nodes = api.list_node()
-                ip = nodes.items[0].status.addresses[0].address
-            except:
-                ip = "<IP address of Kubernetes node>"
-                pass
 
-            # Construct and return urls
-            http_uri = ip + ":" + str(http_port)
-            grpc_uri = ip + ":" + str(grpc_port)
-            metrics_uri = ip + ":" + str(metrics_port)
+def _iter_volume_snapshots(pvcName: str = None, jupyterLabWorkspacesOnly: bool = False, datasetVersion: str = None,
+                           namespace: str = "default", pageSize: int = 500, printOutput: bool = False,
+                           session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
-            return [http_uri, grpc_uri, metrics_uri]
+    # Index the labels of the PVCs in the namespace by name only once a page references a source PVC, with one paged
+    # list rather than one read per source PVC
+    pvcLabels = _LazyObjectIndex(kind="persistentvolumeclaims", namespace=namespace,
+                                 valueFunc=lambda pvc: pvc.metadata.labels or dict(), pageSize=pageSize,
+                                 session=session)
 
+    try:
+        for labelSelector in _get_volume_snapshot_label_selectors(pvcName=pvcName,
+                                                                  jupyterLabWorkspacesOnly=jupyterLabWorkspacesOnly,
+                                                                  datasetVersion=datasetVersion):
+            for volumeSnapshotList in _iter_namespaced_object_pages(kind="volumesnapshots", namespace=namespace,
+                                                                    labelSelector=labelSelector, pageSize=pageSize,
+                                                                    session=session):
+                yield from _construct_volume_snapshots_list(volumeSnapshotList=volumeSnapshotList,
+                                                            pvcLabels=pvcLabels, pvcName=pvcName,
+                                                            jupyterLabWorkspacesOnly=jupyterLabWorkspacesOnly)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
 
-def _retrieve_jupyter_lab_workspace_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
+def _list_volume_snapshot_names_by_namespace(namespaces: list, session: DataOpsSession = None) -> dict:
+    # Retrieve the names of the VolumeSnapshots in several namespaces, grouped by namespace
     try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+        volumeSnapshotsByNamespace = _list_objects_by_namespace(kind="volumesnapshots", namespaces=namespaces,
+                                                                session=session)
+    except ApiException as err:
+        # VolumeSnapshot CRD is not installed (e.g. BeeGFS-only clusters)
+        if err.status == 404:
+            return dict()
+        raise
+    return {namespace: {volumeSnapshot["metadata"]["name"] for volumeSnapshot in volumeSnapshots}
+            for namespace, volumeSnapshots in volumeSnapshotsByNamespace.items()}
 
-    # Retrieve workspace name
+
+def _list_jupyter_labs_in_namespaces(namespaces: list = None, printOutput: bool = False,
+                                     session: DataOpsSession = None) -> list:
+    # Retrieve workspace Deployments, and the PVCs and Services of the namespaces that contain workspaces
     try:
-        api = client.CoreV1Api()
-        pvc = api.read_namespaced_persistent_volume_claim(name=pvcName, namespace=namespace)
-        workspaceName = pvc.metadata.labels["jupyterlab-workspace-name"]
+        labelSelector = _get_jupyter_lab_label_selector()
+        deploymentsByNamespace = _list_objects_by_namespace(kind="deployments", namespaces=namespaces,
+                                                            labelSelector=labelSelector, session=session)
+        workspaceNamespaces = sorted(namespace for namespace, deployments in deploymentsByNamespace.items() if deployments)
+        pvcsByNamespace = _list_objects_by_namespace(kind="persistentvolumeclaims", namespaces=workspaceNamespaces,
+                                                     labelSelector=labelSelector, session=session)
+        servicesByNamespace = _list_objects_by_namespace(kind="services", namespaces=workspaceNamespaces,
+                                                         labelSelector=labelSelector, session=session)
+
+        # Retrieve VolumeSnapshot names (only needed for namespaces that contain clones)
+        cloneNamespaces = sorted(namespace for namespace, pvcs in pvcsByNamespace.items()
+                                 if any(pvc.spec.data_source for pvc in pvcs))
+        volumeSnapshotNames = _list_volume_snapshot_names_by_namespace(namespaces=cloneNamespaces, session=session)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
-    return workspaceName
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type != "LoadBalancer" for services in servicesByNamespace.values() for service in services):
+        nodeIp = _retrieve_node_ip(session=session)
 
+    # Construct list of workspaces, ordered by namespace
+    workspacesList = list()
+    for namespace in workspaceNamespaces:
+        workspacesList.extend(dict({"Namespace": namespace}, **workspaceDict) for workspaceDict in
+                              _construct_jupyter_labs_list(deployments=deploymentsByNamespace[namespace],
+                                                           pvcs=pvcsByNamespace.get(namespace, list()),
+                                                           services=servicesByNamespace.get(namespace, list()),
+                                                           nodeIp=nodeIp,
+                                                           volumeSnapshotNames=volumeSnapshotNames.get(namespace)))
+    return workspacesList
 
-def _retrieve_size_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
 
-    # Retrieve size
+def _list_triton_servers_in_namespaces(namespaces: list = None, printOutput: bool = False,
+                                       session: DataOpsSession = None) -> list:
+    # Retrieve server Deployments and StatefulSets, and the pods and Services of the namespaces that contain servers
     try:
-        api = client.CoreV1Api()
-        pvc = api.read_namespaced_persistent_volume_claim(name=pvcName, namespace=namespace)
+        labelSelector = _get_triton_dev_label_selector()
+        deploymentsByNamespace = _list_objects_by_namespace(kind="deployments", namespaces=namespaces,
+                                                            labelSelector=labelSelector, session=session)
+        statefulSetsByNamespace = _list_objects_by_namespace(kind="statefulsets", namespaces=namespaces,
+                                                             labelSelector=labelSelector, session=session)
+        serverNamespaces = sorted({namespace for objectsByNamespace in (deploymentsByNamespace, statefulSetsByNamespace)
+                                   for namespace, workloads in objectsByNamespace.items() if workloads})
+        podsByNamespace = _list_objects_by_namespace(kind="pods", namespaces=serverNamespaces,
+                                                     labelSelector=labelSelector, session=session)
+        servicesByNamespace = _list_objects_by_namespace(kind="services", namespaces=serverNamespaces,
+                                                         labelSelector=labelSelector, session=session)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
-    pvcSize = pvc.status.capacity["storage"]
 
-    return pvcSize
-
-
-def _retrieve_source_volume_details_for_volume_snapshot(snapshotName: str, namespace: str = "default",
-                                                 printOutput: bool = False) -> (str, str):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
-
-    # Retrieve source PVC and restoreSize
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type == "NodePort" for services in servicesByNamespace.values() for service in services):
+        nodeIp = _retrieve_node_ip(session=session)
+
+    # Construct list of servers, ordered by namespace
+    serversList = list()
+    for namespace in serverNamespaces:
+        serversList.extend(dict({"Namespace": namespace}, **serverDict) for serverDict in
+                           _construct_triton_servers_list(deployments=deploymentsByNamespace.get(namespace, list()),
+                                                          statefulSets=statefulSetsByNamespace.get(namespace, list()),
+                                                          pods=podsByNamespace.get(namespace, list()),
+                                                          services=servicesByNamespace.get(namespace, list()),
+                                                          nodeIp=nodeIp, namespace=namespace))
+    return serversList
+
+
+def _list_volumes_in_namespaces(namespaces: list = None, printOutput: bool = False,
+                                session: DataOpsSession = None) -> list:
+    # Retrieve PVCs, and the VolumeSnapshot names of the namespaces that contain clones
     try:
-        api = client.CustomObjectsApi()
-        volumeSnapshot = api.get_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                                          namespace=namespace, name=snapshotName,
-                                                          plural="volumesnapshots")
+        pvcsByNamespace = _list_objects_by_namespace(kind="persistentvolumeclaims", namespaces=namespaces,
+                                                     session=session)
+        cloneNamespaces = sorted(namespace for namespace, pvcs in pvcsByNamespace.items()
+                                 if any(pvc.spec.data_source for pvc in pvcs))
+        volumeSnapshotNames = _list_volume_snapshot_names_by_namespace(namespaces=cloneNamespaces, session=session)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
-    sourcePvcName = volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"]
-    restoreSize = volumeSnapshot["status"]["restoreSize"]
-
-    return sourcePvcName, restoreSize
 
+    # Construct list of volumes, ordered by namespace
+    volumesList = list()
+    for namespace in sorted(pvcsByNamespace):
+        volumesList.extend(dict({"Namespace": namespace}, **volumeDict) for volumeDict in
+                           _construct_volumes_list(pvcList=pvcsByNamespace[namespace],
+                                                   volumeSnapshotNames=volumeSnapshotNames.get(namespace)))
+    return volumesList
 
-def _retrieve_storage_class_for_pvc(pvcName: str, namespace: str = "default", printOutput: bool = False) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
 
-    # Retrieve StorageClass
+def _list_volume_snapshots_in_namespaces(pvcName: str = None, jupyterLabWorkspacesOnly: bool = False,
+                                         datasetVersion: str = None, namespaces: list = None,
+                                         printOutput: bool = False, session: DataOpsSession = None) -> list:
+    # Retrieve VolumeSnapshots (selected by label where possible), and the PVCs of the namespaces that contain them
     try:
-        api = client.CoreV1Api()
-        pvc = api.read_namespaced_persistent_volume_claim(name=pvcName, namespace=namespace)
+        volumeSnapshotsByNamespace = dict()
+        for labelSelector in _get_volume_snapshot_label_selectors(pvcName=pvcName,
+                                                                  jupyterLabWorkspacesOnly=jupyterLabWorkspacesOnly,
+                                                                  datasetVersion=datasetVersion):
+            for namespace, volumeSnapshots in _list_objects_by_namespace(kind="volumesnapshots", namespaces=namespaces,
+                                                                         labelSelector=labelSelector,
+                                                                         session=session).items():
+                volumeSnapshotsByNamespace.setdefault(namespace, list()).extend(volumeSnapshots)
+        snapshotNamespaces = sorted(namespace for namespace, volumeSnapshots in volumeSnapshotsByNamespace.items()
+                                    if volumeSnapshots)
+        pvcsByNamespace = _list_objects_by_namespace(kind="persistentvolumeclaims", namespaces=snapshotNamespaces,
+                                                     session=session)
     except ApiException as err:
         if printOutput:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
-    storageClass = pvc.spec.storage_class_name
 
-    return storageClass
+    # Construct list of snapshots, ordered by namespace
+    snapshotsList = list()
+    for namespace in snapshotNamespaces:
+        pvcLabels = {pvc.metadata.name: (pvc.metadata.labels or dict()) for pvc in pvcsByNamespace.get(namespace, list())}
+        snapshotsList.extend(dict({"Namespace": namespace}, **snapshotDict) for snapshotDict in
+                             _construct_volume_snapshots_list(volumeSnapshotList=volumeSnapshotsByNamespace[namespace],
+                                                              pvcLabels=pvcLabels, pvcName=pvcName,
+                                                              jupyterLabWorkspacesOnly=jupyterLabWorkspacesOnly))
+    return snapshotsList
 
 
-def _scale_jupyter_lab_deployment(workspaceName: str, numPods: int, namespace: str = "default", printOutput: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+def _scale_jupyter_lab_deployment(workspaceName: str, numPods: int, namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
     # Scale deployment
     deploymentName = _get_jupyter_lab_deployment(workspaceName=workspaceName)
@@ -430,7 +2102,7 @@ def _scale_jupyter_lab_deployment(workspaceName: str, numPods: int, namespace: s
         print("Scaling Deployment '" + _get_jupyter_lab_deployment(
             workspaceName=workspaceName) + "' in namespace '" + namespace + "' to " + str(numPods) + " pod(s).")
     try:
-        api = client.AppsV1Api()
+        api = session.apps_v1_api()
         api.patch_namespaced_deployment(name=deploymentName, namespace=namespace, body=deployment)
     except ApiException as err:
         if printOutput:
@@ -446,58 +2118,518 @@ def _get_snapshot_api_version() -> str:
     return "v1"
 
 
-def _wait_for_jupyter_lab_deployment_ready(workspaceName: str, namespace: str = "default", printOutput: bool = False):
-    # Retrieve kubeconfig
+def _wait_for_object(list_func, name: str, condition, namespace: str = "default", timeout: float = None, **list_kwargs):
+    """Wait for a single Kubernetes object to satisfy a condition.
+
+    The object is watched through the provided namespaced list function using a field selector that matches
+    only the named object. The current state is retrieved with a single list call and the watch is then
+    resumed from the resourceVersion of that list, so no state transitions are missed and the wait returns
+    as soon as the API server reports the change.
+
+    :param list_func: The namespaced list function for the object type, e.g. CoreV1Api().list_namespaced_persistent_volume_claim.
+    :param name: The name of the object to wait for.
+    :param condition: A callable that receives the object, or None if the object does not exist, and returns True
+        when the wait is complete.
+    :param namespace: The namespace that the object is located in.
+    :param timeout: The maximum number of seconds to wait. If None, wait indefinitely.
+    :param list_kwargs: Additional arguments to pass to the list function, e.g. group/version/plural for custom objects.
+    :return: The object that satisfied the condition, or None if the condition was satisfied by the object not existing.
+    :raises ApiException: When the Kubernetes API returns an error.
+    :raises WaitTimeoutError: When the condition is not satisfied before the timeout expires.
+    """
+    objects = _wait_for_objects(list_func=list_func, names=[name], condition=condition, namespace=namespace,
+                                timeout=timeout, field_selector="metadata.name=" + name, **list_kwargs)
+    return objects[name]
+
+
+def _wait_for_objects(list_func, names: list, condition, namespace: str = "default", timeout: float = None, on_satisfied=None, **list_kwargs) -> dict:
+    """Wait for a set of Kubernetes objects to all satisfy a condition using a single watch.
+
+    :param list_func: The namespaced list function for the object type.
+    :param names: The names of the objects to wait for.
+    :param condition: A callable that receives an object, or None if the object does not exist, and returns True
+        when the wait for that object is complete.
+    :param namespace: The namespace that the objects are located in.
+    :param timeout: The maximum number of seconds to wait. If None, wait indefinitely.
+    :param on_satisfied: An optional callable that receives the name of each object when it first satisfies the
+        condition, e.g. to report progress.
+    :param list_kwargs: Additional arguments to pass to the list function, e.g. a label_selector or field_selector
+        that narrows the watch, or group/version/plural for custom objects.
+    :return: A dictionary mapping each name to the object that satisfied the condition (None if the condition
+        was satisfied by the object not existing).
+    :raises ApiException: When the Kubernetes API returns an error.
+    :raises WaitTimeoutError: When the condition is not satisfied for every object before the timeout expires.
+    """
+    deadline = None if timeout is None else monotonic() + timeout
+    resource_version = None
+    states = dict()
+    pending = set(names)
+    satisfied = set()
+
+    def _report(name: str):
+        if on_satisfied is not None and name not in satisfied:
+            satisfied.add(name)
+            on_satisfied(name)
+
+    def _name(obj) -> str:
+        return obj["metadata"]["name"] if isinstance(obj, dict) else obj.metadata.name
+
+    while True:
+        # (Re)establish the current state of the objects
+        if resource_version is None:
+            objects = list_func(namespace=namespace, **list_kwargs)
+            if isinstance(objects, dict):
+                items = objects["items"]
+                resource_version = objects["metadata"]["resourceVersion"]
+            else:
+                items = objects.items
+                resource_version = objects.metadata.resource_version
+            states = {name: None for name in names}
+            for obj in items:
+                if _name(obj) in states:
+                    states[_name(obj)] = obj
+            pending = {name for name in names if not condition(states[name])}
+            for name in names:
+                if name not in pending:
+                    _report(name)
+            if not pending:
+                return states
+
+        # Determine how long the next watch may last
+        if deadline is None:
+            watch_seconds = 300
+        else:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError("Timed out waiting for '" + "', '".join(sorted(pending)) + "' in namespace '" + namespace + "'.")
+            watch_seconds = max(1, min(300, int(remaining + 0.999)))
+
+        # Watch for changes starting from the last observed resourceVersion
+        watcher = watch.Watch()
+        try:
+            for event in watcher.stream(list_func, namespace=namespace, resource_version=resource_version,
+                                        timeout_seconds=watch_seconds, allow_watch_bookmarks=True, **list_kwargs):
+                if not event or event["type"] == "BOOKMARK":
+                    continue
+                name = _name(event["object"])
+                if name not in states:
+                    continue
+                states[name] = None if event["type"] == "DELETED" else event["object"]
+                if condition(states[name]):
+                    pending.discard(name)
+                    _report(name)
+                else:
+                    pending.add(name)
+                if not pending:
+                    return states
+            if watcher.resource_version is not None:
+                resource_version = watcher.resource_version
+        except ApiException as err:
+            # resourceVersion too old; fall back to a fresh list
+            if err.status == 410:
+                resource_version = None
+            else:
+                raise
+        finally:
+            watcher.stop()
+
+
+def _is_deployment_ready(deployment) -> bool:
+    return deployment is not None and deployment.status is not None and deployment.status.ready_replicas == 1
+
+
+def _is_deployment_rollout_complete(deployment) -> bool:
+    # Unlike _is_deployment_ready(), only true once the pods of the latest pod template are ready and no others remain
+    return _is_deployment_ready(deployment) and \
+        (deployment.status.observed_generation or 0) >= (deployment.metadata.generation or 0) and \
+        deployment.status.updated_replicas == 1 and deployment.status.replicas == 1
+
+
+def _is_deployment_scaled_down(deployment) -> bool:
+    # True once the Deployment controller has seen the scale-down and no pods remain (so that their volumes are released)
+    return deployment is None or (deployment.status is not None and
+                                  (deployment.status.observed_generation or 0) >= (deployment.metadata.generation or 0) and
+                                  not deployment.status.replicas)
+
+
+def _is_triton_server_ready(workload) -> bool:
+    # Deployments and StatefulSets are ready once all of their desired replicas are ready
+    if workload is None or workload.status is None:
+        return False
+    replicas = workload.spec.replicas if workload.spec.replicas is not None else 1
+    return (workload.status.ready_replicas or 0) >= replicas
+
+
+def _is_pod_ready(pod) -> bool:
     try:
-        _load_kube_config()
-    except:
-        if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+        return any(condition.type == "Ready" and condition.status == "True" for condition in pod.status.conditions)
+    except (AttributeError, TypeError):
+        return False
+
+
+def _is_volume_snapshot_ready(volumeSnapshot: dict) -> bool:
+    try:
+        return volumeSnapshot["status"]["readyToUse"] == True
+    except (KeyError, TypeError):
+        return False
+
+
+def _wait_for_jupyter_lab_deployment_ready(workspaceName: str, namespace: str = "default", printOutput: bool = False,
+                                           timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
 
     # Wait for deployment to be ready
     if printOutput:
         print(
             "Waiting for Deployment '" + _get_jupyter_lab_deployment(workspaceName=workspaceName) + "' to reach Ready state.")
-    while True:
+    with tracing.span("deployment-ready", deployment=_get_jupyter_lab_deployment(workspaceName=workspaceName)):
         try:
-            api = client.AppsV1Api()
-            deploymentStatus = api.read_namespaced_deployment_status(namespace=namespace, name=_get_jupyter_lab_deployment(
-                workspaceName=workspaceName))
+            api = session.apps_v1_api()
+            _wait_for_object(list_func=api.list_namespaced_deployment, name=_get_jupyter_lab_deployment(workspaceName=workspaceName),
+                             namespace=namespace, condition=_is_deployment_ready, timeout=timeout)
         except ApiException as err:
             if printOutput:
                 print("Error: Kubernetes API Error: ", err)
             raise APIConnectionError(err)
-        if deploymentStatus.status.ready_replicas == 1:
-            break
-        sleep(5)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for Deployment to reach Ready state.")
+            raise
 
 
-def _wait_for_triton_dev_deployment(server_name: str, namespace: str = "default", printOutput: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
+def _wait_for_triton_dev_deployment(server_name: str, namespace: str = "default", printOutput: bool = False,
+                                    timeout: float = None, statefulSet: bool = False, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Wait for all replicas of the deployment (or StatefulSet) to be ready
+    kind = "StatefulSet" if statefulSet else "Deployment"
+    if printOutput:
+        print(
+            "Waiting for " + kind + " '" + _get_triton_deployment(server_name=server_name) + "' to reach Ready state.")
+    with tracing.span("deployment-ready", deployment=_get_triton_deployment(server_name=server_name)):
+        try:
+            api = session.apps_v1_api()
+            listFunc = api.list_namespaced_stateful_set if statefulSet else api.list_namespaced_deployment
+            _wait_for_object(list_func=listFunc, name=_get_triton_deployment(server_name=server_name),
+                             namespace=namespace, condition=_is_triton_server_ready, timeout=timeout)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for " + kind + " to reach Ready state.")
+            raise
+
+
+def _delete_volume_snapshots(snapshotNames: list, namespace: str = "default", printOutput: bool = False,
+                             maxWorkers: int = 8, rateLimit: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+    api = session.custom_objects_api()
+
+    # Optionally space out deletions so that no more than rateLimit deletions are issued per second
+    rateLimitLock = threading.Lock()
+    nextSlot = [monotonic()]
+
+    def _wait_for_slot():
+        with rateLimitLock:
+            slot = max(nextSlot[0], monotonic())
+            nextSlot[0] = slot + 1.0 / rateLimit
+        delay = slot - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+    def _delete_volume_snapshot(snapshotName: str) -> ApiException:
+        if rateLimit:
+            _wait_for_slot()
+        if printOutput:
+            print("Deleting VolumeSnapshot '" + snapshotName + "' in namespace '" + namespace + "'.")
+        try:
+            api.delete_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                                namespace=namespace, plural="volumesnapshots", name=snapshotName)
+        except ApiException as err:
+            # Ignore VolumeSnapshots that have already been deleted
+            if err.status != 404:
+                return err
+        return None
+
+    # Issue all deletions concurrently
+    errors = list()
+    if snapshotNames:
+        with tracing.span("snapshot-delete", snapshots=len(snapshotNames)), \
+                ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(snapshotNames)))) as executor:
+            errors = [err for err in executor.map(tracing.propagate(_delete_volume_snapshot), snapshotNames) if err is not None]
+    if errors:
         if printOutput:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+            print("Error: Kubernetes API Error: ", errors[0])
+        raise APIConnectionError(errors[0])
 
-    # Wait for deployment to be ready
+
+def _wait_for_volume_snapshots_deleted(snapshotNames: list, namespace: str = "default", printOutput: bool = False,
+                                       timeout: float = None, pvcName: str = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    if not snapshotNames:
+        return
+
+    def _report(snapshotName: str):
+        if printOutput:
+            print("VolumeSnapshot '" + snapshotName + "' successfully deleted.")
+
+    # Wait for all VolumeSnapshots to disappear using a single watch per label selector. If the VolumeSnapshots are
+    # all of one PVC, only its labeled VolumeSnapshots are watched, and then those that have not been labeled yet.
+    # The selectors are disjoint, so a VolumeSnapshot that is absent from one selector is waited for by the other,
+    # and VolumeSnapshots are only known to be deleted once the last selector has been waited for.
+    if printOutput:
+        print("Waiting for " + str(len(snapshotNames)) + " VolumeSnapshot(s) to be deleted.")
+    deadline = None if timeout is None else monotonic() + timeout
+    labelSelectors = _get_volume_snapshot_label_selectors(pvcName=pvcName)
+    with tracing.span("snapshot-deleted", snapshots=len(snapshotNames)):
+        try:
+            api = session.custom_objects_api()
+            for index, labelSelector in enumerate(labelSelectors):
+                _wait_for_objects(list_func=api.list_namespaced_custom_object, names=snapshotNames,
+                                  condition=lambda volumeSnapshot: volumeSnapshot is None, namespace=namespace,
+                                  timeout=None if deadline is None else max(deadline - monotonic(), 0),
+                                  on_satisfied=_report if index == len(labelSelectors) - 1 else None,
+                                  group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                  plural="volumesnapshots", label_selector=labelSelector)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for VolumeSnapshots to be deleted.")
+            raise
+
+
+def _run_steps(steps: dict, maxWorkers: int = 4) -> dict:
+    """Run a graph of dependent steps, starting each step as soon as the steps that it depends on have completed.
+
+    :param steps: A dictionary mapping each step name to a tuple containing the step function and a list of the
+        names of the steps that it depends on. Each step function receives a dictionary containing the return values
+        of the steps that have completed. Dependencies on steps that are not in the graph are ignored.
+    :param maxWorkers: The maximum number of steps to run at the same time.
+    :return: A dictionary mapping each step name to the return value of its step function.
+    :raises ValueError: When the steps contain a dependency cycle.
+    :raises Exception: The exception raised by the first step that fails. Steps that have not been started when a
+        step fails are not started, and steps that are running are allowed to finish.
+    """
+    results = dict()
+    pending = dict(steps)
+    running = dict()
+    error = None
+    with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(steps)))) as executor:
+        while pending or running:
+            # Start all steps whose dependencies have completed
+            if error is None:
+                for name, (stepFunc, dependencies) in list(pending.items()):
+                    if all(dependency in results or dependency not in steps for dependency in dependencies):
+                        running[executor.submit(tracing.propagate(stepFunc), dict(results))] = name
+                        del pending[name]
+                if not running:
+                    raise ValueError("Dependency cycle between steps: " + ", ".join(sorted(pending)))
+
+            # Wait for the next step to complete
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as err:
+                    if error is None:
+                        error = err
+            if error is not None:
+                pending.clear()
+
+    if error is not None:
+        raise error
+    return results
+
+
+def _hash_jupyter_lab_password(workspacePassword: str = None) -> str:
+    # The notebook package is slow to import and is only needed to create workspaces
+    from notebook import auth as jupyter_auth
+    with tracing.span("password-hash"):
+        if not workspacePassword:
+            print("Setting workspace password (this password will be required in order to access the workspace)...")
+            return jupyter_auth.passwd()
+        return jupyter_auth.passwd(workspacePassword)
+
+
+def _create_pvc(pvc: client.V1PersistentVolumeClaim, namespace: str = "default", printOutput: bool = False,
+                session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Create PVC
+    if printOutput:
+        print("Creating PersistentVolumeClaim (PVC) '" + pvc.metadata.name + "' in namespace '" + namespace + "'.")
+    with tracing.span("pvc-create", pvc=pvc.metadata.name):
+        try:
+            api = session.core_v1_api()
+            api.create_namespaced_persistent_volume_claim(body=pvc, namespace=namespace)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+
+def _create_pvc_from_volume_snapshot(pvcName: str, snapshotName: str, namespace: str = "default",
+                                     pvcLabels: dict = None, printOutput: bool = False, session: DataOpsSession = None):
+    # Retrieve source volume details
+    sourcePvcName, restoreSize = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=snapshotName,
+                                                                                     namespace=namespace,
+                                                                                     printOutput=printOutput, session=session)
+    storageClass = _retrieve_storage_class_for_pvc(pvcName=sourcePvcName, namespace=namespace, printOutput=printOutput, session=session)
+
+    # Set PVC labels
+    if not pvcLabels:
+        pvcLabels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": sourcePvcName}
+
+    # Create new PVC from snapshot
     if printOutput:
         print(
-            "Waiting for Deployment '" + _get_triton_deployment(server_name=server_name) + "' to reach Ready state.")
-    while True:
+            "Creating new PersistentVolumeClaim (PVC) '" + pvcName + "' from VolumeSnapshot '" + snapshotName + "' in namespace '" + namespace + "'...")
+    pvc = _construct_pvc(pvcName=pvcName, volumeSize=restoreSize, storageClass=storageClass, pvcLabels=pvcLabels,
+                         sourceSnapshot=snapshotName)
+    _create_pvc(pvc=pvc, namespace=namespace, printOutput=printOutput, session=session)
+
+
+def _wait_for_pvc_bound(pvcName: str, namespace: str = "default", printOutput: bool = False, timeout: float = None,
+                        session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Wait for PVC to bind to volume
+    if printOutput:
+        print("PersistentVolumeClaim (PVC) '" + pvcName + "' created. Waiting for Kubernetes to bind volume to PVC.")
+    with tracing.span("pvc-bind", pvc=pvcName):
+        try:
+            api = session.core_v1_api()
+            _wait_for_object(list_func=api.list_namespaced_persistent_volume_claim, name=pvcName, namespace=namespace,
+                             condition=lambda pvc: pvc is not None and pvc.status.phase == "Bound", timeout=timeout)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for Kubernetes to bind volume to PVC.")
+            raise
+
+
+def _create_jupyter_lab_service(workspaceName: str, labels: dict, loadBalancerService: bool = False,
+                                namespace: str = "default", printOutput: bool = False, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Construct service
+    service = _construct_jupyter_lab_service(workspaceName=workspaceName, labels=labels,
+                                             loadBalancerService=loadBalancerService)
+
+    # Create service
+    if printOutput:
+        print("\nCreating Service '" + _get_jupyter_lab_service(
+            workspaceName=workspaceName) + "' in namespace '" + namespace + "'.")
+    with tracing.span("service-create", service=service.metadata.name):
+        try:
+            api = session.core_v1_api()
+            api.create_namespaced_service(namespace=namespace, body=service)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    if printOutput:
+        print("Service successfully created.")
+
+
+def _create_jupyter_lab_deployment(workspaceName: str, labels: dict, hashedPassword: str, workspaceImage: str,
+                                   mountPvc: str = None, requestCpu: str = None, requestMemory: str = None,
+                                   requestNvidiaGpu: str = None, allocateResource: str = None,
+                                   namespace: str = "default", printOutput: bool = False,
+                                   session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=printOutput)
+
+    # Construct deployment
+    deployment = _construct_jupyter_lab_deployment(workspaceName=workspaceName, labels=labels,
+                                                   hashedPassword=hashedPassword, workspaceImage=workspaceImage,
+                                                   mountPvc=mountPvc, requestCpu=requestCpu,
+                                                   requestMemory=requestMemory, requestNvidiaGpu=requestNvidiaGpu,
+                                                   allocateResource=allocateResource)
+
+    # Create deployment
+    if printOutput:
+        print("\nCreating Deployment '" + _get_jupyter_lab_deployment(
+            workspaceName=workspaceName) + "' in namespace '" + namespace + "'.")
+    with tracing.span("deployment-create", deployment=deployment.metadata.name):
         try:
-            api = client.AppsV1Api()
-            deploymentStatus = api.read_namespaced_deployment_status(namespace=namespace, name=_get_triton_deployment(
-                server_name=server_name))
+            api = session.apps_v1_api()
+            api.create_namespaced_deployment(namespace=namespace, body=deployment)
         except ApiException as err:
             if printOutput:
                 print("Error: Kubernetes API Error: ", err)
             raise APIConnectionError(err)
-        if deploymentStatus.status.ready_replicas == 1:
-            break
-        sleep(5)
+
+    if printOutput:
+        print("Deployment '" + _get_jupyter_lab_deployment(workspaceName=workspaceName) + "' created.")
+
+
+def _get_jupyter_lab_steps(workspaceName: str, labels: dict, workspacePassword: str, workspaceImage: str,
+                           loadBalancerService: bool = False, mountPvc: str = None, requestCpu: str = None,
+                           requestMemory: str = None, requestNvidiaGpu: str = None, allocateResource: str = None,
+                           namespace: str = "default", printOutput: bool = False, timeout: float = None,
+                           session: DataOpsSession = None) -> dict:
+    """Get the steps that create a JupyterLab workspace's Service and Deployment and wait for it to be ready.
+
+    The Service and the Deployment are created as soon as the 'pvc-create' step, if the caller adds one, has completed,
+    so that nothing is left behind if the PVC cannot be created; the Deployment also waits for the password to be
+    hashed. Neither waits for the PVC to be bound, since the workspace pod simply stays Pending until the volume is
+    bound. The final 'deployment-ready' step therefore also waits for the volume.
+
+    :return: A dictionary of steps that can be run using _run_steps().
+    """
+    # Prompt for a password before any steps run so that the prompt is not interleaved with step output
+    if not workspacePassword:
+        hashedPassword = _hash_jupyter_lab_password()
+        hashPasswordStep = lambda results: hashedPassword
+    else:
+        hashPasswordStep = lambda results: _hash_jupyter_lab_password(workspacePassword=workspacePassword)
+
+    # Attach additional PVC if needed
+    if mountPvc and printOutput:
+        divider_index = mountPvc.find(":")
+        print("\nAttaching Additional PVC: '" + mountPvc[:divider_index] + "' at mount_path: '" + mountPvc[divider_index+1:] + "'.")
+
+    return {
+        "password-hash": (hashPasswordStep, []),
+        "service-create": (lambda results: _create_jupyter_lab_service(workspaceName=workspaceName, labels=labels,
+                                                                       loadBalancerService=loadBalancerService,
+                                                                       namespace=namespace, printOutput=printOutput,
+                                                                       session=session), ["pvc-create"]),
+        "deployment-create": (lambda results: _create_jupyter_lab_deployment(workspaceName=workspaceName, labels=labels,
+                                                                             hashedPassword=results["password-hash"],
+                                                                             workspaceImage=workspaceImage,
+                                                                             mountPvc=mountPvc, requestCpu=requestCpu,
+                                                                             requestMemory=requestMemory,
+                                                                             requestNvidiaGpu=requestNvidiaGpu,
+                                                                             allocateResource=allocateResource,
+                                                                             namespace=namespace,
+                                                                             printOutput=printOutput, session=session),
+                              ["password-hash", "pvc-create"]),
+        "deployment-ready": (lambda results: _wait_for_jupyter_lab_deployment_ready(workspaceName=workspaceName,
+                                                                                    namespace=namespace,
+                                                                                    printOutput=printOutput,
+                                                                                    timeout=timeout, session=session),
+                             ["deployment-create"])
+    }
 
 
 #
@@ -510,13 +2642,16 @@ class CAConfigMap:
     other objects in the Kubernetes cluster.
     """
 
-    def __init__(self, name: str, certificate_file: str, namespace: str = 'default', print_output: bool = False):
+    def __init__(self, name: str, certificate_file: str, namespace: str = 'default', print_output: bool = False,
+                 session: DataOpsSession = None):
         """Initialize the CAConfigMap object.
 
         :param name: The name of the config map.
         :param certificate_file: The path to the CA certificate file to use.
         :param namespace: The Kubernetes namespace to use for the config map.
         :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
         """
         if name is None:
             raise ValueError("Invalid value of None for parameter name.")
@@ -534,6 +2669,7 @@ class CAConfigMap:
             self.namespace = namespace
 
         self.print_output = print_output
+        self.session = session
 
     def create(self):
         """Create the config map for this CA certificate file.
@@ -546,32 +2682,116 @@ class CAConfigMap:
             content = data_file.read()
         map_data = {'ca_cert': content}
         return create_k8s_config_map(name=self.name, namespace=self.namespace,
-                                     data=map_data, labels=labels, print_output=self.print_output)
+                                     data=map_data, labels=labels, print_output=self.print_output,
+                                     session=self.session)
 
     def delete(self):
         """Delete the config map from Kubernetes"""
-        delete_k8s_config_map(name=self.name, namespace=self.namespace, print_output=self.print_output)
+        delete_k8s_config_map(name=self.name, namespace=self.namespace, print_output=self.print_output,
+                              session=self.session)
 
 #
 # Public functions used for imports
 #
 
 
+@tracing.traced
+def backfill_volume_snapshot_labels(namespace: str = "default", print_output: bool = False,
+                                    session: DataOpsSession = None) -> list:
+    """Label the VolumeSnapshots in a namespace that were created without source PVC labels.
+
+    VolumeSnapshots that are created by create_volume_snapshot() are labeled with their source PVC and JupyterLab
+    workspace, which allows snapshot queries to select them server-side. VolumeSnapshots that were created before
+    snapshots were labeled, or by other tools, are selected client-side until they are labeled by this function.
+
+    :param namespace: Kubernetes namespace. Defaults to the default namespace.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :return: The names of the VolumeSnapshots that were labeled.
+    :raises APIConnectionError: The Kubernetes API returned an error.
+    """
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # Retrieve unlabeled VolumeSnapshots
+    try:
+        volumeSnapshotList = _list_namespaced_objects(kind="volumesnapshots", namespace=namespace,
+                                                      labelSelector="!source-pvc", session=session)
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Index source PVC labels so that workspace membership can be checked without additional API calls
+    pvcLabels = _retrieve_pvc_labels_index(namespace=namespace, printOutput=print_output, session=session)
+
+    # Determine labels for each VolumeSnapshot (pre-provisioned VolumeSnapshots have no source PVC)
+    snapshotLabels = dict()
+    for volumeSnapshot in volumeSnapshotList:
+        try:
+            sourcePvcName = volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"]
+        except:
+            continue
+        if not sourcePvcName or len(sourcePvcName) > 63:
+            continue
+        labels = {"source-pvc": sourcePvcName}
+        workspaceName = pvcLabels.get(sourcePvcName, dict()).get("jupyterlab-workspace-name")
+        if workspaceName:
+            labels["jupyterlab-workspace-name"] = workspaceName
+        snapshotLabels[volumeSnapshot["metadata"]["name"]] = labels
+
+    api = session.custom_objects_api()
+
+    def _label_volume_snapshot(snapshotName: str) -> ApiException:
+        if print_output:
+            print("Labeling VolumeSnapshot '" + snapshotName + "' in namespace '" + namespace + "'.")
+        try:
+            api.patch_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                               namespace=namespace, plural="volumesnapshots", name=snapshotName,
+                                               body={"metadata": {"labels": snapshotLabels[snapshotName]}})
+        except ApiException as err:
+            # Ignore VolumeSnapshots that have been deleted in the meantime
+            if err.status != 404:
+                return err
+        return None
+
+    # Issue all label updates concurrently
+    errors = list()
+    if snapshotLabels:
+        with tracing.span("snapshot-label", snapshots=len(snapshotLabels)), \
+                ThreadPoolExecutor(max_workers=max(1, min(8, len(snapshotLabels)))) as executor:
+            errors = [err for err in executor.map(tracing.propagate(_label_volume_snapshot), snapshotLabels) if err is not None]
+    if errors:
+        if print_output:
+            print("Error: Kubernetes API Error: ", errors[0])
+        raise APIConnectionError(errors[0])
+
+    if print_output:
+        print(str(len(snapshotLabels)) + " VolumeSnapshot(s) successfully labeled.")
+
+    return list(snapshotLabels)
+
+
+@tracing.traced
 def clone_jupyter_lab(new_workspace_name: str, source_workspace_name: str, source_snapshot_name: str = None,
                       load_balancer_service: bool = False, new_workspace_password: str = None, volume_snapshot_class: str = "csi-snapclass",
                       namespace: str = "default", request_cpu: str = None, request_memory: str = None,
-                      request_nvidia_gpu: str = None, allocate_resource: str = None, print_output: bool = False):
+                      request_nvidia_gpu: str = None, allocate_resource: str = None, print_output: bool = False,
+                      labels: dict = None, timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
     # Determine source PVC details
     if source_snapshot_name:
         sourcePvcName, workspaceSize = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=source_snapshot_name,
                                                                                     namespace=namespace,
-                                                                                    printOutput=print_output)
+                                                                                    printOutput=print_output, session=session)
         if print_output:
             print(
                 "Creating new JupyterLab workspace '" + new_workspace_name + "' from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...\n")
     else:
         sourcePvcName = _get_jupyter_lab_workspace_pvc_name(workspaceName=source_workspace_name)
-        workspaceSize = _retrieve_size_for_pvc(pvcName=sourcePvcName, namespace=namespace, printOutput=print_output)
         if print_output:
             print(
                 "Creating new JupyterLab workspace '" + new_workspace_name + "' from source workspace '" + source_workspace_name + "' in namespace '" + namespace + "'...\n")
@@ -579,40 +2799,83 @@ def clone_jupyter_lab(new_workspace_name: str, source_workspace_name: str, sourc
     # Determine source workspace details
     if not source_workspace_name:
         source_workspace_name = _retrieve_jupyter_lab_workspace_for_pvc(pvcName=sourcePvcName, namespace=namespace,
-                                                                printOutput=print_output)
+                                                                printOutput=print_output, session=session)
     sourceWorkspaceImage = _retrieve_image_for_jupyter_lab_deployment(workspaceName=source_workspace_name, namespace=namespace,
-                                                                printOutput=print_output)
+                                                                printOutput=print_output, session=session)
 
     # Set labels
+    additionalLabels = labels
     labels = _get_jupyter_lab_labels(workspaceName=new_workspace_name)
     labels["created-by-operation"] = "clone-jupyterlab"
     labels["source-jupyterlab-workspace"] = source_workspace_name
-    labels["source-pvc"] = sourcePvcName
+    if additionalLabels:
+        labels.update(additionalLabels)
+    pvcLabels = dict(labels)
+    pvcLabels["source-pvc"] = sourcePvcName
+
+    # Construct the steps for creating the new workspace. The Service and Deployment are created once the clone has
+    # been requested, without waiting for it to be bound, and only the readiness of the Deployment is waited for.
+    steps = _get_jupyter_lab_steps(workspaceName=new_workspace_name, labels=labels,
+                                   workspacePassword=new_workspace_password, workspaceImage=sourceWorkspaceImage,
+                                   loadBalancerService=load_balancer_service, requestCpu=request_cpu,
+                                   requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                   allocateResource=allocate_resource, namespace=namespace, printOutput=print_output,
+                                   timeout=timeout, session=session)
+
+    # Create new VolumeSnapshot to use as source for clone if needed
+    if not source_snapshot_name:
+        timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+        source_snapshot_name = "ntap-dsutil.for-clone." + timestamp
+        if print_output:
+            print(
+                "Creating new VolumeSnapshot '" + source_snapshot_name + "' for source PVC '" + sourcePvcName + "' in namespace '" + namespace + "' to use as source for clone...")
+        steps["snapshot-create"] = (lambda results: create_volume_snapshot(pvc_name=sourcePvcName, snapshot_name=source_snapshot_name,
+                                                                           volume_snapshot_class=volume_snapshot_class,
+                                                                           namespace=namespace, print_output=print_output,
+                                                                           timeout=timeout,
+                                                                           snapshot_labels={"created-by-operation": "clone-jupyterlab",
+                                                                                            "jupyterlab-workspace-name": source_workspace_name},
+                                                                           session=session), [])
 
     # Clone workspace PVC
-    clone_volume(new_pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=new_workspace_name), source_pvc_name=sourcePvcName,
-                 source_snapshot_name=source_snapshot_name, volume_snapshot_class=volume_snapshot_class, namespace=namespace,
-                 print_output=print_output, pvc_labels=labels)
+    steps["pvc-create"] = (lambda results: _create_pvc_from_volume_snapshot(pvcName=_get_jupyter_lab_workspace_pvc_name(workspaceName=new_workspace_name),
+                                                                            snapshotName=source_snapshot_name,
+                                                                            namespace=namespace, pvcLabels=pvcLabels,
+                                                                            printOutput=print_output, session=session),
+                           ["snapshot-create"])
+
+    # Run steps
+    try:
+        _run_steps(steps)
+    except:
+        if print_output:
+            print("Aborting workspace creation...")
+        raise
 
-    # Remove source PVC from labels
-    del labels["source-pvc"]
+    if print_output:
+        print("Deployment successfully created.")
 
-    # Create new workspace
-    print()
-    url = create_jupyter_lab(workspace_name=new_workspace_name, workspace_size=workspaceSize, namespace=namespace,
-                       workspace_password=new_workspace_password, workspace_image=sourceWorkspaceImage, request_cpu=request_cpu,
-                       load_balancer_service=load_balancer_service, request_memory=request_memory, request_nvidia_gpu=request_nvidia_gpu, allocate_resource=allocate_resource, print_output=print_output,
-                       pvc_already_exists=True, labels=labels)
+    # Retrieve access URL
+    with tracing.span("url-resolve"):
+        try:
+            url = _retrieve_jupyter_lab_url(workspaceName=new_workspace_name, namespace=namespace, printOutput=print_output, session=session)
+        except (APIConnectionError, ServiceUnavailableError):
+            if print_output:
+                print("Aborting workspace creation...")
+            raise
 
     if print_output:
+        print("\nWorkspace successfully created.")
+        print("To access workspace, navigate to " + url)
         print("JupyterLab workspace successfully cloned.")
 
     return url
 
 
+@tracing.traced
 def clone_volume(new_pvc_name: str, source_pvc_name: str, source_snapshot_name: str = None,
                  volume_snapshot_class: str = "csi-snapclass", namespace: str = "default", print_output: bool = False,
-                 pvc_labels: dict = None):
+                 pvc_labels: dict = None, timeout: float = None, session: DataOpsSession = None):
     # Handle volume source
     if not source_snapshot_name:
         # Create new VolumeSnapshot to use as source for clone
@@ -622,282 +2885,179 @@ def clone_volume(new_pvc_name: str, source_pvc_name: str, source_snapshot_name:
             print(
                 "Creating new VolumeSnapshot '" + source_snapshot_name + "' for source PVC '" + source_pvc_name + "' in namespace '" + namespace + "' to use as source for clone...")
         create_volume_snapshot(pvc_name=source_pvc_name, snapshot_name=source_snapshot_name,
-                               volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output)
+                               volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output,
+                               timeout=timeout, snapshot_labels={"created-by-operation": "clone-volume"}, session=session)
+
+    # Create new PVC from snapshot
+    _create_pvc_from_volume_snapshot(pvcName=new_pvc_name, snapshotName=source_snapshot_name, namespace=namespace,
+                                     pvcLabels=pvc_labels, printOutput=print_output, session=session)
+
+    # Wait for PVC to bind to volume
+    _wait_for_pvc_bound(pvcName=new_pvc_name, namespace=namespace, printOutput=print_output, timeout=timeout, session=session)
+
+    if print_output:
+        print(
+            "Volume successfully created and bound to PersistentVolumeClaim (PVC) '" + new_pvc_name + "' in namespace '" + namespace + "'.")
+        print("Volume successfully cloned.")
+
+
+@tracing.traced
+def clone_volumes(new_pvc_names: list, source_pvc_name: str = None, source_snapshot_name: str = None,
+                  volume_snapshot_class: str = "csi-snapclass", namespace: str = "default", max_workers: int = 8,
+                  print_output: bool = False, pvc_labels: dict = None, timeout: float = None,
+                  session: DataOpsSession = None) -> list:
+    if not source_pvc_name and not source_snapshot_name:
+        raise ValueError("Either source_pvc_name or source_snapshot_name must be specified.")
+
+    # Remove duplicate names, preserving order (there is nothing to do, and no source snapshot to create, if there are
+    # no names)
+    new_pvc_names = list(dict.fromkeys(new_pvc_names))
+    if not new_pvc_names:
+        return list()
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # Handle volume source (a single VolumeSnapshot is shared by all clones)
+    if not source_snapshot_name:
+        # Create new VolumeSnapshot to use as source for clones
+        timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+        source_snapshot_name = "ntap-dsutil.for-clone." + timestamp
+        if print_output:
+            print(
+                "Creating new VolumeSnapshot '" + source_snapshot_name + "' for source PVC '" + source_pvc_name + "' in namespace '" + namespace + "' to use as source for " + str(len(new_pvc_names)) + " clones...")
+        create_volume_snapshot(pvc_name=source_pvc_name, snapshot_name=source_snapshot_name,
+                               volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output,
+                               timeout=timeout, snapshot_labels={"created-by-operation": "clone-volume"}, session=session)
 
     # Retrieve source volume details
     source_pvc_name, restoreSize = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=source_snapshot_name,
                                                                               namespace=namespace,
-                                                                              printOutput=print_output)
-    storageClass = _retrieve_storage_class_for_pvc(pvcName=source_pvc_name, namespace=namespace, printOutput=print_output)
+                                                                              printOutput=print_output, session=session)
+    storageClass = _retrieve_storage_class_for_pvc(pvcName=source_pvc_name, namespace=namespace, printOutput=print_output, session=session)
 
     # Set PVC labels
     if not pvc_labels:
         pvc_labels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": source_pvc_name}
 
-    # Create new PVC from snapshot
+    # Create new PVCs from snapshot concurrently
     if print_output:
         print(
-            "Creating new PersistentVolumeClaim (PVC) '" + new_pvc_name + "' from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...")
-    create_volume(pvc_name=new_pvc_name, volume_size=restoreSize, storage_class=storageClass, namespace=namespace,
-                  print_output=print_output, pvc_labels=pvc_labels, source_snapshot=source_snapshot_name)
+            "Creating " + str(len(new_pvc_names)) + " new PersistentVolumeClaims (PVCs) from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...")
+    api = session.core_v1_api()
+
+    def _create_clone(pvcName: str) -> str:
+        pvc = _construct_pvc(pvcName=pvcName, volumeSize=restoreSize, storageClass=storageClass,
+                             pvcLabels=dict(pvc_labels), sourceSnapshot=source_snapshot_name)
+        try:
+            api.create_namespaced_persistent_volume_claim(body=pvc, namespace=namespace)
+        except ApiException as err:
+            return str(err.reason) if err.reason else str(err)
+        return None
+
+    with tracing.span("pvc-create", pvcs=len(new_pvc_names)), \
+            ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(new_pvc_names)))) as executor:
+        errors = dict(zip(new_pvc_names, executor.map(tracing.propagate(_create_clone), new_pvc_names)))
+
+    # Wait for all created PVCs to bind to volumes using a single watch
+    createdPvcNames = [pvcName for pvcName in new_pvc_names if not errors[pvcName]]
+    pvcStates = dict()
+    if createdPvcNames:
+        if print_output:
+            print("Waiting for Kubernetes to bind volumes to " + str(len(createdPvcNames)) + " PVCs.")
+        with tracing.span("pvc-bind", pvcs=len(createdPvcNames)):
+            try:
+                pvcStates = _wait_for_objects(list_func=api.list_namespaced_persistent_volume_claim, names=createdPvcNames,
+                                              condition=lambda pvc: pvc is not None and pvc.status.phase == "Bound",
+                                              namespace=namespace, timeout=timeout)
+            except WaitTimeoutError:
+                # Retrieve the current state of the PVCs that did not bind in time
+                try:
+                    pvcStates = {pvc.metadata.name: pvc for pvc in _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace, session=session)}
+                except ApiException:
+                    pvcStates = dict()
+            except ApiException as err:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                raise APIConnectionError(err)
+
+    # Construct report
+    report = list()
+    for pvcName in new_pvc_names:
+        cloneDict = dict()
+        cloneDict["PersistentVolumeClaim (PVC) Name"] = pvcName
+        if errors[pvcName]:
+            cloneDict["Status"] = "Failed"
+            cloneDict["Error"] = "Kubernetes API Error: " + errors[pvcName]
+        else:
+            pvc = pvcStates.get(pvcName)
+            if pvc is not None and pvc.status.phase == "Bound":
+                cloneDict["Status"] = "Bound"
+                cloneDict["Error"] = ""
+            else:
+                cloneDict["Status"] = "Failed"
+                cloneDict["Error"] = "Timed out waiting for Kubernetes to bind volume to PVC."
+        report.append(cloneDict)
 
+    # Print report
     if print_output:
-        print("Volume successfully cloned.")
+        _print_table(report)
+        failures = len([cloneDict for cloneDict in report if cloneDict["Status"] == "Failed"])
+        if failures:
+            print(str(failures) + " of " + str(len(report)) + " clones failed.")
+        else:
+            print("Volumes successfully cloned.")
 
+    return report
 
+
+@tracing.traced
 def create_jupyter_lab(workspace_name: str, workspace_size: str, mount_pvc: str = None, storage_class: str = None,
                        load_balancer_service: bool = False, namespace: str = "default",
                        workspace_password: str = None, workspace_image: str = "nvcr.io/nvidia/tensorflow:22.05-tf2-py3",
                        request_cpu: str = None, request_memory: str = None, request_nvidia_gpu: str = None, allocate_resource: str = None, register_with_astra: bool = False,
-                       print_output: bool = False, pvc_already_exists: bool = False, labels: dict = None) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+                       print_output: bool = False, pvc_already_exists: bool = False, labels: dict = None,
+                       timeout: float = None, session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Set labels
     if not labels:
         labels = _get_jupyter_lab_labels(workspaceName=workspace_name)
 
-    # Step 0 - Set password
-    if not workspace_password:
-        print("Setting workspace password (this password will be required in order to access the workspace)...")
-        hashedPassword = jupyter_auth.passwd()
-    else :
-        hashedPassword = jupyter_auth.passwd(workspace_password)
-
-    # Step 1 - Create PVC for workspace
+    # Steps 0-3 - Set password, create PVC, Service and Deployment for workspace, and wait for the Deployment to be
+    # ready. The steps are run as a dependency graph: the Service is created concurrently with the other steps, and
+    # the Deployment is created without waiting for the PVC to be bound (the pod stays Pending until it is).
+    steps = _get_jupyter_lab_steps(workspaceName=workspace_name, labels=labels, workspacePassword=workspace_password,
+                                   workspaceImage=workspace_image, loadBalancerService=load_balancer_service,
+                                   mountPvc=mount_pvc, requestCpu=request_cpu, requestMemory=request_memory,
+                                   requestNvidiaGpu=request_nvidia_gpu, allocateResource=allocate_resource,
+                                   namespace=namespace, printOutput=print_output, timeout=timeout, session=session)
     if not pvc_already_exists:
         if print_output:
             print("\nCreating persistent volume for workspace...")
-        try:
-            create_volume(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name), volume_size=workspace_size,
-                          storage_class=storage_class, namespace=namespace, pvc_labels=labels, print_output=print_output)
-        except:
-            if print_output:
-                print("Aborting workspace creation...")
-            raise
-
-    # Step 2 - Create service for workspace
-
-    # Construct service
-    if load_balancer_service:
-        service = client.V1Service(
-            metadata=client.V1ObjectMeta(
-                name=_get_jupyter_lab_service(workspaceName=workspace_name),
-                labels=labels
-            ),
-            spec=client.V1ServiceSpec(
-                type="LoadBalancer",
-                selector={
-                    "app": labels["app"]
-                },
-                ports=[
-                    client.V1ServicePort(
-                        name="http",
-                        port=80,
-                        target_port=8888,
-                        protocol="TCP"
-                    )
-                ]
-            )
-        )
-    else:
-        service = client.V1Service(
-            metadata=client.V1ObjectMeta(
-                name=_get_jupyter_lab_service(workspaceName=workspace_name),
-                labels=labels
-            ),
-            spec=client.V1ServiceSpec(
-                type="NodePort",
-                selector={
-                    "app": labels["app"]
-                },
-                ports=[
-                    client.V1ServicePort(
-                        name="http",
-                        port=8888,
-                        target_port=8888,
-                        protocol="TCP"
-                    )
-                ]
-            )
-        )
-
-
-    # Create service
-    if print_output:
-        print("\nCreating Service '" + _get_jupyter_lab_service(
-            workspaceName=workspace_name) + "' in namespace '" + namespace + "'.")
-    try:
-        api = client.CoreV1Api()
-        api.create_namespaced_service(namespace=namespace, body=service)
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-            print("Aborting workspace creation...")
-        raise APIConnectionError(err)
-
-    if print_output:
-        print("Service successfully created.")
-
-    # Step 3 - Create deployment
-
-    # Construct deployment
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(
-            name=_get_jupyter_lab_deployment(workspaceName=workspace_name),
-            labels=labels
-        ),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector={
-                "matchLabels": {
-                    "app": labels["app"]
-                }
-            },
-            template=client.V1PodTemplateSpec(
-                metadata=V1ObjectMeta(
-                    labels=labels
-                ),
-                spec=client.V1PodSpec(
-                    volumes=[
-                        client.V1Volume(
-                            name="workspace",
-                            persistent_volume_claim={
-                                "claimName": _get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name)
-                            }
-                        )
-                    ],
-                    init_containers=[
-                        client.V1Container(
-                            name="init-jupyterlab",
-                            image=workspace_image,
-                            command=["/bin/bash", "-c"],
-                            args=["cp -au /workspace/. /vol/ || true"],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="workspace",
-                                    mount_path="/vol"
-                                )
-                            ]
-                        )
-                    ],
-                    containers=[
-                        client.V1Container(
-                            name="jupyterlab",
-                            image=workspace_image,
-                            env=[
-                                client.V1EnvVar(
-                                    name="JUPYTER_ENABLE_LAB",
-                                    value="yes"
-                                ),
-                                client.V1EnvVar(
-                                    name="RESTARTABLE",
-                                    value="yes"
-                                ),
-                                client.V1EnvVar(
-                                    name="CHOWN_HOME",
-                                    value="yes"
-                                )
-                            ],
-                            command=["jupyter", "lab", "--LabApp.password=" + hashedPassword, "--LabApp.ip='0.0.0.0'",
-                                  "--no-browser", "--notebook-dir=/workspace"],
-                            ports=[
-                                client.V1ContainerPort(container_port=8888)
-                            ],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="workspace",
-                                    mount_path="/workspace"
-                                )
-                            ],
-                            resources={
-                                "limits": dict(),
-                                "requests": dict()
-                            }
-                        )
-                    ]
-                )
-            )
-        )
-    )
-
-    # Mount Additional pvc if needed
-    if mount_pvc:
-
-        divider_index = mount_pvc.find(":")
-        user_pvc_name = mount_pvc[:divider_index]
-        user_pvc_mountpoint = mount_pvc[divider_index+1:]
-
-        if print_output:
-            print("\nAttaching Additional PVC: '" + user_pvc_name + "' at mount_path: '" + user_pvc_mountpoint + "'.")
-
-        # Add user-specified PVC
-        deployment.spec.template.spec.volumes.append(
-            client.V1Volume(
-                name="uservol",
-                persistent_volume_claim={
-                    "claimName": user_pvc_name
-                    }
-                )
-            )
-
-        # Add mountpoint for user-specified PVC
-        deployment.spec.template.spec.containers[0].volume_mounts.append(
-            client.V1VolumeMount(
-                name="uservol",
-                mount_path=user_pvc_mountpoint
-                )
-            )
-
-    # Apply resource requests/limits
-    if request_cpu:
-        deployment.spec.template.spec.containers[0].resources["requests"]["cpu"] = request_cpu
-        deployment.spec.template.spec.containers[0].resources["limits"]["cpu"] = request_cpu
-    if request_memory:
-        deployment.spec.template.spec.containers[0].resources["requests"]["memory"] = request_memory
-        deployment.spec.template.spec.containers[0].resources["limits"]["memory"] = request_memory
-    if request_nvidia_gpu:
-        deployment.spec.template.spec.containers[0].resources["requests"]["nvidia.com/gpu"] = request_nvidia_gpu
-        deployment.spec.template.spec.containers[0].resources["limits"]["nvidia.com/gpu"] = request_nvidia_gpu
-    if allocate_resource:
-        allocate = (allocate_resource.partition('='))[0]
-        allocate_limit = allocate_resource.split("=",1)[1]
-        deployment.spec.template.spec.containers[0].resources["requests"][allocate] = allocate_limit
-        deployment.spec.template.spec.containers[0].resources["limits"][allocate] = allocate_limit
-
-    # Create deployment
-    if print_output:
-        print("\nCreating Deployment '" + _get_jupyter_lab_deployment(
-            workspaceName=workspace_name) + "' in namespace '" + namespace + "'.")
+        pvc = _construct_pvc(pvcName=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name),
+                             volumeSize=workspace_size, storageClass=storage_class, pvcLabels=labels)
+        steps["pvc-create"] = (lambda results: _create_pvc(pvc=pvc, namespace=namespace, printOutput=print_output,
+                                                           session=session), [])
     try:
-        api = client.AppsV1Api()
-        api.create_namespaced_deployment(namespace=namespace, body=deployment)
-    except ApiException as err:
+        _run_steps(steps)
+    except:
         if print_output:
-            print("Error: Kubernetes API Error: ", err)
             print("Aborting workspace creation...")
-        raise APIConnectionError(err)
-
-    # Wait for deployment to be ready
-    if print_output:
-        print("Deployment '" + _get_jupyter_lab_deployment(workspaceName=workspace_name) + "' created.")
-    _wait_for_jupyter_lab_deployment_ready(workspaceName=workspace_name, namespace=namespace, printOutput=print_output)
+        raise
 
     if print_output:
         print("Deployment successfully created.")
 
     # Step 4 - Retrieve access URL
-    try:
-        url = _retrieve_jupyter_lab_url(workspaceName=workspace_name, namespace=namespace, printOutput=print_output)
-    except (APIConnectionError, ServiceUnavailableError) as err:
-        if print_output:
-            print("Aborting workspace creation...")
-        raise
+    with tracing.span("url-resolve"):
+        try:
+            url = _retrieve_jupyter_lab_url(workspaceName=workspace_name, namespace=namespace, printOutput=print_output, session=session)
+        except (APIConnectionError, ServiceUnavailableError):
+            if print_output:
+                print("Aborting workspace creation...")
+            raise
 
     # (Optional) Step 5 - Register workspace with Astra Control
     if register_with_astra :
@@ -909,230 +3069,127 @@ def create_jupyter_lab(workspace_name: str, workspace_size: str, mount_pvc: str
 
     return url
 
+@tracing.traced
 def create_triton_server(server_name: str, model_pvc_name: str, load_balancer_service: bool = False, namespace: str = "default",
                        server_image: str = "nvcr.io/nvidia/tritonserver:21.11-py3", request_cpu: str = None, request_memory: str = None, request_nvidia_gpu: str = None, allocate_resource: str = None,
-                       print_output: bool = False, pvc_already_exists: bool = False, labels: dict = None) -> str:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+                       print_output: bool = False, pvc_already_exists: bool = False, labels: dict = None,
+                       timeout: float = None, replicas: int = 1, per_replica_model_clones: bool = False,
+                       model_snapshot_name: str = None, volume_snapshot_class: str = "csi-snapclass",
+                       session: DataOpsSession = None) -> str:
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Set labels
     if not labels:
         labels = _get_triton_dev_labels(server_name=server_name)
 
+    # Step 0 - If each replica will mount its own clone of the model repository, determine the source VolumeSnapshot
+    if per_replica_model_clones:
+        # Create a snapshot of the model repository PVC if a snapshot was not specified
+        if not model_snapshot_name:
+            timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+            model_snapshot_name = "ntap-dsutil.for-triton." + server_name + "." + timestamp
+            if print_output:
+                print("Creating new VolumeSnapshot '" + model_snapshot_name + "' for model repository PVC '" + model_pvc_name + "'...")
+            create_volume_snapshot(pvc_name=model_pvc_name, snapshot_name=model_snapshot_name,
+                                   volume_snapshot_class=volume_snapshot_class, namespace=namespace,
+                                   print_output=print_output, timeout=timeout,
+                                   snapshot_labels={"created-by-operation": "create-triton-server"}, session=session)
 
-    # Step 1 - Create service for server
+        # Retrieve size and StorageClass of the model repository
+        sourcePvcName, modelVolumeSize = _retrieve_source_volume_details_for_volume_snapshot(
+            snapshotName=model_snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+        modelStorageClass = _retrieve_storage_class_for_pvc(pvcName=sourcePvcName, namespace=namespace,
+                                                            printOutput=print_output, session=session)
 
-    # Construct load Balancer Service
-    if load_balancer_service:
-        service = client.V1Service(
-            metadata=client.V1ObjectMeta(
-                name=_get_triton_dev_service(server_name=server_name),
-                labels=labels
-            ),
-            spec=client.V1ServiceSpec(
-                type="LoadBalancer",
-                selector={
-                    "app": labels["app"]
-                },
-                ports=[
-                    client.V1ServicePort(
-                        name="http-inference-server",
-                        port=8000,
-                        target_port="http",
-                    ),
-                    client.V1ServicePort(
-                        name="grpc-inference-server",
-                        port=8001,
-                        target_port="grpc",
-                    ),
-                    client.V1ServicePort(
-                        name="metrics-inference-server",
-                        port=8002,
-                        target_port="metrics",
-                    )
-                ]
-            )
-        )
-    else:
-        service = client.V1Service(
-            metadata=client.V1ObjectMeta(
-                name=_get_triton_dev_service(server_name=server_name),
-                labels=labels
-            ),
-            spec=client.V1ServiceSpec(
-                type="NodePort",
-                selector={
-                    "app": labels["app"]
-                },
-                ports=[
-                    client.V1ServicePort(
-                        name="http-inference-server",
-                        port=8000,
-                        target_port="http",
-                    ),
-                    client.V1ServicePort(
-                        name="grpc-inference-server",
-                        port=8001,
-                        target_port="grpc",
-                    ),
-                    client.V1ServicePort(
-                        name="metrics-inference-server",
-                        port=8002,
-                        target_port="metrics",
-                    )
-                ]
-            )
-        )
 
+    # Step 1 - Create service for server
+
+    # Construct service
+    service = _construct_triton_service(server_name=server_name, labels=labels, loadBalancerService=load_balancer_service)
 
     # Create service
     if print_output:
         print("\nCreating Service '" + _get_triton_dev_service(
             server_name=server_name) + "' in namespace '" + namespace + "'.")
-    try:
-        api = client.CoreV1Api()
-        api.create_namespaced_service(namespace=namespace, body=service)
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-            print("Aborting server creation...")
-        raise APIConnectionError(err)
+    with tracing.span("service-create", service=service.metadata.name):
+        try:
+            api = session.core_v1_api()
+            api.create_namespaced_service(namespace=namespace, body=service)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting server creation...")
+            raise APIConnectionError(err)
+
+    # Create headless service that gives each replica a stable DNS name
+    if per_replica_model_clones:
+        replicaService = _construct_triton_replica_service(server_name=server_name, labels=labels)
+        with tracing.span("service-create", service=replicaService.metadata.name):
+            try:
+                api = session.core_v1_api()
+                api.create_namespaced_service(namespace=namespace, body=replicaService)
+            except ApiException as err:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                    print("Aborting server creation...")
+                raise APIConnectionError(err)
 
     if print_output:
         print("Service successfully created.")
 
-    # Step 2 - Create Deployment for Triton Server
-
-    # Construct deployment for triton server
-    deployment = client.V1Deployment(
-        metadata=client.V1ObjectMeta(
-            name=_get_triton_deployment(server_name=server_name),
-            labels=labels
-        ),
-        spec=client.V1DeploymentSpec(
-            replicas=1,
-            selector={
-                "matchLabels": {
-                    "app": labels["app"]
-                }
-            },
-            template=client.V1PodTemplateSpec(
-                metadata=V1ObjectMeta(
-                    labels=labels
-                ),
-                spec=client.V1PodSpec(
-                    volumes=[
-                        client.V1Volume(
-                            name="model-repo",
-                            persistent_volume_claim={
-                                "claimName": model_pvc_name
-                            }
-                        )
-                    ],
-                    containers=[
-                        client.V1Container(
-                            name="triton-server",
-                            image=server_image,
-                            args=["tritonserver", "--model-store=/models", "--model-control-mode=poll", "--repository-poll-secs=5"],
-                            ports=[
-                                client.V1ContainerPort(
-                                    name="http",
-                                    container_port=8000
-                                    ),
-                                client.V1ContainerPort(
-                                    name="grpc",
-                                    container_port=8001
-                                    ),
-                                client.V1ContainerPort(
-                                    name="metrics",
-                                    container_port=8002
-                                    ),
-                            ],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name="model-repo",
-                                    mount_path="/models"
-                                )
-                            ],
-                            liveness_probe ={
-                                "httpGet" : {
-                                    "path" : "/v2/health/live",
-                                    "port" : "http"
-                                }
-                            },
-                            readiness_probe ={
-                                "initialDelaySeconds" : 5,
-                                "periodSeconds" : 5,
-                                "httpGet" : {
-                                    "path" : "/v2/health/ready",
-                                    "port" : "http"
-                                }
-                            },
-                            resources={
-                                "limits": dict(),
-                                "requests": dict()
-                            }
-                        )
-
-                    ]
-
-                )
-
-            )
-        )
-
-    )
-
-
-    # Apply resource requests/limits
-    if request_cpu:
-        deployment.spec.template.spec.containers[0].resources["requests"]["cpu"] = request_cpu
-        deployment.spec.template.spec.containers[0].resources["limits"]["cpu"] = request_cpu
-    if request_memory:
-        deployment.spec.template.spec.containers[0].resources["requests"]["memory"] = request_memory
-        deployment.spec.template.spec.containers[0].resources["limits"]["memory"] = request_memory
-    if request_nvidia_gpu:
-        deployment.spec.template.spec.containers[0].resources["requests"]["nvidia.com/gpu"] = request_nvidia_gpu
-        deployment.spec.template.spec.containers[0].resources["limits"]["nvidia.com/gpu"] = request_nvidia_gpu
-    if allocate_resource:
-        allocate = (allocate_resource.partition('='))[0]
-        allocate_limit = allocate_resource.split("=",1)[1]
-        deployment.spec.template.spec.containers[0].resources["requests"][allocate] = allocate_limit
-        deployment.spec.template.spec.containers[0].resources["limits"][allocate] = allocate_limit
+    # Step 2 - Create Deployment (or, if each replica mounts its own model repository clone, StatefulSet) for Triton Server
+    if per_replica_model_clones:
+        # Construct StatefulSet for triton server
+        deployment = _construct_triton_stateful_set(server_name=server_name, labels=labels,
+                                                    modelSnapshotName=model_snapshot_name,
+                                                    modelVolumeSize=modelVolumeSize, storageClass=modelStorageClass,
+                                                    serverImage=server_image, requestCpu=request_cpu,
+                                                    requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                                    allocateResource=allocate_resource, replicas=replicas)
+        kind = "StatefulSet"
+    else:
+        # Construct deployment for triton server
+        deployment = _construct_triton_deployment(server_name=server_name, labels=labels, modelPvcName=model_pvc_name,
+                                                  serverImage=server_image, requestCpu=request_cpu,
+                                                  requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                                  allocateResource=allocate_resource, replicas=replicas)
+        kind = "Deployment"
 
     # Create deployment
     if print_output:
-        print("\nCreating Deployment '" + _get_triton_deployment(
+        print("\nCreating " + kind + " '" + _get_triton_deployment(
             server_name=server_name) + "' in namespace '" + namespace + "'.")
-    try:
-        api = client.AppsV1Api()
-        api.create_namespaced_deployment(namespace=namespace, body=deployment)
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-            print("Aborting server creation...")
-        raise APIConnectionError(err)
+    with tracing.span("deployment-create", deployment=deployment.metadata.name):
+        try:
+            api = session.apps_v1_api()
+            if per_replica_model_clones:
+                api.create_namespaced_stateful_set(namespace=namespace, body=deployment)
+            else:
+                api.create_namespaced_deployment(namespace=namespace, body=deployment)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting server creation...")
+            raise APIConnectionError(err)
 
     # Wait for deployment to be ready
     if print_output:
-        print("Deployment '" + _get_triton_deployment(server_name=server_name) + "' created.")
-    _wait_for_triton_dev_deployment(server_name=server_name, namespace=namespace, printOutput=print_output)
+        print(kind + " '" + _get_triton_deployment(server_name=server_name) + "' created.")
+    _wait_for_triton_dev_deployment(server_name=server_name, namespace=namespace, printOutput=print_output, timeout=timeout,
+                                    statefulSet=per_replica_model_clones, session=session)
 
     if print_output:
-        print("Deployment successfully created.")
+        print(kind + " successfully created.")
 
     # Step 3 - Retrieve endpoints
-    try:
-        uri = _retrieve_triton_endpoints(server_name=server_name, namespace=namespace, printOutput=print_output)
-    except (APIConnectionError, ServiceUnavailableError) as err:
-        if print_output:
-            print("Aborting server creation...")
-        raise
+    with tracing.span("url-resolve"):
+        try:
+            uri = _retrieve_triton_endpoints(server_name=server_name, namespace=namespace, printOutput=print_output, session=session)
+        except (APIConnectionError, ServiceUnavailableError):
+            if print_output:
+                print("Aborting server creation...")
+            raise
 
     if print_output:
         print("\nServer successfully created.")
@@ -1142,18 +3199,26 @@ def create_triton_server(server_name: str, model_pvc_name: str, load_balancer_se
         print("metrics: " + uri[2] + "/metrics")
     return uri
 
+@tracing.traced
 def create_jupyter_lab_snapshot(workspace_name: str, snapshot_name: str = None, volume_snapshot_class: str = "csi-snapclass",
-                                namespace: str = "default", print_output: bool = False):
+                                namespace: str = "default", print_output: bool = False, dataset_version: str = None,
+                                session: DataOpsSession = None):
+    _validate_dataset_version(datasetVersion=dataset_version)
+
     # Create snapshot
     if print_output:
         print(
             "Creating VolumeSnapshot for JupyterLab workspace '" + workspace_name + "' in namespace '" + namespace + "'...")
     create_volume_snapshot(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name), snapshot_name=snapshot_name,
-                           volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output)
+                           volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output,
+                           dataset_version=dataset_version,
+                           snapshot_labels={"created-by-operation": "create-jupyterlab-snapshot",
+                                            "jupyterlab-workspace-name": workspace_name},
+                           session=session)
 
 
 def create_k8s_config_map(name: str, data: dict, namespace: str = 'default', labels: dict = None,
-                          print_output: bool = False):
+                          print_output: bool = False, session: DataOpsSession = None):
     """Create a K8s config map with the provided data.
 
     :param name: The name of the config map object.
@@ -1166,15 +3231,15 @@ def create_k8s_config_map(name: str, data: dict, namespace: str = 'default', lab
     if labels is None:
         labels = _get_labels(operation="create_k8s_config_map")
 
-    body = V1ConfigMap(
-        metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+    body = client.V1ConfigMap(
+        metadata=client.V1ObjectMeta(name=name, namespace=namespace, labels=labels),
         data=data
     )
 
-    _load_kube_config2(print_output=print_output)
+    session = _get_session(session=session, print_output=print_output)
 
     try:
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         config_map = api.create_namespaced_config_map(namespace=namespace, body=body)
     except ApiException as error:
         raise APIConnectionError(error)
@@ -1182,7 +3247,7 @@ def create_k8s_config_map(name: str, data: dict, namespace: str = 'default', lab
 
 
 def create_k8s_opaque_secret(name: str, data: dict, namespace: str = 'default', labels: dict = None,
-                             print_output: bool = False) -> V1Secret:
+                             print_output: bool = False, session: DataOpsSession = None) -> client.V1Secret:
     """Create a K8s secret with the provided data.
 
     :param name: The name of the secret to be created.
@@ -1203,175 +3268,114 @@ def create_k8s_opaque_secret(name: str, data: dict, namespace: str = 'default',
     if labels is None:
         labels = _get_labels(operation="generic")
 
-    secret_body = V1Secret(
+    secret_body = client.V1Secret(
         api_version='v1',
         kind='Secret',
-        metadata=V1ObjectMeta(name=name, labels=labels),
+        metadata=client.V1ObjectMeta(name=name, labels=labels),
         data=secret_data
     )
 
-    _load_kube_config2(print_output=print_output)
+    session = _get_session(session=session, print_output=print_output)
 
     try:
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         secret = api.create_namespaced_secret(namespace=namespace, body=secret_body)
     except ApiException as error:
         raise APIConnectionError(error)
     return secret
 
+@tracing.traced
 def create_volume(pvc_name: str, volume_size: str, storage_class: str = None, namespace: str = "default",
                   print_output: bool = False,
                   pvc_labels: dict = {"created-by": "ntap-dsutil", "created-by-operation": "create-volume"},
-                  source_snapshot: str = None, source_pvc: str = None):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
-
+                  source_snapshot: str = None, source_pvc: str = None, timeout: float = None, session: DataOpsSession = None):
     # Construct PVC
-    pvc = client.V1PersistentVolumeClaim(
-        metadata=client.V1ObjectMeta(
-            name=pvc_name,
-            labels=pvc_labels
-        ),
-        spec=client.V1PersistentVolumeClaimSpec(
-            access_modes=["ReadWriteMany"],
-            resources=client.V1ResourceRequirements(
-                requests={
-                    'storage': volume_size
-                }
-            )
-        )
-    )
-
-    # Apply custom storageClass if specified
-    if storage_class:
-        pvc.spec.storage_class_name = storage_class
-
-    # Apply source snapshot if specified
-    if source_snapshot:
-        pvc.spec.data_source = {
-            'name': source_snapshot,
-            'kind': 'VolumeSnapshot',
-            'apiGroup': _get_snapshot_api_group()
-        }
-    # Apply source PVC if specified
-    elif source_pvc:
-        pvc.metadata.annotations = {
-            'trident.netapp.io/cloneFromPVC': source_pvc
-        }
+    pvc = _construct_pvc(pvcName=pvc_name, volumeSize=volume_size, storageClass=storage_class, pvcLabels=pvc_labels,
+                         sourceSnapshot=source_snapshot, sourcePvc=source_pvc)
 
     # Create PVC
-    if print_output:
-        print("Creating PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
-    try:
-        api = client.CoreV1Api()
-        api.create_namespaced_persistent_volume_claim(body=pvc, namespace=namespace)
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-        raise APIConnectionError(err)
+    _create_pvc(pvc=pvc, namespace=namespace, printOutput=print_output, session=session)
 
     # Wait for PVC to bind to volume
-    if print_output:
-        print("PersistentVolumeClaim (PVC) '" + pvc_name + "' created. Waiting for Kubernetes to bind volume to PVC.")
-    while True:
-        try:
-            api = client.CoreV1Api()
-            pvcStatus = api.read_namespaced_persistent_volume_claim_status(name=pvc_name, namespace=namespace)
-        except ApiException as err:
-            if print_output:
-                print("Error: Kubernetes API Error: ", err)
-            raise APIConnectionError(err)
-        if pvcStatus.status.phase == "Bound":
-            break
-        sleep(5)
+    _wait_for_pvc_bound(pvcName=pvc_name, namespace=namespace, printOutput=print_output, timeout=timeout, session=session)
 
     if print_output:
         print(
             "Volume successfully created and bound to PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
 
 
+@tracing.traced
 def create_volume_snapshot(pvc_name: str, snapshot_name: str = None, volume_snapshot_class: str = "csi-snapclass",
-                           namespace: str = "default", print_output: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+                           namespace: str = "default", print_output: bool = False, timeout: float = None,
+                           dataset_version: str = None, snapshot_labels: dict = None, session: DataOpsSession = None):
+    _validate_dataset_version(datasetVersion=dataset_version)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Set snapshot name if not passed into function
     if not snapshot_name:
         timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
         snapshot_name = "ntap-dsutil." + timestamp
 
+    # Label snapshot with its source PVC and JupyterLab workspace so that snapshot queries can use label selectors
+    labels = _get_volume_snapshot_labels(pvcName=pvc_name, operation="create-volume-snapshot",
+                                         datasetVersion=dataset_version)
+    labels.update(snapshot_labels or dict())
+    # create_jupyter_lab_snapshot() passes the workspace label in; the PVC is only read to find the workspace when a
+    # workspace PVC is snapshotted directly
+    if "jupyterlab-workspace-name" not in labels and pvc_name.startswith(_get_jupyter_lab_prefix()):
+        pvcLabels = _retrieve_pvc_labels_index(pvcName=pvc_name, namespace=namespace, printOutput=print_output,
+                                               session=session)
+        workspaceName = pvcLabels.get(pvc_name, dict()).get("jupyterlab-workspace-name")
+        if workspaceName:
+            labels["jupyterlab-workspace-name"] = workspaceName
+
     # Construct dict representing snapshot
-    snapshot = {
-        "apiVersion": _get_snapshot_api_group() + "/" + _get_snapshot_api_version(),
-        "kind": "VolumeSnapshot",
-        "metadata": {
-            "name": snapshot_name
-        },
-        "spec": {
-            "volumeSnapshotClassName": volume_snapshot_class,
-            "source": {
-                "persistentVolumeClaimName": pvc_name
-            }
-        }
-    }
+    snapshot = _construct_volume_snapshot(snapshotName=snapshot_name, pvcName=pvc_name,
+                                          volumeSnapshotClass=volume_snapshot_class, labels=labels)
 
     # Create snapshot
     if print_output:
         print(
             "Creating VolumeSnapshot '" + snapshot_name + "' for PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
-    try:
-        api = client.CustomObjectsApi()
-        api.create_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(), namespace=namespace,
-                                            body=snapshot, plural="volumesnapshots")
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-        raise APIConnectionError(err)
+    with tracing.span("snapshot-create", snapshot=snapshot_name):
+        try:
+            api = session.custom_objects_api()
+            api.create_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(), namespace=namespace,
+                                                body=snapshot, plural="volumesnapshots")
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
 
     # Wait for snapshot creation to complete
     if print_output:
         print(
             "VolumeSnapshot '" + snapshot_name + "' created. Waiting for Trident to create snapshot on backing storage.")
-    while True:
+    with tracing.span("snapshot-ready", snapshot=snapshot_name):
         try:
-            api = client.CustomObjectsApi()
-            snapshotStatus = api.get_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                                              namespace=namespace, name=snapshot_name,
-                                                              plural="volumesnapshots")
+            _wait_for_object(list_func=api.list_namespaced_custom_object, name=snapshot_name, namespace=namespace,
+                             condition=_is_volume_snapshot_ready, timeout=timeout, group=_get_snapshot_api_group(),
+                             version=_get_snapshot_api_version(), plural="volumesnapshots")
         except ApiException as err:
             if print_output:
                 print("Error: Kubernetes API Error: ", err)
             raise APIConnectionError(err)
-        try:
-            if snapshotStatus["status"]["readyToUse"] == True:
-                break
-        except:
-            pass
-        sleep(5)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for Trident to create snapshot on backing storage.")
+            raise
 
     if print_output:
         print("Snapshot successfully created.")
 
 
+@tracing.traced
 def delete_jupyter_lab(workspace_name: str, namespace: str = "default", preserve_snapshots: bool = False,
-                       print_output: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+                       print_output: bool = False, timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Delete workspace
     if print_output:
@@ -1380,13 +3384,13 @@ def delete_jupyter_lab(workspace_name: str, namespace: str = "default", preserve
         # Delete deployment
         if print_output:
             print("Deleting Deployment...")
-        api = client.AppsV1Api()
+        api = session.apps_v1_api()
         api.delete_namespaced_deployment(namespace=namespace, name=_get_jupyter_lab_deployment(workspaceName=workspace_name))
 
         # Delete service
         if print_output:
             print("Deleting Service...")
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         api.delete_namespaced_service(namespace=namespace, name=_get_jupyter_lab_service(workspaceName=workspace_name))
 
     except ApiException as err:
@@ -1398,39 +3402,56 @@ def delete_jupyter_lab(workspace_name: str, namespace: str = "default", preserve
     if print_output:
         print("Deleting PVC...")
     delete_volume(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name), namespace=namespace,
-                  preserve_snapshots=preserve_snapshots, print_output=print_output)
+                  preserve_snapshots=preserve_snapshots, print_output=print_output, timeout=timeout, session=session)
 
     if print_output:
         print("Workspace successfully deleted.")
 
 
+@tracing.traced
 def delete_triton_server(server_name: str, namespace: str = "default",
-                       print_output: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+                       print_output: bool = False, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Delete workspace
     if print_output:
         print("Deleting server '" + server_name + "' in namespace '" + namespace + "'.")
-        print("Note: this operation does NOT delete the model repository PVC.")
+        print("Note: this operation does NOT delete the model repository PVC or VolumeSnapshot.")
     try:
         # Delete deployment
         if print_output:
             print("Deleting Deployment...")
-        api = client.AppsV1Api()
-        api.delete_namespaced_deployment(namespace=namespace, name=_get_triton_deployment(server_name=server_name))
+        api = session.apps_v1_api()
+        perReplicaModelClones = False
+        try:
+            api.delete_namespaced_deployment(namespace=namespace, name=_get_triton_deployment(server_name=server_name))
+        except ApiException as err:
+            # Servers whose replicas mount their own model repository clones are StatefulSets
+            if err.status != 404:
+                raise
+            api.delete_namespaced_stateful_set(namespace=namespace, name=_get_triton_deployment(server_name=server_name))
+            perReplicaModelClones = True
 
         # Delete service
         if print_output:
             print("Deleting Service...")
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         api.delete_namespaced_service(namespace=namespace, name=_get_triton_dev_service(server_name=server_name))
 
+        # Delete headless replica service and per-replica model repository clones
+        if perReplicaModelClones:
+            try:
+                api.delete_namespaced_service(namespace=namespace,
+                                              name=_get_triton_dev_replica_service(server_name=server_name))
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+            if print_output:
+                print("Deleting per-replica model repository PVCs...")
+            api.delete_collection_namespaced_persistent_volume_claim(
+                namespace=namespace, label_selector=_get_triton_dev_label_selector() + ",triton-server-name=" + server_name)
+
     except ApiException as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
@@ -1439,48 +3460,46 @@ def delete_triton_server(server_name: str, namespace: str = "default",
         print("Triton Server instance successfully deleted.")
 
 
-def delete_k8s_config_map(name: str, namespace: str, print_output: bool = False):
+def delete_k8s_config_map(name: str, namespace: str, print_output: bool = False, session: DataOpsSession = None):
     """Delete a Kubernetes config map with the provided name from the provided namespace.
 
     :param name: The name of the config map to delete.
     :param namespace: The namespace the config map is in.
     :param print_output: If True enable information to be printed to the console. Default value is False.
     """
-    _load_kube_config2(print_output=print_output)
+    session = _get_session(session=session, print_output=print_output)
 
     try:
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         api.delete_namespaced_config_map(name=name, namespace=namespace)
     except ApiException as error:
         raise APIConnectionError(error)
 
 
-def delete_k8s_secret(name: str, namespace: str, print_output: bool = False):
+def delete_k8s_secret(name: str, namespace: str, print_output: bool = False, session: DataOpsSession = None):
     """Delete a Kubernetes secret with the provided name from the provided namespace.
 
     :param name: The name of the secret to be deleted.
     :param namespace: The namespace to which the secret is associated with.
     :param print_output: If True enable information to be printed to the console. Default value is False.
     """
-    _load_kube_config2(print_output=print_output)
+    session = _get_session(session=session, print_output=print_output)
 
     try:
-        api = client.CoreV1Api()
+        api = session.core_v1_api()
         api.delete_namespaced_secret(name=name, namespace=namespace)
     except ApiException as error:
         raise APIConnectionError(error)
 
 
-def delete_volume(pvc_name: str, namespace: str = "default", preserve_snapshots: bool = False, print_output: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+@tracing.traced
+def delete_volume(pvc_name: str, namespace: str = "default", preserve_snapshots: bool = False, print_output: bool = False,
+                  timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Optionally delete snapshots
+    snapshotNames = list()
     if not preserve_snapshots:
         if print_output:
             print(
@@ -1488,57 +3507,63 @@ def delete_volume(pvc_name: str, namespace: str = "default", preserve_snapshots:
 
         # Retrieve list of snapshots for PVC
         try:
-            snapshotList = list_volume_snapshots(pvc_name=pvc_name, namespace=namespace, print_output=False)
+            snapshotList = list_volume_snapshots(pvc_name=pvc_name, namespace=namespace, print_output=False, session=session)
         except APIConnectionError as err:
             if print_output:
                 print("Error: Kubernetes API Error: ", err)
             raise
+        snapshotNames = [snapshot["VolumeSnapshot Name"] for snapshot in snapshotList]
 
-        # Delete each snapshot
-        for snapshot in snapshotList:
-            delete_volume_snapshot(snapshot_name=snapshot["VolumeSnapshot Name"], namespace=namespace,
-                                   print_output=print_output)
+        # Issue all snapshot deletions concurrently
+        _delete_volume_snapshots(snapshotNames=snapshotNames, namespace=namespace, printOutput=print_output,
+                                 session=session)
 
-    # Delete PVC
+    # Delete PVC (the backing volume is retained by the storage driver until its snapshots are gone, so the PVC
+    # deletion does not have to wait for the snapshot deletions to complete)
     if print_output:
         print(
             "Deleting PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "' and associated volume.")
-    try:
-        api = client.CoreV1Api()
-        api.delete_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
-    except ApiException as err:
-        if print_output:
-            print("Error: Kubernetes API Error: ", err)
-        raise APIConnectionError(err)
+    with tracing.span("pvc-delete", pvc=pvc_name):
+        try:
+            api = session.core_v1_api()
+            api.delete_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
 
-    # Wait for PVC to disappear
-    while True:
+    # Wait for PVC and VolumeSnapshots to disappear (the deletions proceed concurrently, so waiting for them one after
+    # the other does not add to the total wait time)
+    with tracing.span("pvc-deleted", pvc=pvc_name):
         try:
-            api = client.CoreV1Api()
-            api.read_namespaced_persistent_volume_claim(name=pvc_name,
-                                                        namespace=namespace)  # Confirm that source PVC still exists
-        except:
-            break  # Break loop when source PVC no longer exists
-        sleep(5)
+            _wait_for_object(list_func=api.list_namespaced_persistent_volume_claim, name=pvc_name, namespace=namespace,
+                             condition=lambda pvc: pvc is None, timeout=timeout)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for PersistentVolumeClaim (PVC) to be deleted.")
+            raise
+    _wait_for_volume_snapshots_deleted(snapshotNames=snapshotNames, namespace=namespace, printOutput=print_output,
+                                       timeout=timeout, pvcName=pvc_name, session=session)
 
     if print_output:
         print("PersistentVolumeClaim (PVC) successfully deleted.")
 
 
-def delete_volume_snapshot(snapshot_name: str, namespace: str = "default", print_output: bool = False):
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
-        if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+@tracing.traced
+def delete_volume_snapshot(snapshot_name: str, namespace: str = "default", print_output: bool = False,
+                           timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
 
     # Delete VolumeSnapshot
     if print_output:
         print("Deleting VolumeSnapshot '" + snapshot_name + "' in namespace '" + namespace + "'.")
     try:
-        api = client.CustomObjectsApi()
+        api = session.custom_objects_api()
         api.delete_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(), namespace=namespace,
                                             plural="volumesnapshots", name=snapshot_name)
     except ApiException as err:
@@ -1547,33 +3572,183 @@ def delete_volume_snapshot(snapshot_name: str, namespace: str = "default", print
         raise APIConnectionError(err)
 
     # Wait for VolumeSnapshot to disappear
-    while True:
-        try:
-            api = client.CustomObjectsApi()
-            api.get_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                             namespace=namespace, plural="volumesnapshots",
-                                             name=snapshot_name)  # Confirm that VolumeSnapshot still exists
-        except:
-            break  # Break loop when snapshot no longer exists
-        sleep(5)
+    try:
+        _wait_for_object(list_func=api.list_namespaced_custom_object, name=snapshot_name, namespace=namespace,
+                         condition=lambda volumeSnapshot: volumeSnapshot is None, timeout=timeout,
+                         group=_get_snapshot_api_group(), version=_get_snapshot_api_version(), plural="volumesnapshots")
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    except WaitTimeoutError:
+        if print_output:
+            print("Error: Timed out waiting for VolumeSnapshot to be deleted.")
+        raise
 
     if print_output:
         print("VolumeSnapshot successfully deleted.")
 
 
-def list_jupyter_labs(namespace: str = "default", include_astra_app_id: bool = False, print_output: bool = False) -> list:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
+def get_default_session(print_output: bool = False) -> DataOpsSession:
+    """Get the process-wide default DataOpsSession, creating it on first use.
+
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :return: The default DataOpsSession object.
+    :raises InvalidConfigError: When the Kubernetes configuration is missing or invalid.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = DataOpsSession(print_output=print_output)
+        return _default_session
+
+
+@tracing.traced
+def iter_jupyter_labs(namespace: str = "default", page_size: int = 500, print_output: bool = False,
+                      output_format: str = "table", session: DataOpsSession = None):
+    """Iterate over JupyterLab workspaces, retrieving them one page at a time.
+
+    Yields the same dictionaries as list_jupyter_labs(), as each page is retrieved, so that memory use stays flat
+    and the first workspaces are available quickly in namespaces that contain many workspaces.
+
+    :param namespace: Kubernetes namespace. Default value is "default".
+    :param page_size: Maximum number of workspaces to retrieve per Kubernetes API request. Default value is 500.
+    :param print_output: If True print workspaces as they are retrieved. Default value is False.
+    :param output_format: Format in which to print workspaces: "table", "json" (a single array), "ndjson" (one JSON object
+        per line) or "csv". Default value is "table".
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :raises APIConnectionError: When a Kubernetes API request fails.
+    """
+    _validate_output_format(output_format)
+    workspaces = _iter_jupyter_labs(namespace=namespace, pageSize=page_size, printOutput=print_output,
+                                    session=session)
+    if print_output:
+        workspaces = _print_rows(workspaces, outputFormat=output_format, bufferSize=page_size)
+    yield from workspaces
+
+
+@tracing.traced
+def iter_triton_servers(namespace: str = "default", page_size: int = 500, print_output: bool = False,
+                        output_format: str = "table", session: DataOpsSession = None):
+    """Iterate over Triton Inference Servers, retrieving them one page at a time.
+
+    Yields the same dictionaries as list_triton_servers(), as each page is retrieved.
+
+    :param namespace: Kubernetes namespace. Default value is "default".
+    :param page_size: Maximum number of servers to retrieve per Kubernetes API request. Default value is 500.
+    :param print_output: If True print servers as they are retrieved. Default value is False.
+    :param output_format: Format in which to print servers: "table", "json" (a single array), "ndjson" (one JSON object
+        per line) or "csv". Default value is "table".
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :raises APIConnectionError: When a Kubernetes API request fails.
+    """
+    _validate_output_format(output_format)
+    servers = _iter_triton_servers(namespace=namespace, pageSize=page_size, printOutput=print_output, session=session)
+    if print_output:
+        servers = _print_triton_servers_rows(servers, bufferSize=page_size, outputFormat=output_format)
+    yield from servers
+
+
+@tracing.traced
+def iter_jupyter_lab_snapshots(workspace_name: str = None, namespace: str = "default", dataset_version: str = None,
+                               page_size: int = 500, print_output: bool = False, output_format: str = "table",
+                               session: DataOpsSession = None):
+    """Iterate over JupyterLab workspace snapshots, retrieving them one page at a time.
+
+    Yields the same dictionaries as list_jupyter_lab_snapshots(). See iter_volume_snapshots().
+    """
+    # Determine PVC name
+    if workspace_name:
+        pvcName = _get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name)
+    else:
+        pvcName = None
+
+    yield from iter_volume_snapshots(pvc_name=pvcName, namespace=namespace, jupyter_lab_workspaces_only=True,
+                                     dataset_version=dataset_version, page_size=page_size, print_output=print_output,
+                                     output_format=output_format, session=session)
+
+
+@tracing.traced
+def iter_volumes(namespace: str = "default", page_size: int = 500, print_output: bool = False,
+                 output_format: str = "table", session: DataOpsSession = None):
+    """Iterate over persistent volumes, retrieving them one page at a time.
+
+    Yields the same dictionaries as list_volumes(), as each page is retrieved, so that only one page of PVCs is held in
+    memory at a time and the first volumes are available quickly in namespaces that contain many PVCs. If a page
+    contains clones, the names of the PVCs and VolumeSnapshots in the namespace are indexed (one paged list per kind)
+    to resolve their sources.
+
+    :param namespace: Kubernetes namespace. Default value is "default".
+    :param page_size: Maximum number of PVCs to retrieve per Kubernetes API request. Default value is 500.
+    :param print_output: If True print volumes as they are retrieved. Default value is False.
+    :param output_format: Format in which to print volumes: "table", "json" (a single array), "ndjson" (one JSON object
+        per line) or "csv". Default value is "table".
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :raises APIConnectionError: When a Kubernetes API request fails.
+    """
+    _validate_output_format(output_format)
+    volumes = _iter_volumes(namespace=namespace, pageSize=page_size, printOutput=print_output, session=session)
+    if print_output:
+        volumes = _print_rows(volumes, outputFormat=output_format, bufferSize=page_size)
+    yield from volumes
+
+
+@tracing.traced
+def iter_volume_snapshots(pvc_name: str = None, namespace: str = "default", jupyter_lab_workspaces_only: bool = False,
+                          dataset_version: str = None, page_size: int = 500, print_output: bool = False,
+                          output_format: str = "table", session: DataOpsSession = None):
+    """Iterate over VolumeSnapshots, retrieving them one page at a time.
+
+    Yields the same dictionaries as list_volume_snapshots(), as each page is retrieved, so that memory use stays flat
+    and the first snapshots are available quickly in namespaces that contain many VolumeSnapshots.
+
+    :param pvc_name: If specified, only snapshots of this PVC are yielded.
+    :param namespace: Kubernetes namespace. Default value is "default".
+    :param jupyter_lab_workspaces_only: If True only snapshots of JupyterLab workspaces are yielded.
+    :param dataset_version: If specified, only snapshots labeled with this dataset version are yielded.
+    :param page_size: Maximum number of VolumeSnapshots to retrieve per Kubernetes API request. Default value is 500.
+    :param print_output: If True print snapshots as they are retrieved. Default value is False.
+    :param output_format: Format in which to print snapshots: "table", "json" (a single array), "ndjson" (one JSON object
+        per line) or "csv". Default value is "table".
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :raises APIConnectionError: When a Kubernetes API request fails.
+    """
+    _validate_output_format(output_format)
+    snapshots = _iter_volume_snapshots(pvcName=pvc_name, jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only,
+                                       datasetVersion=dataset_version, namespace=namespace, pageSize=page_size,
+                                       printOutput=print_output, session=session)
+    if print_output:
+        snapshots = _print_rows(snapshots, outputFormat=output_format, bufferSize=page_size)
+    yield from snapshots
+
+
+@tracing.traced
+def list_jupyter_labs(namespace: str = "default", include_astra_app_id: bool = False, print_output: bool = False,
+                      namespaces: list = None, all_namespaces: bool = False, output_format: str = "table",
+                      session: DataOpsSession = None) -> list:
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # List workspaces in several namespaces
+    if namespaces or all_namespaces:
+        if include_astra_app_id :
+            _astra_not_supported_message(print_output=print_output)
+        workspacesList = _list_jupyter_labs_in_namespaces(namespaces=None if all_namespaces else namespaces,
+                                                          printOutput=print_output, session=session)
         if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+            _print_table(workspacesList, outputFormat=output_format)
+        return workspacesList
 
     # Retrieve list of workspaces
     try:
-        api = client.AppsV1Api()
-        deployments = api.list_namespaced_deployment(namespace=namespace, label_selector=_get_jupyter_lab_label_selector())
+        deployments = _list_namespaced_objects(kind="deployments", namespace=namespace,
+                                               labelSelector=_get_jupyter_lab_label_selector(), session=session)
     except ApiException as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
@@ -1583,151 +3758,92 @@ def list_jupyter_labs(namespace: str = "default", include_astra_app_id: bool = F
     if include_astra_app_id :
         _astra_not_supported_message(print_output=print_output)
 
-    # Construct list of workspaces
-    workspacesList = list()
-    for deployment in deployments.items:
-        # Construct dict containing workspace details
-        workspaceDict = dict()
-
-        # Retrieve workspace name
-        workspaceName = deployment.metadata.labels["jupyterlab-workspace-name"]
-        workspaceDict["Workspace Name"] = workspaceName
-
-        # Determine readiness status
-        if deployment.status.ready_replicas == 1:
-            workspaceDict["Status"] = "Ready"
-        else:
-            workspaceDict["Status"] = "Not Ready"
-
-        # Retrieve PVC size and StorageClass
-        try:
-            api = client.CoreV1Api()
-            pvc = api.read_namespaced_persistent_volume_claim(namespace=namespace, name=_get_jupyter_lab_workspace_pvc_name(
-                workspaceName=workspaceName))
-            workspaceDict["Size"] = pvc.status.capacity["storage"]
-            workspaceDict["StorageClass"] = pvc.spec.storage_class_name
-        except:
-            workspaceDict["Size"] = ""
-            workspaceDict["StorageClass"] = ""
+    # Retrieve workspace PVCs and Services in bulk and index them by name
+    try:
+        pvcs = _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace,
+                                        labelSelector=_get_jupyter_lab_label_selector(), session=session)
+        services = _list_namespaced_objects(kind="services", namespace=namespace,
+                                            labelSelector=_get_jupyter_lab_label_selector(), session=session)
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
 
-        # Retrieve access URL
-        try :
-            workspaceDict["Access URL"] = _retrieve_jupyter_lab_url(workspaceName=workspaceName, namespace=namespace, printOutput=False)
-        except ServiceUnavailableError :
-            workspaceDict["Access URL"] = "unavailable"
-        except APIConnectionError as err:
-            if print_output:
-                print("Error: Kubernetes API Error: ", err)
-            raise APIConnectionError(err)
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type != "LoadBalancer" for service in services):
+        nodeIp = _retrieve_node_ip(session=session)
 
-        # Retrieve clone details
-        try:
-            if deployment.metadata.labels["created-by-operation"] == "clone-jupyterlab":
-                workspaceDict["Clone"] = "Yes"
-                workspaceDict["Source Workspace"] = pvc.metadata.labels["source-jupyterlab-workspace"]
-                try:
-                    api = client.AppsV1Api()
-                    deployments = api.read_namespaced_deployment(namespace=namespace, name=_get_jupyter_lab_deployment(
-                        workspaceName=workspaceDict["Source Workspace"]))
-                except:
-                    workspaceDict["Source Workspace"] = "*deleted*"
-                try:
-                    workspaceDict["Source VolumeSnapshot"] = pvc.spec.data_source.name
-                    try:
-                        api = client.CustomObjectsApi()
-                        api.get_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                                         namespace=namespace, plural="volumesnapshots",
-                                                         name=workspaceDict[
-                                                             "Source VolumeSnapshot"])  # Confirm that VolumeSnapshot still exists
-                    except:
-                        workspaceDict["Source VolumeSnapshot"] = "*deleted*"
-                except:
-                    workspaceDict["Source VolumeSnapshot"] = "n/a"
-            else:
-                workspaceDict["Clone"] = "No"
-                workspaceDict["Source Workspace"] = ""
-                workspaceDict["Source VolumeSnapshot"] = ""
-        except:
-            workspaceDict["Clone"] = "No"
-            workspaceDict["Source Workspace"] = ""
-            workspaceDict["Source VolumeSnapshot"] = ""
+    # Retrieve VolumeSnapshot names (only needed for clones)
+    volumeSnapshotNames = set()
+    if any(pvc.spec.data_source for pvc in pvcs):
+        volumeSnapshotNames = _retrieve_volume_snapshot_names(namespace=namespace, printOutput=print_output, session=session)
 
-        # Append dict to list of workspaces
-        workspacesList.append(workspaceDict)
+    # Construct list of workspaces
+    workspacesList = _construct_jupyter_labs_list(deployments=deployments, pvcs=pvcs, services=services, nodeIp=nodeIp,
+                                                  volumeSnapshotNames=volumeSnapshotNames)
 
     # Print list of workspaces
     if print_output:
-        # Convert workspaces array to Pandas DataFrame
-        workspacesDF = pd.DataFrame.from_dict(workspacesList, dtype="string")
-        print(tabulate(workspacesDF, showindex=False, headers=workspacesDF.columns))
+        _print_table(workspacesList, outputFormat=output_format)
 
     return workspacesList
 
-def list_triton_servers(namespace: str = "default", print_output: bool = False) -> list:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
+@tracing.traced
+def list_triton_servers(namespace: str = "default", print_output: bool = False, namespaces: list = None,
+                        all_namespaces: bool = False, output_format: str = "table",
+                        session: DataOpsSession = None) -> list:
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # List servers in several namespaces
+    if namespaces or all_namespaces:
+        serversList = _list_triton_servers_in_namespaces(namespaces=None if all_namespaces else namespaces,
+                                                         printOutput=print_output, session=session)
         if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+            _print_triton_servers_list(serversList, outputFormat=output_format)
+        return serversList
 
-    # Retrieve list of instances
+    # Retrieve server Deployments and StatefulSets, and the pods and Services of the servers (only if there are any)
     try:
-        api = client.AppsV1Api()
-        deployments = api.list_namespaced_deployment(namespace=namespace, label_selector=_get_triton_dev_label_selector())
+        labelSelector = _get_triton_dev_label_selector()
+        deployments = _list_namespaced_objects(kind="deployments", namespace=namespace, labelSelector=labelSelector,
+                                               session=session)
+        statefulSets = _list_triton_stateful_sets(namespace=namespace, labelSelector=labelSelector, session=session)
+        pods = list()
+        services = list()
+        if deployments or statefulSets:
+            pods = _list_namespaced_objects(kind="pods", namespace=namespace, labelSelector=labelSelector,
+                                            session=session)
+            services = _list_namespaced_objects(kind="services", namespace=namespace, labelSelector=labelSelector,
+                                                session=session)
     except ApiException as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
-    # Construct list of instances
-    workspacesList = list()
-    for deployment in deployments.items:
-        # Construct dict containing workspace details
-        workspaceDict = dict()
-
-        # Retrieve instance name
-        server_name = deployment.metadata.labels["triton-server-name"]
-        workspaceDict["Server Name"] = server_name
-
-        # Determine readiness status
-        if deployment.status.ready_replicas == 1:
-            workspaceDict["Status"] = "Ready"
-        else:
-            workspaceDict["Status"] = "Not Ready"
-
-
-        # Retrieve access URL
-        try :
-            endpoints = _retrieve_triton_endpoints(server_name=server_name, namespace=namespace, printOutput=False)
-            workspaceDict["HTTP Endpoint"] = endpoints[0]
-            workspaceDict["gRPC Endpoint"] = endpoints[1]
-            workspaceDict["Metrics Endpoint"] = endpoints[2]
-
-        except ServiceUnavailableError :
-            workspaceDict["HTTP Endpoint"] = "unavailable"
-            workspaceDict["gRPC Endpoint"] = "unavailable"
-            workspaceDict["Metrics Endpoint"] = "unavailable"
-
-        except APIConnectionError as err:
-            if print_output:
-                print("Error: Kubernetes API Error: ", err)
-            raise APIConnectionError(err)
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type == "NodePort" for service in services):
+        nodeIp = _retrieve_node_ip(session=session)
 
-        # Append dict to list of instances
-        workspacesList.append(workspaceDict)
+    # Construct list of instances
+    serversList = _construct_triton_servers_list(deployments=deployments, statefulSets=statefulSets, pods=pods,
+                                                 services=services, nodeIp=nodeIp, namespace=namespace)
 
-    # Print list of workspaces
+    # Print list of servers
     if print_output:
-        # Convert workspaces array to Pandas DataFrame
-        workspacesDF = pd.DataFrame.from_dict(workspacesList, dtype="string")
-        print(tabulate(workspacesDF, showindex=False, headers=workspacesDF.columns))
+        _print_triton_servers_list(serversList, outputFormat=output_format)
 
-    return workspacesList
+    return serversList
 
 
-def list_jupyter_lab_snapshots(workspace_name: str = None, namespace: str = "default", print_output: bool = False):
+@tracing.traced
+def list_jupyter_lab_snapshots(workspace_name: str = None, namespace: str = "default", print_output: bool = False,
+                               dataset_version: str = None, namespaces: list = None, all_namespaces: bool = False,
+                               output_format: str = "table", session: DataOpsSession = None):
     # Determine PVC name
     if workspace_name:
         pvcName = _get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name)
@@ -1736,171 +3852,109 @@ def list_jupyter_lab_snapshots(workspace_name: str = None, namespace: str = "def
 
     # List snapshots
     return list_volume_snapshots(pvc_name=pvcName, namespace=namespace, print_output=print_output,
-                                 jupyter_lab_workspaces_only=True)
+                                 jupyter_lab_workspaces_only=True, dataset_version=dataset_version,
+                                 namespaces=namespaces, all_namespaces=all_namespaces, output_format=output_format,
+                                 session=session)
 
 
-def list_volumes(namespace: str = "default", print_output: bool = False) -> list:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
+@tracing.traced
+def list_volumes(namespace: str = "default", print_output: bool = False, namespaces: list = None,
+                 all_namespaces: bool = False, output_format: str = "table", session: DataOpsSession = None) -> list:
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # List volumes in several namespaces
+    if namespaces or all_namespaces:
+        volumesList = _list_volumes_in_namespaces(namespaces=None if all_namespaces else namespaces,
+                                                  printOutput=print_output, session=session)
         if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+            _print_table(volumesList, outputFormat=output_format)
+        return volumesList
 
     # Retrieve list of PVCs
     try:
-        api = client.CoreV1Api()
-        pvcList = api.list_namespaced_persistent_volume_claim(namespace=namespace)
+        pvcList = _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace, session=session)
     except ApiException as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
-    # Construct list of volumes
-    volumesList = list()
-    for pvc in pvcList.items:
-        # Construct dict containing volume details
-        volumeDict = dict()
-        volumeDict["PersistentVolumeClaim (PVC) Name"] = pvc.metadata.name
-        volumeDict["Status"] = pvc.status.phase
-        try:
-            volumeDict["Size"] = pvc.status.capacity["storage"]
-        except:
-            volumeDict["Size"] = ""
-        try:
-            volumeDict["StorageClass"] = pvc.spec.storage_class_name
-        except:
-            volumeDict["StorageClass"] = ""
-        try:
-            if (pvc.metadata.labels["created-by-operation"] == "clone-volume") or (
-                    pvc.metadata.labels["created-by-operation"] == "clone-jupyterlab"):
-                volumeDict["Clone"] = "Yes"
-                volumeDict["Source PVC"] = pvc.metadata.labels["source-pvc"]
-                try:
-                    api = client.CoreV1Api()
-                    api.read_namespaced_persistent_volume_claim(name=volumeDict["Source PVC"],
-                                                                namespace=namespace)  # Confirm that source PVC still exists
-                except:
-                    volumeDict["Source PVC"] = "*deleted*"
-                try:
-                    volumeDict["Source VolumeSnapshot"] = pvc.spec.data_source.name
-                    try:
-                        api = client.CustomObjectsApi()
-                        api.get_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                                         namespace=namespace, plural="volumesnapshots", name=volumeDict[
-                                "Source VolumeSnapshot"])  # Confirm that VolumeSnapshot still exists
-                    except:
-                        volumeDict["Source VolumeSnapshot"] = "*deleted*"
-                except:
-                    volumeDict["Source VolumeSnapshot"] = "n/a"
-            else:
-                volumeDict["Clone"] = "No"
-                volumeDict["Source PVC"] = ""
-                volumeDict["Source VolumeSnapshot"] = ""
-        except:
-            volumeDict["Clone"] = "No"
-            volumeDict["Source PVC"] = ""
-            volumeDict["Source VolumeSnapshot"] = ""
+    # Retrieve VolumeSnapshot names so that clone sources can be checked without additional API calls
+    if any(pvc.spec.data_source for pvc in pvcList):
+        volumeSnapshotNames = _retrieve_volume_snapshot_names(namespace=namespace, printOutput=print_output, session=session)
+    else:
+        volumeSnapshotNames = set()
 
-        # Append dict to list of volumes
-        volumesList.append(volumeDict)
+    # Construct list of volumes
+    volumesList = _construct_volumes_list(pvcList=pvcList, volumeSnapshotNames=volumeSnapshotNames)
 
     # Print list of volumes
     if print_output:
-        # Convert volumes array to Pandas DataFrame
-        volumesDF = pd.DataFrame.from_dict(volumesList, dtype="string")
-        print(tabulate(volumesDF, showindex=False, headers=volumesDF.columns))
+        _print_table(volumesList, outputFormat=output_format)
 
     return volumesList
 
 
+@tracing.traced
 def list_volume_snapshots(pvc_name: str = None, namespace: str = "default", print_output: bool = False,
-                          jupyter_lab_workspaces_only: bool = False) -> list:
-    # Retrieve kubeconfig
-    try:
-        _load_kube_config()
-    except:
+                          jupyter_lab_workspaces_only: bool = False, dataset_version: str = None,
+                          namespaces: list = None, all_namespaces: bool = False, output_format: str = "table",
+                          session: DataOpsSession = None) -> list:
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # List snapshots in several namespaces
+    if namespaces or all_namespaces:
+        snapshotsList = _list_volume_snapshots_in_namespaces(pvcName=pvc_name,
+                                                             jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only,
+                                                             datasetVersion=dataset_version,
+                                                             namespaces=None if all_namespaces else namespaces,
+                                                             printOutput=print_output, session=session)
         if print_output:
-            _print_invalid_config_error()
-        raise InvalidConfigError()
+            _print_table(snapshotsList, outputFormat=output_format)
+        return snapshotsList
 
-    # Retrieve list of Snapshots
+    # Retrieve list of Snapshots (selected by label where possible)
     try:
-        api = client.CustomObjectsApi()
-        volumeSnapshotList = api.list_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
-                                                               namespace=namespace, plural="volumesnapshots")
+        volumeSnapshotList = _list_volume_snapshots(pvcName=pvc_name, jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only,
+                                                    datasetVersion=dataset_version, namespace=namespace, session=session)
     except ApiException as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
         raise APIConnectionError(err)
 
-    # Construct list of snapshots
-    snapshotsList = list()
-    # return volumeSnapshotList
-    for volumeSnapshot in volumeSnapshotList["items"]:
-        # Retrieve source PVC for snapshot
-        try :
-            source_pvc_name = volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"]
-        except :
-            source_pvc_name = None
-        # Construct dict containing snapshot details
-        if (not pvc_name) or (source_pvc_name == pvc_name):
-            snapshotDict = dict()
-            snapshotDict["VolumeSnapshot Name"] = volumeSnapshot["metadata"]["name"]
-            snapshotDict["Ready to Use"] = volumeSnapshot["status"]["readyToUse"]
-            try:
-                snapshotDict["Creation Time"] = volumeSnapshot["status"]["creationTime"]
-            except:
-                snapshotDict["Creation Time"] = ""
-            if source_pvc_name :
-                snapshotDict["Source PersistentVolumeClaim (PVC)"] = source_pvc_name
-                try:
-                    api = client.CoreV1Api()
-                    api.read_namespaced_persistent_volume_claim(name=snapshotDict["Source PersistentVolumeClaim (PVC)"],
-                                                                namespace=namespace)  # Confirm that source PVC still exists
-                except:
-                    snapshotDict["Source PersistentVolumeClaim (PVC)"] = "*deleted*"
-                try:
-                    snapshotDict["Source JupyterLab workspace"] = _retrieve_jupyter_lab_workspace_for_pvc(
-                        pvcName=snapshotDict["Source PersistentVolumeClaim (PVC)"], namespace=namespace, printOutput=False)
-                    jupyterLabWorkspace = True
-                except:
-                    snapshotDict["Source JupyterLab workspace"] = ""
-                    jupyterLabWorkspace = False
-            else :
-                snapshotDict["Source PersistentVolumeClaim (PVC)"] = ""
-                snapshotDict["Source JupyterLab workspace"] = ""
-                jupyterLabWorkspace = False
-            try:
-                snapshotDict["VolumeSnapshotClass"] = volumeSnapshot["spec"]["volumeSnapshotClassName"]
-            except:
-                snapshotDict["VolumeSnapshotClass"] = ""
+    # Index source PVC labels so that PVC existence and workspace membership can be checked without additional API calls
+    pvcLabels = _retrieve_pvc_labels_index(pvcName=pvc_name, namespace=namespace, printOutput=print_output, session=session)
 
-            # Append dict to list of snapshots
-            if jupyter_lab_workspaces_only:
-                if jupyterLabWorkspace:
-                    snapshotsList.append(snapshotDict)
-            else:
-                snapshotsList.append(snapshotDict)
+    # Construct list of snapshots
+    snapshotsList = _construct_volume_snapshots_list(volumeSnapshotList=volumeSnapshotList, pvcLabels=pvcLabels,
+                                                     pvcName=pvc_name,
+                                                     jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only)
 
     # Print list of snapshots
     if print_output:
-        # Convert snapshots array to Pandas DataFrame
-        snapshotsDF = pd.DataFrame.from_dict(snapshotsList, dtype="string")
-        print(tabulate(snapshotsDF, showindex=False, headers=snapshotsDF.columns))
+        _print_table(snapshotsList, outputFormat=output_format)
 
     return snapshotsList
 
 
-def restore_jupyter_lab_snapshot(snapshot_name: str = None, namespace: str = "default", print_output: bool = False):
+@tracing.traced
+def restore_jupyter_lab_snapshot(snapshot_name: str = None, namespace: str = "default", print_output: bool = False,
+                                 timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
     # Retrieve source PVC name
     sourcePvcName = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=snapshot_name, namespace=namespace,
-                                                                 printOutput=print_output)[0]
+                                                                 printOutput=print_output, session=session)[0]
 
     # Retrieve workspace name
     workspaceName = _retrieve_jupyter_lab_workspace_for_pvc(pvcName=sourcePvcName, namespace=namespace,
-                                                      printOutput=print_output)
+                                                      printOutput=print_output, session=session)
 
     # Set labels
     labels = _get_jupyter_lab_labels(workspaceName=workspaceName)
@@ -1911,30 +3965,49 @@ def restore_jupyter_lab_snapshot(snapshot_name: str = None, namespace: str = "de
             "Restoring VolumeSnapshot '" + snapshot_name + "' for JupyterLab workspace '" + workspaceName + "' in namespace '" + namespace + "'...")
 
     # Scale deployment to 0 pods
-    _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=0, namespace=namespace, printOutput=print_output)
-    sleep(5)
+    _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=0, namespace=namespace, printOutput=print_output, session=session)
+
+    # Wait for workspace pod to terminate
+    deploymentName = _get_jupyter_lab_deployment(workspaceName=workspaceName)
+    with tracing.span("deployment-scaled-down", deployment=deploymentName):
+        try:
+            _wait_for_object(list_func=session.apps_v1_api().list_namespaced_deployment,
+                             name=deploymentName, namespace=namespace, condition=_is_deployment_scaled_down,
+                             timeout=timeout)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for Deployment to scale down.")
+            raise
 
     # Restore snapshot
-    restore_volume_snapshot(snapshot_name=snapshot_name, namespace=namespace, print_output=print_output, pvc_labels=labels)
+    restore_volume_snapshot(snapshot_name=snapshot_name, namespace=namespace, print_output=print_output, pvc_labels=labels,
+                            timeout=timeout, session=session)
 
     # Scale deployment to 1 pod
-    _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=1, namespace=namespace, printOutput=print_output)
+    _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=1, namespace=namespace, printOutput=print_output, session=session)
 
     # Wait for deployment to reach ready state
-    _wait_for_jupyter_lab_deployment_ready(workspaceName=workspaceName, namespace=namespace, printOutput=print_output)
+    _wait_for_jupyter_lab_deployment_ready(workspaceName=workspaceName, namespace=namespace, printOutput=print_output,
+                                           timeout=timeout, session=session)
 
     if print_output:
         print("JupyterLab workspace snapshot successfully restored.")
 
 
+@tracing.traced
 def restore_volume_snapshot(snapshot_name: str, namespace: str = "default", print_output: bool = False,
                             pvc_labels: dict = {"created-by": "ntap-dsutil",
-                                             "created-by-operation": "restore-volume-snapshot"}):
+                                             "created-by-operation": "restore-volume-snapshot"}, timeout: float = None,
+                            session: DataOpsSession = None):
     # Retrieve source PVC, restoreSize, and StorageClass
     sourcePvcName, restoreSize = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=snapshot_name,
                                                                               namespace=namespace,
-                                                                              printOutput=print_output)
-    storageClass = _retrieve_storage_class_for_pvc(pvcName=sourcePvcName, namespace=namespace, printOutput=print_output)
+                                                                              printOutput=print_output, session=session)
+    storageClass = _retrieve_storage_class_for_pvc(pvcName=sourcePvcName, namespace=namespace, printOutput=print_output, session=session)
 
     if print_output:
         print(
@@ -1942,7 +4015,8 @@ def restore_volume_snapshot(snapshot_name: str, namespace: str = "default", prin
 
     # Delete source PVC
     try:
-        delete_volume(pvc_name=sourcePvcName, namespace=namespace, preserve_snapshots=True, print_output=False)
+        delete_volume(pvc_name=sourcePvcName, namespace=namespace, preserve_snapshots=True, print_output=False,
+                      timeout=timeout, session=session)
     except APIConnectionError as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
@@ -1951,7 +4025,8 @@ def restore_volume_snapshot(snapshot_name: str, namespace: str = "default", prin
     # Create new PVC from snapshot
     try:
         create_volume(pvc_name=sourcePvcName, volume_size=restoreSize, storage_class=storageClass, namespace=namespace,
-                      print_output=False, pvc_labels=pvc_labels, source_snapshot=snapshot_name)
+                      print_output=False, pvc_labels=pvc_labels, source_snapshot=snapshot_name, timeout=timeout,
+                      session=session)
     except APIConnectionError as err:
         if print_output:
             print("Error: Kubernetes API Error: ", err)
@@ -1961,6 +4036,70 @@ def restore_volume_snapshot(snapshot_name: str, namespace: str = "default", prin
         print("VolumeSnapshot successfully restored.")
 
 
+@tracing.traced
+def scale_triton_server(server_name: str, replicas: int, namespace: str = "default", wait: bool = False,
+                        print_output: bool = False, timeout: float = None, session: DataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # Scale deployment (or, for servers whose replicas mount their own model repository clones, StatefulSet)
+    body = {
+        "spec": {
+            "replicas": replicas
+        }
+    }
+    if print_output:
+        print("Scaling server '" + server_name + "' in namespace '" + namespace + "' to " + str(replicas) + " replica(s).")
+    statefulSet = False
+    with tracing.span("server-scale", server=server_name, replicas=replicas):
+        try:
+            api = session.apps_v1_api()
+            try:
+                api.patch_namespaced_deployment(name=_get_triton_deployment(server_name=server_name),
+                                                namespace=namespace, body=body)
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+                api.patch_namespaced_stateful_set(name=_get_triton_deployment(server_name=server_name),
+                                                  namespace=namespace, body=body)
+                statefulSet = True
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    # Wait for all replicas to be ready
+    if wait:
+        _wait_for_triton_dev_deployment(server_name=server_name, namespace=namespace, printOutput=print_output,
+                                        timeout=timeout, statefulSet=statefulSet, session=session)
+
+    if print_output:
+        print("Server successfully scaled.")
+
+
+def set_default_session(session: DataOpsSession = None):
+    """Replace the process-wide default DataOpsSession.
+
+    :param session: The session to use as the default. If None, the current default session is discarded and a
+        new one will be created, reloading the Kubernetes configuration, the next time it is needed.
+    """
+    global _default_session
+    with _default_session_lock:
+        _default_session = session
+
+
+def to_dataframe(rows):
+    """Convert the dictionaries returned by a list_* or iter_* function to a pandas DataFrame.
+
+    pandas is only imported when this function is called, and is not needed otherwise.
+
+    :param rows: A list (or any iterable) of dictionaries, e.g. the return value of list_volumes().
+    :return: A DataFrame with one row per dictionary and one string column per key.
+    """
+    import pandas as pd
+    return pd.DataFrame.from_dict(list(rows), dtype="string")
+
+
 #
 # Deprecated function names
 #
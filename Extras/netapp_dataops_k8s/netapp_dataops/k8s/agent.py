@@ -0,0 +1,248 @@
+"""NetApp DataOps Toolkit for Kubernetes agent.
+
+The agent is a long-running process, typically a Deployment within the cluster, that runs toolkit operations on
+behalf of clients over a small HTTP/JSON API. It keeps a single Kubernetes API session warm, so that pipeline steps
+(e.g. Kubeflow Pipelines or Apache Airflow tasks) can create a snapshot or clone a volume with one HTTP request,
+instead of installing the toolkit and loading the Kubernetes configuration in every step.
+
+API:
+    GET  /healthz                   Liveness and readiness check.
+    GET  /v1/operations             List the supported operations.
+    POST /v1/operations/<operation> Run an operation. The request body is a JSON object containing the keyword
+                                    arguments of the toolkit function of the same name (e.g. create_volume_snapshot),
+                                    and the response body is a JSON object containing its return value ("result") or
+                                    an error message ("error").
+    GET  /v1/client                 Download the agent client (netapp_dataops_k8s_agent_client.py), which only
+                                    requires the Python standard library.
+
+Requests to /v1/operations must include an 'Authorization: Bearer <token>' header, where the token is configured
+with the NETAPP_DATAOPS_K8S_AGENT_TOKEN environment variable. The agent refuses to start without a token unless
+unauthenticated requests are explicitly allowed.
+
+Example::
+
+    from netapp_dataops.k8s.agent import DataOpsAgent
+
+    with DataOpsAgent(port=8080, token="...") as agent:
+        ...  # serve requests in a background thread
+
+    DataOpsAgent(port=8080).serve_forever()  # token from NETAPP_DATAOPS_K8S_AGENT_TOKEN
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hmac
+import inspect
+import json
+import os
+import threading
+import urllib.parse
+
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    _get_session,
+    list_jupyter_lab_snapshots,
+    list_jupyter_labs,
+    list_triton_servers,
+    list_volume_snapshots,
+    list_volumes,
+    tracing,
+    APIConnectionError,
+    DataOpsSession,
+    InvalidConfigError,
+    ServiceUnavailableError,
+    WaitTimeoutError,
+)
+from netapp_dataops.k8s.plan import (
+    _OPERATIONS as _PLAN_OPERATIONS,
+    _REQUIRED_ARGS,
+    _get_error_message,
+    _get_operation,
+    InvalidPlanError,
+)
+
+
+_OPERATIONS = dict(_PLAN_OPERATIONS, **{func.__name__: func for func in (
+    list_jupyter_lab_snapshots,
+    list_jupyter_labs,
+    list_triton_servers,
+    list_volume_snapshots,
+    list_volumes,
+)})
+
+_CLIENT_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "netapp_dataops_k8s_agent_client.py")
+
+
+class _AgentRequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _get_error_status(err: Exception) -> int:
+    # Kubernetes API client errors (e.g. 404 Not Found, 409 AlreadyExists) are passed on to the client; other
+    # Kubernetes API errors are reported as a bad gateway
+    if isinstance(err, APIConnectionError):
+        apiError = err.args[0] if err.args else None
+        if isinstance(apiError, ApiException) and apiError.status and 400 <= apiError.status < 500:
+            return apiError.status
+        return 502
+    if isinstance(err, ServiceUnavailableError):
+        return 503
+    if isinstance(err, WaitTimeoutError):
+        return 504
+    return 500
+
+
+class _DataOpsAgentRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        if self.server.agent.print_output:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _check_token(self):
+        token = self.server.agent.token
+        if token and not hmac.compare_digest(self.headers.get("Authorization", ""), "Bearer " + token):
+            raise _AgentRequestError(401, "Unauthorized.")
+
+    def _handle(self, method: str):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        try:
+            if method == "GET" and path == "/healthz":
+                self._send_json(200, {"status": "ok"})
+            elif method == "GET" and path == "/v1/client":
+                with open(_CLIENT_FILE, "rb") as file:
+                    data = file.read()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/x-python")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            elif method == "GET" and path == "/v1/operations":
+                self._check_token()
+                self._send_json(200, {"operations": sorted(_OPERATIONS)})
+            elif method == "POST" and path.startswith("/v1/operations/"):
+                self._check_token()
+                try:
+                    body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                    args = json.loads(body) if body else dict()
+                except ValueError:
+                    raise _AgentRequestError(400, "The request body must be a JSON object.")
+                if not isinstance(args, dict):
+                    raise _AgentRequestError(400, "The request body must be a JSON object.")
+                operation = urllib.parse.unquote(path[len("/v1/operations/"):])
+                result = self.server.agent.call(operation=operation, args=args)
+                self._send_json(200, {"result": result})
+            else:
+                raise _AgentRequestError(404, "Not found.")
+        except _AgentRequestError as err:
+            self._send_json(err.status, {"error": str(err)})
+        except Exception as err:
+            self._send_json(500, {"error": _get_error_message(err)})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+
+class DataOpsAgent:
+    """An HTTP server that runs toolkit operations on behalf of clients using a single Kubernetes API session."""
+
+    def __init__(self, address: str = "0.0.0.0", port: int = 8080, token: str = None,
+                 allow_unauthenticated: bool = False, print_output: bool = False, session: DataOpsSession = None):
+        """Initialize the DataOpsAgent object.
+
+        :param address: Address to listen on. Default value is "0.0.0.0" (all interfaces).
+        :param port: Port to listen on. Default value is 8080.
+        :param token: Token that clients must present as a bearer token. If not specified, the
+            NETAPP_DATAOPS_K8S_AGENT_TOKEN environment variable is used.
+        :param allow_unauthenticated: If True the agent starts without a token, and anyone who can reach it can run
+            operations with the permissions of its ServiceAccount. Default value is False.
+        :param print_output: If True print a line for each request and for each failed operation. Default value is
+            False.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+            session is used.
+        :raises InvalidConfigError: When no token is configured and allow_unauthenticated is False, or when the
+            Kubernetes configuration is missing or invalid.
+        """
+        self.token = token or os.environ.get("NETAPP_DATAOPS_K8S_AGENT_TOKEN") or None
+        if not self.token and not allow_unauthenticated:
+            if print_output:
+                print("Error: No token is configured. Set NETAPP_DATAOPS_K8S_AGENT_TOKEN, or explicitly allow "
+                      "unauthenticated requests.")
+            raise InvalidConfigError()
+        self.session = _get_session(session=session, print_output=print_output)
+        self.print_output = print_output
+        self._httpd = ThreadingHTTPServer((address, port), _DataOpsAgentRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.agent = self
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        """The address (host:port) that the agent is listening on."""
+        return self._httpd.server_address[0] + ":" + str(self._httpd.server_address[1])
+
+    def call(self, operation: str, args: dict):
+        """Run an operation, as if it had been requested over HTTP.
+
+        :param operation: Name of the toolkit function to call, e.g. "create_volume_snapshot".
+        :param args: Keyword arguments of the function.
+        :return: The return value of the function.
+        """
+        try:
+            operation = _get_operation(operation, operations=_OPERATIONS)
+        except InvalidPlanError as err:
+            raise _AgentRequestError(404, str(err))
+        func = _OPERATIONS[operation]
+        for reserved in ("print_output", "session"):
+            if reserved in args:
+                raise _AgentRequestError(400, "'" + reserved + "' cannot be specified.")
+        try:
+            inspect.signature(func).bind(**args)
+        except TypeError as err:
+            raise _AgentRequestError(400, "Invalid arguments for " + operation + ": " + str(err))
+        for required in _REQUIRED_ARGS.get(operation, ()):
+            if not args.get(required):
+                raise _AgentRequestError(400, "'" + required + "' is required.")
+
+        with tracing.span("agent-request", operation=operation):
+            try:
+                return func(**args, print_output=False, session=self.session)
+            except (APIConnectionError, InvalidConfigError, ServiceUnavailableError, WaitTimeoutError) as err:
+                if self.print_output:
+                    print("Error: " + operation + " failed: " + _get_error_message(err), flush=True)
+                raise _AgentRequestError(_get_error_status(err), _get_error_message(err))
+
+    def start(self):
+        """Start serving requests in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve requests until stop() is called (or the process is interrupted)."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """Stop serving requests."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
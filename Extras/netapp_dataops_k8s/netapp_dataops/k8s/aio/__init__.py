@@ -0,0 +1,1699 @@
+"""NetApp DataOps Toolkit for Kubernetes Environments asyncio module.
+
+This module provides coroutine versions of the volume, snapshot, clone, JupyterLab workspace, and NVIDIA Triton
+Inference Server management functions that are available in the netapp_dataops.k8s module. The coroutines use the
+kubernetes_asyncio client, so many operations can be run concurrently from a single event loop (e.g. an asyncio based
+web service or orchestration agent) without blocking it or consuming a thread per operation.
+
+The coroutines accept the same parameters, print the same output, return the same values, and raise the same
+exceptions as their synchronous counterparts. Kubernetes objects are constructed using the same private builder
+functions that are used by the netapp_dataops.k8s module.
+
+This module requires the kubernetes_asyncio package, which can be installed using the 'aio' extra:
+    python3 -m pip install netapp-dataops-k8s[aio]
+"""
+
+import asyncio
+from datetime import datetime
+import os
+from time import monotonic
+import weakref
+
+try:
+    from kubernetes_asyncio import client, config, watch
+    from kubernetes_asyncio.client.rest import ApiException
+except ImportError as err:
+    raise ImportError("The netapp_dataops.k8s.aio module requires the kubernetes_asyncio package. Install it using "
+                      "'python3 -m pip install netapp-dataops-k8s[aio]'.") from err
+
+from netapp_dataops.k8s import (
+    _construct_jupyter_lab_deployment,
+    _construct_jupyter_lab_service,
+    _construct_jupyter_lab_url,
+    _construct_jupyter_labs_list,
+    _construct_pvc,
+    _construct_triton_deployment,
+    _construct_triton_endpoints,
+    _construct_triton_replica_service,
+    _construct_triton_servers_list,
+    _construct_triton_service,
+    _construct_triton_stateful_set,
+    _construct_volume_snapshot,
+    _construct_volume_snapshots_list,
+    _construct_volumes_list,
+    _get_jupyter_lab_deployment,
+    _get_jupyter_lab_label_selector,
+    _get_jupyter_lab_labels,
+    _get_jupyter_lab_service,
+    _get_jupyter_lab_workspace_pvc_name,
+    _get_snapshot_api_group,
+    _get_snapshot_api_version,
+    _get_triton_deployment,
+    _get_triton_dev_label_selector,
+    _get_triton_dev_labels,
+    _get_triton_dev_replica_service,
+    _get_triton_dev_service,
+    _get_volume_snapshot_label_selectors,
+    _get_volume_snapshot_labels,
+    _is_deployment_ready,
+    _is_deployment_scaled_down,
+    _is_triton_server_ready,
+    _is_volume_snapshot_ready,
+    _print_invalid_config_error,
+    _print_table,
+    _print_triton_servers_list,
+    _select_node_address,
+    _validate_dataset_version,
+    _validate_output_format,
+    APIConnectionError,
+    InvalidConfigError,
+    ServiceUnavailableError,
+    WaitTimeoutError,
+)
+from netapp_dataops.k8s import tracing
+
+
+#
+# Class definitions
+#
+
+
+class AsyncDataOpsSession:
+    """Reusable asynchronous Kubernetes API session.
+
+    An AsyncDataOpsSession is the asyncio equivalent of netapp_dataops.k8s.DataOpsSession. It loads the Kubernetes
+    configuration once, holds a single kubernetes_asyncio ApiClient whose aiohttp connection pool keeps connections
+    to the API server alive between requests, and hands out cached typed API objects.
+
+    Because loading the configuration and closing the connection pool are coroutines, a session must be opened
+    before use, either by awaiting open() or by using the session as an async context manager:
+
+        async with AsyncDataOpsSession(context="cluster2") as session:
+            await list_volumes(namespace="team1", session=session)
+
+    Every coroutine in this module accepts an optional session parameter. If no session is passed, the default
+    session for the running event loop is used (see get_default_session()).
+    """
+
+    def __init__(self, config_file: str = None, context: str = None, connection_pool_maxsize: int = 32,
+                 print_output: bool = False, ingress_host: str = None, node_address_ttl: float = 300):
+        """Initialize the AsyncDataOpsSession object.
+
+        :param config_file: Path to a kubeconfig file. If not specified, the in-cluster configuration is used when
+            running inside a pod, otherwise the default kubeconfig location ($HOME/.kube/config or $KUBECONFIG).
+        :param context: The kubeconfig context to use. If not specified, the current context is used.
+        :param connection_pool_maxsize: The maximum number of connections to keep open to the API server.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param ingress_host: Host name or IP address to use in the URLs of NodePort services instead of the address
+            of a Kubernetes node. If not specified, the NETAPP_DATAOPS_K8S_INGRESS_HOST environment variable is used.
+        :param node_address_ttl: Number of seconds for which a Kubernetes node address is cached.
+        """
+        self.config_file = config_file
+        self.context = context
+        self.connection_pool_maxsize = connection_pool_maxsize
+        self.print_output = print_output
+        self.ingress_host = ingress_host or os.environ.get("NETAPP_DATAOPS_K8S_INGRESS_HOST") or None
+        self.node_address_ttl = node_address_ttl
+        self.configuration = None
+        self.api_client = None
+        self._apis = dict()
+        self._node_address = None
+        self._node_address_expiry = 0
+
+    async def __aenter__(self):
+        if self.api_client is None:
+            await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def open(self):
+        """Load the Kubernetes configuration and create the session's ApiClient.
+
+        :return: The session object.
+        :raises InvalidConfigError: When the Kubernetes configuration is missing or invalid.
+        """
+        configuration = client.Configuration()
+        configured = False
+        if not self.config_file and not self.context:
+            try:
+                config.load_incluster_config(client_configuration=configuration)
+                configured = True
+            except:
+                configured = False
+        if not configured:
+            try:
+                await config.load_kube_config(config_file=self.config_file, context=self.context,
+                                              client_configuration=configuration)
+            except:
+                if self.print_output:
+                    _print_invalid_config_error()
+                raise InvalidConfigError()
+
+        # Size the connection pool
+        configuration.connection_pool_maxsize = self.connection_pool_maxsize
+
+        self.configuration = configuration
+        self.api_client = tracing.instrument_api_client(client.ApiClient(configuration=self.configuration))
+        self._apis = dict()
+        return self
+
+    def _get_api(self, api_class):
+        if self.api_client is None:
+            raise RuntimeError("AsyncDataOpsSession has not been opened.")
+        if api_class not in self._apis:
+            self._apis[api_class] = api_class(api_client=self.api_client)
+        return self._apis[api_class]
+
+    def apps_v1_api(self) -> client.AppsV1Api:
+        """Get the session's AppsV1Api object."""
+        return self._get_api(client.AppsV1Api)
+
+    def batch_v1_api(self) -> client.BatchV1Api:
+        """Get the session's BatchV1Api object."""
+        return self._get_api(client.BatchV1Api)
+
+    def core_v1_api(self) -> client.CoreV1Api:
+        """Get the session's CoreV1Api object."""
+        return self._get_api(client.CoreV1Api)
+
+    def custom_objects_api(self) -> client.CustomObjectsApi:
+        """Get the session's CustomObjectsApi object."""
+        return self._get_api(client.CustomObjectsApi)
+
+    async def close(self):
+        """Close the session's connection pool."""
+        if self.api_client is not None:
+            await self.api_client.close()
+            self.api_client = None
+            self._apis = dict()
+
+
+#
+# Private functions
+#
+
+
+_default_sessions = weakref.WeakKeyDictionary()
+
+
+async def _get_session(session: AsyncDataOpsSession = None, print_output: bool = False) -> AsyncDataOpsSession:
+    if session:
+        return session
+    return await get_default_session(print_output=print_output)
+
+
+def _get_resource_list_function(kind: str, session: AsyncDataOpsSession) -> tuple:
+    if kind == "deployments":
+        return session.apps_v1_api().list_namespaced_deployment, dict()
+    if kind == "jobs":
+        return session.batch_v1_api().list_namespaced_job, dict()
+    if kind == "persistentvolumeclaims":
+        return session.core_v1_api().list_namespaced_persistent_volume_claim, dict()
+    if kind == "services":
+        return session.core_v1_api().list_namespaced_service, dict()
+    if kind == "volumesnapshots":
+        return session.custom_objects_api().list_namespaced_custom_object, {"group": _get_snapshot_api_group(),
+                                                                            "version": _get_snapshot_api_version(),
+                                                                            "plural": "volumesnapshots"}
+    raise ValueError("Unsupported resource kind: " + kind)
+
+
+async def _list_namespaced_objects(kind: str, namespace: str = "default", labelSelector: str = None,
+                                   session: AsyncDataOpsSession = None) -> list:
+    session = await _get_session(session=session)
+    listFunc, listKwargs = _get_resource_list_function(kind=kind, session=session)
+    if labelSelector:
+        listKwargs["label_selector"] = labelSelector
+    objectList = await listFunc(namespace=namespace, **listKwargs)
+    if isinstance(objectList, dict):
+        return objectList["items"]
+    return objectList.items
+
+
+async def _read_namespaced_object(kind: str, name: str, namespace: str = "default",
+                                  session: AsyncDataOpsSession = None):
+    session = await _get_session(session=session)
+    if kind == "deployments":
+        return await session.apps_v1_api().read_namespaced_deployment(name=name, namespace=namespace)
+    if kind == "jobs":
+        return await session.batch_v1_api().read_namespaced_job(name=name, namespace=namespace)
+    if kind == "persistentvolumeclaims":
+        return await session.core_v1_api().read_namespaced_persistent_volume_claim(name=name, namespace=namespace)
+    if kind == "services":
+        return await session.core_v1_api().read_namespaced_service(name=name, namespace=namespace)
+    if kind == "volumesnapshots":
+        return await session.custom_objects_api().get_namespaced_custom_object(group=_get_snapshot_api_group(),
+                                                                               version=_get_snapshot_api_version(),
+                                                                               namespace=namespace,
+                                                                               plural="volumesnapshots", name=name)
+    raise ValueError("Unsupported resource kind: " + kind)
+
+
+async def _retrieve_node_ip(session: AsyncDataOpsSession = None) -> str:
+    # Retrieve node IP (random node, cached) or the pinned ingress host
+    try:
+        session = await _get_session(session=session)
+        if session.ingress_host:
+            return session.ingress_host
+        if session._node_address and monotonic() < session._node_address_expiry:
+            return session._node_address
+        nodes = await session.core_v1_api().list_node(limit=1)
+        session._node_address = _select_node_address(nodes.items[0].status.addresses)
+        session._node_address_expiry = monotonic() + session.node_address_ttl
+        return session._node_address
+    except:
+        return None
+
+
+async def _retrieve_object(kind: str, name: str, namespace: str = "default", printOutput: bool = False,
+                           session: AsyncDataOpsSession = None):
+    try:
+        return await _read_namespaced_object(kind=kind, name=name, namespace=namespace, session=session)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+
+async def _retrieve_source_volume_details_for_volume_snapshot(snapshotName: str, namespace: str = "default",
+                                                              printOutput: bool = False,
+                                                              session: AsyncDataOpsSession = None) -> (str, str):
+    volumeSnapshot = await _retrieve_object(kind="volumesnapshots", name=snapshotName, namespace=namespace,
+                                            printOutput=printOutput, session=session)
+    return volumeSnapshot["spec"]["source"]["persistentVolumeClaimName"], volumeSnapshot["status"]["restoreSize"]
+
+
+async def _retrieve_volume_snapshot_names(namespace: str = "default", printOutput: bool = False,
+                                          session: AsyncDataOpsSession = None) -> set:
+    try:
+        volumeSnapshotList = await _list_namespaced_objects(kind="volumesnapshots", namespace=namespace,
+                                                            session=session)
+    except ApiException as err:
+        # VolumeSnapshot CRD is not installed (e.g. BeeGFS-only clusters)
+        if err.status == 404:
+            return set()
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    return {volumeSnapshot["metadata"]["name"] for volumeSnapshot in volumeSnapshotList}
+
+
+async def _scale_jupyter_lab_deployment(workspaceName: str, numPods: int, namespace: str = "default",
+                                        printOutput: bool = False, session: AsyncDataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=printOutput)
+
+    # Scale deployment
+    deploymentName = _get_jupyter_lab_deployment(workspaceName=workspaceName)
+    deployment = {
+        "metadata": {
+            "name": deploymentName
+        },
+        "spec": {
+            "replicas": numPods
+        }
+    }
+    if printOutput:
+        print("Scaling Deployment '" + deploymentName + "' in namespace '" + namespace + "' to " + str(numPods) + " pod(s).")
+    try:
+        await session.apps_v1_api().patch_namespaced_deployment(name=deploymentName, namespace=namespace,
+                                                                body=deployment)
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+
+async def _wait_for_object(list_func, name: str, condition, namespace: str = "default", timeout: float = None,
+                           **list_kwargs):
+    """Wait for a single Kubernetes object to satisfy a condition.
+
+    This is the asyncio equivalent of netapp_dataops.k8s._wait_for_object(). The wait is suspended on the watch
+    stream, so the event loop is free to run other coroutines while the object changes state.
+    """
+    objects = await _wait_for_objects(list_func=list_func, names=[name], condition=condition, namespace=namespace,
+                                      timeout=timeout, field_selector="metadata.name=" + name, **list_kwargs)
+    return objects[name]
+
+
+async def _wait_for_objects(list_func, names: list, condition, namespace: str = "default", timeout: float = None,
+                            on_satisfied=None, **list_kwargs) -> dict:
+    """Wait for a set of Kubernetes objects to all satisfy a condition using a single watch.
+
+    This is the asyncio equivalent of netapp_dataops.k8s._wait_for_objects(). If specified, on_satisfied is called
+    with the name of each object when it first satisfies the condition.
+
+    :return: A dictionary mapping each name to the object that satisfied the condition (None if the condition
+        was satisfied by the object not existing).
+    :raises ApiException: When the Kubernetes API returns an error.
+    :raises WaitTimeoutError: When the condition is not satisfied for every object before the timeout expires.
+    """
+    deadline = None if timeout is None else monotonic() + timeout
+    resource_version = None
+    states = dict()
+    pending = set(names)
+    satisfied = set()
+
+    def _report(name: str):
+        if on_satisfied is not None and name not in satisfied:
+            satisfied.add(name)
+            on_satisfied(name)
+
+    def _name(obj) -> str:
+        return obj["metadata"]["name"] if isinstance(obj, dict) else obj.metadata.name
+
+    while True:
+        # (Re)establish the current state of the objects
+        if resource_version is None:
+            objects = await list_func(namespace=namespace, **list_kwargs)
+            if isinstance(objects, dict):
+                items = objects["items"]
+                resource_version = objects["metadata"]["resourceVersion"]
+            else:
+                items = objects.items
+                resource_version = objects.metadata.resource_version
+            states = {name: None for name in names}
+            for obj in items:
+                if _name(obj) in states:
+                    states[_name(obj)] = obj
+            pending = {name for name in names if not condition(states[name])}
+            for name in names:
+                if name not in pending:
+                    _report(name)
+            if not pending:
+                return states
+
+        # Determine how long the next watch may last
+        if deadline is None:
+            watch_seconds = 300
+        else:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise WaitTimeoutError("Timed out waiting for '" + "', '".join(sorted(pending)) + "' in namespace '" + namespace + "'.")
+            watch_seconds = max(1, min(300, int(remaining + 0.999)))
+
+        # Watch for changes starting from the last observed resourceVersion
+        try:
+            async with watch.Watch().stream(list_func, namespace=namespace, resource_version=resource_version,
+                                            timeout_seconds=watch_seconds, allow_watch_bookmarks=True,
+                                            **list_kwargs) as watcher:
+                async for event in watcher:
+                    if not event or event["type"] == "BOOKMARK":
+                        continue
+                    name = _name(event["object"])
+                    if name not in states:
+                        continue
+                    states[name] = None if event["type"] == "DELETED" else event["object"]
+                    if condition(states[name]):
+                        pending.discard(name)
+                        _report(name)
+                    else:
+                        pending.add(name)
+                    if not pending:
+                        return states
+                if watcher.resource_version is not None:
+                    resource_version = watcher.resource_version
+        except ApiException as err:
+            # resourceVersion too old; fall back to a fresh list
+            if err.status == 410:
+                resource_version = None
+            else:
+                raise
+
+
+async def _wait_for_deployment_ready(deploymentName: str, namespace: str = "default", printOutput: bool = False,
+                                     timeout: float = None, condition=_is_deployment_ready, statefulSet: bool = False,
+                                     session: AsyncDataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=printOutput)
+
+    # Wait for deployment (or StatefulSet) to be ready
+    kind = "StatefulSet" if statefulSet else "Deployment"
+    if printOutput:
+        print("Waiting for " + kind + " '" + deploymentName + "' to reach Ready state.")
+    with tracing.span("deployment-ready", deployment=deploymentName):
+        try:
+            api = session.apps_v1_api()
+            listFunc = api.list_namespaced_stateful_set if statefulSet else api.list_namespaced_deployment
+            await _wait_for_object(list_func=listFunc, name=deploymentName, namespace=namespace, condition=condition,
+                                   timeout=timeout)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for " + kind + " to reach Ready state.")
+            raise
+
+
+async def _delete_volume_snapshots(snapshotNames: list, namespace: str = "default", printOutput: bool = False,
+                                   maxWorkers: int = 8, session: AsyncDataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=printOutput)
+    api = session.custom_objects_api()
+    semaphore = asyncio.Semaphore(max(1, maxWorkers))
+
+    async def _delete_volume_snapshot(snapshotName: str) -> ApiException:
+        if printOutput:
+            print("Deleting VolumeSnapshot '" + snapshotName + "' in namespace '" + namespace + "'.")
+        async with semaphore:
+            try:
+                await api.delete_namespaced_custom_object(group=_get_snapshot_api_group(),
+                                                          version=_get_snapshot_api_version(), namespace=namespace,
+                                                          plural="volumesnapshots", name=snapshotName)
+            except ApiException as err:
+                # Ignore VolumeSnapshots that have already been deleted
+                if err.status != 404:
+                    return err
+        return None
+
+    # Issue all deletions concurrently
+    with tracing.span("snapshot-delete", snapshots=len(snapshotNames)):
+        errors = [err for err in await asyncio.gather(*[_delete_volume_snapshot(snapshotName) for snapshotName in snapshotNames])
+                  if err is not None]
+    if errors:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", errors[0])
+        raise APIConnectionError(errors[0])
+
+
+async def _wait_for_volume_snapshots_deleted(snapshotNames: list, namespace: str = "default", printOutput: bool = False,
+                                             timeout: float = None, pvcName: str = None,
+                                             session: AsyncDataOpsSession = None):
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=printOutput)
+
+    if not snapshotNames:
+        return
+
+    def _report(snapshotName: str):
+        if printOutput:
+            print("VolumeSnapshot '" + snapshotName + "' successfully deleted.")
+
+    # Wait for all VolumeSnapshots to disappear using a single watch per label selector (see the synchronous version)
+    if printOutput:
+        print("Waiting for " + str(len(snapshotNames)) + " VolumeSnapshot(s) to be deleted.")
+    deadline = None if timeout is None else monotonic() + timeout
+    labelSelectors = _get_volume_snapshot_label_selectors(pvcName=pvcName)
+    with tracing.span("snapshot-deleted", snapshots=len(snapshotNames)):
+        try:
+            for index, labelSelector in enumerate(labelSelectors):
+                await _wait_for_objects(list_func=session.custom_objects_api().list_namespaced_custom_object,
+                                        names=snapshotNames, condition=lambda volumeSnapshot: volumeSnapshot is None,
+                                        namespace=namespace,
+                                        timeout=None if deadline is None else max(deadline - monotonic(), 0),
+                                        on_satisfied=_report if index == len(labelSelectors) - 1 else None,
+                                        group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                        plural="volumesnapshots", label_selector=labelSelector)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for VolumeSnapshots to be deleted.")
+            raise
+
+
+#
+# Public functions
+#
+
+
+@tracing.traced
+async def clone_jupyter_lab(new_workspace_name: str, source_workspace_name: str, source_snapshot_name: str = None,
+                            load_balancer_service: bool = False, new_workspace_password: str = None,
+                            volume_snapshot_class: str = "csi-snapclass", namespace: str = "default",
+                            request_cpu: str = None, request_memory: str = None, request_nvidia_gpu: str = None,
+                            allocate_resource: str = None, print_output: bool = False, labels: dict = None,
+                            timeout: float = None, session: AsyncDataOpsSession = None) -> str:
+    """Asynchronous version of netapp_dataops.k8s.clone_jupyter_lab()."""
+    # Determine source PVC details
+    if source_snapshot_name:
+        sourcePvcName, workspaceSize = await _retrieve_source_volume_details_for_volume_snapshot(
+            snapshotName=source_snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+        if print_output:
+            print(
+                "Creating new JupyterLab workspace '" + new_workspace_name + "' from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...\n")
+    else:
+        sourcePvcName = _get_jupyter_lab_workspace_pvc_name(workspaceName=source_workspace_name)
+        sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=sourcePvcName, namespace=namespace,
+                                           printOutput=print_output, session=session)
+        workspaceSize = sourcePvc.status.capacity["storage"]
+        if print_output:
+            print(
+                "Creating new JupyterLab workspace '" + new_workspace_name + "' from source workspace '" + source_workspace_name + "' in namespace '" + namespace + "'...\n")
+
+    # Determine source workspace details
+    if not source_workspace_name:
+        sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=sourcePvcName, namespace=namespace,
+                                           printOutput=print_output, session=session)
+        source_workspace_name = sourcePvc.metadata.labels["jupyterlab-workspace-name"]
+    sourceDeployment = await _retrieve_object(kind="deployments",
+                                              name=_get_jupyter_lab_deployment(workspaceName=source_workspace_name),
+                                              namespace=namespace, printOutput=print_output, session=session)
+    sourceWorkspaceImage = sourceDeployment.spec.template.spec.containers[0].image
+
+    # Set labels
+    additionalLabels = labels
+    labels = _get_jupyter_lab_labels(workspaceName=new_workspace_name)
+    labels["created-by-operation"] = "clone-jupyterlab"
+    labels["source-jupyterlab-workspace"] = source_workspace_name
+    if additionalLabels:
+        labels.update(additionalLabels)
+    labels["source-pvc"] = sourcePvcName
+
+    # Clone workspace PVC
+    await clone_volume(new_pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=new_workspace_name),
+                       source_pvc_name=sourcePvcName, source_snapshot_name=source_snapshot_name,
+                       volume_snapshot_class=volume_snapshot_class, namespace=namespace, print_output=print_output,
+                       pvc_labels=labels, timeout=timeout, session=session)
+
+    # Remove source PVC from labels
+    del labels["source-pvc"]
+
+    # Create new workspace
+    if print_output:
+        print()
+    url = await create_jupyter_lab(workspace_name=new_workspace_name, workspace_size=workspaceSize, namespace=namespace,
+                                   workspace_password=new_workspace_password, workspace_image=sourceWorkspaceImage,
+                                   request_cpu=request_cpu, load_balancer_service=load_balancer_service,
+                                   request_memory=request_memory, request_nvidia_gpu=request_nvidia_gpu,
+                                   allocate_resource=allocate_resource, print_output=print_output,
+                                   pvc_already_exists=True, labels=labels, timeout=timeout, session=session)
+
+    if print_output:
+        print("JupyterLab workspace successfully cloned.")
+
+    return url
+
+
+@tracing.traced
+async def clone_volume(new_pvc_name: str, source_pvc_name: str, source_snapshot_name: str = None,
+                       volume_snapshot_class: str = "csi-snapclass", namespace: str = "default",
+                       print_output: bool = False, pvc_labels: dict = None, timeout: float = None,
+                       session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.clone_volume()."""
+    # Handle volume source
+    if not source_snapshot_name:
+        # Create new VolumeSnapshot to use as source for clone
+        timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+        source_snapshot_name = "ntap-dsutil.for-clone." + timestamp
+        if print_output:
+            print(
+                "Creating new VolumeSnapshot '" + source_snapshot_name + "' for source PVC '" + source_pvc_name + "' in namespace '" + namespace + "' to use as source for clone...")
+        await create_volume_snapshot(pvc_name=source_pvc_name, snapshot_name=source_snapshot_name,
+                                     volume_snapshot_class=volume_snapshot_class, namespace=namespace,
+                                     print_output=print_output, timeout=timeout,
+                                     snapshot_labels={"created-by-operation": "clone-volume"}, session=session)
+
+    # Retrieve source volume details
+    source_pvc_name, restoreSize = await _retrieve_source_volume_details_for_volume_snapshot(
+        snapshotName=source_snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+    sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=source_pvc_name, namespace=namespace,
+                                       printOutput=print_output, session=session)
+    storageClass = sourcePvc.spec.storage_class_name
+
+    # Set PVC labels
+    if not pvc_labels:
+        pvc_labels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": source_pvc_name}
+
+    # Create new PVC from snapshot
+    if print_output:
+        print(
+            "Creating new PersistentVolumeClaim (PVC) '" + new_pvc_name + "' from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...")
+    await create_volume(pvc_name=new_pvc_name, volume_size=restoreSize, storage_class=storageClass, namespace=namespace,
+                        print_output=print_output, pvc_labels=pvc_labels, source_snapshot=source_snapshot_name,
+                        timeout=timeout, session=session)
+
+    if print_output:
+        print("Volume successfully cloned.")
+
+
+@tracing.traced
+async def clone_volumes(new_pvc_names: list, source_pvc_name: str = None, source_snapshot_name: str = None,
+                        volume_snapshot_class: str = "csi-snapclass", namespace: str = "default",
+                        max_workers: int = 8, print_output: bool = False, pvc_labels: dict = None,
+                        timeout: float = None, session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.clone_volumes().
+
+    PVC creation requests are issued concurrently from the event loop, with at most max_workers requests
+    in flight at a time.
+    """
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Remove duplicate names, preserving order
+    new_pvc_names = list(dict.fromkeys(new_pvc_names))
+
+    # Handle volume source (a single VolumeSnapshot is shared by all clones)
+    if not source_snapshot_name:
+        # Create new VolumeSnapshot to use as source for clones
+        timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+        source_snapshot_name = "ntap-dsutil.for-clone." + timestamp
+        if print_output:
+            print(
+                "Creating new VolumeSnapshot '" + source_snapshot_name + "' for source PVC '" + source_pvc_name + "' in namespace '" + namespace + "' to use as source for " + str(len(new_pvc_names)) + " clones...")
+        await create_volume_snapshot(pvc_name=source_pvc_name, snapshot_name=source_snapshot_name,
+                                     volume_snapshot_class=volume_snapshot_class, namespace=namespace,
+                                     print_output=print_output, timeout=timeout,
+                                     snapshot_labels={"created-by-operation": "clone-volume"}, session=session)
+
+    # Retrieve source volume details
+    source_pvc_name, restoreSize = await _retrieve_source_volume_details_for_volume_snapshot(
+        snapshotName=source_snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+    sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=source_pvc_name, namespace=namespace,
+                                       printOutput=print_output, session=session)
+    storageClass = sourcePvc.spec.storage_class_name
+
+    # Set PVC labels
+    if not pvc_labels:
+        pvc_labels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": source_pvc_name}
+
+    # Create new PVCs from snapshot concurrently
+    if print_output:
+        print(
+            "Creating " + str(len(new_pvc_names)) + " new PersistentVolumeClaims (PVCs) from VolumeSnapshot '" + source_snapshot_name + "' in namespace '" + namespace + "'...")
+    api = session.core_v1_api()
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def _create_clone(pvcName: str) -> str:
+        pvc = _construct_pvc(pvcName=pvcName, volumeSize=restoreSize, storageClass=storageClass,
+                             pvcLabels=dict(pvc_labels), sourceSnapshot=source_snapshot_name)
+        async with semaphore:
+            try:
+                await api.create_namespaced_persistent_volume_claim(body=pvc, namespace=namespace)
+            except ApiException as err:
+                return str(err.reason) if err.reason else str(err)
+        return None
+
+    with tracing.span("pvc-create", pvcs=len(new_pvc_names)):
+        errors = dict(zip(new_pvc_names, await asyncio.gather(*[_create_clone(pvcName) for pvcName in new_pvc_names])))
+
+    # Wait for all created PVCs to bind to volumes using a single watch
+    createdPvcNames = [pvcName for pvcName in new_pvc_names if not errors[pvcName]]
+    pvcStates = dict()
+    if createdPvcNames:
+        if print_output:
+            print("Waiting for Kubernetes to bind volumes to " + str(len(createdPvcNames)) + " PVCs.")
+        with tracing.span("pvc-bind", pvcs=len(createdPvcNames)):
+            try:
+                pvcStates = await _wait_for_objects(list_func=api.list_namespaced_persistent_volume_claim,
+                                                    names=createdPvcNames,
+                                                    condition=lambda pvc: pvc is not None and pvc.status.phase == "Bound",
+                                                    namespace=namespace, timeout=timeout)
+            except WaitTimeoutError:
+                # Retrieve the current state of the PVCs that did not bind in time
+                try:
+                    pvcStates = {pvc.metadata.name: pvc for pvc in await _list_namespaced_objects(
+                        kind="persistentvolumeclaims", namespace=namespace, session=session)}
+                except ApiException:
+                    pvcStates = dict()
+            except ApiException as err:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                raise APIConnectionError(err)
+
+    # Construct report
+    report = list()
+    for pvcName in new_pvc_names:
+        cloneDict = dict()
+        cloneDict["PersistentVolumeClaim (PVC) Name"] = pvcName
+        if errors[pvcName]:
+            cloneDict["Status"] = "Failed"
+            cloneDict["Error"] = "Kubernetes API Error: " + errors[pvcName]
+        else:
+            pvc = pvcStates.get(pvcName)
+            if pvc is not None and pvc.status.phase == "Bound":
+                cloneDict["Status"] = "Bound"
+                cloneDict["Error"] = ""
+            else:
+                cloneDict["Status"] = "Failed"
+                cloneDict["Error"] = "Timed out waiting for Kubernetes to bind volume to PVC."
+        report.append(cloneDict)
+
+    # Print report
+    if print_output:
+        _print_table(report)
+        failures = len([cloneDict for cloneDict in report if cloneDict["Status"] == "Failed"])
+        if failures:
+            print(str(failures) + " of " + str(len(report)) + " clones failed.")
+        else:
+            print("Volumes successfully cloned.")
+
+    return report
+
+
+@tracing.traced
+async def create_jupyter_lab(workspace_name: str, workspace_size: str, mount_pvc: str = None, storage_class: str = None,
+                             load_balancer_service: bool = False, namespace: str = "default",
+                             workspace_password: str = None,
+                             workspace_image: str = "nvcr.io/nvidia/tensorflow:22.05-tf2-py3",
+                             request_cpu: str = None, request_memory: str = None, request_nvidia_gpu: str = None,
+                             allocate_resource: str = None, print_output: bool = False,
+                             pvc_already_exists: bool = False, labels: dict = None, timeout: float = None,
+                             session: AsyncDataOpsSession = None) -> str:
+    """Asynchronous version of netapp_dataops.k8s.create_jupyter_lab().
+
+    If workspace_password is not specified, the password prompt is run in the event loop's default executor so
+    that it does not block other coroutines.
+    """
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Set labels
+    if not labels:
+        labels = _get_jupyter_lab_labels(workspaceName=workspace_name)
+
+    # Step 0 - Set password
+    from notebook import auth as jupyter_auth
+    with tracing.span("password-hash"):
+        if not workspace_password:
+            print("Setting workspace password (this password will be required in order to access the workspace)...")
+            hashedPassword = await asyncio.get_running_loop().run_in_executor(None, jupyter_auth.passwd)
+        else:
+            hashedPassword = jupyter_auth.passwd(workspace_password)
+
+    # Step 1 - Create PVC for workspace
+    if not pvc_already_exists:
+        if print_output:
+            print("\nCreating persistent volume for workspace...")
+        try:
+            await create_volume(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name),
+                                volume_size=workspace_size, storage_class=storage_class, namespace=namespace,
+                                pvc_labels=labels, print_output=print_output, timeout=timeout, session=session)
+        except:
+            if print_output:
+                print("Aborting workspace creation...")
+            raise
+
+    # Step 2 - Create service for workspace
+    service = _construct_jupyter_lab_service(workspaceName=workspace_name, labels=labels,
+                                             loadBalancerService=load_balancer_service)
+    if print_output:
+        print("\nCreating Service '" + _get_jupyter_lab_service(
+            workspaceName=workspace_name) + "' in namespace '" + namespace + "'.")
+    with tracing.span("service-create", service=service.metadata.name):
+        try:
+            await session.core_v1_api().create_namespaced_service(namespace=namespace, body=service)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting workspace creation...")
+            raise APIConnectionError(err)
+
+    if print_output:
+        print("Service successfully created.")
+
+    # Step 3 - Create deployment
+
+    # Attach additional PVC if needed
+    if mount_pvc and print_output:
+        divider_index = mount_pvc.find(":")
+        print("\nAttaching Additional PVC: '" + mount_pvc[:divider_index] + "' at mount_path: '" + mount_pvc[divider_index+1:] + "'.")
+
+    deployment = _construct_jupyter_lab_deployment(workspaceName=workspace_name, labels=labels,
+                                                   hashedPassword=hashedPassword, workspaceImage=workspace_image,
+                                                   mountPvc=mount_pvc, requestCpu=request_cpu,
+                                                   requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                                   allocateResource=allocate_resource)
+    if print_output:
+        print("\nCreating Deployment '" + _get_jupyter_lab_deployment(
+            workspaceName=workspace_name) + "' in namespace '" + namespace + "'.")
+    with tracing.span("deployment-create", deployment=deployment.metadata.name):
+        try:
+            await session.apps_v1_api().create_namespaced_deployment(namespace=namespace, body=deployment)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting workspace creation...")
+            raise APIConnectionError(err)
+
+    # Wait for deployment to be ready
+    if print_output:
+        print("Deployment '" + _get_jupyter_lab_deployment(workspaceName=workspace_name) + "' created.")
+    await _wait_for_deployment_ready(deploymentName=_get_jupyter_lab_deployment(workspaceName=workspace_name),
+                                     namespace=namespace, printOutput=print_output, timeout=timeout, session=session)
+
+    if print_output:
+        print("Deployment successfully created.")
+
+    # Step 4 - Retrieve access URL
+    with tracing.span("url-resolve"):
+        try:
+            serviceStatus = await _retrieve_object(kind="services", name=_get_jupyter_lab_service(workspaceName=workspace_name),
+                                                   namespace=namespace, printOutput=print_output, session=session)
+            nodeIp = None
+            if serviceStatus.spec.type != "LoadBalancer":
+                nodeIp = await _retrieve_node_ip(session=session)
+            url = _construct_jupyter_lab_url(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=print_output)
+        except (APIConnectionError, ServiceUnavailableError):
+            if print_output:
+                print("Aborting workspace creation...")
+            raise
+
+    if print_output:
+        print("\nWorkspace successfully created.")
+        print("To access workspace, navigate to " + url)
+
+    return url
+
+
+@tracing.traced
+async def create_jupyter_lab_snapshot(workspace_name: str, snapshot_name: str = None,
+                                      volume_snapshot_class: str = "csi-snapclass", namespace: str = "default",
+                                      print_output: bool = False, timeout: float = None,
+                                      dataset_version: str = None, session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.create_jupyter_lab_snapshot()."""
+    _validate_dataset_version(datasetVersion=dataset_version)
+
+    if print_output:
+        print(
+            "Creating VolumeSnapshot for JupyterLab workspace '" + workspace_name + "' in namespace '" + namespace + "'...")
+    await create_volume_snapshot(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name),
+                                 snapshot_name=snapshot_name, volume_snapshot_class=volume_snapshot_class,
+                                 namespace=namespace, print_output=print_output, timeout=timeout,
+                                 dataset_version=dataset_version,
+                                 snapshot_labels={"created-by-operation": "create-jupyterlab-snapshot",
+                                                  "jupyterlab-workspace-name": workspace_name},
+                                 session=session)
+
+
+@tracing.traced
+async def create_triton_server(server_name: str, model_pvc_name: str, load_balancer_service: bool = False,
+                               namespace: str = "default", server_image: str = "nvcr.io/nvidia/tritonserver:21.11-py3",
+                               request_cpu: str = None, request_memory: str = None, request_nvidia_gpu: str = None,
+                               allocate_resource: str = None, print_output: bool = False, labels: dict = None,
+                               timeout: float = None, replicas: int = 1, per_replica_model_clones: bool = False,
+                               model_snapshot_name: str = None, volume_snapshot_class: str = "csi-snapclass",
+                               session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.create_triton_server()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Set labels
+    if not labels:
+        labels = _get_triton_dev_labels(server_name=server_name)
+
+    # Step 0 - If each replica will mount its own clone of the model repository, determine the source VolumeSnapshot
+    if per_replica_model_clones:
+        if not model_snapshot_name:
+            timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+            model_snapshot_name = "ntap-dsutil.for-triton." + server_name + "." + timestamp
+            if print_output:
+                print("Creating new VolumeSnapshot '" + model_snapshot_name + "' for model repository PVC '" + model_pvc_name + "'...")
+            await create_volume_snapshot(pvc_name=model_pvc_name, snapshot_name=model_snapshot_name,
+                                         volume_snapshot_class=volume_snapshot_class, namespace=namespace,
+                                         print_output=print_output, timeout=timeout,
+                                         snapshot_labels={"created-by-operation": "create-triton-server"},
+                                         session=session)
+        sourcePvcName, modelVolumeSize = await _retrieve_source_volume_details_for_volume_snapshot(
+            snapshotName=model_snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+        sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=sourcePvcName, namespace=namespace,
+                                           printOutput=print_output, session=session)
+        modelStorageClass = sourcePvc.spec.storage_class_name
+
+    # Step 1 - Create service for server
+    service = _construct_triton_service(server_name=server_name, labels=labels, loadBalancerService=load_balancer_service)
+    if print_output:
+        print("\nCreating Service '" + _get_triton_dev_service(
+            server_name=server_name) + "' in namespace '" + namespace + "'.")
+    with tracing.span("service-create", service=service.metadata.name):
+        try:
+            await session.core_v1_api().create_namespaced_service(namespace=namespace, body=service)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting server creation...")
+            raise APIConnectionError(err)
+
+    # Create headless service that gives each replica a stable DNS name
+    if per_replica_model_clones:
+        replicaService = _construct_triton_replica_service(server_name=server_name, labels=labels)
+        with tracing.span("service-create", service=replicaService.metadata.name):
+            try:
+                await session.core_v1_api().create_namespaced_service(namespace=namespace, body=replicaService)
+            except ApiException as err:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                    print("Aborting server creation...")
+                raise APIConnectionError(err)
+
+    if print_output:
+        print("Service successfully created.")
+
+    # Step 2 - Create Deployment (or, if each replica mounts its own model repository clone, StatefulSet) for Triton Server
+    if per_replica_model_clones:
+        deployment = _construct_triton_stateful_set(server_name=server_name, labels=labels,
+                                                    modelSnapshotName=model_snapshot_name,
+                                                    modelVolumeSize=modelVolumeSize, storageClass=modelStorageClass,
+                                                    serverImage=server_image, requestCpu=request_cpu,
+                                                    requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                                    allocateResource=allocate_resource, replicas=replicas)
+        kind = "StatefulSet"
+    else:
+        deployment = _construct_triton_deployment(server_name=server_name, labels=labels, modelPvcName=model_pvc_name,
+                                                  serverImage=server_image, requestCpu=request_cpu,
+                                                  requestMemory=request_memory, requestNvidiaGpu=request_nvidia_gpu,
+                                                  allocateResource=allocate_resource, replicas=replicas)
+        kind = "Deployment"
+    if print_output:
+        print("\nCreating " + kind + " '" + _get_triton_deployment(
+            server_name=server_name) + "' in namespace '" + namespace + "'.")
+    with tracing.span("deployment-create", deployment=deployment.metadata.name):
+        try:
+            if per_replica_model_clones:
+                await session.apps_v1_api().create_namespaced_stateful_set(namespace=namespace, body=deployment)
+            else:
+                await session.apps_v1_api().create_namespaced_deployment(namespace=namespace, body=deployment)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+                print("Aborting server creation...")
+            raise APIConnectionError(err)
+
+    # Wait for all replicas to be ready
+    if print_output:
+        print(kind + " '" + _get_triton_deployment(server_name=server_name) + "' created.")
+    await _wait_for_deployment_ready(deploymentName=_get_triton_deployment(server_name=server_name),
+                                     namespace=namespace, printOutput=print_output, timeout=timeout,
+                                     condition=_is_triton_server_ready, statefulSet=per_replica_model_clones,
+                                     session=session)
+
+    if print_output:
+        print(kind + " successfully created.")
+
+    # Step 3 - Retrieve endpoints
+    with tracing.span("url-resolve"):
+        try:
+            serviceStatus = await _retrieve_object(kind="services", name=_get_triton_dev_service(server_name=server_name),
+                                                   namespace=namespace, printOutput=print_output, session=session)
+            nodeIp = None
+            if serviceStatus.spec.type != "LoadBalancer":
+                nodeIp = await _retrieve_node_ip(session=session)
+            uri = _construct_triton_endpoints(serviceStatus=serviceStatus, nodeIp=nodeIp, printOutput=print_output)
+        except (APIConnectionError, ServiceUnavailableError):
+            if print_output:
+                print("Aborting server creation...")
+            raise
+
+    if print_output:
+        print("\nServer successfully created.")
+        print("Server endpoints:")
+        print("http: " + uri[0])
+        print("grpc: " + uri[1])
+        print("metrics: " + uri[2] + "/metrics")
+    return uri
+
+
+@tracing.traced
+async def create_volume(pvc_name: str, volume_size: str, storage_class: str = None, namespace: str = "default",
+                        print_output: bool = False,
+                        pvc_labels: dict = {"created-by": "ntap-dsutil", "created-by-operation": "create-volume"},
+                        source_snapshot: str = None, source_pvc: str = None, timeout: float = None,
+                        session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.create_volume()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Construct PVC
+    pvc = _construct_pvc(pvcName=pvc_name, volumeSize=volume_size, storageClass=storage_class, pvcLabels=pvc_labels,
+                         sourceSnapshot=source_snapshot, sourcePvc=source_pvc)
+
+    # Create PVC
+    if print_output:
+        print("Creating PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
+    api = session.core_v1_api()
+    with tracing.span("pvc-create", pvc=pvc_name):
+        try:
+            await api.create_namespaced_persistent_volume_claim(body=pvc, namespace=namespace)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    # Wait for PVC to bind to volume
+    if print_output:
+        print("PersistentVolumeClaim (PVC) '" + pvc_name + "' created. Waiting for Kubernetes to bind volume to PVC.")
+    with tracing.span("pvc-bind", pvc=pvc_name):
+        try:
+            await _wait_for_object(list_func=api.list_namespaced_persistent_volume_claim, name=pvc_name,
+                                   namespace=namespace, condition=lambda pvc: pvc is not None and pvc.status.phase == "Bound",
+                                   timeout=timeout)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for Kubernetes to bind volume to PVC.")
+            raise
+
+    if print_output:
+        print(
+            "Volume successfully created and bound to PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
+
+
+@tracing.traced
+async def create_volume_snapshot(pvc_name: str, snapshot_name: str = None, volume_snapshot_class: str = "csi-snapclass",
+                                 namespace: str = "default", print_output: bool = False, timeout: float = None,
+                                 dataset_version: str = None, snapshot_labels: dict = None,
+                                 session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.create_volume_snapshot()."""
+    _validate_dataset_version(datasetVersion=dataset_version)
+
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Set snapshot name if not passed into function
+    if not snapshot_name:
+        timestamp = datetime.today().strftime("%Y%m%d%H%M%S")
+        snapshot_name = "ntap-dsutil." + timestamp
+
+    # Label snapshot with its source PVC and JupyterLab workspace so that snapshot queries can use label selectors
+    labels = _get_volume_snapshot_labels(pvcName=pvc_name, operation="create-volume-snapshot",
+                                         datasetVersion=dataset_version)
+    labels.update(snapshot_labels or dict())
+    if "jupyterlab-workspace-name" not in labels:
+        try:
+            sourcePvc = await _read_namespaced_object(kind="persistentvolumeclaims", name=pvc_name, namespace=namespace,
+                                                      session=session)
+            workspaceName = (sourcePvc.metadata.labels or dict()).get("jupyterlab-workspace-name")
+        except ApiException as err:
+            if err.status != 404:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                raise APIConnectionError(err)
+            workspaceName = None
+        if workspaceName:
+            labels["jupyterlab-workspace-name"] = workspaceName
+
+    # Construct dict representing snapshot
+    snapshot = _construct_volume_snapshot(snapshotName=snapshot_name, pvcName=pvc_name,
+                                          volumeSnapshotClass=volume_snapshot_class, labels=labels)
+
+    # Create snapshot
+    if print_output:
+        print(
+            "Creating VolumeSnapshot '" + snapshot_name + "' for PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'.")
+    api = session.custom_objects_api()
+    with tracing.span("snapshot-create", snapshot=snapshot_name):
+        try:
+            await api.create_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                                      namespace=namespace, body=snapshot, plural="volumesnapshots")
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    # Wait for snapshot creation to complete
+    if print_output:
+        print(
+            "VolumeSnapshot '" + snapshot_name + "' created. Waiting for Trident to create snapshot on backing storage.")
+    with tracing.span("snapshot-ready", snapshot=snapshot_name):
+        try:
+            await _wait_for_object(list_func=api.list_namespaced_custom_object, name=snapshot_name, namespace=namespace,
+                                   condition=_is_volume_snapshot_ready, timeout=timeout, group=_get_snapshot_api_group(),
+                                   version=_get_snapshot_api_version(), plural="volumesnapshots")
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for Trident to create snapshot on backing storage.")
+            raise
+
+    if print_output:
+        print("Snapshot successfully created.")
+
+
+@tracing.traced
+async def delete_jupyter_lab(workspace_name: str, namespace: str = "default", preserve_snapshots: bool = False,
+                             print_output: bool = False, timeout: float = None, session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.delete_jupyter_lab()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Delete workspace
+    if print_output:
+        print("Deleting workspace '" + workspace_name + "' in namespace '" + namespace + "'.")
+    try:
+        # Delete deployment
+        if print_output:
+            print("Deleting Deployment...")
+        await session.apps_v1_api().delete_namespaced_deployment(
+            namespace=namespace, name=_get_jupyter_lab_deployment(workspaceName=workspace_name))
+
+        # Delete service
+        if print_output:
+            print("Deleting Service...")
+        await session.core_v1_api().delete_namespaced_service(
+            namespace=namespace, name=_get_jupyter_lab_service(workspaceName=workspace_name))
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Delete PVC
+    if print_output:
+        print("Deleting PVC...")
+    await delete_volume(pvc_name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name), namespace=namespace,
+                        preserve_snapshots=preserve_snapshots, print_output=print_output, timeout=timeout,
+                        session=session)
+
+    if print_output:
+        print("Workspace successfully deleted.")
+
+
+@tracing.traced
+async def delete_triton_server(server_name: str, namespace: str = "default", print_output: bool = False,
+                               session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.delete_triton_server()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Delete server
+    if print_output:
+        print("Deleting server '" + server_name + "' in namespace '" + namespace + "'.")
+        print("Note: this operation does NOT delete the model repository PVC or VolumeSnapshot.")
+    try:
+        # Delete deployment
+        if print_output:
+            print("Deleting Deployment...")
+        perReplicaModelClones = False
+        try:
+            await session.apps_v1_api().delete_namespaced_deployment(
+                namespace=namespace, name=_get_triton_deployment(server_name=server_name))
+        except ApiException as err:
+            # Servers whose replicas mount their own model repository clones are StatefulSets
+            if err.status != 404:
+                raise
+            await session.apps_v1_api().delete_namespaced_stateful_set(
+                namespace=namespace, name=_get_triton_deployment(server_name=server_name))
+            perReplicaModelClones = True
+
+        # Delete service
+        if print_output:
+            print("Deleting Service...")
+        await session.core_v1_api().delete_namespaced_service(
+            namespace=namespace, name=_get_triton_dev_service(server_name=server_name))
+
+        # Delete headless replica service and per-replica model repository clones
+        if perReplicaModelClones:
+            try:
+                await session.core_v1_api().delete_namespaced_service(
+                    namespace=namespace, name=_get_triton_dev_replica_service(server_name=server_name))
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+            if print_output:
+                print("Deleting per-replica model repository PVCs...")
+            await session.core_v1_api().delete_collection_namespaced_persistent_volume_claim(
+                namespace=namespace, label_selector=_get_triton_dev_label_selector() + ",triton-server-name=" + server_name)
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    if print_output:
+        print("Triton Server instance successfully deleted.")
+
+
+@tracing.traced
+async def delete_volume(pvc_name: str, namespace: str = "default", preserve_snapshots: bool = False,
+                        print_output: bool = False, timeout: float = None, session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.delete_volume()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Optionally delete snapshots
+    snapshotNames = list()
+    if not preserve_snapshots:
+        if print_output:
+            print(
+                "Deleting all VolumeSnapshots associated with PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "'...")
+
+        # Retrieve list of snapshots for PVC
+        try:
+            snapshotList = await list_volume_snapshots(pvc_name=pvc_name, namespace=namespace, print_output=False,
+                                                       session=session)
+        except APIConnectionError as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise
+        snapshotNames = [snapshot["VolumeSnapshot Name"] for snapshot in snapshotList]
+
+        # Issue all snapshot deletions concurrently
+        await _delete_volume_snapshots(snapshotNames=snapshotNames, namespace=namespace, printOutput=print_output,
+                                       session=session)
+
+    # Delete PVC (the backing volume is retained by the storage driver until its snapshots are gone, so the PVC
+    # deletion does not have to wait for the snapshot deletions to complete)
+    if print_output:
+        print(
+            "Deleting PersistentVolumeClaim (PVC) '" + pvc_name + "' in namespace '" + namespace + "' and associated volume.")
+    api = session.core_v1_api()
+    with tracing.span("pvc-delete", pvc=pvc_name):
+        try:
+            await api.delete_namespaced_persistent_volume_claim(name=pvc_name, namespace=namespace)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    # Wait for VolumeSnapshots and PVC to disappear
+    async def _wait_for_pvc_deleted():
+        with tracing.span("pvc-deleted", pvc=pvc_name):
+            try:
+                await _wait_for_object(list_func=api.list_namespaced_persistent_volume_claim, name=pvc_name,
+                                       namespace=namespace, condition=lambda pvc: pvc is None, timeout=timeout)
+            except ApiException as err:
+                if print_output:
+                    print("Error: Kubernetes API Error: ", err)
+                raise APIConnectionError(err)
+            except WaitTimeoutError:
+                if print_output:
+                    print("Error: Timed out waiting for PersistentVolumeClaim (PVC) to be deleted.")
+                raise
+
+    await asyncio.gather(_wait_for_pvc_deleted(),
+                         _wait_for_volume_snapshots_deleted(snapshotNames=snapshotNames, namespace=namespace,
+                                                            printOutput=print_output, timeout=timeout,
+                                                            pvcName=pvc_name, session=session))
+
+    if print_output:
+        print("PersistentVolumeClaim (PVC) successfully deleted.")
+
+
+@tracing.traced
+async def delete_volume_snapshot(snapshot_name: str, namespace: str = "default", print_output: bool = False,
+                                 timeout: float = None, session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.delete_volume_snapshot()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Delete VolumeSnapshot
+    if print_output:
+        print("Deleting VolumeSnapshot '" + snapshot_name + "' in namespace '" + namespace + "'.")
+    api = session.custom_objects_api()
+    try:
+        await api.delete_namespaced_custom_object(group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                                                  namespace=namespace, plural="volumesnapshots", name=snapshot_name)
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Wait for VolumeSnapshot to disappear
+    try:
+        await _wait_for_object(list_func=api.list_namespaced_custom_object, name=snapshot_name, namespace=namespace,
+                               condition=lambda volumeSnapshot: volumeSnapshot is None, timeout=timeout,
+                               group=_get_snapshot_api_group(), version=_get_snapshot_api_version(),
+                               plural="volumesnapshots")
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    except WaitTimeoutError:
+        if print_output:
+            print("Error: Timed out waiting for VolumeSnapshot to be deleted.")
+        raise
+
+    if print_output:
+        print("VolumeSnapshot successfully deleted.")
+
+
+async def get_default_session(print_output: bool = False) -> AsyncDataOpsSession:
+    """Get the default AsyncDataOpsSession for the running event loop, opening it on first use.
+
+    An aiohttp connection pool is bound to the event loop that created it, so each event loop has its own
+    default session.
+
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :return: The default AsyncDataOpsSession object for the running event loop.
+    :raises InvalidConfigError: When the Kubernetes configuration is missing or invalid.
+    """
+    loop = asyncio.get_running_loop()
+    session = _default_sessions.get(loop)
+    if session is None:
+        session = await AsyncDataOpsSession(print_output=print_output).open()
+        # Another coroutine may have opened a default session while the configuration was loading
+        if loop in _default_sessions:
+            await session.close()
+            session = _default_sessions[loop]
+        else:
+            _default_sessions[loop] = session
+    return session
+
+
+@tracing.traced
+async def list_jupyter_labs(namespace: str = "default", print_output: bool = False, output_format: str = "table",
+                            session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.list_jupyter_labs()."""
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Retrieve workspace Deployments, PVCs, and Services concurrently
+    try:
+        deployments, pvcs, services = await asyncio.gather(
+            *[_list_namespaced_objects(kind=kind, namespace=namespace, labelSelector=_get_jupyter_lab_label_selector(),
+                                       session=session)
+              for kind in ("deployments", "persistentvolumeclaims", "services")])
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type != "LoadBalancer" for service in services):
+        nodeIp = await _retrieve_node_ip(session=session)
+
+    # Retrieve VolumeSnapshot names (only needed for clones)
+    volumeSnapshotNames = set()
+    if any(pvc.spec.data_source for pvc in pvcs):
+        volumeSnapshotNames = await _retrieve_volume_snapshot_names(namespace=namespace, printOutput=print_output,
+                                                                    session=session)
+
+    # Construct list of workspaces
+    workspacesList = _construct_jupyter_labs_list(deployments=deployments, pvcs=pvcs, services=services, nodeIp=nodeIp,
+                                                  volumeSnapshotNames=volumeSnapshotNames)
+
+    # Print list of workspaces
+    if print_output:
+        _print_table(workspacesList, outputFormat=output_format)
+
+    return workspacesList
+
+
+@tracing.traced
+async def list_jupyter_lab_snapshots(workspace_name: str = None, namespace: str = "default", print_output: bool = False,
+                                     dataset_version: str = None, output_format: str = "table",
+                                     session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.list_jupyter_lab_snapshots()."""
+    # Determine PVC name
+    if workspace_name:
+        pvcName = _get_jupyter_lab_workspace_pvc_name(workspaceName=workspace_name)
+    else:
+        pvcName = None
+
+    # List snapshots
+    return await list_volume_snapshots(pvc_name=pvcName, namespace=namespace, print_output=print_output,
+                                       jupyter_lab_workspaces_only=True, dataset_version=dataset_version,
+                                       output_format=output_format, session=session)
+
+
+@tracing.traced
+async def list_triton_servers(namespace: str = "default", print_output: bool = False, output_format: str = "table",
+                              session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.list_triton_servers()."""
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Retrieve server Deployments, StatefulSets, pods, and Services concurrently
+    try:
+        deployments, services, statefulSets, pods = await asyncio.gather(
+            _list_namespaced_objects(kind="deployments", namespace=namespace,
+                                     labelSelector=_get_triton_dev_label_selector(), session=session),
+            _list_namespaced_objects(kind="services", namespace=namespace,
+                                     labelSelector=_get_triton_dev_label_selector(), session=session),
+            session.apps_v1_api().list_namespaced_stateful_set(namespace=namespace,
+                                                               label_selector=_get_triton_dev_label_selector()),
+            session.core_v1_api().list_namespaced_pod(namespace=namespace,
+                                                      label_selector=_get_triton_dev_label_selector()))
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve node IP (only needed for NodePort services)
+    nodeIp = None
+    if any(service.spec.type == "NodePort" for service in services):
+        nodeIp = await _retrieve_node_ip(session=session)
+
+    # Construct list of instances
+    serversList = _construct_triton_servers_list(deployments=deployments, statefulSets=statefulSets.items,
+                                                 pods=pods.items, services=services, nodeIp=nodeIp,
+                                                 namespace=namespace)
+
+    # Print list of servers
+    if print_output:
+        _print_triton_servers_list(serversList, outputFormat=output_format)
+
+    return serversList
+
+
+@tracing.traced
+async def list_volumes(namespace: str = "default", print_output: bool = False, output_format: str = "table",
+                       session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.list_volumes()."""
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Retrieve list of PVCs
+    try:
+        pvcList = await _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace, session=session)
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Retrieve VolumeSnapshot names so that clone sources can be checked without additional API calls
+    if any(pvc.spec.data_source for pvc in pvcList):
+        volumeSnapshotNames = await _retrieve_volume_snapshot_names(namespace=namespace, printOutput=print_output,
+                                                                    session=session)
+    else:
+        volumeSnapshotNames = set()
+
+    # Construct list of volumes
+    volumesList = _construct_volumes_list(pvcList=pvcList, volumeSnapshotNames=volumeSnapshotNames)
+
+    # Print list of volumes
+    if print_output:
+        _print_table(volumesList, outputFormat=output_format)
+
+    return volumesList
+
+
+@tracing.traced
+async def list_volume_snapshots(pvc_name: str = None, namespace: str = "default", print_output: bool = False,
+                                jupyter_lab_workspaces_only: bool = False, dataset_version: str = None,
+                                output_format: str = "table", session: AsyncDataOpsSession = None) -> list:
+    """Asynchronous version of netapp_dataops.k8s.list_volume_snapshots()."""
+    _validate_output_format(output_format)
+
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Retrieve VolumeSnapshots and source PVCs (only the named PVC if specified) concurrently
+    async def _list_pvcs() -> list:
+        if not pvc_name:
+            return await _list_namespaced_objects(kind="persistentvolumeclaims", namespace=namespace, session=session)
+        try:
+            return [await _read_namespaced_object(kind="persistentvolumeclaims", name=pvc_name, namespace=namespace,
+                                                  session=session)]
+        except ApiException as err:
+            if err.status != 404:
+                raise
+            return []
+
+    # VolumeSnapshots are selected by label where possible
+    labelSelectors = _get_volume_snapshot_label_selectors(pvcName=pvc_name,
+                                                          jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only,
+                                                          datasetVersion=dataset_version)
+    try:
+        results = await asyncio.gather(
+            _list_pvcs(), *[_list_namespaced_objects(kind="volumesnapshots", namespace=namespace,
+                                                     labelSelector=labelSelector, session=session)
+                            for labelSelector in labelSelectors])
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+    pvcs = results[0]
+    volumeSnapshotList = list({volumeSnapshot["metadata"]["name"]: volumeSnapshot
+                               for volumeSnapshots in results[1:] for volumeSnapshot in volumeSnapshots}.values())
+
+    # Index source PVC labels so that PVC existence and workspace membership can be checked without additional API calls
+    pvcLabels = {pvc.metadata.name: (pvc.metadata.labels or dict()) for pvc in pvcs}
+
+    # Construct list of snapshots
+    snapshotsList = _construct_volume_snapshots_list(volumeSnapshotList=volumeSnapshotList, pvcLabels=pvcLabels,
+                                                     pvcName=pvc_name,
+                                                     jupyterLabWorkspacesOnly=jupyter_lab_workspaces_only)
+
+    # Print list of snapshots
+    if print_output:
+        _print_table(snapshotsList, outputFormat=output_format)
+
+    return snapshotsList
+
+
+@tracing.traced
+async def restore_jupyter_lab_snapshot(snapshot_name: str = None, namespace: str = "default",
+                                       print_output: bool = False, timeout: float = None,
+                                       session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.restore_jupyter_lab_snapshot()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Retrieve source PVC name
+    sourcePvcName = (await _retrieve_source_volume_details_for_volume_snapshot(
+        snapshotName=snapshot_name, namespace=namespace, printOutput=print_output, session=session))[0]
+
+    # Retrieve workspace name
+    sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=sourcePvcName, namespace=namespace,
+                                       printOutput=print_output, session=session)
+    workspaceName = sourcePvc.metadata.labels["jupyterlab-workspace-name"]
+
+    # Set labels
+    labels = _get_jupyter_lab_labels(workspaceName=workspaceName)
+    labels["created-by-operation"] = "restore-jupyterlab-snapshot"
+
+    if print_output:
+        print(
+            "Restoring VolumeSnapshot '" + snapshot_name + "' for JupyterLab workspace '" + workspaceName + "' in namespace '" + namespace + "'...")
+
+    # Scale deployment to 0 pods
+    await _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=0, namespace=namespace,
+                                        printOutput=print_output, session=session)
+
+    # Wait for workspace pod to terminate
+    deploymentName = _get_jupyter_lab_deployment(workspaceName=workspaceName)
+    with tracing.span("deployment-scaled-down", deployment=deploymentName):
+        try:
+            await _wait_for_object(list_func=session.apps_v1_api().list_namespaced_deployment, name=deploymentName,
+                                   namespace=namespace, condition=_is_deployment_scaled_down, timeout=timeout)
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if print_output:
+                print("Error: Timed out waiting for Deployment to scale down.")
+            raise
+
+    # Restore snapshot
+    await restore_volume_snapshot(snapshot_name=snapshot_name, namespace=namespace, print_output=print_output,
+                                  pvc_labels=labels, timeout=timeout, session=session)
+
+    # Scale deployment to 1 pod
+    await _scale_jupyter_lab_deployment(workspaceName=workspaceName, numPods=1, namespace=namespace,
+                                        printOutput=print_output, session=session)
+
+    # Wait for deployment to reach ready state
+    await _wait_for_deployment_ready(deploymentName=_get_jupyter_lab_deployment(workspaceName=workspaceName),
+                                     namespace=namespace, printOutput=print_output, timeout=timeout, session=session)
+
+    if print_output:
+        print("JupyterLab workspace snapshot successfully restored.")
+
+
+@tracing.traced
+async def restore_volume_snapshot(snapshot_name: str, namespace: str = "default", print_output: bool = False,
+                                  pvc_labels: dict = {"created-by": "ntap-dsutil",
+                                                      "created-by-operation": "restore-volume-snapshot"},
+                                  timeout: float = None, session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.restore_volume_snapshot()."""
+    # Retrieve source PVC, restoreSize, and StorageClass
+    sourcePvcName, restoreSize = await _retrieve_source_volume_details_for_volume_snapshot(
+        snapshotName=snapshot_name, namespace=namespace, printOutput=print_output, session=session)
+    sourcePvc = await _retrieve_object(kind="persistentvolumeclaims", name=sourcePvcName, namespace=namespace,
+                                       printOutput=print_output, session=session)
+    storageClass = sourcePvc.spec.storage_class_name
+
+    if print_output:
+        print(
+            "Restoring VolumeSnapshot '" + snapshot_name + "' for PersistentVolumeClaim '" + sourcePvcName + "' in namespace '" + namespace + "'.")
+
+    # Delete source PVC
+    try:
+        await delete_volume(pvc_name=sourcePvcName, namespace=namespace, preserve_snapshots=True, print_output=False,
+                            timeout=timeout, session=session)
+    except APIConnectionError as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise
+
+    # Create new PVC from snapshot
+    try:
+        await create_volume(pvc_name=sourcePvcName, volume_size=restoreSize, storage_class=storageClass,
+                            namespace=namespace, print_output=False, pvc_labels=pvc_labels,
+                            source_snapshot=snapshot_name, timeout=timeout, session=session)
+    except APIConnectionError as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise
+
+    if print_output:
+        print("VolumeSnapshot successfully restored.")
+
+
+@tracing.traced
+async def scale_triton_server(server_name: str, replicas: int, namespace: str = "default", wait: bool = False,
+                              print_output: bool = False, timeout: float = None,
+                              session: AsyncDataOpsSession = None):
+    """Asynchronous version of netapp_dataops.k8s.scale_triton_server()."""
+    # Retrieve Kubernetes API session
+    session = await _get_session(session=session, print_output=print_output)
+
+    # Scale deployment (or, for servers whose replicas mount their own model repository clones, StatefulSet)
+    body = {
+        "spec": {
+            "replicas": replicas
+        }
+    }
+    if print_output:
+        print("Scaling server '" + server_name + "' in namespace '" + namespace + "' to " + str(replicas) + " replica(s).")
+    statefulSet = False
+    with tracing.span("server-scale", server=server_name, replicas=replicas):
+        try:
+            try:
+                await session.apps_v1_api().patch_namespaced_deployment(
+                    name=_get_triton_deployment(server_name=server_name), namespace=namespace, body=body)
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+                await session.apps_v1_api().patch_namespaced_stateful_set(
+                    name=_get_triton_deployment(server_name=server_name), namespace=namespace, body=body)
+                statefulSet = True
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+    # Wait for all replicas to be ready
+    if wait:
+        await _wait_for_deployment_ready(deploymentName=_get_triton_deployment(server_name=server_name),
+                                         namespace=namespace, printOutput=print_output, timeout=timeout,
+                                         condition=_is_triton_server_ready, statefulSet=statefulSet,
+                                         session=session)
+
+    if print_output:
+        print("Server successfully scaled.")
+
+
+def set_default_session(session: AsyncDataOpsSession = None):
+    """Replace the default AsyncDataOpsSession for the running event loop.
+
+    This function must be called from a coroutine running in the event loop whose default session is replaced.
+
+    :param session: The session to use as the default. If None, the current default session is discarded and a
+        new one will be opened, reloading the Kubernetes configuration, the next time it is needed.
+    """
+    loop = asyncio.get_running_loop()
+    if session is None:
+        _default_sessions.pop(loop, None)
+    else:
+        _default_sessions[loop] = session
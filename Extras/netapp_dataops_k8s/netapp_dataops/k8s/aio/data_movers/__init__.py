@@ -0,0 +1,182 @@
+"""NetApp DataOps Toolkit asyncio data mover package."""
+import copy
+
+from kubernetes.client import (
+    V1Job,
+    V1JobSpec,
+    V1JobStatus,
+    V1ObjectMeta,
+    V1PodTemplateSpec,
+)
+
+from netapp_dataops.k8s import (
+    APIConnectionError,
+    WaitTimeoutError,
+)
+from netapp_dataops.k8s.aio import (
+    _get_session,
+    _wait_for_object,
+    ApiException,
+    AsyncDataOpsSession,
+)
+
+
+def _is_job_finished(job) -> bool:
+    if job is None or job.status is None or not job.status.conditions:
+        return False
+    return any(condition.type in ("Complete", "Failed") and condition.status == "True"
+               for condition in job.status.conditions)
+
+
+class AsyncDataMoverJob:
+    """Manage Kubernetes jobs intended for moving data between locations using asyncio.
+
+    This is the asyncio equivalent of netapp_dataops.k8s.data_movers.DataMoverJob. It is unlikely
+    that you want to use this class directly. Instead use a derived class from this.
+    """
+
+    def __init__(self, namespace: str = "default",
+                 job_spec_template: V1JobSpec = None,
+                 print_output: bool = False,
+                 session: AsyncDataOpsSession = None):
+        """Initialize an AsyncDataMoverJob object.
+
+        :param namespace: The namespace which applies to the job. Defaults to the default namespace.
+        :param job_spec_template: A Kubernetes job spec object. This can be used to configure any of the
+            optional properties of a job spec if desired.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param session: The AsyncDataOpsSession to use for Kubernetes API calls. If not specified, the default
+            session for the running event loop is used.
+        """
+        if namespace is None:
+            self.namespace = "default"
+        else:
+            self.namespace = namespace
+
+        if job_spec_template is None:
+            self.__job_spec = V1JobSpec(template=V1PodTemplateSpec())
+        else:
+            self.__job_spec = job_spec_template
+
+        self.print_output = print_output
+        self.session = session
+
+    @property
+    def job_spec(self) -> V1JobSpec:
+        """Get a deep copy of the object's job_spec template."""
+        return copy.deepcopy(self.__job_spec)
+
+    @job_spec.setter
+    def job_spec(self, spec: V1JobSpec):
+        self.__job_spec = spec
+
+    async def create_job(self, job_metadata: V1ObjectMeta, job_spec: V1JobSpec):
+        """Create a Kubernetes job.
+
+        :return: The V1Job object representing the created job.
+        """
+        job_request = V1Job(
+            api_version='batch/v1',
+            kind='Job',
+            metadata=job_metadata,
+            spec=job_spec
+        )
+
+        session = await _get_session(session=self.session, print_output=self.print_output)
+
+        try:
+            job = await session.batch_v1_api().create_namespaced_job(namespace=self.namespace, body=job_request)
+        except ApiException as error:
+            raise APIConnectionError(error)
+        return job
+
+    async def delete_job(self, job: str):
+        """Delete the Kubernetes job with the provided name.
+
+        This will delete the job with the provided name regardless of the status of the job.
+
+        :param job: The name of the job to delete.
+        """
+        session = await _get_session(session=self.session, print_output=self.print_output)
+
+        try:
+            await session.batch_v1_api().delete_namespaced_job(name=job, namespace=self.namespace)
+        except ApiException as error:
+            raise APIConnectionError(error)
+
+    async def did_job_fail(self, job: str) -> bool:
+        """Get an indication if the job failed or not.
+
+        :param job: The name of the job.
+        :return: True if the job failed and False otherwise.
+        """
+        job_status = await self.get_job_status(job=job)
+        return bool(job_status.failed)
+
+    async def did_job_succeed(self, job: str) -> bool:
+        """Get an indication if the job succeeded or not.
+
+        :param job: The name of the job.
+        :return: True if the job succeeded and False otherwise.
+        """
+        job_status = await self.get_job_status(job=job)
+        return bool(job_status.succeeded)
+
+    async def get_job_status(self, job: str) -> V1JobStatus:
+        """Get the status of a Kubernetes job.
+
+        :param job: The name of the job to get the status of.
+        :return: The status of the requested job.
+        :raises APIConnectionError: When there is a problem connecting to Kubernetes.
+        """
+        session = await _get_session(session=self.session, print_output=self.print_output)
+
+        try:
+            job = await session.batch_v1_api().read_namespaced_job(name=job, namespace=self.namespace)
+        except ApiException as error:
+            raise APIConnectionError(error)
+        return job.status
+
+    async def is_job_active(self, job: str) -> bool:
+        """Get an indication if the job is active or not.
+
+        :param job: The name of the job.
+        :return: True if the job is active, meaning a pod is running, and False otherwise.
+        """
+        job_status = await self.get_job_status(job=job)
+        return bool(job_status.active)
+
+    async def is_job_started(self, job: str) -> bool:
+        """Get an indication if the job has started or not.
+
+        :param job: The name of the job.
+        :return: True if the job status indicates a start time. False otherwise.
+        """
+        job_status = await self.get_job_status(job=job)
+        return bool(job_status.start_time)
+
+    async def wait_for_job(self, job: str, timeout: float = None) -> V1JobStatus:
+        """Wait for a Kubernetes job to complete or fail.
+
+        The job is watched rather than polled, so the coroutine resumes as soon as the API server reports
+        that the job has finished.
+
+        :param job: The name of the job.
+        :param timeout: The maximum number of seconds to wait. If None, wait indefinitely.
+        :return: The final status of the job.
+        :raises APIConnectionError: When there is a problem connecting to Kubernetes.
+        :raises WaitTimeoutError: When the job does not finish before the timeout expires.
+        """
+        session = await _get_session(session=self.session, print_output=self.print_output)
+
+        try:
+            finished_job = await _wait_for_object(list_func=session.batch_v1_api().list_namespaced_job, name=job,
+                                                  namespace=self.namespace, condition=_is_job_finished,
+                                                  timeout=timeout)
+        except ApiException as error:
+            raise APIConnectionError(error)
+        except WaitTimeoutError:
+            if self.print_output:
+                print("Error: Timed out waiting for job '" + job + "' to finish.")
+            raise
+        return finished_job.status
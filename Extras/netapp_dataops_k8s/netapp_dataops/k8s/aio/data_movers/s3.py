@@ -0,0 +1,103 @@
+"""NetApp DataOps Toolkit asyncio S3 Data Mover module"""
+
+from netapp_dataops.k8s.aio import AsyncDataOpsSession
+from netapp_dataops.k8s.aio.data_movers import AsyncDataMoverJob
+from netapp_dataops.k8s.data_movers.s3 import S3DataMover
+
+
+class AsyncS3DataMover(AsyncDataMoverJob):
+    """Used to move data between an S3 service and Kubernetes volumes using asyncio.
+
+    This is the asyncio equivalent of netapp_dataops.k8s.data_movers.s3.S3DataMover. The jobs
+    that are created are identical to the jobs created by S3DataMover. The S3 credentials secret
+    can be managed using netapp_dataops.k8s.data_movers.s3.S3ConfigSecret.
+    """
+
+    def __init__(self, credentials_secret,
+                 s3_host: str,
+                 s3_port: str = None,
+                 use_https: bool = True,
+                 verify_certificates: bool = True,
+                 image_name: str = None,
+                 job_spec_template=None,
+                 namespace: str = "default",
+                 ca_config_maps: list = None,
+                 cpu_request: str = None,
+                 cpu_limit: str = None,
+                 memory_request: str = None,
+                 memory_limit: str = None,
+                 print_output: bool = False,
+                 session: AsyncDataOpsSession = None):
+        """Initialize the AsyncS3DataMover object.
+
+        The parameters are the same as the parameters of S3DataMover, except that session is an
+        AsyncDataOpsSession. If not specified, the default session for the running event loop is used.
+        """
+        # The synchronous data mover is only used to construct job requests; it never calls the Kubernetes API.
+        self._s3_data_mover = S3DataMover(credentials_secret=credentials_secret, s3_host=s3_host, s3_port=s3_port,
+                                          use_https=use_https, verify_certificates=verify_certificates,
+                                          image_name=image_name, job_spec_template=job_spec_template,
+                                          namespace=namespace, ca_config_maps=ca_config_maps,
+                                          cpu_request=cpu_request, cpu_limit=cpu_limit,
+                                          memory_request=memory_request, memory_limit=memory_limit,
+                                          print_output=print_output)
+
+        super().__init__(namespace=namespace, job_spec_template=job_spec_template, print_output=print_output,
+                         session=session)
+
+    async def _start_job(self, operation: str, command: str, pvc: str) -> str:
+        self._s3_data_mover.job_spec = self.job_spec
+        job_metadata, job_spec = self._s3_data_mover._get_job_request(operation=operation, command=command, pvc=pvc)
+        job = await self.create_job(job_metadata=job_metadata, job_spec=job_spec)
+        return job.metadata.name
+
+    async def get_bucket(self, bucket: str, pvc: str, pvc_dir: str = None) -> str:
+        """Start a job to transfer the contents of a bucket to a PVC.
+
+        :param bucket: The name of the bucket that will be the source of the data transfer.
+        :param pvc: The name of the Persistent Volume Claim that will be the destination of the
+            data transfer.
+        :param pvc_dir: An optional directory path to use as the base directory within the PVC
+            for the destination of the files to be transferred.
+        :return: The name of the job created to transfer data.
+        """
+        command = self._s3_data_mover._get_bucket_command(bucket=bucket, pvc_dir=pvc_dir)
+        return await self._start_job(operation="get-bucket", command=command, pvc=pvc)
+
+    async def get_object(self, bucket: str, pvc: str, object_key: str, file_location: str = None) -> str:
+        """Start a job to transfer an object from a bucket to a PVC.
+
+        :param bucket: The name of the bucket where the object is located.
+        :param pvc: The name of the Persistent Volume Claim where the object will be copied to.
+        :param object_key: The value of the object key to copy from the bucket to the PVC.
+        :param file_location: The location within the PVC to save the file, including the file name.
+        :return: The name of the job created to transfer data.
+        """
+        command = self._s3_data_mover._get_object_command(bucket=bucket, object_key=object_key,
+                                                          file_location=file_location)
+        return await self._start_job(operation="get-object", command=command, pvc=pvc)
+
+    async def put_bucket(self, bucket: str, pvc: str, pvc_dir: str = None) -> str:
+        """Start a job to transfer all files from a PVC to the named bucket.
+
+        :param bucket: The name of the bucket to which the files will be copied.
+        :param pvc: The name of the Persistent Volume Claim where files will be copied from.
+        :param pvc_dir: An optional path and directory name to specify the directory to use as the
+            base for uploading objects to the S3 bucket.
+        :return: The name of the job created.
+        """
+        command = self._s3_data_mover._put_bucket_command(bucket=bucket, pvc_dir=pvc_dir)
+        return await self._start_job(operation="put-bucket", command=command, pvc=pvc)
+
+    async def put_object(self, bucket: str, pvc: str, file_location: str, object_key: str) -> str:
+        """Start a job to transfer an object from a PVC to the named bucket.
+
+        :param bucket: The name of the bucket to which the file will be copied.
+        :param pvc: The name of the Persistent Volume Claim where the file will be copied from.
+        :param file_location: The path and name of the source file to copy.
+        :param object_key: The value of the object's key in the bucket.
+        :return: The name of the job created.
+        """
+        command = self._s3_data_mover._put_object_command(bucket=bucket, file_location=file_location,
+                                                          object_key=object_key)
+        return await self._start_job(operation="put-object", command=command, pvc=pvc)
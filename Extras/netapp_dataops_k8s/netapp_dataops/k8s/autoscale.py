@@ -0,0 +1,422 @@
+"""NetApp DataOps Toolkit for Kubernetes NVIDIA Triton Inference Server autoscaling.
+
+A Triton Inference Server that is created with create_triton_server() runs a fixed number of replicas. A
+TritonServerAutoscaler scales the server with its load instead. It periodically scrapes the Prometheus metrics
+endpoint (port 8002) of every ready replica, computes the inference request rate and the average time that requests
+spend queued, and scales the server so that both stay close to their targets, within a configurable range of
+replicas.
+
+Example::
+
+    from netapp_dataops.k8s.autoscale import TritonServerAutoscaler
+
+    autoscaler = TritonServerAutoscaler(server_name="resnet", namespace="team1", min_replicas=0, max_replicas=4,
+                                        target_queue_time_ms=50, target_request_rate=100)
+    autoscaler.start()  # evaluate and scale the server in the background
+    print(autoscaler.metrics())
+
+Scaling up takes effect immediately. Scaling down takes effect once the lower number of replicas has been
+recommended for the whole scale-down delay, so that short lulls do not cause replicas to be removed and re-added.
+
+If min_replicas is 0, the server is scaled to zero after it has served no requests for the whole scale-down delay,
+freeing its GPUs. A server with no replicas has no metrics to scrape, so it is not scaled up again by its metrics
+unless metrics_endpoints are specified. Instead, clients signal that they need the server, e.g. when a request fails
+because the server is unavailable: either call wake() on the autoscaler, or, from any other process, call
+request_triton_server_wake(), which annotates the server's Deployment (or StatefulSet) so that the autoscaler scales
+it up at its next evaluation. For servers whose replicas have their own model repository clones, the clones are
+deleted when the server is scaled down and are cloned again, near-instantly, from the model repository
+VolumeSnapshot when it is scaled up.
+"""
+from datetime import datetime, timezone
+import math
+import re
+import threading
+import time
+import urllib.request
+
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    _construct_triton_replica_endpoints,
+    _get_session,
+    _get_triton_deployment,
+    _is_pod_ready,
+    scale_triton_server,
+    tracing,
+    APIConnectionError,
+    DataOpsSession,
+    ServiceUnavailableError,
+)
+
+
+_TRITON_REQUEST_METRICS = ("nv_inference_request_success", "nv_inference_request_failure")
+_TRITON_QUEUE_TIME_METRIC = "nv_inference_queue_duration_us"
+_WAKE_ANNOTATION = "dataops.netapp.com/wake-requested"
+
+
+def _parse_triton_metrics(metricsText: str) -> dict:
+    # Sum each metric over all of its label sets (i.e. over all models and model versions)
+    totals = dict()
+    for line in metricsText.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = re.match(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})?\s+(\S+)", line)
+        if match is None:
+            continue
+        try:
+            value = float(match.group(3))
+        except ValueError:
+            continue
+        totals[match.group(1)] = totals.get(match.group(1), 0.0) + value
+    return totals
+
+
+def _scrape_triton_metrics(metricsEndpoint: str, timeout: float = None) -> dict:
+    url = metricsEndpoint if "://" in metricsEndpoint else "http://" + metricsEndpoint
+    if not url.rstrip("/").endswith("/metrics"):
+        url = url.rstrip("/") + "/metrics"
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return _parse_triton_metrics(response.read().decode("utf-8"))
+
+
+def _patch_triton_workload(session: DataOpsSession, server_name: str, namespace: str, body: dict,
+                           statefulSet: bool = None):
+    # Patch the server's Deployment, or its StatefulSet if it has no Deployment (or statefulSet is True)
+    api = session.apps_v1_api()
+    name = _get_triton_deployment(server_name=server_name)
+    if not statefulSet:
+        try:
+            api.patch_namespaced_deployment(name=name, namespace=namespace, body=body)
+            return
+        except ApiException as err:
+            if err.status != 404 or statefulSet is not None:
+                raise
+    api.patch_namespaced_stateful_set(name=name, namespace=namespace, body=body)
+
+
+def _compute_desired_replicas(currentReplicas: int, requestRate: float, queueTimeMs: float, minReplicas: int,
+                              maxReplicas: int, targetRequestRate: float = None, targetQueueTimeMs: float = None,
+                              tolerance: float = 0.1) -> int:
+    # Like the HorizontalPodAutoscaler, scale proportionally to the ratio of each metric to its target and use the
+    # largest result. requestRate is the total rate of all replicas; targetRequestRate is the target per replica.
+    if requestRate <= 0:
+        desiredReplicas = 0
+    elif currentReplicas <= 0:
+        desiredReplicas = 1
+    else:
+        ratios = list()
+        if targetRequestRate:
+            ratios.append(requestRate / currentReplicas / targetRequestRate)
+        if targetQueueTimeMs:
+            ratios.append(queueTimeMs / targetQueueTimeMs)
+        ratio = max(ratios) if ratios else 1.0
+        if abs(ratio - 1.0) <= tolerance:
+            desiredReplicas = currentReplicas
+        else:
+            desiredReplicas = math.ceil(currentReplicas * ratio)
+        desiredReplicas = max(desiredReplicas, 1)
+
+    return min(max(desiredReplicas, minReplicas), maxReplicas)
+
+
+class TritonServerAutoscaler:
+    """Scales an NVIDIA Triton Inference Server based on the inference request rate and queue time of its replicas.
+
+    The autoscaler evaluates the server in a background thread once it has been started. Only one autoscaler
+    should be run for a server at a time.
+    """
+
+    def __init__(self, server_name: str, namespace: str = "default", min_replicas: int = 1, max_replicas: int = 4,
+                 target_queue_time_ms: float = 100, target_request_rate: float = None, interval: float = 15,
+                 scale_down_delay: float = 300, tolerance: float = 0.1, metrics_endpoints: list = None,
+                 metrics_timeout: float = 5, session: DataOpsSession = None, print_output: bool = False):
+        """Initialize the TritonServerAutoscaler object.
+
+        :param server_name: Name of the Triton Inference Server to scale.
+        :param namespace: Kubernetes namespace that the server is located in. Defaults to the default namespace.
+        :param min_replicas: Minimum number of replicas. If 0, the server is scaled to zero when it is idle, and is only
+            scaled up again by wake() or request_triton_server_wake().
+        :param max_replicas: Maximum number of replicas.
+        :param target_queue_time_ms: Target average number of milliseconds that inference requests spend queued
+            before they are executed. If None, queue time is not used for scaling.
+        :param target_request_rate: Target number of inference requests per second per replica. If None, the
+            request rate is only used to determine whether the server is idle.
+        :param interval: Number of seconds between evaluations by the background thread.
+        :param scale_down_delay: Number of seconds for which a lower number of replicas must be recommended before the
+            server is scaled down.
+        :param tolerance: Ratio of a metric to its target within which (1 +/- tolerance) the server is not scaled.
+        :param metrics_endpoints: Triton metrics endpoints (host:port) to scrape instead of the endpoints of the
+            server's ready replicas, e.g. when the replicas' pod IPs are not reachable from where the autoscaler
+            runs.
+        :param metrics_timeout: Maximum number of seconds to wait for a metrics endpoint to respond.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        """
+        self.server_name = server_name
+        self.namespace = namespace
+        self.min_replicas = min_replicas
+        self.max_replicas = max_replicas
+        self.target_queue_time_ms = target_queue_time_ms
+        self.target_request_rate = target_request_rate
+        self.interval = interval
+        self.scale_down_delay = scale_down_delay
+        self.tolerance = tolerance
+        self.metrics_endpoints = metrics_endpoints
+        self.metrics_timeout = metrics_timeout
+        self.session = _get_session(session=session, print_output=print_output)
+        self.print_output = print_output
+
+        self._samples = dict()
+        self._recommendations = list()
+        self._status = {"replicas": None, "desired_replicas": None, "request_rate": None, "queue_time_ms": None}
+        self._counters = {"scale_ups": 0, "scale_downs": 0, "scrape_errors": 0, "evaluation_errors": 0}
+        self._lock = threading.Lock()
+        self._evaluate_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start evaluating and scaling the server in the background.
+
+        :return: The TritonServerAutoscaler object.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="triton-autoscaler-" + self.server_name,
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop evaluating and scaling the server. The server keeps its current number of replicas."""
+        self._stopped.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.evaluate()
+            except Exception as err:
+                with self._lock:
+                    self._counters["evaluation_errors"] += 1
+                if self.print_output:
+                    print("Error: Failed to autoscale Triton Server '" + self.server_name + "': ", err)
+            self._stopped.wait(timeout=self.interval)
+
+    def _read_server(self) -> tuple:
+        # Retrieve the server's Deployment (or StatefulSet) and its ready pods
+        try:
+            api = self.session.apps_v1_api()
+            statefulSet = False
+            try:
+                workload = api.read_namespaced_deployment(name=_get_triton_deployment(server_name=self.server_name),
+                                                          namespace=self.namespace)
+            except ApiException as err:
+                if err.status != 404:
+                    raise
+                workload = api.read_namespaced_stateful_set(name=_get_triton_deployment(server_name=self.server_name),
+                                                            namespace=self.namespace)
+                statefulSet = True
+            selector = ",".join(key + "=" + value for key, value in workload.spec.selector.match_labels.items())
+            pods = self.session.core_v1_api().list_namespaced_pod(namespace=self.namespace,
+                                                                  label_selector=selector).items
+        except ApiException as err:
+            if self.print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+        return workload, statefulSet, [pod for pod in pods if _is_pod_ready(pod)]
+
+    def _sample_metrics(self, metricsEndpoints: list) -> tuple:
+        # Scrape every endpoint and compute the total request rate and the average queue time since the previous
+        # scrape of each endpoint. Endpoints that are scraped for the first time only provide a baseline.
+        now = time.monotonic()
+        requestRate = 0.0
+        requests = 0.0
+        queueTimeUs = 0.0
+        sampled = False
+        samples = dict()
+        for metricsEndpoint in metricsEndpoints:
+            try:
+                metrics = _scrape_triton_metrics(metricsEndpoint=metricsEndpoint, timeout=self.metrics_timeout)
+            except Exception as err:
+                with self._lock:
+                    self._counters["scrape_errors"] += 1
+                if self.print_output:
+                    print("Error: Failed to scrape Triton metrics endpoint '" + metricsEndpoint + "': ", err)
+                continue
+            sample = (now, sum(metrics.get(name, 0.0) for name in _TRITON_REQUEST_METRICS),
+                      metrics.get(_TRITON_QUEUE_TIME_METRIC, 0.0))
+            samples[metricsEndpoint] = sample
+            previous = self._samples.get(metricsEndpoint)
+            if previous is None or now <= previous[0]:
+                continue
+            deltaRequests = sample[1] - previous[1]
+            deltaQueueTimeUs = sample[2] - previous[2]
+            if deltaRequests < 0 or deltaQueueTimeUs < 0:
+                # The counters were reset, i.e. Triton was restarted
+                deltaRequests, deltaQueueTimeUs = sample[1], sample[2]
+            requestRate += deltaRequests / (now - previous[0])
+            requests += deltaRequests
+            queueTimeUs += deltaQueueTimeUs
+            sampled = True
+        self._samples = samples
+
+        if not sampled:
+            return None, None
+        return requestRate, (queueTimeUs / requests / 1000) if requests else 0.0
+
+    def _recommend(self, desiredReplicas: int) -> int:
+        # Scale up immediately, but only scale down to the highest number of replicas that has been recommended
+        # during the scale-down delay
+        now = time.monotonic()
+        with self._lock:
+            self._recommendations = [(timestamp, replicas) for timestamp, replicas in self._recommendations
+                                     if now - timestamp < self.scale_down_delay]
+            self._recommendations.append((now, desiredReplicas))
+            return max(replicas for _, replicas in self._recommendations)
+
+    def evaluate(self) -> int:
+        """Scrape the server's metrics once and scale the server if needed.
+
+        :return: The number of replicas that the server was scaled to (or kept at).
+        :raises APIConnectionError: When the Kubernetes API returns an error.
+        """
+        with self._evaluate_lock, tracing.span("autoscale-evaluate", server=self.server_name) as evaluateSpan:
+            workload, statefulSet, readyPods = self._read_server()
+            currentReplicas = workload.spec.replicas if workload.spec.replicas is not None else 1
+            wakeRequested = _WAKE_ANNOTATION in (workload.metadata.annotations or dict())
+
+            # Scrape the metrics endpoints of the ready replicas
+            metricsEndpoints = self.metrics_endpoints
+            if metricsEndpoints is None:
+                metricsEndpoints = list()
+                for pod in readyPods:
+                    try:
+                        metricsEndpoints.append(_construct_triton_replica_endpoints(
+                            pod=pod, server_name=self.server_name, namespace=self.namespace,
+                            statefulSet=statefulSet)[2])
+                    except ServiceUnavailableError:
+                        pass
+            requestRate, queueTimeMs = self._sample_metrics(metricsEndpoints=metricsEndpoints)
+
+            # Compute desired number of replicas; hold the current number when there is nothing to go by yet
+            if requestRate is None:
+                desiredReplicas = min(max(currentReplicas, self.min_replicas), self.max_replicas)
+            else:
+                desiredReplicas = _compute_desired_replicas(currentReplicas=currentReplicas, requestRate=requestRate,
+                                                            queueTimeMs=queueTimeMs, minReplicas=self.min_replicas,
+                                                            maxReplicas=self.max_replicas,
+                                                            targetRequestRate=self.target_request_rate,
+                                                            targetQueueTimeMs=self.target_queue_time_ms,
+                                                            tolerance=self.tolerance)
+            # Keep at least one replica when a client has requested the server (see request_triton_server_wake())
+            if wakeRequested:
+                desiredReplicas = min(max(desiredReplicas, 1), self.max_replicas)
+            newReplicas = self._recommend(desiredReplicas=desiredReplicas)
+            with self._lock:
+                self._status = {"replicas": currentReplicas, "desired_replicas": newReplicas,
+                                "request_rate": requestRate, "queue_time_ms": queueTimeMs}
+            if evaluateSpan is not None:
+                evaluateSpan.set_attribute("replicas", currentReplicas)
+                evaluateSpan.set_attribute("desired_replicas", newReplicas)
+
+            # Scale server
+            if newReplicas != currentReplicas:
+                if self.print_output:
+                    print("Triton Server '" + self.server_name + "': request rate " + ("%.2f" % (requestRate or 0.0)) +
+                          "/s, queue time " + ("%.2f" % (queueTimeMs or 0.0)) + " ms.")
+                scale_triton_server(server_name=self.server_name, replicas=newReplicas, namespace=self.namespace,
+                                    print_output=self.print_output, session=self.session)
+                with self._lock:
+                    self._counters["scale_ups" if newReplicas > currentReplicas else "scale_downs"] += 1
+
+            # Acknowledge the wake request
+            if wakeRequested:
+                try:
+                    _patch_triton_workload(session=self.session, server_name=self.server_name,
+                                           namespace=self.namespace, statefulSet=statefulSet,
+                                           body={"metadata": {"annotations": {_WAKE_ANNOTATION: None}}})
+                except ApiException as err:
+                    if self.print_output:
+                        print("Error: Kubernetes API Error: ", err)
+                    raise APIConnectionError(err)
+
+        return newReplicas
+
+    def wake(self) -> int:
+        """Scale the server up from zero replicas, e.g. before sending requests to a server that was idle.
+
+        :return: The number of replicas that the server was scaled to (or kept at).
+        :raises APIConnectionError: When the Kubernetes API returns an error.
+        """
+        with self._evaluate_lock:
+            workload, _, _ = self._read_server()
+            currentReplicas = workload.spec.replicas if workload.spec.replicas is not None else 1
+            if currentReplicas > 0:
+                return currentReplicas
+
+            # Record the recommendation so that the server is not scaled back to zero before it has had a chance to
+            # serve requests
+            newReplicas = self._recommend(desiredReplicas=min(max(self.min_replicas, 1), self.max_replicas))
+            scale_triton_server(server_name=self.server_name, replicas=newReplicas, namespace=self.namespace,
+                                print_output=self.print_output, session=self.session)
+            with self._lock:
+                self._counters["scale_ups"] += 1
+            return newReplicas
+
+    def metrics(self) -> dict:
+        """Get autoscaler metrics.
+
+        :return: A dictionary containing the number of replicas of the server and the number of replicas that it
+            was scaled to at the latest evaluation, the request rate (requests per second, all replicas) and average
+            queue time (milliseconds) measured at the latest evaluation (None if not yet measured), and the number
+            of scale-ups, scale-downs, failed metrics scrapes and failed evaluations.
+        """
+        with self._lock:
+            metrics = {"server_name": self.server_name, "namespace": self.namespace,
+                       "min_replicas": self.min_replicas, "max_replicas": self.max_replicas}
+            metrics.update(self._status)
+            metrics.update(self._counters)
+        return metrics
+
+
+@tracing.traced
+def request_triton_server_wake(server_name: str, namespace: str = "default", print_output: bool = False,
+                               session: DataOpsSession = None):
+    """Request that the autoscaler of a Triton Inference Server scales it up from zero replicas.
+
+    The request is recorded as an annotation on the server's Deployment (or StatefulSet), so it can be made from any
+    process, e.g. by a client whose inference request failed because the server has no replicas. The
+    TritonServerAutoscaler of the server scales it to at least one replica at its next evaluation, and then removes
+    the annotation.
+
+    :param server_name: Name of the Triton Inference Server.
+    :param namespace: Kubernetes namespace that the server is located in. Defaults to the default namespace.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :raises APIConnectionError: When the Kubernetes API returns an error.
+    """
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # Annotate server
+    requestedAt = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        _patch_triton_workload(session=session, server_name=server_name, namespace=namespace,
+                               body={"metadata": {"annotations": {_WAKE_ANNOTATION: requestedAt}}})
+    except ApiException as err:
+        if print_output:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    if print_output:
+        print("Requested that server '" + server_name + "' in namespace '" + namespace + "' be scaled up.")
@@ -0,0 +1,374 @@
+"""NetApp DataOps Toolkit for Kubernetes local resource cache.
+
+Long-running processes that call the toolkit repeatedly, such as Airflow schedulers, Kubeflow components and
+Jupyter kernels, can enable a local resource cache for a namespace. The cache keeps PVCs, VolumeSnapshots,
+Deployments, Services and Jobs in memory using list+watch, and the toolkit's list and read operations are then
+served from memory instead of from the Kubernetes API server.
+
+Example::
+
+    from netapp_dataops.k8s import list_volumes
+    from netapp_dataops.k8s.cache import enable_cache
+
+    cache = enable_cache(namespace="team1")
+    list_volumes(namespace="team1")  # served from the cache
+    print(cache.metrics())
+"""
+import threading
+from time import monotonic
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    _get_resource_kinds,
+    _get_resource_list_function,
+    _get_session,
+    DataOpsSession,
+)
+
+
+def _get_object_name(obj) -> str:
+    if isinstance(obj, dict):
+        return obj["metadata"]["name"]
+    return obj.metadata.name
+
+
+def _get_object_labels(obj) -> dict:
+    if isinstance(obj, dict):
+        labels = obj["metadata"].get("labels")
+    else:
+        labels = obj.metadata.labels
+    return labels or dict()
+
+
+def _parse_label_selector(label_selector: str) -> dict:
+    """Parse an equality-based label selector.
+
+    :param label_selector: A label selector such as "created-by=ntap-dsutil,entity-type=jupyterlab-workspace".
+    :return: A dictionary of required label values, or None if the selector uses set-based or inequality
+        requirements, which the cache does not evaluate.
+    """
+    requirements = dict()
+    if not label_selector:
+        return requirements
+    for requirement in label_selector.split(","):
+        if "!=" in requirement or "=" not in requirement:
+            return None
+        key, value = requirement.replace("==", "=").split("=", 1)
+        requirements[key.strip()] = value.strip()
+    return requirements
+
+
+class _Reflector:
+    """Keep an in-memory copy of one resource kind in one namespace up to date using list+watch."""
+
+    def __init__(self, kind: str, namespace: str, session: DataOpsSession, watch_timeout: int,
+                 print_output: bool = False):
+        self.kind = kind
+        self.namespace = namespace
+        self.session = session
+        self.watch_timeout = watch_timeout
+        self.print_output = print_output
+
+        self.objects = dict()
+        self.resource_version = None
+        self.synced = False
+        self.last_sync = None
+        self.relists = 0
+        self.events = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._attempted = threading.Event()
+        self._watcher = None
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="netapp-dataops-cache-" + kind + "-" + namespace)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._watcher:
+            self._watcher.stop()
+
+    def wait_attempted(self, timeout: float = None) -> bool:
+        return self._attempted.wait(timeout=timeout)
+
+    def staleness(self) -> float:
+        """Get the number of seconds since the cache was last known to be current, or None if never synced."""
+        with self._lock:
+            if not self.synced:
+                return None
+            return monotonic() - self.last_sync
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return list(self.objects.values())
+
+    def get(self, name: str):
+        with self._lock:
+            return self.objects.get(name)
+
+    def _run(self):
+        backoff = 1
+        while not self._stop.is_set():
+            try:
+                self._list()
+                backoff = 1
+                self._watch()
+            except Exception as err:
+                if self._stop.is_set():
+                    break
+                if self.print_output:
+                    print("Error: Resource cache for " + self.kind + " in namespace " + self.namespace +
+                          " could not be refreshed: ", err)
+                self._attempted.set()
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 60)
+
+    def _list(self):
+        list_func, list_kwargs = _get_resource_list_function(kind=self.kind, session=self.session)
+        object_list = list_func(namespace=self.namespace, **list_kwargs)
+        if isinstance(object_list, dict):
+            items = object_list["items"]
+            resource_version = object_list["metadata"]["resourceVersion"]
+        else:
+            items = object_list.items
+            resource_version = object_list.metadata.resource_version
+
+        with self._lock:
+            self.objects = {_get_object_name(obj): obj for obj in items}
+            self.resource_version = resource_version
+            self.synced = True
+            self.last_sync = monotonic()
+            self.relists += 1
+        self._attempted.set()
+
+    def _watch(self):
+        # Watch until the resourceVersion expires (410 Gone) or the reflector is stopped
+        list_func, list_kwargs = _get_resource_list_function(kind=self.kind, session=self.session)
+        while not self._stop.is_set():
+            self._watcher = watch.Watch()
+            try:
+                for event in self._watcher.stream(list_func, namespace=self.namespace,
+                                                  resource_version=self.resource_version,
+                                                  timeout_seconds=self.watch_timeout,
+                                                  allow_watch_bookmarks=True, **list_kwargs):
+                    if not event:
+                        continue
+                    if event["type"] == "ERROR":
+                        return
+                    with self._lock:
+                        if event["type"] in ("ADDED", "MODIFIED"):
+                            self.objects[_get_object_name(event["object"])] = event["object"]
+                        elif event["type"] == "DELETED":
+                            self.objects.pop(_get_object_name(event["object"]), None)
+                        if self._watcher.resource_version:
+                            self.resource_version = self._watcher.resource_version
+                        self.last_sync = monotonic()
+                        self.events += 1
+            except ApiException as err:
+                if err.status == 410:
+                    return
+                raise
+
+            # The watch ran until the server-side timeout without a gap, so the cache is current
+            with self._lock:
+                if self._watcher.resource_version:
+                    self.resource_version = self._watcher.resource_version
+                self.last_sync = monotonic()
+
+
+class ResourceCache:
+    """In-memory cache of the toolkit's Kubernetes resources for a namespace.
+
+    Reads are only served from the cache while the corresponding resource kind is synced and its data is no
+    older than max_staleness seconds; otherwise the toolkit falls back to the Kubernetes API. Objects returned
+    from the cache are shared and must be treated as read-only.
+    """
+
+    def __init__(self, namespace: str = "default", kinds: list = None, max_staleness: float = 120,
+                 watch_timeout: int = 60, session: DataOpsSession = None, print_output: bool = False):
+        """Initialize the ResourceCache object.
+
+        :param namespace: The namespace to cache. Defaults to the default namespace.
+        :param kinds: The resource kinds to cache. Defaults to all supported kinds ("deployments", "jobs",
+            "persistentvolumeclaims", "services", "volumesnapshots").
+        :param max_staleness: The maximum age, in seconds, of cached data that will be served. Watches receive
+            bookmarks and are restarted every watch_timeout seconds, so a healthy cache is never older than that.
+        :param watch_timeout: The server-side timeout, in seconds, for each watch request.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        """
+        if kinds is None:
+            kinds = _get_resource_kinds()
+        for kind in kinds:
+            if kind not in _get_resource_kinds():
+                raise ValueError("Unsupported resource kind: " + kind)
+
+        self.namespace = namespace
+        self.max_staleness = max_staleness
+        self.session = _get_session(session=session, print_output=print_output)
+        self.print_output = print_output
+
+        self._reflectors = {kind: _Reflector(kind=kind, namespace=namespace, session=self.session,
+                                             watch_timeout=watch_timeout, print_output=print_output)
+                            for kind in kinds}
+        self._counters = {kind: {"hits": 0, "misses": 0, "stale": 0} for kind in kinds}
+        self._counters_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self, wait: bool = True, timeout: float = None):
+        """Start listing and watching the cached resource kinds.
+
+        :param wait: If True, wait until the initial list of every resource kind has been attempted.
+        :param timeout: The maximum number of seconds to wait. If not specified, wait indefinitely.
+        :return: The ResourceCache object.
+        """
+        for reflector in self._reflectors.values():
+            reflector.start()
+        if wait:
+            for reflector in self._reflectors.values():
+                reflector.wait_attempted(timeout=timeout)
+        return self
+
+    def stop(self):
+        """Stop all watches. Subsequent reads fall back to the Kubernetes API."""
+        for reflector in self._reflectors.values():
+            reflector.stop()
+
+    def is_synced(self) -> bool:
+        """Get an indication if every cached resource kind is synced and within the staleness bound."""
+        return all(self._is_fresh(reflector) for reflector in self._reflectors.values())
+
+    def _is_fresh(self, reflector: _Reflector) -> bool:
+        staleness = reflector.staleness()
+        return staleness is not None and staleness <= self.max_staleness
+
+    def _lookup(self, kind: str, namespace: str) -> _Reflector:
+        # Return the reflector that can serve the request, or None if the request must go to the API
+        if namespace != self.namespace or kind not in self._reflectors:
+            return None
+        if not self._is_fresh(self._reflectors[kind]):
+            self._record(kind=kind, outcome="stale")
+            return None
+        return self._reflectors[kind]
+
+    def _record(self, kind: str, outcome: str):
+        with self._counters_lock:
+            self._counters[kind][outcome] += 1
+
+    def list(self, kind: str, namespace: str = "default", label_selector: str = None) -> list:
+        """List cached objects of a resource kind.
+
+        :param kind: The resource kind.
+        :param namespace: The namespace.
+        :param label_selector: An equality-based label selector.
+        :return: A list of objects, or None if the request cannot be served from the cache.
+        """
+        requirements = _parse_label_selector(label_selector)
+        if requirements is None:
+            return None
+        reflector = self._lookup(kind=kind, namespace=namespace)
+        if reflector is None:
+            return None
+        self._record(kind=kind, outcome="hits")
+        items = reflector.snapshot()
+        if requirements:
+            items = [obj for obj in items
+                     if all(_get_object_labels(obj).get(key) == value for key, value in requirements.items())]
+        return items
+
+    def get(self, kind: str, name: str, namespace: str = "default"):
+        """Get a cached object.
+
+        :param kind: The resource kind.
+        :param name: The object name.
+        :param namespace: The namespace.
+        :return: The object, or None if the object is not in the cache. Callers should fall back to the
+            Kubernetes API in that case, since the object may have been created moments ago.
+        """
+        reflector = self._lookup(kind=kind, namespace=namespace)
+        if reflector is None:
+            return None
+        obj = reflector.get(name)
+        self._record(kind=kind, outcome="hits" if obj is not None else "misses")
+        return obj
+
+    def metrics(self) -> dict:
+        """Get cache metrics.
+
+        :return: A dictionary containing overall hit, miss and stale counts, the hit ratio, and per resource
+            kind counts, object counts, staleness in seconds, relist counts and watch event counts.
+        """
+        with self._counters_lock:
+            counters = {kind: dict(values) for kind, values in self._counters.items()}
+
+        resources = dict()
+        for kind, reflector in self._reflectors.items():
+            resources[kind] = dict(counters[kind])
+            resources[kind]["objects"] = len(reflector.objects)
+            resources[kind]["synced"] = self._is_fresh(reflector)
+            resources[kind]["staleness"] = reflector.staleness()
+            resources[kind]["relists"] = reflector.relists
+            resources[kind]["events"] = reflector.events
+
+        hits = sum(values["hits"] for values in counters.values())
+        misses = sum(values["misses"] for values in counters.values())
+        stale = sum(values["stale"] for values in counters.values())
+        total = hits + misses + stale
+        return {
+            "namespace": self.namespace,
+            "hits": hits,
+            "misses": misses,
+            "stale": stale,
+            "hit_ratio": (hits / total) if total else 0.0,
+            "resources": resources
+        }
+
+
+def enable_cache(namespace: str = "default", kinds: list = None, max_staleness: float = 120,
+                 watch_timeout: int = 60, wait: bool = True, timeout: float = None,
+                 session: DataOpsSession = None, print_output: bool = False) -> ResourceCache:
+    """Enable a local resource cache for a session.
+
+    Any cache previously enabled for the session is stopped and replaced.
+
+    :param namespace: The namespace to cache. Defaults to the default namespace.
+    :param kinds: The resource kinds to cache. Defaults to all supported kinds.
+    :param max_staleness: The maximum age, in seconds, of cached data that will be served.
+    :param watch_timeout: The server-side timeout, in seconds, for each watch request.
+    :param wait: If True, wait until the initial list of every resource kind has been attempted.
+    :param timeout: The maximum number of seconds to wait. If not specified, wait indefinitely.
+    :param session: The DataOpsSession to attach the cache to. If not specified, the process-wide default
+        session is used.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :return: The ResourceCache object.
+    """
+    session = _get_session(session=session, print_output=print_output)
+    disable_cache(session=session)
+
+    cache = ResourceCache(namespace=namespace, kinds=kinds, max_staleness=max_staleness,
+                          watch_timeout=watch_timeout, session=session, print_output=print_output)
+    cache.start(wait=wait, timeout=timeout)
+    session.cache = cache
+    return cache
+
+
+def disable_cache(session: DataOpsSession = None):
+    """Stop and detach the local resource cache for a session, if one is enabled.
+
+    :param session: The DataOpsSession. If not specified, the process-wide default session is used.
+    """
+    session = _get_session(session=session)
+    if session.cache is not None:
+        session.cache.stop()
+        session.cache = None
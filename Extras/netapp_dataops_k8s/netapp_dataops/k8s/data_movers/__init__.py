@@ -1,7 +1,6 @@
 """NetApp DataOps Toolkit data mover package."""
 import copy
 
-from kubernetes import client
 from kubernetes.client import (
     V1Job,
     V1JobSpec,
@@ -9,11 +8,13 @@ from kubernetes.client import (
     V1ObjectMeta,
     V1PodTemplateSpec,
 )
+from kubernetes.client.rest import ApiException
 
 from netapp_dataops.k8s import (
-    _load_kube_config2,
+    _get_session,
+    _read_namespaced_object,
     APIConnectionError,
-    ApiException,
+    DataOpsSession,
 )
 
 
@@ -27,7 +28,8 @@ class DataMoverJob:
 
     def __init__(self, namespace: str = "default",
                  job_spec_template: V1JobSpec = None,
-                 print_output: bool = False):
+                 print_output: bool = False,
+                 session: DataOpsSession = None):
         """Initialize a DataMoverJob object.
 
         :param namespace: The namespace which applies to the job. Defaults to the default namespace.
@@ -37,6 +39,8 @@ class DataMoverJob:
             job spec and replace the required template field with the appropriate pod template spec for the
             particular operation being performed.
         :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
         """
         if namespace is None:
             self.namespace = "default"
@@ -49,6 +53,7 @@ class DataMoverJob:
             self.__job_spec = job_spec_template
 
         self.print_output = print_output
+        self.session = session
 
     @property
     def job_spec(self) -> V1JobSpec:
@@ -71,10 +76,10 @@ class DataMoverJob:
             spec=job_spec
         )
 
-        _load_kube_config2(print_output=self.print_output)
+        session = _get_session(session=self.session, print_output=self.print_output)
 
         try:
-            batch_api = client.BatchV1Api()
+            batch_api = session.batch_v1_api()
             job: V1Job = batch_api.create_namespaced_job(namespace=self.namespace,
                                                          body=job_request)
         except ApiException as error:
@@ -90,9 +95,9 @@ class DataMoverJob:
 
         :param job: The name of the job to delete.
         """
-        _load_kube_config2(print_output=self.print_output)
+        session = _get_session(session=self.session, print_output=self.print_output)
 
-        batch_api = client.BatchV1Api()
+        batch_api = session.batch_v1_api()
         try:
             batch_api.delete_namespaced_job(name=job, namespace=self.namespace)
         except ApiException as error:
@@ -137,11 +142,10 @@ class DataMoverJob:
         :return: The status of the requested job.
         :raises APIConnectionError: When there is a problem connecting to Kubernetes.
         """
-        _load_kube_config2(print_output=self.print_output)
+        session = _get_session(session=self.session, print_output=self.print_output)
 
         try:
-            batch_api = client.BatchV1Api()
-            job: V1Job = batch_api.read_namespaced_job_status(name=job, namespace=self.namespace)
+            job: V1Job = _read_namespaced_object(kind="jobs", name=job, namespace=self.namespace, session=session)
         except ApiException as error:
             raise APIConnectionError(error)
         return job.status
@@ -19,7 +19,8 @@ from kubernetes.client import (
 from netapp_dataops.k8s import (
     _get_labels,
     create_k8s_opaque_secret,
-    delete_k8s_secret
+    delete_k8s_secret,
+    DataOpsSession,
 )
 from netapp_dataops.k8s.data_movers import DataMoverJob
 
@@ -37,7 +38,8 @@ class S3ConfigSecret:
                  access_key: str,
                  secret_key: str,
                  namespace: str = 'default',
-                 print_output: bool = False):
+                 print_output: bool = False,
+                 session: DataOpsSession = None):
         """Initialize the S3ConfigSecret object.
 
         :param name: The name of the Kubernetes secret.
@@ -46,6 +48,8 @@ class S3ConfigSecret:
         :param namespace: The Kubernetes namespace to use for the secret. Defaults to the default
             namespace.
         :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
         """
         # Validate we have values where required.
         for parameter in ["name", "access_key", "secret_key"]:
@@ -65,17 +69,19 @@ class S3ConfigSecret:
             "secret_key": secret_key,
         }
         self.print_output = print_output
+        self.session = session
 
     def create(self):
         """Create the secret with the provided data."""
         labels = _get_labels(operation="s3configsecret-create")
         create_k8s_opaque_secret(name=self.name, data=self.secret_data,
                                  namespace=self.namespace, labels=labels,
-                                 print_output=self.print_output)
+                                 print_output=self.print_output, session=self.session)
 
     def delete(self):
         """Delete the secret from Kubernetes."""
-        delete_k8s_secret(name=self.name, namespace=self.namespace, print_output=self.print_output)
+        delete_k8s_secret(name=self.name, namespace=self.namespace, print_output=self.print_output,
+                          session=self.session)
 
 
 class S3DataMover(DataMoverJob):
@@ -97,7 +103,8 @@ class S3DataMover(DataMoverJob):
                  cpu_limit: str = None,
                  memory_request: str = None,
                  memory_limit: str = None,
-                 print_output: bool = False):
+                 print_output: bool = False,
+                 session: DataOpsSession = None):
         """Initialize the S3DataMover object.
 
         :param credentials_secret: The name of the Kubernetes secret which contains the S3 credentials.
@@ -139,6 +146,8 @@ class S3DataMover(DataMoverJob):
             example would be "500M". If the memory_limit parameter is not set then no memory limit is used
             with the jobs.
         :param print_output: If True enable information to be printed to the console. Default value is False.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
         """
         self.data_volume_name = "s3mc-data-volume"
         self.data_volume_path = "/mnt/data"
@@ -175,7 +184,8 @@ class S3DataMover(DataMoverJob):
         else:
             self.image = f"{image_name}"
 
-        super().__init__(namespace=namespace, job_spec_template=job_spec_template, print_output=print_output)
+        super().__init__(namespace=namespace, job_spec_template=job_spec_template, print_output=print_output,
+                         session=session)
 
     def _get_container(self, command: str, config_map_volume_names: list = None) -> V1Container:
         """Get the K8s container object to be used by by a PodSpec.
@@ -323,6 +333,49 @@ class S3DataMover(DataMoverJob):
 
         return resources
 
+    def _get_verify_flag(self) -> str:
+        if self.verify_certificates:
+            return ""
+        return "--insecure"
+
+    def _get_bucket_command(self, bucket: str, pvc_dir: str = None) -> str:
+        if pvc_dir:
+            sub_dir = pvc_dir
+        else:
+            sub_dir = ""
+        return f"mc cp {self._get_verify_flag()} -r {self.s3_alias}/{bucket}/ {self.data_volume_path}/{sub_dir}"
+
+    def _get_object_command(self, bucket: str, object_key: str, file_location: str = None) -> str:
+        if not file_location:
+            file_location = object_key
+        return f"mc cp {self._get_verify_flag()} {self.s3_alias}/{bucket}/{object_key} {self.data_volume_path}/{file_location}"
+
+    def _put_bucket_command(self, bucket: str, pvc_dir: str = None) -> str:
+        if pvc_dir:
+            sub_dir = pvc_dir
+        else:
+            sub_dir = ""
+        # If we don't change directories the cp will copy files in to a 'data' directory within the bucket
+        return f"cd {self.data_volume_path}/{sub_dir};mc cp {self._get_verify_flag()} -r * {self.s3_alias}/{bucket}"
+
+    def _put_object_command(self, bucket: str, file_location: str, object_key: str) -> str:
+        return f"mc cp {self._get_verify_flag()} {self.data_volume_path}/{file_location} {self.s3_alias}/{bucket}/{object_key}"
+
+    def _get_job_request(self, operation: str, command: str, pvc: str) -> tuple:
+        """Get the metadata and spec for a data transfer job.
+
+        :param operation: The name of the operation, e.g. 'get-bucket'.
+        :param command: The shell command to run in the data mover container.
+        :param pvc: The name of the Persistent Volume Claim to mount in the data mover container.
+        :return: A tuple containing the V1ObjectMeta and V1JobSpec for the job.
+        """
+        job_spec = self.job_spec
+        job_spec.template = self._get_pod_template_spec(container_command=command, pvc=pvc, operation=operation)
+        job_metadata = V1ObjectMeta(generate_name="s3mover-{}-".format(operation),
+                                    namespace=self.namespace,
+                                    labels=_get_labels(operation=operation))
+        return job_metadata, job_spec
+
     def get_bucket(self, bucket: str, pvc: str, pvc_dir: str = None) -> str:
         """Start a job to transfer the contents of a bucket to a PVC.
 
@@ -337,23 +390,9 @@ class S3DataMover(DataMoverJob):
             the root of the PVC is the base path used.
         :return: The name of the job created to transfer data.
         """
-        if self.verify_certificates:
-            verify_flag = ""
-        else:
-            verify_flag = "--insecure"
-
-        if pvc_dir:
-            sub_dir = pvc_dir
-        else:
-            sub_dir = ""
-
         operation = "get-bucket"
-        command = f"mc cp {verify_flag} -r {self.s3_alias}/{bucket}/ {self.data_volume_path}/{sub_dir}"
-        job_spec = self.job_spec
-        job_spec.template = self._get_pod_template_spec(container_command=command, pvc=pvc, operation=operation)
-        job_metadata = V1ObjectMeta(generate_name="s3mover-{}-".format(operation),
-                                    namespace=self.namespace,
-                                    labels=_get_labels(operation=operation))
+        command = self._get_bucket_command(bucket=bucket, pvc_dir=pvc_dir)
+        job_metadata, job_spec = self._get_job_request(operation=operation, command=command, pvc=pvc)
         job = self.create_job(job_metadata=job_metadata, job_spec=job_spec)
         return job.metadata.name
 
@@ -370,22 +409,9 @@ class S3DataMover(DataMoverJob):
          with any pathing retained from the object's key name. The default is None.
         :return: The name of the job created to transfer data.
         """
-        if self.verify_certificates:
-            verify_flag = ""
-        else:
-            verify_flag = "--insecure"
-
         operation = "get-object"
-
-        if not file_location:
-            file_location = object_key
-
-        command = f"mc cp {verify_flag} {self.s3_alias}/{bucket}/{object_key} {self.data_volume_path}/{file_location}"
-        job_spec = self.job_spec
-        job_spec.template = self._get_pod_template_spec(container_command=command, pvc=pvc, operation=operation)
-        job_metadata = V1ObjectMeta(generate_name="s3mover-{}-".format(operation),
-                                    namespace=self.namespace,
-                                    labels=_get_labels(operation=operation))
+        command = self._get_object_command(bucket=bucket, object_key=object_key, file_location=file_location)
+        job_metadata, job_spec = self._get_job_request(operation=operation, command=command, pvc=pvc)
         job = self.create_job(job_metadata=job_metadata, job_spec=job_spec)
         return job.metadata.name
 
@@ -402,23 +428,9 @@ class S3DataMover(DataMoverJob):
             the PVC is used as the base directory.
         :return: The name of the job created.
         """
-        if self.verify_certificates:
-            verify_flag = ""
-        else:
-            verify_flag = "--insecure"
-
-        if pvc_dir:
-            sub_dir = pvc_dir
-        else:
-            sub_dir = ""
         operation = "put-bucket"
-        # If we don't change directories the cp will copy files in to a 'data' directory within the bucket
-        command = f"cd {self.data_volume_path}/{sub_dir};mc cp {verify_flag} -r * {self.s3_alias}/{bucket}"
-        job_spec = self.job_spec
-        job_spec.template = self._get_pod_template_spec(container_command=command, pvc=pvc, operation=operation)
-        job_metadata = V1ObjectMeta(generate_name="s3mover-{}-".format(operation),
-                                    namespace=self.namespace,
-                                    labels=_get_labels(operation=operation))
+        command = self._put_bucket_command(bucket=bucket, pvc_dir=pvc_dir)
+        job_metadata, job_spec = self._get_job_request(operation=operation, command=command, pvc=pvc)
         job = self.create_job(job_metadata=job_metadata, job_spec=job_spec)
         return job.metadata.name
 
@@ -434,16 +446,8 @@ class S3DataMover(DataMoverJob):
         :param object_key: The value of the object's key in the bucket.
         :return: The name of the job created.
         """
-        if self.verify_certificates:
-            verify_flag = ""
-        else:
-            verify_flag = "--insecure"
         operation = "put-object"
-        command = f"mc cp {verify_flag} {self.data_volume_path}/{file_location} {self.s3_alias}/{bucket}/{object_key}"
-        job_spec = self.job_spec
-        job_spec.template = self._get_pod_template_spec(container_command=command, pvc=pvc, operation=operation)
-        job_metadata = V1ObjectMeta(generate_name="s3mover-{}-".format(operation),
-                                    namespace=self.namespace,
-                                    labels=_get_labels(operation=operation))
+        command = self._put_object_command(bucket=bucket, file_location=file_location, object_key=object_key)
+        job_metadata, job_spec = self._get_job_request(operation=operation, command=command, pvc=pvc)
         job = self.create_job(job_metadata=job_metadata, job_spec=job_spec)
         return job.metadata.name
@@ -0,0 +1,457 @@
+"""NetApp DataOps Toolkit for Kubernetes Kubeflow Pipelines components.
+
+Prebuilt, typed Kubeflow Pipelines components for common DataOps steps (snapshot, clone, multi-clone, restore,
+delete, and S3 data transfers). Each component runs a single toolkit operation in a container image that has the
+toolkit preinstalled (see the Dockerfile that is included with the toolkit), so that a step starts as soon as its
+container starts, instead of installing the toolkit with pip on every run. The image tag is pinned to the toolkit
+version, and each step writes its results (e.g. the name of the snapshot that it created) to typed outputs, so that
+the outputs can be passed to downstream steps and steps can be cached by Kubeflow Pipelines.
+
+If a component's namespace is not specified, the namespace that the step runs in is used.
+
+Example::
+
+    import kfp.dsl as dsl
+    from netapp_dataops.k8s.kfp import load_component
+
+    image = "registry.example.com/netapp-dataops-k8s:2.5.0"
+    snapshot_op = load_component("create-volume-snapshot", image=image)
+    clone_op = load_component("clone-volume", image=image)
+
+    @dsl.pipeline(name="Dataset Version")
+    def dataset_version(pvc_name: str = "dataset"):
+        snapshot = snapshot_op(pvc_name=pvc_name)
+        clone_op(new_pvc_name="dataset-exp1", source_pvc_name=pvc_name,
+                 source_snapshot_name=snapshot.outputs["snapshot"])
+
+Components can also be written to YAML files, for use with kfp.components.load_component_from_file() without
+installing the toolkit::
+
+    from netapp_dataops.k8s.kfp import write_component_files
+
+    write_component_files("components", image=image)
+"""
+import argparse
+from datetime import datetime
+import json
+import os
+import sys
+
+import yaml
+
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    __version__,
+    _get_session,
+    _retrieve_source_volume_details_for_volume_snapshot,
+    _wait_for_objects,
+    clone_volume,
+    clone_volumes,
+    create_volume_snapshot,
+    delete_volume,
+    delete_volume_snapshot,
+    restore_volume_snapshot,
+    APIConnectionError,
+    InvalidConfigError,
+    ServiceUnavailableError,
+    WaitTimeoutError,
+)
+from netapp_dataops.k8s.plan import _get_error_message
+
+
+DEFAULT_IMAGE = "netapp-dataops-k8s:" + __version__
+
+_SERVICE_ACCOUNT_NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
+
+class ComponentError(Exception):
+    '''Error that will be raised when a component step does not complete successfully'''
+    pass
+
+
+def _get_namespace(namespace: str) -> str:
+    # Default to the namespace of the pod that the step runs in
+    if namespace:
+        return namespace
+    try:
+        with open(_SERVICE_ACCOUNT_NAMESPACE_FILE) as file:
+            return file.read().strip() or "default"
+    except OSError:
+        return "default"
+
+
+def _run_s3_job(operation: str, args: dict, session) -> dict:
+    from netapp_dataops.k8s.data_movers.s3 import S3DataMover
+
+    namespace = _get_namespace(args["namespace"])
+    dataMover = S3DataMover(credentials_secret=args["credentials_secret"], s3_host=args["s3_host"],
+                            s3_port=args["s3_port"], use_https=args["use_https"],
+                            verify_certificates=args["verify_certificates"], image_name=args["image_name"],
+                            namespace=namespace, ca_config_maps=args["ca_config_maps"] or None, print_output=True,
+                            session=session)
+    if operation == "get-bucket":
+        job = dataMover.get_bucket(bucket=args["bucket_name"], pvc=args["pvc_name"], pvc_dir=args["pvc_dir"])
+    elif operation == "get-object":
+        job = dataMover.get_object(bucket=args["bucket_name"], pvc=args["pvc_name"], object_key=args["object_key"],
+                                   file_location=args["file_location"])
+    elif operation == "put-bucket":
+        job = dataMover.put_bucket(bucket=args["bucket_name"], pvc=args["pvc_name"], pvc_dir=args["pvc_dir"])
+    else:
+        job = dataMover.put_object(bucket=args["bucket_name"], pvc=args["pvc_name"],
+                                   file_location=args["file_location"], object_key=args["object_key"])
+    print("Started data transfer job '" + job + "' in namespace '" + namespace + "'.", flush=True)
+
+    # Wait for the job to complete, so that downstream steps can use the transferred data
+    if args["wait"]:
+        print("Waiting for job to complete...", flush=True)
+        try:
+            _wait_for_objects(list_func=session.batch_v1_api().list_namespaced_job, names=[job],
+                              condition=lambda obj: obj is not None and bool(obj.status.succeeded or obj.status.failed),
+                              namespace=namespace)
+        except ApiException as err:
+            raise APIConnectionError(err)
+        if dataMover.did_job_fail(job=job):
+            raise ComponentError("Data transfer job '" + job + "' failed.")
+        print("Data transfer job completed.")
+    return {"job": job}
+
+
+def _run_create_volume_snapshot(args: dict, session) -> dict:
+    # Name the snapshot here, rather than in create_volume_snapshot(), so that the name can be output
+    snapshotName = args["snapshot_name"] or "ntap-dsutil." + datetime.today().strftime("%Y%m%d%H%M%S")
+    create_volume_snapshot(pvc_name=args["pvc_name"], snapshot_name=snapshotName,
+                           volume_snapshot_class=args["volume_snapshot_class"],
+                           namespace=_get_namespace(args["namespace"]), dataset_version=args["dataset_version"],
+                           print_output=True, session=session)
+    return {"snapshot": snapshotName}
+
+
+def _run_clone_volume(args: dict, session) -> dict:
+    clone_volume(new_pvc_name=args["new_pvc_name"], source_pvc_name=args["source_pvc_name"],
+                 source_snapshot_name=args["source_snapshot_name"],
+                 volume_snapshot_class=args["volume_snapshot_class"], namespace=_get_namespace(args["namespace"]),
+                 print_output=True, session=session)
+    return {"pvc": args["new_pvc_name"]}
+
+
+def _run_clone_volumes(args: dict, session) -> dict:
+    report = clone_volumes(new_pvc_names=args["new_pvc_names"], source_pvc_name=args["source_pvc_name"],
+                           source_snapshot_name=args["source_snapshot_name"],
+                           volume_snapshot_class=args["volume_snapshot_class"],
+                           namespace=_get_namespace(args["namespace"]), max_workers=args["max_parallel"],
+                           print_output=True, session=session)
+    failures = [cloneDict["PersistentVolumeClaim (PVC) Name"] for cloneDict in report if cloneDict["Status"] == "Failed"]
+    if failures:
+        raise ComponentError("Unable to clone volumes: " + ", ".join(failures) + ".")
+    return {"pvcs": [cloneDict["PersistentVolumeClaim (PVC) Name"] for cloneDict in report]}
+
+
+def _run_restore_volume_snapshot(args: dict, session) -> dict:
+    namespace = _get_namespace(args["namespace"])
+    pvcName, _ = _retrieve_source_volume_details_for_volume_snapshot(snapshotName=args["snapshot_name"],
+                                                                     namespace=namespace, printOutput=True,
+                                                                     session=session)
+    restore_volume_snapshot(snapshot_name=args["snapshot_name"], namespace=namespace, print_output=True,
+                            session=session)
+    return {"pvc": pvcName}
+
+
+def _run_delete_volume(args: dict, session) -> dict:
+    delete_volume(pvc_name=args["pvc_name"], namespace=_get_namespace(args["namespace"]),
+                  preserve_snapshots=args["preserve_snapshots"], print_output=True, session=session)
+    return dict()
+
+
+def _run_delete_volume_snapshot(args: dict, session) -> dict:
+    delete_volume_snapshot(snapshot_name=args["snapshot_name"], namespace=_get_namespace(args["namespace"]),
+                           print_output=True, session=session)
+    return dict()
+
+
+def _input(name: str, valueType: str, description: str, default: str = None) -> dict:
+    inputDict = {"name": name, "type": valueType, "description": description}
+    if default is not None:
+        inputDict["default"] = default
+        inputDict["optional"] = True
+    return inputDict
+
+
+_NAMESPACE_INPUT = _input("namespace", "String", "Kubernetes namespace. If not specified, the namespace that the "
+                                                 "step runs in is used.", default="")
+_SNAPSHOT_CLASS_INPUT = _input("volume_snapshot_class", "String", "Kubernetes VolumeSnapshotClass to use.",
+                               default="csi-snapclass")
+
+_S3_INPUTS = [
+    _input("bucket_name", "String", "Name of the S3 bucket."),
+    _input("pvc_name", "String", "Name of the PersistentVolumeClaim (PVC)."),
+    _input("s3_host", "String", "Hostname or IP address of the S3 service."),
+    _input("credentials_secret", "String", "Name of the Kubernetes secret that contains the S3 credentials (see "
+                                           "'netapp_dataops_k8s_cli.py create s3-secret')."),
+    _input("s3_port", "String", "Port of the S3 service. If not specified, the default port for the protocol is used.",
+           default=""),
+    _input("use_https", "Boolean", "Use HTTPS to connect to the S3 service.", default="False"),
+    _input("verify_certificates", "Boolean", "Verify the certificates of the S3 service.", default="False"),
+    _input("ca_config_maps", "JsonArray", "Names of config maps that contain CA certificates to trust.", default="[]"),
+    _input("image_name", "String", "Data mover container image. If not specified, the minio/mc image is used.",
+           default=""),
+    _input("wait", "Boolean", "Wait for the data transfer job to complete.", default="True"),
+    _NAMESPACE_INPUT,
+]
+_S3_JOB_OUTPUT = {"name": "job", "type": "String", "description": "Name of the data transfer job."}
+
+_COMPONENTS = {
+    "create-volume-snapshot": {
+        "description": "Create a VolumeSnapshot for a persistent volume.",
+        "inputs": [
+            _input("pvc_name", "String", "Name of the PersistentVolumeClaim (PVC) to snapshot."),
+            _input("snapshot_name", "String", "Name of the new VolumeSnapshot. If not specified, a name of the form "
+                                              "'ntap-dsutil.<timestamp>' is used.", default=""),
+            _input("dataset_version", "String", "Dataset version to record on the VolumeSnapshot.", default=""),
+            _SNAPSHOT_CLASS_INPUT,
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [{"name": "snapshot", "type": "String", "description": "Name of the new VolumeSnapshot."}],
+        "func": _run_create_volume_snapshot,
+    },
+    "clone-volume": {
+        "description": "Create a new persistent volume that is a clone of an existing persistent volume or snapshot.",
+        "inputs": [
+            _input("new_pvc_name", "String", "Name of the new PersistentVolumeClaim (PVC)."),
+            _input("source_pvc_name", "String", "Name of the PVC to clone. A new snapshot of it is used as the "
+                                                "source, unless a source snapshot is specified.", default=""),
+            _input("source_snapshot_name", "String", "Name of the VolumeSnapshot to clone.", default=""),
+            _SNAPSHOT_CLASS_INPUT,
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [{"name": "pvc", "type": "String", "description": "Name of the new PVC."}],
+        "func": _run_clone_volume,
+    },
+    "clone-volumes": {
+        "description": "Create multiple new persistent volumes that are clones of the same persistent volume or "
+                       "snapshot.",
+        "inputs": [
+            _input("new_pvc_names", "JsonArray", "Names of the new PersistentVolumeClaims (PVCs)."),
+            _input("source_pvc_name", "String", "Name of the PVC to clone. A single new snapshot of it is used as the "
+                                                "source of every clone, unless a source snapshot is specified.",
+                   default=""),
+            _input("source_snapshot_name", "String", "Name of the VolumeSnapshot to clone.", default=""),
+            _input("max_parallel", "Integer", "Maximum number of PVCs to create at the same time.", default="8"),
+            _SNAPSHOT_CLASS_INPUT,
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [{"name": "pvcs", "type": "JsonArray", "description": "Names of the new PVCs."}],
+        "func": _run_clone_volumes,
+    },
+    "restore-volume-snapshot": {
+        "description": "Restore a VolumeSnapshot to the persistent volume that it was created from.",
+        "inputs": [
+            _input("snapshot_name", "String", "Name of the VolumeSnapshot to restore."),
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [{"name": "pvc", "type": "String", "description": "Name of the restored PVC."}],
+        "func": _run_restore_volume_snapshot,
+    },
+    "delete-volume": {
+        "description": "Delete a persistent volume.",
+        "inputs": [
+            _input("pvc_name", "String", "Name of the PersistentVolumeClaim (PVC) to delete."),
+            _input("preserve_snapshots", "Boolean", "Do not delete the VolumeSnapshots of the volume.",
+                   default="False"),
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [],
+        "func": _run_delete_volume,
+    },
+    "delete-volume-snapshot": {
+        "description": "Delete a VolumeSnapshot.",
+        "inputs": [
+            _input("snapshot_name", "String", "Name of the VolumeSnapshot to delete."),
+            _NAMESPACE_INPUT,
+        ],
+        "outputs": [],
+        "func": _run_delete_volume_snapshot,
+    },
+    "get-s3-bucket": {
+        "description": "Copy the contents of an S3 bucket to a persistent volume.",
+        "inputs": _S3_INPUTS + [_input("pvc_dir", "String", "Directory within the PVC to copy the bucket to.",
+                                       default="")],
+        "outputs": [_S3_JOB_OUTPUT],
+        "func": lambda args, session: _run_s3_job("get-bucket", args=args, session=session),
+    },
+    "get-s3-object": {
+        "description": "Copy an object from an S3 bucket to a persistent volume.",
+        "inputs": _S3_INPUTS + [
+            _input("object_key", "String", "Key of the object to copy."),
+            _input("file_location", "String", "Path within the PVC to copy the object to. If not specified, the "
+                                              "object key is used.", default=""),
+        ],
+        "outputs": [_S3_JOB_OUTPUT],
+        "func": lambda args, session: _run_s3_job("get-object", args=args, session=session),
+    },
+    "put-s3-bucket": {
+        "description": "Copy the contents of a persistent volume to an S3 bucket.",
+        "inputs": _S3_INPUTS + [_input("pvc_dir", "String", "Directory within the PVC to copy to the bucket.",
+                                       default="")],
+        "outputs": [_S3_JOB_OUTPUT],
+        "func": lambda args, session: _run_s3_job("put-bucket", args=args, session=session),
+    },
+    "put-s3-object": {
+        "description": "Copy a file from a persistent volume to an S3 bucket.",
+        "inputs": _S3_INPUTS + [
+            _input("file_location", "String", "Path of the file within the PVC."),
+            _input("object_key", "String", "Key of the new object."),
+        ],
+        "outputs": [_S3_JOB_OUTPUT],
+        "func": lambda args, session: _run_s3_job("put-object", args=args, session=session),
+    },
+}
+
+COMPONENT_NAMES = tuple(_COMPONENTS)
+
+
+def _get_component(name: str) -> dict:
+    if name not in _COMPONENTS:
+        raise ValueError("Unsupported component: " + str(name) + ". Supported components: " +
+                         ", ".join(COMPONENT_NAMES) + ".")
+    return _COMPONENTS[name]
+
+
+def _parse_value(value: str, valueType: str):
+    # Values are passed as strings; an empty string means that an optional input was not specified
+    if valueType == "Boolean":
+        return value.strip().lower() in ("true", "1", "yes")
+    if valueType == "Integer":
+        return int(value)
+    if valueType == "JsonArray":
+        return json.loads(value) if value.strip() else list()
+    return value or None
+
+
+def get_component_spec(name: str, image: str = None) -> dict:
+    """Get the Kubeflow Pipelines component specification of a component.
+
+    :param name: Name of the component (one of COMPONENT_NAMES, e.g. "create-volume-snapshot").
+    :param image: Container image to run the component in. The image must have this version of the toolkit
+        installed (see the Dockerfile that is included with the toolkit). If not specified, DEFAULT_IMAGE is used.
+    :return: The component specification, as a dictionary that can be serialized to a component YAML file.
+    :raises ValueError: If the component is not supported.
+    """
+    component = _get_component(name)
+    args = list()
+    for inputDict in component["inputs"]:
+        args += ["--" + inputDict["name"].replace("_", "-"), {"inputValue": inputDict["name"]}]
+    for outputDict in component["outputs"]:
+        args += ["--output-" + outputDict["name"].replace("_", "-"), {"outputPath": outputDict["name"]}]
+    return {
+        "name": "NetApp DataOps - " + name.replace("-", " ").capitalize().replace("s3", "S3"),
+        "description": component["description"],
+        "metadata": {"annotations": {"netapp-dataops-k8s/component": name,
+                                     "netapp-dataops-k8s/version": __version__}},
+        "inputs": [dict(inputDict) for inputDict in component["inputs"]],
+        "outputs": [dict(outputDict) for outputDict in component["outputs"]],
+        "implementation": {"container": {
+            "image": image or DEFAULT_IMAGE,
+            "command": ["python3", "-m", "netapp_dataops.k8s.kfp", name],
+            "args": args,
+        }},
+    }
+
+
+def get_component_text(name: str, image: str = None) -> str:
+    """Get the Kubeflow Pipelines component specification of a component as YAML.
+
+    :param name: Name of the component (one of COMPONENT_NAMES, e.g. "create-volume-snapshot").
+    :param image: Container image to run the component in. If not specified, DEFAULT_IMAGE is used.
+    :return: The component specification, in the Kubeflow Pipelines component YAML format.
+    :raises ValueError: If the component is not supported.
+    """
+    return yaml.safe_dump(get_component_spec(name, image=image), sort_keys=False)
+
+
+def load_component(name: str, image: str = None):
+    """Load a component as a Kubeflow Pipelines component (task factory). Requires the kfp package.
+
+    :param name: Name of the component (one of COMPONENT_NAMES, e.g. "create-volume-snapshot").
+    :param image: Container image to run the component in. If not specified, DEFAULT_IMAGE is used.
+    :return: The task factory returned by kfp.components.load_component_from_text().
+    :raises ValueError: If the component is not supported.
+    """
+    try:
+        from kfp import components
+    except ImportError as err:
+        raise ImportError("Loading Kubeflow Pipelines components requires the kfp package. Install it using "
+                          "'python3 -m pip install kfp'.") from err
+    return components.load_component_from_text(get_component_text(name, image=image))
+
+
+def write_component_files(directory: str, image: str = None) -> list:
+    """Write the specification of every component to a '<name>.yaml' file.
+
+    :param directory: Directory to write the files to. It is created if it does not exist.
+    :param image: Container image to run the components in. If not specified, DEFAULT_IMAGE is used.
+    :return: The paths of the files that were written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = list()
+    for name in COMPONENT_NAMES:
+        path = os.path.join(directory, name + ".yaml")
+        with open(path, "w") as file:
+            file.write(get_component_text(name, image=image))
+        paths.append(path)
+    return paths
+
+
+def main(argv: list = None) -> int:
+    """Run a component. This is the entrypoint of the component containers.
+
+    Usage: python3 -m netapp_dataops.k8s.kfp <component> [--<input>=<value> ...] [--output-<output>=<path> ...]
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in _COMPONENTS:
+        print("Usage: python3 -m netapp_dataops.k8s.kfp <component> [--<input>=<value> ...] "
+              "[--output-<output>=<path> ...]\nSupported components: " + ", ".join(COMPONENT_NAMES) + ".")
+        return 1
+    name = argv[0]
+    component = _COMPONENTS[name]
+
+    # Parse inputs and output paths
+    parser = argparse.ArgumentParser(prog="python3 -m netapp_dataops.k8s.kfp " + name,
+                                     description=component["description"])
+    for inputDict in component["inputs"]:
+        parser.add_argument("--" + inputDict["name"].replace("_", "-"), dest=inputDict["name"],
+                            default=inputDict.get("default"), required="default" not in inputDict,
+                            help=inputDict["description"])
+    for outputDict in component["outputs"]:
+        parser.add_argument("--output-" + outputDict["name"].replace("_", "-"), dest="output_" + outputDict["name"],
+                            help="Path to write output '" + outputDict["name"] + "' to.")
+    parsedArgs = vars(parser.parse_args(argv[1:]))
+    try:
+        args = {inputDict["name"]: _parse_value(parsedArgs[inputDict["name"]], inputDict["type"])
+                for inputDict in component["inputs"]}
+    except ValueError as err:
+        print("Error: Invalid input value: " + str(err))
+        return 1
+
+    # Run component
+    try:
+        session = _get_session(print_output=True)
+        outputs = component["func"](args, session=session)
+    except (InvalidConfigError, APIConnectionError, ServiceUnavailableError, WaitTimeoutError, ComponentError) as err:
+        print("Error: " + _get_error_message(err))
+        return 1
+
+    # Write outputs
+    for outputDict in component["outputs"]:
+        path = parsedArgs["output_" + outputDict["name"]]
+        if not path:
+            continue
+        value = outputs[outputDict["name"]]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as file:
+            file.write(json.dumps(value) if outputDict["type"] == "JsonArray" else str(value))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""NetApp DataOps Toolkit for Kubernetes declarative plans.
+
+A plan is a YAML (or JSON) document that lists DataOps operations and the operations that each of them depends on.
+Applying a plan runs every operation whose dependencies have completed, several at a time, using a single
+Kubernetes API session, so that dozens of volumes, snapshots, clones and workspaces can be provisioned in one
+invocation instead of one CLI process per operation.
+
+Example plan::
+
+    namespace: team1            # Default namespace for every step (optional)
+    steps:
+      - name: dataset
+        operation: create_volume
+        args:
+          pvc_name: dataset
+          volume_size: 100Gi
+      - name: baseline
+        operation: create_volume_snapshot
+        depends_on: [dataset]
+        args:
+          pvc_name: dataset
+          snapshot_name: baseline
+      - name: workspace
+        operation: create_jupyter_lab
+        depends_on: [baseline]
+        args:
+          workspace_name: project1
+          workspace_size: 50Gi
+          workspace_password: changeme
+
+Each step calls the toolkit function named by 'operation' (CLI-style names such as "create volume-snapshot" are
+accepted as well) with 'args' as its keyword arguments. When a state file is specified, the steps that complete
+are recorded in it, so that applying the plan again after a failure skips them and resumes with the remaining
+steps. A step is only skipped if its operation and arguments have not changed since it completed.
+
+Example::
+
+    from netapp_dataops.k8s.plan import apply_plan, load_plan
+
+    apply_plan(load_plan("plan.yaml"), max_workers=8, state_file="plan.yaml.state", print_output=True)
+"""
+import hashlib
+import inspect
+import json
+import os
+import threading
+
+import yaml
+
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    _get_session,
+    _print_table,
+    _run_steps,
+    clone_jupyter_lab,
+    clone_volume,
+    create_jupyter_lab,
+    create_jupyter_lab_snapshot,
+    create_triton_server,
+    create_volume,
+    create_volume_snapshot,
+    delete_jupyter_lab,
+    delete_triton_server,
+    delete_volume,
+    delete_volume_snapshot,
+    restore_jupyter_lab_snapshot,
+    restore_volume_snapshot,
+    scale_triton_server,
+    tracing,
+    DataOpsSession,
+)
+
+
+class InvalidPlanError(Exception):
+    '''Error that will be raised when a plan is malformed'''
+    pass
+
+
+_OPERATIONS = {func.__name__: func for func in (
+    clone_jupyter_lab,
+    clone_volume,
+    create_jupyter_lab,
+    create_jupyter_lab_snapshot,
+    create_triton_server,
+    create_volume,
+    create_volume_snapshot,
+    delete_jupyter_lab,
+    delete_triton_server,
+    delete_volume,
+    delete_volume_snapshot,
+    restore_jupyter_lab_snapshot,
+    restore_volume_snapshot,
+    scale_triton_server,
+)}
+
+# Password arguments of operations that would otherwise prompt for a password, which is not possible while several
+# steps are running at the same time
+_REQUIRED_ARGS = {
+    "clone_jupyter_lab": ("new_workspace_password",),
+    "create_jupyter_lab": ("workspace_password",),
+}
+
+
+def _normalize_operation_name(operation: str) -> str:
+    return "".join(character for character in str(operation).lower() if character.isalnum())
+
+
+def _get_operation(operation: str, operations: dict = None) -> str:
+    # Accept both function names (e.g. "create_jupyter_lab") and CLI-style names (e.g. "create jupyterlab")
+    operations = operations or _OPERATIONS
+    for name in operations:
+        if _normalize_operation_name(name) == _normalize_operation_name(operation):
+            return name
+    raise InvalidPlanError("Unsupported operation: " + str(operation) + ". Supported operations: " +
+                           ", ".join(sorted(operations)) + ".")
+
+
+def _get_step_digest(operation: str, args: dict) -> str:
+    return hashlib.sha256(json.dumps({"operation": operation, "args": args}, sort_keys=True,
+                                     default=str).encode("utf-8")).hexdigest()
+
+
+def _get_error_message(err: Exception) -> str:
+    # Kubernetes API errors are wrapped in APIConnectionError; report the message of the API response rather than the
+    # whole response
+    apiError = err.args[0] if err.args and isinstance(err.args[0], ApiException) else err
+    if isinstance(apiError, ApiException):
+        try:
+            return json.loads(apiError.body)["message"]
+        except (TypeError, ValueError, KeyError):
+            return "(" + str(apiError.status) + ") " + str(apiError.reason)
+    return str(err) or type(err).__name__
+
+
+def _parse_plan(plan: dict) -> list:
+    # Validate the plan and return its steps, with the operation name resolved and the default namespace applied
+    if not isinstance(plan, dict) or not isinstance(plan.get("steps"), list):
+        raise InvalidPlanError("A plan must be a mapping with a 'steps' list.")
+    defaultNamespace = plan.get("namespace")
+
+    steps = list()
+    for index, stepDict in enumerate(plan["steps"]):
+        if not isinstance(stepDict, dict) or "name" not in stepDict or "operation" not in stepDict:
+            raise InvalidPlanError("Step " + str(index + 1) + " must be a mapping with a 'name' and an 'operation'.")
+        name = str(stepDict["name"])
+        operation = _get_operation(stepDict["operation"])
+        args = dict(stepDict.get("args") or dict())
+        dependencies = stepDict.get("depends_on") or list()
+        if isinstance(dependencies, str):
+            dependencies = [dependencies]
+        dependencies = [str(dependency) for dependency in dependencies]
+
+        # Check the arguments against the signature of the operation
+        signature = inspect.signature(_OPERATIONS[operation])
+        for reserved in ("print_output", "session"):
+            if reserved in args:
+                raise InvalidPlanError("Step '" + name + "': '" + reserved + "' cannot be specified in a plan.")
+        if defaultNamespace and "namespace" in signature.parameters and "namespace" not in args:
+            args["namespace"] = defaultNamespace
+        try:
+            signature.bind(**args)
+        except TypeError as err:
+            raise InvalidPlanError("Step '" + name + "': invalid arguments for " + operation + ": " + str(err))
+        for required in _REQUIRED_ARGS.get(operation, ()):
+            if not args.get(required):
+                raise InvalidPlanError("Step '" + name + "': '" + required + "' is required.")
+
+        steps.append({"name": name, "operation": operation, "args": args, "depends_on": dependencies,
+                      "digest": _get_step_digest(operation=operation, args=args)})
+
+    # Check step names and dependencies
+    names = [step["name"] for step in steps]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        raise InvalidPlanError("Duplicate step names: " + ", ".join(duplicates) + ".")
+    for step in steps:
+        unknown = [dependency for dependency in step["depends_on"] if dependency not in names]
+        if unknown:
+            raise InvalidPlanError("Step '" + step["name"] + "' depends on unknown steps: " + ", ".join(unknown) + ".")
+
+    # Check for dependency cycles, so that no steps are run if the plan cannot be completed
+    resolved = set()
+    remaining = {step["name"]: set(step["depends_on"]) for step in steps}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if dependencies <= resolved]
+        if not ready:
+            raise InvalidPlanError("Dependency cycle between steps: " + ", ".join(sorted(remaining)) + ".")
+        resolved.update(ready)
+        for name in ready:
+            del remaining[name]
+
+    return steps
+
+
+def _load_state(stateFile: str) -> dict:
+    if not stateFile or not os.path.exists(stateFile):
+        return dict()
+    with open(stateFile) as file:
+        return json.load(file).get("completed", dict())
+
+
+def _save_state(stateFile: str, completed: dict):
+    # Write to a temporary file first, so that the state file is never left partially written
+    tempFile = stateFile + ".tmp"
+    with open(tempFile, "w") as file:
+        json.dump({"completed": completed}, file, indent=2, sort_keys=True)
+    os.replace(tempFile, stateFile)
+
+
+def load_plan(plan_file: str) -> dict:
+    """Load a plan from a YAML or JSON file.
+
+    :param plan_file: Path to the plan file.
+    :return: The plan, which can be passed to apply_plan().
+    :raises InvalidPlanError: If the file is not valid YAML.
+    """
+    with open(plan_file) as file:
+        try:
+            return yaml.safe_load(file)
+        except yaml.YAMLError as err:
+            raise InvalidPlanError("Unable to parse plan file " + plan_file + ": " + str(err))
+
+
+@tracing.traced
+def apply_plan(plan: dict, max_workers: int = 4, state_file: str = None, print_output: bool = False,
+               session: DataOpsSession = None) -> list:
+    """Apply a plan, running each step as soon as the steps that it depends on have completed.
+
+    :param plan: The plan, e.g. as returned by load_plan(). See the module documentation for its format.
+    :param max_workers: Maximum number of steps to run at the same time. Default value is 4.
+    :param state_file: If specified, steps that complete are recorded in this file, and steps that are recorded as
+        completed (with the same operation and arguments) are skipped. Default value is None.
+    :param print_output: If True print the progress of each step and a summary of the plan. Default value is False.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :return: A list of dictionaries, one per step, with the keys "Step", "Operation", "Status" (Completed, Skipped,
+        Failed or Not Started) and "Error".
+    :raises InvalidPlanError: If the plan is malformed or contains a dependency cycle. No steps are run in that case.
+    :raises Exception: The exception raised by the first step that fails. Steps that have not been started when a
+        step fails are not started; steps that are running are allowed to finish and are recorded in the state file.
+    """
+    steps = _parse_plan(plan)
+
+    # Retrieve Kubernetes API session (shared by every step)
+    session = _get_session(session=session, print_output=print_output)
+
+    # Skip steps that completed during a previous run
+    completed = {name: digest for name, digest in _load_state(state_file).items()
+                 if name in [step["name"] for step in steps]}
+    statuses = dict()
+    for step in steps:
+        if completed.get(step["name"]) == step["digest"]:
+            statuses[step["name"]] = ("Skipped", "")
+        else:
+            completed.pop(step["name"], None)
+            statuses[step["name"]] = ("Not Started", "")
+    if print_output and completed:
+        print("Skipping " + str(len(completed)) + " step(s) that completed during a previous run.")
+
+    stateLock = threading.Lock()
+    printLock = threading.Lock()
+
+    def _print_progress(message: str):
+        # Steps run concurrently, so each message is printed under a lock to keep lines from interleaving
+        if print_output:
+            with printLock:
+                print(message, flush=True)
+
+    def _make_step_func(step: dict):
+        def _run_step(results: dict):
+            _print_progress("Running step '" + step["name"] + "' (" + step["operation"] + ")...")
+            with tracing.span("plan-step", step=step["name"], operation=step["operation"]):
+                try:
+                    _OPERATIONS[step["operation"]](**step["args"], print_output=False, session=session)
+                except Exception as err:
+                    statuses[step["name"]] = ("Failed", _get_error_message(err))
+                    _print_progress("Error: Step '" + step["name"] + "' failed: " + _get_error_message(err))
+                    raise
+            with stateLock:
+                statuses[step["name"]] = ("Completed", "")
+                completed[step["name"]] = step["digest"]
+                if state_file:
+                    _save_state(stateFile=state_file, completed=completed)
+            _print_progress("Step '" + step["name"] + "' completed.")
+
+        return _run_step
+
+    # Run the remaining steps. Dependencies on skipped steps are satisfied, since they are not in the graph.
+    error = None
+    try:
+        _run_steps({step["name"]: (_make_step_func(step), step["depends_on"]) for step in steps
+                    if statuses[step["name"]][0] != "Skipped"}, maxWorkers=max_workers)
+    except Exception as err:
+        error = err
+
+    stepsList = [{"Step": step["name"], "Operation": step["operation"], "Status": statuses[step["name"]][0],
+                  "Error": statuses[step["name"]][1]} for step in steps]
+    if print_output:
+        print()
+        _print_table(stepsList)
+    if error is not None:
+        raise error
+    return stepsList
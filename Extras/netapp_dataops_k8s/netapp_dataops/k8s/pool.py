@@ -0,0 +1,496 @@
+"""NetApp DataOps Toolkit for Kubernetes JupyterLab workspace pools.
+
+Provisioning a JupyterLab workspace requires cloning its volume, scheduling its pod and starting a workspace
+image that can be several GB in size. When many users need a workspace at the same time, e.g. at the start of a
+workshop, a workspace pool can be used instead. The pool keeps a number of ready, unassigned workspaces that are
+cloned from a golden VolumeSnapshot, hands one out as soon as it is claimed, and refills itself in the background.
+
+Example::
+
+    from netapp_dataops.k8s.pool import JupyterLabWorkspacePool
+
+    pool = JupyterLabWorkspacePool(pool_name="workshop", source_snapshot_name="golden", size=10, namespace="team1")
+    pool.start()  # fill the pool and keep it filled in the background
+    workspace = pool.claim(claimed_by="alice", workspace_password="...")
+    print(workspace["Access URL"])
+    print(pool.metrics())
+
+Workspaces in a pool are regular JupyterLab workspaces, named after the pool with a random suffix, that are labeled
+with 'jupyterlab-pool-name' and 'jupyterlab-pool-state'. A claimed workspace can be managed, e.g. deleted, like any
+other workspace.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import random
+import secrets
+import string
+import threading
+
+from kubernetes.client.rest import ApiException
+
+from netapp_dataops.k8s import (
+    _get_jupyter_lab_deployment,
+    _get_jupyter_lab_service,
+    _get_jupyter_lab_workspace_pvc_name,
+    _get_session,
+    _hash_jupyter_lab_password,
+    _is_deployment_ready,
+    _is_deployment_rollout_complete,
+    _retrieve_jupyter_lab_url,
+    _wait_for_object,
+    clone_jupyter_lab,
+    delete_jupyter_lab,
+    tracing,
+    APIConnectionError,
+    DataOpsSession,
+    WaitTimeoutError,
+)
+
+
+class PoolExhaustedError(Exception):
+    '''Error that will be raised when a workspace pool has no available workspaces'''
+    pass
+
+
+_pools = dict()
+_pools_lock = threading.Lock()
+
+
+def _get_pool_labels(poolName: str, state: str, claimedBy: str = None) -> dict:
+    labels = {
+        "jupyterlab-pool-name": poolName,
+        "jupyterlab-pool-state": state
+    }
+    if claimedBy:
+        labels["jupyterlab-pool-claimed-by"] = claimedBy
+    return labels
+
+
+def _get_pool_label_selector(poolName: str, state: str) -> str:
+    return ",".join(key + "=" + value for key, value in _get_pool_labels(poolName=poolName, state=state).items())
+
+
+def _get_pool_workspace_name(poolName: str) -> str:
+    return poolName + "-" + "".join(random.choices(string.ascii_lowercase + string.digits, k=5))
+
+
+def _list_pool_deployments(poolName: str, state: str, namespace: str = "default", printOutput: bool = False,
+                           session: DataOpsSession = None) -> list:
+    # Pool state is always read from the Kubernetes API, not from a local resource cache, since claims rely on the
+    # resourceVersion of each Deployment being current
+    try:
+        api = session.apps_v1_api()
+        return api.list_namespaced_deployment(namespace=namespace,
+                                              label_selector=_get_pool_label_selector(poolName=poolName, state=state)).items
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+
+def _claim_available_workspace(poolName: str, claimedBy: str = None, workspacePassword: str = None,
+                               namespace: str = "default", printOutput: bool = False,
+                               session: DataOpsSession = None) -> str:
+    """Claim an available workspace in a pool by relabeling it and replacing its password.
+
+    The Deployment is patched with the resourceVersion that it was listed with, so that when several callers try to
+    claim the same workspace at the same time, only one of them succeeds and the others move on to another workspace.
+
+    :return: The name of the claimed workspace, or None if the pool has no available workspaces.
+    """
+    deployments = _list_pool_deployments(poolName=poolName, state="available", namespace=namespace,
+                                         printOutput=printOutput, session=session)
+
+    # Prefer workspaces that are ready; within each group, pick workspaces in random order so that concurrent claims
+    # rarely contend for the same workspace
+    random.shuffle(deployments)
+    deployments.sort(key=lambda deployment: not _is_deployment_ready(deployment))
+
+    claimLabels = _get_pool_labels(poolName=poolName, state="claimed", claimedBy=claimedBy)
+    hashedPassword = None
+    for deployment in deployments:
+        if hashedPassword is None:
+            hashedPassword = _hash_jupyter_lab_password(workspacePassword=workspacePassword)
+
+        # Replace the password. This restarts the workspace pod, but the volume is already cloned and bound, and the
+        # workspace image is already present on the node. The Recreate strategy ensures that the new pod never has
+        # to share the volume with the old one.
+        container = deployment.spec.template.spec.containers[0]
+        command = ["--LabApp.password=" + hashedPassword if arg.startswith("--LabApp.password=") else arg
+                   for arg in container.command]
+        body = {
+            "metadata": {
+                "resourceVersion": deployment.metadata.resource_version,
+                "labels": claimLabels
+            },
+            "spec": {
+                "strategy": {
+                    "type": "Recreate",
+                    "rollingUpdate": None
+                },
+                "template": {
+                    "metadata": {
+                        "labels": claimLabels
+                    },
+                    "spec": {
+                        "containers": [
+                            {
+                                "name": container.name,
+                                "command": command
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+        try:
+            api = session.apps_v1_api()
+            api.patch_namespaced_deployment(name=deployment.metadata.name, namespace=namespace, body=body)
+        except ApiException as err:
+            # The workspace was claimed or deleted by someone else; try the next one
+            if err.status in (404, 409):
+                continue
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Relabel the workspace's Service and PVC
+        workspaceName = deployment.metadata.labels["jupyterlab-workspace-name"]
+        if printOutput:
+            print("Claimed JupyterLab workspace '" + workspaceName + "' from pool '" + poolName + "' in namespace '" + namespace + "'.")
+        try:
+            api = session.core_v1_api()
+            api.patch_namespaced_service(name=_get_jupyter_lab_service(workspaceName=workspaceName),
+                                         namespace=namespace, body={"metadata": {"labels": claimLabels}})
+            api.patch_namespaced_persistent_volume_claim(name=_get_jupyter_lab_workspace_pvc_name(workspaceName=workspaceName),
+                                                         namespace=namespace, body={"metadata": {"labels": claimLabels}})
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+        return workspaceName
+
+    return None
+
+
+def _wait_for_claimed_workspace(workspaceName: str, namespace: str = "default", printOutput: bool = False,
+                                timeout: float = None, session: DataOpsSession = None) -> str:
+    # Wait for the workspace to restart with its new password
+    if printOutput:
+        print("Waiting for JupyterLab workspace '" + workspaceName + "' to restart with the new password.")
+    with tracing.span("deployment-ready", workspace=workspaceName):
+        try:
+            api = session.apps_v1_api()
+            _wait_for_object(list_func=api.list_namespaced_deployment, name=_get_jupyter_lab_deployment(workspaceName=workspaceName),
+                             namespace=namespace, condition=_is_deployment_rollout_complete, timeout=timeout)
+        except ApiException as err:
+            if printOutput:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+        except WaitTimeoutError:
+            if printOutput:
+                print("Error: Timed out waiting for JupyterLab workspace to restart.")
+            raise
+
+    # Retrieve access URL
+    with tracing.span("url-resolve"):
+        return _retrieve_jupyter_lab_url(workspaceName=workspaceName, namespace=namespace, printOutput=printOutput,
+                                         session=session)
+
+
+class JupyterLabWorkspacePool:
+    """Pool of ready, unassigned JupyterLab workspaces that are cloned from a golden VolumeSnapshot.
+
+    The pool is refilled by a background thread once it has been started. Workspaces that are provisioned by
+    other processes for the same pool name and namespace count towards the size of the pool, so several processes
+    can share a pool, but the hit and miss metrics only cover claims made through this object.
+    """
+
+    def __init__(self, pool_name: str, source_snapshot_name: str, size: int, namespace: str = "default",
+                 load_balancer_service: bool = False, request_cpu: str = None, request_memory: str = None,
+                 request_nvidia_gpu: str = None, allocate_resource: str = None, refill_interval: float = 30,
+                 max_workers: int = 4, timeout: float = None, session: DataOpsSession = None,
+                 print_output: bool = False):
+        """Initialize the JupyterLabWorkspacePool object.
+
+        :param pool_name: Name of the pool. Workspaces in the pool are named after the pool with a random suffix.
+        :param source_snapshot_name: Name of the golden VolumeSnapshot to clone workspaces from. The VolumeSnapshot
+            must be a snapshot of a JupyterLab workspace; the image of that workspace is used for the clones.
+        :param size: Number of available workspaces to keep in the pool.
+        :param namespace: Kubernetes namespace of the pool. Defaults to the default namespace.
+        :param load_balancer_service: Option to use a LoadBalancer service instead of a NodePort service.
+        :param request_cpu: Number of CPUs to reserve for each workspace. Format: '0.5', '1', etc.
+        :param request_memory: Amount of memory to reserve for each workspace. Format: '1024Mi', '100Gi', etc.
+        :param request_nvidia_gpu: Number of NVIDIA GPUs to allocate to each workspace. Format: '1', '4', etc.
+        :param allocate_resource: Custom resource allocation for each workspace, ex. 'nvidia.com/mig-1g.5gb=1'.
+        :param refill_interval: Maximum number of seconds between checks of the size of the pool by the background
+            thread. The pool is also checked immediately after every claim.
+        :param max_workers: Maximum number of workspaces to provision at the same time.
+        :param timeout: Maximum number of seconds to allow for each wait when provisioning or claiming a workspace.
+            If not specified, wait indefinitely.
+        :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide
+            default session is used.
+        :param print_output: If True enable information to be printed to the console. Default value is False.
+        """
+        self.pool_name = pool_name
+        self.source_snapshot_name = source_snapshot_name
+        self.size = size
+        self.namespace = namespace
+        self.load_balancer_service = load_balancer_service
+        self.request_cpu = request_cpu
+        self.request_memory = request_memory
+        self.request_nvidia_gpu = request_nvidia_gpu
+        self.allocate_resource = allocate_resource
+        self.refill_interval = refill_interval
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = _get_session(session=session, print_output=print_output)
+        self.print_output = print_output
+
+        self._provisioning = set()
+        self._counters = {"hits": 0, "misses": 0, "refill_errors": 0}
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._refill_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start refilling the pool in the background.
+
+        While the pool is started, claim_jupyter_lab() calls for the pool name and namespace are made through it.
+
+        :return: The JupyterLabWorkspacePool object.
+        """
+        with _pools_lock:
+            _pools[(self.namespace, self.pool_name)] = self
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="jupyterlab-pool-" + self.pool_name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop refilling the pool. Workspaces that are being provisioned are left to finish."""
+        with _pools_lock:
+            if _pools.get((self.namespace, self.pool_name)) is self:
+                del _pools[(self.namespace, self.pool_name)]
+        self._stopped.set()
+        self._refill_requested.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.refill()
+            except Exception as err:
+                with self._lock:
+                    self._counters["refill_errors"] += 1
+                if self.print_output:
+                    print("Error: Failed to refill JupyterLab workspace pool '" + self.pool_name + "': ", err)
+            self._refill_requested.wait(timeout=self.refill_interval)
+            self._refill_requested.clear()
+
+    def _provision_workspace(self, workspaceName: str, labels: dict, workspacePassword: str, timeout: float = None,
+                             printOutput: bool = None) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        printOutput = self.print_output if printOutput is None else printOutput
+        try:
+            return clone_jupyter_lab(new_workspace_name=workspaceName, source_workspace_name=None,
+                                     source_snapshot_name=self.source_snapshot_name,
+                                     load_balancer_service=self.load_balancer_service,
+                                     new_workspace_password=workspacePassword, namespace=self.namespace,
+                                     request_cpu=self.request_cpu, request_memory=self.request_memory,
+                                     request_nvidia_gpu=self.request_nvidia_gpu,
+                                     allocate_resource=self.allocate_resource, print_output=printOutput,
+                                     labels=labels, timeout=timeout, session=self.session)
+        except Exception:
+            # Do not leave a partially provisioned workspace in the pool
+            try:
+                delete_jupyter_lab(workspace_name=workspaceName, namespace=self.namespace,
+                                   print_output=printOutput, session=self.session)
+            except Exception as err:
+                if printOutput:
+                    print("Error: Failed to delete partially provisioned JupyterLab workspace '" + workspaceName + "': ", err)
+            raise
+
+    def refill(self) -> list:
+        """Provision workspaces until the pool contains the configured number of available workspaces.
+
+        :return: The names of the workspaces that were provisioned.
+        :raises APIConnectionError: When the Kubernetes API returns an error.
+        :raises WaitTimeoutError: When a workspace does not become ready before the timeout expires.
+        """
+        with self._refill_lock:
+            deployments = _list_pool_deployments(poolName=self.pool_name, state="available",
+                                                 namespace=self.namespace, printOutput=self.print_output,
+                                                 session=self.session)
+            with self._lock:
+                workspaceNames = {deployment.metadata.labels["jupyterlab-workspace-name"] for deployment in deployments}
+                workspaceNames.update(self._provisioning)
+                newWorkspaceNames = [_get_pool_workspace_name(poolName=self.pool_name)
+                                     for _ in range(self.size - len(workspaceNames))]
+                self._provisioning.update(newWorkspaceNames)
+
+        if not newWorkspaceNames:
+            return newWorkspaceNames
+
+        if self.print_output:
+            print("Provisioning " + str(len(newWorkspaceNames)) + " JupyterLab workspace(s) for pool '" + self.pool_name + "' in namespace '" + self.namespace + "'...")
+
+        # Pool workspaces get a random password; the password is replaced when the workspace is claimed
+        def _provision(workspaceName: str):
+            try:
+                self._provision_workspace(workspaceName=workspaceName,
+                                          labels=_get_pool_labels(poolName=self.pool_name, state="available"),
+                                          workspacePassword=secrets.token_urlsafe(16))
+            finally:
+                with self._lock:
+                    self._provisioning.discard(workspaceName)
+
+        with tracing.span("pool-refill", pool=self.pool_name, workspaces=len(newWorkspaceNames)):
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(newWorkspaceNames)))) as executor:
+                futures = [executor.submit(tracing.propagate(_provision), workspaceName)
+                           for workspaceName in newWorkspaceNames]
+            for future in futures:
+                if future.exception() is not None:
+                    raise future.exception()
+
+        return newWorkspaceNames
+
+    def claim(self, claimed_by: str = None, workspace_password: str = None, timeout: float = None,
+              print_output: bool = None) -> dict:
+        """Claim a workspace from the pool.
+
+        If the pool has no available workspaces, a new workspace is cloned from the golden VolumeSnapshot for the
+        caller (a pool miss), which takes as long as clone_jupyter_lab().
+
+        :param claimed_by: Optional name of the user that claims the workspace, applied as the
+            'jupyterlab-pool-claimed-by' label. Must be a valid Kubernetes label value.
+        :param workspace_password: Workspace password. If not specified, you will be prompted to enter a password
+            via the console.
+        :param timeout: Maximum number of seconds to allow for each wait, i.e. for the workspace to restart with its
+            new password or, on a pool miss, for the new workspace to be cloned. If not specified, the timeout of the
+            pool is used.
+        :param print_output: If True enable information to be printed to the console. If not specified, the
+            print_output setting of the pool is used.
+        :return: A dictionary containing the "Workspace Name" and "Access URL" of the claimed workspace, and
+            "Pool Hit" (True/False).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        printOutput = self.print_output if print_output is None else print_output
+        with tracing.span("pool-claim", pool=self.pool_name) as claimSpan:
+            workspaceName = _claim_available_workspace(poolName=self.pool_name, claimedBy=claimed_by,
+                                                       workspacePassword=workspace_password,
+                                                       namespace=self.namespace, printOutput=printOutput,
+                                                       session=self.session)
+            hit = workspaceName is not None
+            with self._lock:
+                self._counters["hits" if hit else "misses"] += 1
+            if claimSpan is not None:
+                claimSpan.set_attribute("hit", hit)
+            self._refill_requested.set()
+
+            if hit:
+                url = _wait_for_claimed_workspace(workspaceName=workspaceName, namespace=self.namespace,
+                                                  printOutput=printOutput, timeout=timeout, session=self.session)
+            else:
+                workspaceName = _get_pool_workspace_name(poolName=self.pool_name)
+                if printOutput:
+                    print("No workspaces available in pool '" + self.pool_name + "'. Cloning new JupyterLab workspace '" + workspaceName + "'...")
+                url = self._provision_workspace(workspaceName=workspaceName,
+                                                labels=_get_pool_labels(poolName=self.pool_name, state="claimed",
+                                                                        claimedBy=claimed_by),
+                                                workspacePassword=workspace_password, timeout=timeout,
+                                                printOutput=printOutput)
+
+        if printOutput:
+            print("\nJupyterLab workspace '" + workspaceName + "' successfully claimed.")
+            print("To access workspace, navigate to " + url)
+
+        return {"Workspace Name": workspaceName, "Access URL": url, "Pool Hit": hit}
+
+    def metrics(self) -> dict:
+        """Get pool metrics.
+
+        :return: A dictionary containing the hit and miss counts and the hit ratio of claims made through this
+            object, the number of available workspaces in the pool and how many of them are ready, the number of
+            workspaces being provisioned by this object, and the number of failed background refills.
+        """
+        deployments = _list_pool_deployments(poolName=self.pool_name, state="available", namespace=self.namespace,
+                                             printOutput=self.print_output, session=self.session)
+        with self._lock:
+            counters = dict(self._counters)
+            provisioning = len(self._provisioning)
+
+        total = counters["hits"] + counters["misses"]
+        return {
+            "pool_name": self.pool_name,
+            "namespace": self.namespace,
+            "size": self.size,
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_ratio": (counters["hits"] / total) if total else 0.0,
+            "available": len(deployments),
+            "ready": sum(1 for deployment in deployments if _is_deployment_ready(deployment)),
+            "provisioning": provisioning,
+            "refill_errors": counters["refill_errors"]
+        }
+
+
+def claim_jupyter_lab(pool_name: str, claimed_by: str = None, workspace_password: str = None,
+                      namespace: str = "default", print_output: bool = False, timeout: float = None,
+                      session: DataOpsSession = None) -> dict:
+    """Claim a workspace from a JupyterLab workspace pool.
+
+    If a JupyterLabWorkspacePool for the pool name and namespace has been started in this process, the claim is
+    made through it, so that it is counted in the pool's metrics, triggers a refill, and falls back to cloning a new
+    workspace when the pool is empty. The claim then uses the pool's session, but the timeout and print_output
+    that are passed to this function. Otherwise, an available workspace is claimed directly.
+
+    :param pool_name: Name of the pool.
+    :param claimed_by: Optional name of the user that claims the workspace, applied as the
+        'jupyterlab-pool-claimed-by' label. Must be a valid Kubernetes label value.
+    :param workspace_password: Workspace password. If not specified, you will be prompted to enter a password via
+        the console.
+    :param namespace: Kubernetes namespace of the pool. Defaults to the default namespace.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :param timeout: Maximum number of seconds to wait for the workspace to restart with its new password. If not
+        specified, wait indefinitely.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :return: A dictionary containing the "Workspace Name" and "Access URL" of the claimed workspace, and
+        "Pool Hit" (True/False).
+    :raises PoolExhaustedError: When the pool has no available workspaces and is not managed by this process.
+    """
+    with _pools_lock:
+        pool = _pools.get((namespace, pool_name))
+    if pool is not None:
+        return pool.claim(claimed_by=claimed_by, workspace_password=workspace_password, timeout=timeout,
+                          print_output=print_output)
+
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    with tracing.span("pool-claim", pool=pool_name):
+        workspaceName = _claim_available_workspace(poolName=pool_name, claimedBy=claimed_by,
+                                                   workspacePassword=workspace_password, namespace=namespace,
+                                                   printOutput=print_output, session=session)
+        if workspaceName is None:
+            if print_output:
+                print("Error: No workspaces available in JupyterLab workspace pool '" + pool_name + "' in namespace '" + namespace + "'.")
+            raise PoolExhaustedError("No workspaces available in JupyterLab workspace pool '" + pool_name + "'")
+
+        url = _wait_for_claimed_workspace(workspaceName=workspaceName, namespace=namespace, printOutput=print_output,
+                                          timeout=timeout, session=session)
+
+    if print_output:
+        print("\nJupyterLab workspace '" + workspaceName + "' successfully claimed.")
+        print("To access workspace, navigate to " + url)
+
+    return {"Workspace Name": workspaceName, "Access URL": url, "Pool Hit": True}
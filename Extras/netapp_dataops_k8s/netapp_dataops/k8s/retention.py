@@ -0,0 +1,288 @@
+"""NetApp DataOps Toolkit for Kubernetes VolumeSnapshot retention.
+
+VolumeSnapshots that are created by create_volume_snapshot(), by clone_volume() and by scheduled pipelines are
+never deleted automatically. Large numbers of VolumeSnapshots slow down every operation that lists them and use up
+the per-volume snapshot limit of the storage system. A RetentionPolicy selects the VolumeSnapshots of each volume
+that are kept, and prune_volume_snapshots() deletes the others.
+
+Example::
+
+    from netapp_dataops.k8s.retention import RetentionPolicy, plan_snapshot_retention, prune_volume_snapshots
+
+    policy = RetentionPolicy(keep_last=3, keep_daily=7, keep_weekly=4)
+    plan = plan_snapshot_retention(policy=policy, namespace="team1")  # inspect what would be deleted
+    prune_volume_snapshots(policy=policy, namespace="team1", max_deletions_per_second=5)
+
+VolumeSnapshots that are the source of a PersistentVolumeClaim (PVC), or of the volume claim templates of a
+StatefulSet (e.g. the model repository snapshot of a Triton Inference Server with per-replica model repository
+clones), are always kept, as are VolumeSnapshots that are not ready to use yet.
+"""
+from datetime import datetime, timezone
+
+from netapp_dataops.k8s import (
+    _delete_volume_snapshots,
+    _get_session,
+    _get_snapshot_api_group,
+    _get_snapshot_api_version,
+    _print_table,
+    _wait_for_volume_snapshots_deleted,
+    tracing,
+    APIConnectionError,
+    DataOpsSession,
+)
+
+
+class RetentionPolicy:
+    """Rules that select the VolumeSnapshots of a volume to keep.
+
+    The rules are applied separately to the VolumeSnapshots of each source volume, and a VolumeSnapshot is kept if
+    any rule selects it. The hourly, daily and weekly rules keep the most recent VolumeSnapshot of each of the N
+    most recent hours, days or ISO weeks (in UTC) that have a VolumeSnapshot.
+    """
+
+    def __init__(self, keep_last: int = 0, keep_hourly: int = 0, keep_daily: int = 0, keep_weekly: int = 0):
+        """Initialize the RetentionPolicy object.
+
+        :param keep_last: Number of most recent VolumeSnapshots to keep.
+        :param keep_hourly: Number of hours for which to keep the most recent VolumeSnapshot.
+        :param keep_daily: Number of days for which to keep the most recent VolumeSnapshot.
+        :param keep_weekly: Number of weeks for which to keep the most recent VolumeSnapshot.
+        :raises ValueError: When a rule is negative or when no rule keeps any VolumeSnapshots.
+        """
+        if min(keep_last, keep_hourly, keep_daily, keep_weekly) < 0:
+            raise ValueError("Retention rules must not be negative.")
+        if not (keep_last or keep_hourly or keep_daily or keep_weekly):
+            raise ValueError("A retention policy must keep at least one VolumeSnapshot per volume.")
+        self.keep_last = keep_last
+        self.keep_hourly = keep_hourly
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+
+    def select(self, creation_times: dict) -> dict:
+        """Select the VolumeSnapshots of a single volume to keep.
+
+        :param creation_times: A dictionary mapping VolumeSnapshot names to their (timezone-aware) creation times.
+        :return: A dictionary mapping the names of the VolumeSnapshots to keep to the list of rules that keep them.
+        """
+        # Newest first; ties are broken by name so that the selection is deterministic
+        names = sorted(creation_times, key=lambda name: (creation_times[name], name), reverse=True)
+
+        selected = dict()
+        for name in names[:self.keep_last]:
+            selected.setdefault(name, list()).append("last " + str(self.keep_last))
+
+        buckets = (
+            ("hourly", self.keep_hourly, lambda time: (time.year, time.month, time.day, time.hour)),
+            ("daily", self.keep_daily, lambda time: (time.year, time.month, time.day)),
+            ("weekly", self.keep_weekly, lambda time: tuple(time.isocalendar())[:2])
+        )
+        for rule, count, bucketFunc in buckets:
+            seen = set()
+            for name in names:
+                if len(seen) >= count:
+                    break
+                bucket = bucketFunc(creation_times[name].astimezone(timezone.utc))
+                if bucket not in seen:
+                    seen.add(bucket)
+                    selected.setdefault(name, list()).append(rule)
+
+        return selected
+
+
+def _parse_creation_time(creationTime: str) -> datetime:
+    try:
+        return datetime.fromisoformat(creationTime.replace("Z", "+00:00"))
+    except:
+        return None
+
+
+def _retrieve_clone_source_snapshots(namespace: str = "default", printOutput: bool = False,
+                                     session: DataOpsSession = None) -> dict:
+    # The Kubernetes client library is only imported once it is needed, since 'prune volume-snapshots' imports this
+    # module before it parses its options
+    from kubernetes.client.rest import ApiException
+
+    # Protection is always read from the Kubernetes API, not from a local resource cache, so that a VolumeSnapshot
+    # that has just been cloned is never deleted
+    try:
+        pvcs = session.core_v1_api().list_namespaced_persistent_volume_claim(namespace=namespace).items
+        statefulSets = session.apps_v1_api().list_namespaced_stateful_set(namespace=namespace).items
+    except ApiException as err:
+        if printOutput:
+            print("Error: Kubernetes API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Map the names of the VolumeSnapshots that are referenced by PVCs or StatefulSets to the referencing objects
+    references = [("PVC " + pvc.metadata.name, pvc.spec) for pvc in pvcs]
+    for statefulSet in statefulSets:
+        for template in statefulSet.spec.volume_claim_templates or list():
+            references.append(("StatefulSet " + statefulSet.metadata.name, template.spec))
+    cloneSources = dict()
+    for referrer, pvcSpec in references:
+        for dataSource in (pvcSpec.data_source, pvcSpec.data_source_ref):
+            if dataSource and dataSource.kind == "VolumeSnapshot":
+                cloneSources.setdefault(dataSource.name, set()).add(referrer)
+
+    return cloneSources
+
+
+def _construct_retention_plan(volumeSnapshotList: list, policy: RetentionPolicy, cloneSources: dict,
+                              pvcName: str = None, snapshotNamePrefix: str = None) -> list:
+    # Group VolumeSnapshots by source PVC
+    volumeSnapshots = dict()
+    for volumeSnapshot in volumeSnapshotList:
+        name = volumeSnapshot["metadata"]["name"]
+        sourcePvcName = volumeSnapshot.get("spec", dict()).get("source", dict()).get("persistentVolumeClaimName", "")
+        if pvcName and sourcePvcName != pvcName:
+            continue
+        if snapshotNamePrefix and not name.startswith(snapshotNamePrefix):
+            continue
+        volumeSnapshots.setdefault(sourcePvcName, list()).append(volumeSnapshot)
+
+    # Decide which VolumeSnapshots of each source PVC to keep
+    plan = list()
+    for sourcePvcName, snapshots in sorted(volumeSnapshots.items()):
+        reasons = dict()
+        creationTimes = dict()
+        for volumeSnapshot in snapshots:
+            name = volumeSnapshot["metadata"]["name"]
+            status = volumeSnapshot.get("status") or dict()
+            creationTime = _parse_creation_time(status.get("creationTime") or "")
+            if name in cloneSources:
+                reasons.setdefault(name, list()).append("clone source (" + ", ".join(sorted(cloneSources[name])) + ")")
+            if not status.get("readyToUse"):
+                reasons.setdefault(name, list()).append("not ready")
+            elif creationTime is None:
+                reasons.setdefault(name, list()).append("no creation time")
+            else:
+                creationTimes[name] = creationTime
+        for name, rules in policy.select(creation_times=creationTimes).items():
+            reasons.setdefault(name, list()).extend(rules)
+
+        # Construct dict containing plan details, newest first
+        for volumeSnapshot in sorted(snapshots, key=lambda snapshot: ((snapshot.get("status") or dict()).get("creationTime") or "",
+                                                                      snapshot["metadata"]["name"]), reverse=True):
+            name = volumeSnapshot["metadata"]["name"]
+            planDict = dict()
+            planDict["VolumeSnapshot Name"] = name
+            planDict["Source PersistentVolumeClaim (PVC)"] = sourcePvcName
+            planDict["Creation Time"] = (volumeSnapshot.get("status") or dict()).get("creationTime") or ""
+            planDict["Action"] = "keep" if name in reasons else "delete"
+            planDict["Reason"] = ", ".join(reasons.get(name, list()))
+            plan.append(planDict)
+
+    return plan
+
+
+@tracing.traced
+def plan_snapshot_retention(policy: RetentionPolicy, pvc_name: str = None, snapshot_name_prefix: str = None,
+                            namespace: str = "default", print_output: bool = False,
+                            session: DataOpsSession = None) -> list:
+    """Compute which VolumeSnapshots a retention policy keeps and which it deletes, without deleting anything.
+
+    All VolumeSnapshots in the namespace are retrieved with a single list call.
+
+    :param policy: The RetentionPolicy to apply.
+    :param pvc_name: Only consider VolumeSnapshots of this PersistentVolumeClaim (PVC).
+    :param snapshot_name_prefix: Only consider VolumeSnapshots whose names start with this prefix
+        (e.g. "ntap-dsutil.").
+    :param namespace: Kubernetes namespace. Defaults to the default namespace.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :return: A list of dictionaries, one per VolumeSnapshot, containing the "VolumeSnapshot Name",
+        "Source PersistentVolumeClaim (PVC)", "Creation Time", "Action" ("keep" or "delete") and "Reason".
+    :raises APIConnectionError: The Kubernetes API returned an error.
+    """
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+    from kubernetes.client.rest import ApiException
+
+    with tracing.span("retention-plan"):
+        # Retrieve all VolumeSnapshots in namespace
+        try:
+            volumeSnapshotList = session.custom_objects_api().list_namespaced_custom_object(
+                group=_get_snapshot_api_group(), version=_get_snapshot_api_version(), namespace=namespace,
+                plural="volumesnapshots")["items"]
+        except ApiException as err:
+            if print_output:
+                print("Error: Kubernetes API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Retrieve VolumeSnapshots that must be kept because they are cloned from
+        cloneSources = _retrieve_clone_source_snapshots(namespace=namespace, printOutput=print_output,
+                                                        session=session)
+
+        plan = _construct_retention_plan(volumeSnapshotList=volumeSnapshotList, policy=policy,
+                                         cloneSources=cloneSources, pvcName=pvc_name,
+                                         snapshotNamePrefix=snapshot_name_prefix)
+
+    # Print plan
+    if print_output:
+        if plan:
+            _print_table(plan)
+        else:
+            print("No VolumeSnapshots found.")
+
+    return plan
+
+
+@tracing.traced
+def prune_volume_snapshots(policy: RetentionPolicy, pvc_name: str = None, snapshot_name_prefix: str = None,
+                           namespace: str = "default", dry_run: bool = False, max_concurrency: int = 8,
+                           max_deletions_per_second: float = 10, wait: bool = False, timeout: float = None,
+                           print_output: bool = False, session: DataOpsSession = None) -> list:
+    """Delete the VolumeSnapshots that a retention policy does not keep.
+
+    :param policy: The RetentionPolicy to apply.
+    :param pvc_name: Only consider VolumeSnapshots of this PersistentVolumeClaim (PVC).
+    :param snapshot_name_prefix: Only consider VolumeSnapshots whose names start with this prefix
+        (e.g. "ntap-dsutil.").
+    :param namespace: Kubernetes namespace. Defaults to the default namespace.
+    :param dry_run: If True, compute and return the plan without deleting anything.
+    :param max_concurrency: Maximum number of deletion requests that are in flight at the same time.
+    :param max_deletions_per_second: Maximum number of deletion requests that are issued per second, so that pruning
+        a large backlog does not overload the Kubernetes API server or the storage system. If 0 or None, deletions
+        are not rate limited.
+    :param wait: If True, wait for the deleted VolumeSnapshots to disappear.
+    :param timeout: Maximum number of seconds to wait for the deleted VolumeSnapshots to disappear. If not
+        specified, wait indefinitely.
+    :param print_output: If True enable information to be printed to the console. Default value is False.
+    :param session: The DataOpsSession to use for Kubernetes API calls. If not specified, the process-wide default
+        session is used.
+    :return: The plan (see plan_snapshot_retention()).
+    :raises APIConnectionError: The Kubernetes API returned an error.
+    :raises WaitTimeoutError: The deleted VolumeSnapshots did not disappear within the timeout.
+    """
+    # Retrieve Kubernetes API session
+    session = _get_session(session=session, print_output=print_output)
+
+    # Compute plan
+    plan = plan_snapshot_retention(policy=policy, pvc_name=pvc_name, snapshot_name_prefix=snapshot_name_prefix,
+                                   namespace=namespace, print_output=print_output, session=session)
+    snapshotNames = [planDict["VolumeSnapshot Name"] for planDict in plan if planDict["Action"] == "delete"]
+    if dry_run:
+        if print_output:
+            print("\n" + str(len(snapshotNames)) + " VolumeSnapshot(s) would be deleted.")
+        return plan
+    if not snapshotNames:
+        if print_output:
+            print("\nNo VolumeSnapshots to delete.")
+        return plan
+
+    # Delete VolumeSnapshots concurrently, at a limited rate
+    if print_output:
+        print("\nDeleting " + str(len(snapshotNames)) + " VolumeSnapshot(s) in namespace '" + namespace + "'.")
+    _delete_volume_snapshots(snapshotNames=snapshotNames, namespace=namespace, printOutput=print_output,
+                             maxWorkers=max_concurrency, rateLimit=max_deletions_per_second, session=session)
+
+    # Optionally wait for VolumeSnapshots to disappear
+    if wait:
+        _wait_for_volume_snapshots_deleted(snapshotNames=snapshotNames, namespace=namespace,
+                                           printOutput=print_output, timeout=timeout, pvcName=pvc_name,
+                                           session=session)
+
+    if print_output:
+        print(str(len(snapshotNames)) + " VolumeSnapshot(s) successfully " + ("deleted." if wait else "marked for deletion."))
+
+    return plan
@@ -0,0 +1,638 @@
+"""NetApp DataOps Toolkit for Kubernetes tracing and metrics.
+
+Every Kubernetes API request made through a DataOpsSession or AsyncDataOpsSession is recorded with its verb,
+resource, namespace, latency and HTTP status, and each toolkit operation and each of its high-level steps
+(snapshot-create, snapshot-ready, pvc-create, pvc-bind, service-create, deployment-create, deployment-ready, etc.)
+is recorded as a span. API requests are attributed to the innermost span that was active when they were made, so a
+trace shows where the time of a slow operation was spent.
+
+Records are passed to the registered exporters. Exporters can be registered using add_exporter(), or by setting the
+NETAPP_DATAOPS_K8S_TRACE environment variable to a comma-separated list of:
+
+    jsonl:<path>            Append one JSON object per span and per API request to the file at <path>.
+    otel                    Emit OpenTelemetry spans using the globally configured TracerProvider (requires the
+                            opentelemetry-api package).
+    prometheus[:<port>]     Record latency histograms in the default Prometheus registry (requires the
+                            prometheus_client package) and, if a port is specified, serve them on that port.
+
+When no exporter is registered, tracing adds a single check to each API request and operation.
+
+Example::
+
+    from netapp_dataops.k8s import clone_jupyter_lab
+    from netapp_dataops.k8s.tracing import add_exporter, TraceRecorder
+
+    recorder = add_exporter(TraceRecorder())
+    clone_jupyter_lab(new_workspace_name="ws2", source_workspace_name="ws1", namespace="team1")
+    recorder.print_summary()
+"""
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+import warnings
+
+
+#
+# Class definitions
+#
+
+
+class Span:
+    """A timed toolkit operation or operation step."""
+
+    def __init__(self, name: str, parent=None, attributes: dict = None):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes) if attributes else dict()
+        self.span_id = os.urandom(8).hex()
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.start = time.time()
+        self.duration = None
+        self.error = None
+        # Exporter-specific state, e.g. the corresponding OpenTelemetry span
+        self.context = dict()
+        self._start_counter = time.perf_counter()
+
+    def set_attribute(self, key: str, value):
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        """Get a JSON serializable representation of the span."""
+        return {
+            "type": "span",
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent is not None else None,
+            "name": self.name,
+            "start": self.start,
+            "duration": self.duration,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+
+class JsonlExporter:
+    """Append spans and API requests to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        """Initialize the JsonlExporter object.
+
+        :param path: The path of the file to append records to.
+        """
+        self.path = path
+        self._file = open(path, "a", buffering=1)
+        self._lock = threading.Lock()
+
+    def _write(self, record: dict):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def start_span(self, span: Span):
+        pass
+
+    def end_span(self, span: Span):
+        self._write(span.to_dict())
+
+    def record_request(self, request: dict, span: Span = None):
+        self._write(request)
+
+    def close(self):
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetryExporter:
+    """Emit spans and API requests as OpenTelemetry spans.
+
+    Spans are created using the globally configured OpenTelemetry TracerProvider unless a tracer is passed, so the
+    application controls where they are exported to (e.g. an OTLP collector).
+    """
+
+    def __init__(self, tracer=None):
+        """Initialize the OpenTelemetryExporter object.
+
+        :param tracer: The OpenTelemetry tracer to use. If not specified, a tracer named 'netapp_dataops.k8s' is
+            retrieved from the global TracerProvider.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as err:
+            raise ImportError("The OpenTelemetry exporter requires the opentelemetry-api package. Install it using "
+                              "'python3 -m pip install opentelemetry-api'.") from err
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("netapp_dataops.k8s")
+
+    def _parent_context(self, span: Span):
+        if span is None or "otel" not in span.context:
+            return None
+        return self._trace.set_span_in_context(span.context["otel"])
+
+    def start_span(self, span: Span):
+        span.context["otel"] = self.tracer.start_span(span.name, context=self._parent_context(span.parent),
+                                                      attributes=_otel_attributes(span.attributes),
+                                                      start_time=int(span.start * 1e9))
+
+    def end_span(self, span: Span):
+        otelSpan = span.context.get("otel")
+        if otelSpan is None:
+            return
+        if span.error:
+            otelSpan.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otelSpan.end(end_time=int((span.start + span.duration) * 1e9))
+
+    def record_request(self, request: dict, span: Span = None):
+        attributes = {
+            "http.request.method": request["method"],
+            "k8s.verb": request["verb"],
+            "k8s.resource": request["resource"],
+            "k8s.namespace": request["namespace"],
+            "k8s.name": request["name"],
+            "http.response.status_code": request["status"]
+        }
+        otelSpan = self.tracer.start_span(request["verb"] + " " + request["resource"],
+                                          context=self._parent_context(span),
+                                          kind=self._trace.SpanKind.CLIENT,
+                                          attributes=_otel_attributes(attributes),
+                                          start_time=int(request["start"] * 1e9))
+        if request["error"]:
+            otelSpan.set_status(self._trace.Status(self._trace.StatusCode.ERROR, request["error"]))
+        otelSpan.end(end_time=int((request["start"] + request["duration"]) * 1e9))
+
+
+class PrometheusExporter:
+    """Record span and API request latencies as Prometheus histograms.
+
+    The following metrics are recorded:
+
+        netapp_dataops_k8s_api_request_duration_seconds{verb, resource, status}
+        netapp_dataops_k8s_span_duration_seconds{span, status}
+    """
+
+    def __init__(self, registry=None, port: int = None):
+        """Initialize the PrometheusExporter object.
+
+        :param registry: The prometheus_client CollectorRegistry to register the metrics with. If not specified,
+            the default registry is used.
+        :param port: If specified, serve the registry's metrics over HTTP on this port.
+        """
+        try:
+            import prometheus_client
+        except ImportError as err:
+            raise ImportError("The Prometheus exporter requires the prometheus_client package. Install it using "
+                              "'python3 -m pip install prometheus_client'.") from err
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+
+        # Metrics can only be registered once per registry
+        with _prometheus_metrics_lock:
+            if id(registry) not in _prometheus_metrics:
+                _prometheus_metrics[id(registry)] = (
+                    prometheus_client.Histogram("netapp_dataops_k8s_api_request_duration_seconds",
+                                                "Latency of Kubernetes API requests made by the NetApp DataOps Toolkit.",
+                                                ["verb", "resource", "status"], registry=registry),
+                    prometheus_client.Histogram("netapp_dataops_k8s_span_duration_seconds",
+                                                "Duration of NetApp DataOps Toolkit operations and operation steps.",
+                                                ["span", "status"], registry=registry,
+                                                buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600,
+                                                         float("inf")))
+                )
+            self.request_histogram, self.span_histogram = _prometheus_metrics[id(registry)]
+
+        if port is not None:
+            prometheus_client.start_http_server(port, registry=registry)
+
+    def start_span(self, span: Span):
+        pass
+
+    def end_span(self, span: Span):
+        self.span_histogram.labels(span=span.name, status="error" if span.error else "ok").observe(span.duration)
+
+    def record_request(self, request: dict, span: Span = None):
+        status = str(request["status"]) if request["status"] is not None else "error"
+        self.request_histogram.labels(verb=request["verb"], resource=request["resource"],
+                                      status=status).observe(request["duration"])
+
+
+class TraceRecorder:
+    """Keep spans and API requests in memory and summarize them.
+
+    This is used by the --profile option of the command line interface.
+    """
+
+    def __init__(self):
+        self.spans = list()
+        self.requests = list()
+        self._lock = threading.Lock()
+
+    def start_span(self, span: Span):
+        pass
+
+    def end_span(self, span: Span):
+        with self._lock:
+            self.spans.append(span.to_dict())
+
+    def record_request(self, request: dict, span: Span = None):
+        with self._lock:
+            self.requests.append(request)
+
+    def span_summary(self) -> list:
+        """Get a summary of the recorded spans.
+
+        :return: A list of dictionaries, one per span in start order, containing the span name (indented by
+            nesting depth), its duration, the number of API requests made directly within it, and its status.
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span["start"])
+            requests = list(self.requests)
+
+        depths = dict()
+        spanIds = {span["span_id"] for span in spans}
+        for span in spans:
+            parentId = span["parent_id"]
+            depths[span["span_id"]] = depths[parentId] + 1 if parentId in depths else 0
+        requestCounts = dict()
+        for request in requests:
+            requestCounts[request["parent_id"]] = requestCounts.get(request["parent_id"], 0) + 1
+
+        summary = list()
+        for span in spans:
+            spanDict = dict()
+            spanDict["Span"] = "\u00b7 " * depths[span["span_id"]] + span["name"]
+            spanDict["Duration (s)"] = round(span["duration"], 3)
+            spanDict["API Requests"] = requestCounts.get(span["span_id"], 0)
+            spanDict["Status"] = span["error"] if span["error"] else "ok"
+            summary.append(spanDict)
+        untraced = len([request for request in requests if request["parent_id"] not in spanIds])
+        if untraced:
+            summary.append({"Span": "(no span)", "Duration (s)": "", "API Requests": untraced, "Status": ""})
+        return summary
+
+    def request_summary(self) -> list:
+        """Get a summary of the recorded API requests.
+
+        :return: A list of dictionaries, one per verb and resource, containing the number of requests, their total
+            and maximum latency, and the number of failed requests.
+        """
+        with self._lock:
+            requests = list(self.requests)
+
+        totals = dict()
+        for request in requests:
+            key = (request["verb"], request["resource"])
+            if key not in totals:
+                totals[key] = {"Verb": request["verb"], "Resource": request["resource"], "Requests": 0,
+                               "Total (s)": 0.0, "Max (s)": 0.0, "Errors": 0}
+            total = totals[key]
+            total["Requests"] += 1
+            total["Total (s)"] += request["duration"]
+            total["Max (s)"] = max(total["Max (s)"], request["duration"])
+            if request["error"]:
+                total["Errors"] += 1
+        summary = sorted(totals.values(), key=lambda total: total["Total (s)"], reverse=True)
+        for total in summary:
+            total["Total (s)"] = round(total["Total (s)"], 3)
+            total["Max (s)"] = round(total["Max (s)"], 3)
+        return summary
+
+    def print_summary(self, file=None):
+        """Print the span and API request summaries as tables.
+
+        :param file: The file to print to. Defaults to sys.stderr.
+        """
+        from tabulate import tabulate
+
+        if file is None:
+            file = sys.stderr
+        spanSummary = self.span_summary()
+        requestSummary = self.request_summary()
+        print("\nProfile:", file=file)
+        if spanSummary:
+            print(tabulate([list(span.values()) for span in spanSummary], headers=list(spanSummary[0].keys()),
+                           colalign=("left",)), file=file)
+        if requestSummary:
+            print("", file=file)
+            print(tabulate([list(total.values()) for total in requestSummary],
+                           headers=list(requestSummary[0].keys())), file=file)
+        print("\nTotal API requests: " + str(sum(total["Requests"] for total in requestSummary)), file=file)
+
+
+#
+# Private functions
+#
+
+
+_exporters = list()
+_exporters_lock = threading.Lock()
+_current_span = contextvars.ContextVar("netapp_dataops_k8s_current_span", default=None)
+_prometheus_metrics = dict()
+_prometheus_metrics_lock = threading.Lock()
+
+
+def _otel_attributes(attributes: dict) -> dict:
+    # OpenTelemetry attributes may not be None and must be primitive values
+    return {key: value if isinstance(value, (bool, int, float, str)) else str(value)
+            for key, value in attributes.items() if value is not None}
+
+
+def _parse_request(method: str, url: str, queryParams) -> tuple:
+    """Determine the Kubernetes verb, resource, namespace and object name of an API request.
+
+    :param method: The HTTP method.
+    :param url: The request URL, e.g. https://host/apis/snapshot.storage.k8s.io/v1/namespaces/ns/volumesnapshots/snap.
+    :param queryParams: The request query parameters as a list of tuples or a dictionary.
+    :return: A tuple containing the verb, resource, namespace (or None) and object name (or None).
+    """
+    path = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if path and path[0] == "api":
+        path = path[2:]
+    elif path and path[0] == "apis":
+        path = path[3:]
+
+    namespace = None
+    if len(path) > 2 and path[0] == "namespaces":
+        namespace = path[1]
+        path = path[2:]
+    resource = path[0] if path else ""
+    name = path[1] if len(path) > 1 else None
+    if len(path) > 2:
+        resource += "/" + path[2]
+
+    if isinstance(queryParams, dict):
+        queryParams = queryParams.items()
+    isWatch = any(key == "watch" and str(value).lower() == "true" for key, value in (queryParams or []))
+
+    method = method.upper()
+    if method == "GET":
+        verb = "get" if name else ("watch" if isWatch else "list")
+    elif method == "POST":
+        verb = "create"
+    elif method == "PUT":
+        verb = "update"
+    elif method == "PATCH":
+        verb = "patch"
+    elif method == "DELETE":
+        verb = "delete" if name else "deletecollection"
+    else:
+        verb = method.lower()
+    return verb, resource, namespace, name
+
+
+def _record_request(method: str, url: str, queryParams, start: float, duration: float, status: int = None,
+                    error: str = None):
+    verb, resource, namespace, name = _parse_request(method=method, url=url, queryParams=queryParams)
+    span = _current_span.get()
+    request = {
+        "type": "request",
+        "trace_id": span.trace_id if span is not None else None,
+        "parent_id": span.span_id if span is not None else None,
+        "method": method.upper(),
+        "verb": verb,
+        "resource": resource,
+        "namespace": namespace,
+        "name": name,
+        "start": start,
+        "duration": duration,
+        "status": status,
+        "error": error
+    }
+    for exporter in list(_exporters):
+        exporter.record_request(request, span)
+
+
+def _configure_from_environment():
+    setting = os.environ.get("NETAPP_DATAOPS_K8S_TRACE")
+    if not setting:
+        return
+    for entry in setting.split(","):
+        entry = entry.strip()
+        kind, _, arg = entry.partition(":")
+        try:
+            if kind == "jsonl" and arg:
+                add_exporter(JsonlExporter(path=arg))
+            elif kind == "otel":
+                add_exporter(OpenTelemetryExporter())
+            elif kind == "prometheus":
+                add_exporter(PrometheusExporter(port=int(arg) if arg else None))
+            elif entry:
+                warnings.warn("Ignoring unsupported NETAPP_DATAOPS_K8S_TRACE exporter: '" + entry + "'.")
+        except (ImportError, OSError, ValueError) as err:
+            warnings.warn("Unable to enable NETAPP_DATAOPS_K8S_TRACE exporter '" + entry + "': " + str(err))
+
+
+#
+# Public functions
+#
+
+
+def add_exporter(exporter):
+    """Register an exporter that receives spans and API requests.
+
+    An exporter is any object that implements start_span(span), end_span(span) and record_request(request, span).
+
+    :param exporter: The exporter to register, e.g. a JsonlExporter, OpenTelemetryExporter, PrometheusExporter or
+        TraceRecorder.
+    :return: The registered exporter.
+    """
+    with _exporters_lock:
+        _exporters.append(exporter)
+    return exporter
+
+
+def remove_exporter(exporter):
+    """Unregister an exporter that was registered using add_exporter().
+
+    :param exporter: The exporter to unregister.
+    """
+    with _exporters_lock:
+        if exporter in _exporters:
+            _exporters.remove(exporter)
+
+
+def is_enabled() -> bool:
+    """Determine whether any exporter is registered."""
+    return bool(_exporters)
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes):
+    """Record the enclosed block as a span.
+
+    Spans nest: API requests and spans that are started within the block, in the same thread or asyncio task,
+    become children of this span.
+
+    :param name: The name of the span, e.g. 'pvc-bind'.
+    :param attributes: Attributes to attach to the span, e.g. namespace='team1'.
+    :return: A context manager that yields the Span object, or None if tracing is not enabled.
+    """
+    if not _exporters:
+        yield None
+        return
+
+    newSpan = Span(name=name, parent=_current_span.get(), attributes=attributes)
+    token = _current_span.set(newSpan)
+    exporters = list(_exporters)
+    for exporter in exporters:
+        exporter.start_span(newSpan)
+    try:
+        yield newSpan
+    except BaseException as err:
+        newSpan.error = type(err).__name__
+        raise
+    finally:
+        newSpan.duration = time.perf_counter() - newSpan._start_counter
+        _current_span.reset(token)
+        for exporter in exporters:
+            exporter.end_span(newSpan)
+
+
+def traced(func):
+    """Decorate a toolkit function, coroutine or generator so that each call is recorded as a span named after the function."""
+    name = func.__name__
+
+    def _attributes(kwargs: dict) -> dict:
+        return {key: kwargs[key] for key in ("namespace",) if key in kwargs}
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def traced_coroutine(*args, **kwargs):
+            if not _exporters:
+                return await func(*args, **kwargs)
+            with span(name, **_attributes(kwargs)):
+                return await func(*args, **kwargs)
+        return traced_coroutine
+
+    if inspect.isgeneratorfunction(func):
+        # The span covers iteration rather than the call, which only creates the generator. It is only the
+        # current span while the generator runs, so that it does not leak into the caller between items.
+        @functools.wraps(func)
+        def traced_generator(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            if not _exporters:
+                return (yield from generator)
+            newSpan = Span(name=name, parent=_current_span.get(), attributes=_attributes(kwargs))
+            exporters = list(_exporters)
+            for exporter in exporters:
+                exporter.start_span(newSpan)
+            try:
+                sendValue, thrown = None, None
+                while True:
+                    token = _current_span.set(newSpan)
+                    try:
+                        value = generator.send(sendValue) if thrown is None else generator.throw(thrown)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        _current_span.reset(token)
+                    try:
+                        sendValue, thrown = (yield value), None
+                    except GeneratorExit:
+                        token = _current_span.set(newSpan)
+                        try:
+                            generator.close()
+                        finally:
+                            _current_span.reset(token)
+                        raise
+                    except BaseException as err:
+                        sendValue, thrown = None, err
+            except GeneratorExit:
+                raise
+            except BaseException as err:
+                newSpan.error = type(err).__name__
+                raise
+            finally:
+                newSpan.duration = time.perf_counter() - newSpan._start_counter
+                for exporter in exporters:
+                    exporter.end_span(newSpan)
+        return traced_generator
+
+    @functools.wraps(func)
+    def traced_func(*args, **kwargs):
+        if not _exporters:
+            return func(*args, **kwargs)
+        with span(name, **_attributes(kwargs)):
+            return func(*args, **kwargs)
+    return traced_func
+
+
+def propagate(func):
+    """Wrap a function so that it runs within the span that is current when propagate() is called.
+
+    Use this for functions that are submitted to a thread pool, since worker threads do not inherit the span of
+    the thread that submits work to them.
+    """
+    parent = _current_span.get()
+
+    @functools.wraps(func)
+    def propagated_func(*args, **kwargs):
+        token = _current_span.set(parent)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_span.reset(token)
+    return propagated_func
+
+
+def instrument_api_client(api_client):
+    """Record every request made through a kubernetes or kubernetes_asyncio ApiClient.
+
+    DataOpsSession and AsyncDataOpsSession instrument their ApiClients automatically. Requests are only recorded
+    while an exporter is registered. The latency of a watch request is the time until the response headers are
+    received.
+
+    :param api_client: The ApiClient to instrument.
+    :return: The ApiClient.
+    """
+    request = api_client.request
+    if getattr(request, "_netapp_dataops_traced", False):
+        return api_client
+
+    async def _await_response(response, method: str, url: str, queryParams, start: float, startCounter: float):
+        # kubernetes_asyncio returns the awaitable response of its REST client
+        try:
+            response = await response
+        except Exception as err:
+            _record_request(method=method, url=url, queryParams=queryParams, start=start,
+                            duration=time.perf_counter() - startCounter, status=getattr(err, "status", None),
+                            error=type(err).__name__)
+            raise
+        _record_request(method=method, url=url, queryParams=queryParams, start=start,
+                        duration=time.perf_counter() - startCounter, status=getattr(response, "status", None))
+        return response
+
+    def traced_request(method, url, *args, **kwargs):
+        if not _exporters:
+            return request(method, url, *args, **kwargs)
+        queryParams = kwargs.get("query_params", args[0] if args else None)
+        start = time.time()
+        startCounter = time.perf_counter()
+        try:
+            response = request(method, url, *args, **kwargs)
+        except Exception as err:
+            _record_request(method=method, url=url, queryParams=queryParams, start=start,
+                            duration=time.perf_counter() - startCounter, status=getattr(err, "status", None),
+                            error=type(err).__name__)
+            raise
+        if inspect.isawaitable(response):
+            return _await_response(response, method=method, url=url, queryParams=queryParams, start=start,
+                                   startCounter=startCounter)
+        _record_request(method=method, url=url, queryParams=queryParams, start=start,
+                        duration=time.perf_counter() - startCounter, status=getattr(response, "status", None))
+        return response
+
+    traced_request._netapp_dataops_traced = True
+    api_client.request = traced_request
+    return api_client
+
+
+_configure_from_environment()
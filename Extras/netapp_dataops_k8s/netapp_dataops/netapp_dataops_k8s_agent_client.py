@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""NetApp DataOps Toolkit for Kubernetes agent client.
+
+Runs toolkit operations through a NetApp DataOps Toolkit agent (see 'netapp_dataops_k8s_cli.py serve'). This file only
+requires the Python standard library, so that pipeline steps can use it without installing the toolkit. It can be
+downloaded from a running agent:
+
+    curl -o netapp_dataops_k8s_agent_client.py http://netapp-dataops-agent:8080/v1/client
+
+Usage:
+    netapp_dataops_k8s_agent_client.py <operation> [<argument>=<value> ...]
+
+Example:
+    netapp_dataops_k8s_agent_client.py create_volume_snapshot pvc_name=dataset snapshot_name=dataset-v1 namespace=team1
+
+Operations are the names of toolkit functions, and arguments are their keyword arguments. Values are parsed as JSON
+where possible (e.g. true, 8, {"app": "demo"}) and are used as strings otherwise. The return value of the operation is
+printed as JSON. The agent URL is taken from the NETAPP_DATAOPS_K8S_AGENT_URL environment variable (default:
+http://netapp-dataops-agent:8080) and the token, if the agent requires one, from NETAPP_DATAOPS_K8S_AGENT_TOKEN.
+
+The client can also be used from Python:
+
+    from netapp_dataops_k8s_agent_client import DataOpsAgentClient
+
+    DataOpsAgentClient().create_volume_snapshot(pvc_name="dataset", snapshot_name="dataset-v1", namespace="team1")
+"""
+import json
+import os
+import sys
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+class DataOpsAgentError(Exception):
+    '''Error that will be raised when the agent reports that an operation failed'''
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+class DataOpsAgentClient:
+    """Client for the HTTP/JSON API of a NetApp DataOps Toolkit agent.
+
+    Each toolkit operation is available as a method of the same name, e.g. client.create_volume_snapshot(...).
+    """
+
+    def __init__(self, url: str = None, token: str = None, timeout: float = None):
+        """Initialize the DataOpsAgentClient object.
+
+        :param url: URL of the agent. If not specified, the NETAPP_DATAOPS_K8S_AGENT_URL environment variable is used,
+            or "http://netapp-dataops-agent:8080" if that is not set.
+        :param token: Token to present to the agent. If not specified, the NETAPP_DATAOPS_K8S_AGENT_TOKEN environment
+            variable is used, if set.
+        :param timeout: Maximum number of seconds to wait for an operation to complete. If not specified, there is no
+            limit.
+        """
+        self.url = (url or os.environ.get("NETAPP_DATAOPS_K8S_AGENT_URL") or "http://netapp-dataops-agent:8080").rstrip("/")
+        self.token = token or os.environ.get("NETAPP_DATAOPS_K8S_AGENT_TOKEN") or None
+        self.timeout = timeout
+
+    def call(self, operation: str, **kwargs):
+        """Run an operation and return its return value.
+
+        :param operation: Name of the toolkit function to call, e.g. "create_volume_snapshot".
+        :param kwargs: Keyword arguments of the function.
+        :raises DataOpsAgentError: When the operation fails or the agent cannot be reached.
+        """
+        request = urllib.request.Request(self.url + "/v1/operations/" + urllib.parse.quote(operation),
+                                         data=json.dumps(kwargs).encode("utf-8"), method="POST",
+                                         headers={"Content-Type": "application/json"})
+        if self.token:
+            request.add_header("Authorization", "Bearer " + self.token)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())["result"]
+        except urllib.error.HTTPError as err:
+            try:
+                message = json.loads(err.read())["error"]
+            except (ValueError, KeyError):
+                message = str(err)
+            raise DataOpsAgentError(message, status=err.code)
+        except urllib.error.URLError as err:
+            raise DataOpsAgentError("Unable to reach agent at " + self.url + ": " + str(err.reason))
+
+    def __getattr__(self, operation: str):
+        if operation.startswith("_"):
+            raise AttributeError(operation)
+        return lambda **kwargs: self.call(operation, **kwargs)
+
+
+def _parse_value(value: str):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def main(argv: list = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help") or any("=" not in argument for argument in argv[1:]):
+        print(__doc__)
+        return 0 if argv and argv[0] in ("-h", "--help") else 1
+
+    kwargs = dict()
+    for argument in argv[1:]:
+        name, value = argument.split("=", 1)
+        kwargs[name] = _parse_value(value)
+
+    try:
+        result = DataOpsAgentClient().call(argv[0], **kwargs)
+    except DataOpsAgentError as err:
+        print("Error: " + str(err), file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
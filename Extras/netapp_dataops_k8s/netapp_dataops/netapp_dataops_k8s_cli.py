@@ -1,35 +1,5 @@
 #!/usr/bin/env python3
 """NetApp DataOps Toolkit for Kubernetes Script Interface."""
-from netapp_dataops import k8s
-from netapp_dataops.k8s import (
-    clone_volume,
-    create_volume_snapshot,
-    create_volume,
-    clone_jupyter_lab,
-    create_triton_server,
-    create_jupyter_lab,
-    create_jupyter_lab_snapshot,
-    delete_volume_snapshot,
-    delete_volume,
-    delete_jupyter_lab,
-    delete_triton_server,
-    list_jupyter_labs,
-    list_volume_snapshots,
-    list_jupyter_lab_snapshots,
-    list_volumes,
-    list_triton_servers,
-    restore_jupyter_lab_snapshot,
-    restore_volume_snapshot,
-    APIConnectionError,
-    CAConfigMap,
-    InvalidConfigError
-)
-from netapp_dataops.k8s.data_movers.s3 import (
-    DataMoverJob,
-    S3ConfigSecret,
-    S3DataMover,
-)
-
 # Define contents of help text
 astra_error_text = "Error: Astra Control functionality within the DataOps Toolkit is no longer supported. Please use the Astra SDK and/or toolkit. For details, visit https://github.com/NetApp/netapp-astra-toolkits."
 helpTextStandard = '''
@@ -37,16 +7,24 @@ The NetApp DataOps Toolkit for Kubernetes is a Python library that makes it simp
 
 Basic Commands:
 
+\tapply\t\t\t\tRun the operations in a plan file, running independent operations in parallel.
 \thelp\t\t\t\tPrint help text.
+\tserve\t\t\t\tRun an agent that performs operations on behalf of pipeline steps over an HTTP/JSON API.
 \tversion\t\t\t\tPrint version details.
 
+Global Options:
+
+\t--profile\t\t\tAfter the command completes, print the time spent in each operation step and in each type of Kubernetes API request.
+
 JupyterLab Management Commands:
 Note: To view details regarding options/arguments for a specific command, run the command with the '-h' or '--help' option.
 
+\tclaim jupyterlab\t\tClaim a ready JupyterLab workspace from a workspace pool.
 \tclone jupyterlab\t\tClone a JupyterLab workspace within the same namespace.
 \tcreate jupyterlab\t\tProvision a JupyterLab workspace.
 \tdelete jupyterlab\t\tDelete an existing JupyterLab workspace.
 \tlist jupyterlabs\t\tList all JupyterLab workspaces.
+\tfill jupyterlab-pool\t\tProvision ready JupyterLab workspaces for a workspace pool.
 \tcreate jupyterlab-snapshot\tCreate a new snapshot for a JupyterLab workspace.
 \tlist jupyterlab-snapshots\tList all snapshots.
 \trestore jupyterlab-snapshot\tRestore a snapshot.
@@ -54,20 +32,25 @@ Note: To view details regarding options/arguments for a specific command, run th
 NVIDIA Triton Inference Server Management Commands:
 Note: To view details regarding options/arguments for a specific command, run the command with the '-h' or '--help' option.
 
+\tautoscale triton-server\t\tScale an instance of the NVIDIA Triton Inference Server based on its request rate and queue time.
 \tcreate triton-server\t\tDeploy a new instance of the NVIDIA Triton Inference Server.
 \tdelete triton-server\t\tDelete an existing instance of the NVIDIA Triton Inference Server.
 \tlist triton-servers\t\tList all instances of the NVIDIA Triton Inference Server in a namespace.
+\tscale triton-server\t\tScale an instance of the NVIDIA Triton Inference Server to a specific number of replicas.
 
 Kubernetes Persistent Volume Management Commands (for advanced Kubernetes users):
 Note: To view details regarding options/arguments for a specific command, run the command with the '-h' or '--help' option.
 
 \tclone volume\t\t\tCreate a new persistent volume that is an exact copy of an existing persistent volume.
+\tclone volumes\t\t\tCreate multiple new persistent volumes that are exact copies of an existing persistent volume.
 \tcreate volume\t\t\tProvision a new persistent volume.
 \tdelete volume\t\t\tDelete an existing persistent volume.
 \tlist volumes\t\t\tList all persistent volumes.
 \tcreate volume-snapshot\t\tCreate a new snapshot for a persistent volume.
 \tdelete volume-snapshot\t\tDelete an existing snapshot.
 \tlist volume-snapshots\t\tList all snapshots.
+\tbackfill volume-snapshot-labels\tLabel existing snapshots so that snapshot queries can select them by label.
+\tprune volume-snapshots\t\tDelete the snapshots that a retention policy does not keep.
 \trestore volume-snapshot\t\tRestore a snapshot.
 
 Data Movement Commands:
@@ -84,7 +67,80 @@ Note: To view details regarding options/arguments for a specific command, run th
 \tshow s3-job\t\t\tShow the status of the specifed Kubernetes job.
 \tdelete s3-job\t\t\tDelete a Kubernetes S3 job.
 '''
+helpTextApply = '''
+Command: apply
+
+Run the operations (e.g. create volume, create volume-snapshot, clone volume, create jupyterlab) listed in a YAML or JSON plan file using a single Kubernetes API session. Each operation is started as soon as the operations that it depends on have completed, so that independent operations run in parallel. Completed operations are recorded in a state file; if the plan fails partway through, applying it again skips the operations that have already completed. Refer to the documentation for the plan file format.
+
+Required Options/Arguments:
+\t-f, --file=\t\tPath to plan file.
+
+Optional Options/Arguments:
+\t-h, --help\t\tPrint help text.
+\t-p, --max-parallel=\tMaximum number of operations to run at the same time. If not specified, 4 will be used.
+\t-s, --state-file=\tPath to state file. If not specified, the path of the plan file with '.state' appended will be used.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py apply -f plan.yaml
+\tnetapp_dataops_k8s_cli.py apply --file=plan.yaml --max-parallel=8
+'''
+helpTextAutoscaleTritonServer = '''
+Command: autoscale triton-server
+
+Scale an existing NVIDIA Triton Inference Server based on the inference request rate and queue time reported by its metrics endpoints. The command keeps running, evaluating the server periodically, until it is interrupted.
+
+Required Options/Arguments:
+\t-s, --server-name=\t\tName of NVIDIA Triton Inference Server to scale.
+
+Optional Options/Arguments:
+\t-a, --min-replicas=\t\tMinimum number of replicas. If 0, the server is scaled to zero when it is idle, and is only scaled up again once a client requests it (see request_triton_server_wake() in netapp_dataops.k8s.autoscale) or it is scaled using 'scale triton-server'. If not specified, 1 will be used.
+\t-d, --scale-down-delay=\t\tNumber of seconds for which a lower number of replicas must be recommended before the server is scaled down. If not specified, 300 will be used.
+\t-e, --metrics-endpoints=\tComma-separated list of Triton metrics endpoints (host:port) to scrape instead of the endpoints of the server's ready replicas. Use if the replicas' pod IPs are not reachable from where the command runs.
+\t-h, --help\t\t\tPrint help text.
+\t-i, --interval=\t\t\tNumber of seconds between evaluations. If not specified, 15 will be used.
+\t-n, --namespace=\t\tKubernetes namespace that the server is located in. If not specified, namespace "default" will be used.
+\t-q, --target-queue-time=\tTarget average number of milliseconds that inference requests spend queued. If not specified, 100 will be used.
+\t-r, --target-request-rate=\tTarget number of inference requests per second per replica. If not specified, the request rate is only used to detect an idle server.
+\t-z, --max-replicas=\t\tMaximum number of replicas. If not specified, 4 will be used.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py autoscale triton-server --server-name=resnet --max-replicas=8 --target-request-rate=100
+\tnetapp_dataops_k8s_cli.py autoscale triton-server -s resnet -n team1 -a 0 -z 4 -q 50
+'''
+helpTextBackfillVolumeSnapshotLabels = '''
+Command: backfill volume-snapshot-labels
+
+Label the VolumeSnapshots in a namespace that were created without source PersistentVolumeClaim (PVC) labels (e.g. by an earlier version of the toolkit), so that snapshot queries can select them by label.
+
+No options/arguments are required.
+
+Optional Options/Arguments:
+\t-h, --help\t\tPrint help text.
+\t-n, --namespace=\tKubernetes namespace that the VolumeSnapshots are located in. If not specified, namespace "default" will be used.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py backfill volume-snapshot-labels
+\tnetapp_dataops_k8s_cli.py backfill volume-snapshot-labels -n team1
+'''
 helpTextBackupJupyterLab = astra_error_text
+helpTextClaimJupyterLab = '''
+Command: claim jupyterlab
+
+Claim a ready JupyterLab workspace from a workspace pool. The workspace is labeled as claimed and restarted with a new password. Use 'fill jupyterlab-pool' to provision workspaces for the pool.
+
+Required Options/Arguments:
+\t-l, --pool-name=\t\tName of workspace pool to claim a workspace from.
+
+Optional Options/Arguments:
+\t-h, --help\t\t\tPrint help text.
+\t-n, --namespace=\t\tKubernetes namespace that the workspace pool is located in. If not specified, namespace "default" will be used.
+\t-t, --timeout=\t\t\tMaximum number of seconds to wait for the workspace to restart with the new password. If not specified, the command will wait indefinitely.
+\t-u, --claimed-by=\t\tName of user claiming the workspace. Applied to the workspace as the 'jupyterlab-pool-claimed-by' label.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py claim jupyterlab --pool-name=workshop --claimed-by=mike
+\tnetapp_dataops_k8s_cli.py claim jupyterlab -l workshop -n team1
+'''
 helpTextCloneJupyterLab = '''
 Command: clone jupyterlab
 
@@ -133,6 +189,29 @@ Examples:
 \tnetapp_dataops_k8s_cli.py clone volume --new-pvc-name=project1-experiment1 --source-pvc-name=project1
 \tnetapp_dataops_k8s_cli.py clone volume -p project2-mike -s snap1 -n team1
 '''
+helpTextCloneVolumes = '''
+Command: clone volumes
+
+Create multiple new persistent volumes that are exact copies of an existing persistent volume. A single snapshot of the source volume is used for all clones, and the clones are created concurrently.
+
+Note: Either -s/--source-snapshot-name or -v/--source-pvc-name must be specified. However, only one of these flags (not both) should be specified for a given operation. If -v/--source-pvc-name is specified, then the clones will be created from the current state of the volume. If -s/--source-snapshot-name is specified, then the clones will be created from a specific snapshot related the source volume.
+
+Required Options/Arguments:
+\t-p, --new-pvc-names=\t\tComma-separated list of names of new volumes (names to be applied to new Kubernetes PersistentVolumeClaims/PVCs).
+
+Optional Options/Arguments:
+\t-c, --volume-snapshot-class=\tKubernetes VolumeSnapshotClass to use when creating clones. If not specified, "csi-snapclass" will be used. Note: VolumeSnapshotClass must be configured to use Trident.
+\t-h, --help\t\t\tPrint help text.
+\t-n, --namespace=\t\tKubernetes namespace that source PersistentVolumeClaim (PVC) is located in. If not specified, namespace "default" will be used.
+\t-s, --source-snapshot-name=\tName of Kubernetes VolumeSnapshot to use as source for clones. Either -s/--source-snapshot-name or -v/--source-pvc-name must be specified.
+\t-t, --timeout=\t\t\tMaximum number of seconds to wait for the snapshot to be ready and for the clones to be bound. If not specified, the command will wait indefinitely.
+\t-v, --source-pvc-name=\t\tName of Kubernetes PersistentVolumeClaim (PVC) to use as source for clones. Either -s/--source-snapshot-name or -v/--source-pvc-name must be specified.
+\t-w, --max-workers=\t\tMaximum number of PersistentVolumeClaims (PVCs) to create concurrently. If not specified, 8 will be used.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py clone volumes --new-pvc-names=trial1,trial2,trial3,trial4 --source-pvc-name=dataset1
+\tnetapp_dataops_k8s_cli.py clone volumes -p trial1,trial2 -s snap1 -n team1 -w 16
+'''
 helpTextCreateCAConfigMap = '''
 Command: create ca-config-map
 
@@ -183,9 +262,13 @@ Deploy a new NVIDIA Triton Inference Server instance
 
 Required Options/Arguments:
 \t-s, --server-name=\t\tName of a new Triton Inference Server.
-\t-v, --model-repo-pvc-name=\tName of the PVC containing the model repository.
+\t-v, --model-repo-pvc-name=\tName of the PVC containing the model repository. Not required if -x/--per-replica-model-clones and -t/--model-snapshot-name are specified.
 
 Optional Options/Arguments:
+\t-c, --replicas=\t\t\tNumber of Triton instance replicas to run. If not specified, 1 replica will be run.
+\t-x, --per-replica-model-clones\tOption to give each replica its own clone of the model repository (created near-instantly from a VolumeSnapshot) instead of sharing the model repository PVC between replicas.
+\t-t, --model-snapshot-name=\tName of the VolumeSnapshot of the model repository to clone for each replica (only used with -x/--per-replica-model-clones). If not specified, a new VolumeSnapshot of the model repository PVC will be created.
+\t-a, --volume-snapshot-class=\tKubernetes VolumeSnapshotClass to use when creating a VolumeSnapshot of the model repository PVC (only used with -x/--per-replica-model-clones). If not specified, "csi-snapclass" will be used.
 \t-g, --nvidia-gpu=\t\tNumber of NVIDIA GPUs to allocate to Triton instance. Format: '1', '4', etc. If not specified, no GPUs will be allocated.
 \t-h, --help\t\t\tPrint help text.
 \t-i, --image=\t\t\tContainer image to use when creating instance. If not specified, "nvcr.io/nvidia/tritonserver:21.11-py3" will be used.
@@ -198,6 +281,8 @@ Optional Options/Arguments:
 Examples:
 \tnetapp_dataops_k8s_cli.py create triton-server --server-name=Test --model-repo-pvc-name=model-pvc
 \tnetapp_dataops_k8s_cli.py create triton-server -s Test -v model-pvc -g 1 -p 0.5 -m 1Gi -b
+\tnetapp_dataops_k8s_cli.py create triton-server -s Test -v model-pvc -c 4 -x
+\tnetapp_dataops_k8s_cli.py create triton-server --server-name=Test --replicas=4 --per-replica-model-clones --model-snapshot-name=model-snap
 '''
 helpTextCreateJupyterLabSnapshot = '''
 Command: create jupyterlab-snapshot
@@ -209,6 +294,7 @@ Required Options/Arguments:
 
 Optional Options/Arguments:
 \t-c, --volume-snapshot-class=\tKubernetes VolumeSnapshotClass to use when creating snapshot of backing volume for workspace. If not specified, "csi-snapclass" will be used. Note: VolumeSnapshotClass must be configured to use Trident.
+\t-d, --dataset-version=\t\tDataset version to tag the snapshot with (applied as the 'dataset-version' label, so it must be a valid Kubernetes label value).
 \t-h, --help\t\t\tPrint help text.
 \t-n, --namespace=\t\tKubernetes namespace that workspace is located in. If not specified, namespace "default" will be used.
 \t-s, --snapshot-name=\t\tName of new Kubernetes VolumeSnapshot for workspace. If not specified, will be set to 'ntap-dsutil.<timestamp>'.
@@ -216,6 +302,7 @@ Optional Options/Arguments:
 Examples:
 \tnetapp_dataops_k8s_cli.py create jupyterlab-snapshot --workspace-name=mike
 \tnetapp_dataops_k8s_cli.py create jupyterlab-snapshot -w sathish -s snap1 -c ontap -n team1
+\tnetapp_dataops_k8s_cli.py create jupyterlab-snapshot -w mike -d v2
 '''
 helpTextCreateS3Secret = '''
 Command: create s3-secret
@@ -244,6 +331,7 @@ Required Options/Arguments:
 
 Optional Options/Arguments:
 \t-c, --volume-snapshot-class=\tKubernetes VolumeSnapshotClass to use when creating snapshot. If not specified, "csi-snapclass" will be used. Note: VolumeSnapshotClass must be configured to use Trident.
+\t-d, --dataset-version=\t\tDataset version to tag the snapshot with (applied as the 'dataset-version' label, so it must be a valid Kubernetes label value).
 \t-h, --help\t\t\tPrint help text.
 \t-n, --namespace=\t\tKubernetes namespace that PersistentVolumeClaim (PVC) is located in. If not specified, namespace "default" will be used.
 \t-s, --snapshot-name=\t\tName of new Kubernetes VolumeSnapshot. If not specified, will be set to 'ntap-dsutil.<timestamp>'.
@@ -251,6 +339,7 @@ Optional Options/Arguments:
 Examples:
 \tnetapp_dataops_k8s_cli.py create volume-snapshot --pvc-name=project1
 \tnetapp_dataops_k8s_cli.py create volume-snapshot -p project2 -s snap1 -c ontap -n team1
+\tnetapp_dataops_k8s_cli.py create volume-snapshot -p imagenet -d 2024-06
 '''
 helpTextCreateVolume = '''
 Command: create volume
@@ -406,6 +495,31 @@ Examples:
 \tnetapp_dataops_k8s_cli.py delete volume --pvc-name=project1
 \tnetapp_dataops_k8s_cli.py delete volume -p project2 -n team1
 '''
+helpTextFillJupyterLabPool = '''
+Command: fill jupyterlab-pool
+
+Provision ready, unassigned JupyterLab workspaces for a workspace pool, by cloning a golden VolumeSnapshot of a JupyterLab workspace, until the pool contains the specified number of workspaces. Workspaces can then be handed out near-instantaneously using 'claim jupyterlab'.
+
+Required Options/Arguments:
+\t-l, --pool-name=\t\tName of workspace pool. Workspaces in the pool are named after the pool with a random suffix.
+\t-s, --source-snapshot-name=\tName of Kubernetes VolumeSnapshot of a JupyterLab workspace to use as source for the workspaces in the pool.
+\t-z, --pool-size=\t\tNumber of ready, unassigned workspaces to keep in the pool.
+
+Optional Options/Arguments:
+\t-b, --load-balancer\t\tOption to use a LoadBalancer instead of using NodePort service. If not specified, NodePort service will be utilized.
+\t-g, --nvidia-gpu=\t\tNumber of NVIDIA GPUs to allocate to each workspace. Format: '1', '4', etc. If not specified, no GPUs will be allocated.
+\t-h, --help\t\t\tPrint help text.
+\t-k, --keep-filled\t\tDo not exit after filling the pool. Instead, keep refilling the pool as workspaces are claimed until interrupted.
+\t-m, --memory=\t\t\tAmount of memory to reserve for each workspace. Format: '1024Mi', '100Gi', '10Ti', etc. If not specified, no memory will be reserved.
+\t-n, --namespace=\t\tKubernetes namespace to create the workspace pool in. If not specified, namespace "default" will be used.
+\t-p, --cpu=\t\t\tNumber of CPUs to reserve for each workspace. Format: '0.5', '1', etc. If not specified, no CPUs will be reserved.
+\t-r, --allocate-resource=\tOption to specify custom resource allocations, ex. 'nvidia.com/mig-1g.5gb=1'. If not specified, no custom resource will be allocated.
+\t-t, --timeout=\t\t\tMaximum number of seconds to allow for each wait when provisioning a workspace. If not specified, the command will wait indefinitely.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py fill jupyterlab-pool --pool-name=workshop --source-snapshot-name=workshop-golden --pool-size=10
+\tnetapp_dataops_k8s_cli.py fill jupyterlab-pool -l workshop -s workshop-golden -z 60 -n team1 -g 1 -k
+'''
 helpTextGetS3Bucket = '''
 Command: get-s3 bucket
 
@@ -470,81 +584,132 @@ Examples:
 helpTextListJupyterLabs = '''
 Command: list jupyterlabs
 
-List all JupyterLab workspaces in a specific namespace.
+List all JupyterLab workspaces in a specific namespace, in several namespaces, or in all namespaces.
 
 No options/arguments are required.
 
 Optional Options/Arguments:
+\t-A, --all-namespaces\t\tList workspaces in all namespaces.
 \t-h, --help\t\t\tPrint help text.
-\t-n, --namespace=\t\tKubernetes namespace for which to retrieve list of workspaces. If not specified, namespace "default" will be used.
+\t-n, --namespace=\t\tKubernetes namespace for which to retrieve list of workspaces, or a comma-separated list of namespaces. If not specified, namespace "default" will be used.
+\t-o, --output=\t\t\tOutput format: table (default), json (a single array), ndjson (one JSON object per line) or csv.
 
 Examples:
 \tnetapp_dataops_k8s_cli.py list jupyterlabs -n team1
 \tnetapp_dataops_k8s_cli.py list jupyterlabs --namespace=team2
+\tnetapp_dataops_k8s_cli.py list jupyterlabs -n team1,team2
+\tnetapp_dataops_k8s_cli.py list jupyterlabs -A
+\tnetapp_dataops_k8s_cli.py list jupyterlabs -n team1 -o json
 '''
 
 helpTextListTritonServers = '''
 Command: list triton-servers
 
-List all NVIDIA Triton Inference Server instances in a specific namespace.
+List all NVIDIA Triton Inference Server instances in a specific namespace, in several namespaces, or in all namespaces.
 
 No options/arguments are required.
 
 Optional Options/Arguments:
+\t-A, --all-namespaces\t\tList instances in all namespaces.
 \t-h, --help\t\t\tPrint help text.
-\t-n, --namespace=\t\tKubernetes namespace for which to retrieve list of instances. If not specified, namespace "default" will be used.
+\t-n, --namespace=\t\tKubernetes namespace for which to retrieve list of instances, or a comma-separated list of namespaces. If not specified, namespace "default" will be used.
+\t-o, --output=\t\t\tOutput format: table (default), json (a single array), ndjson (one JSON object per line) or csv.
 
 Examples:
 \tnetapp_dataops_k8s_cli.py list triton-servers -n team1
 \tnetapp_dataops_k8s_cli.py list triton-servers --namespace=team2
+\tnetapp_dataops_k8s_cli.py list triton-servers -A
+\tnetapp_dataops_k8s_cli.py list triton-servers -o ndjson
 '''
 
 helpTextListJupyterLabSnapshots = '''
 Command: list jupyterlab-snapshots
 
-List all JupyterLab workspace snapshots in a specific namespace.
+List all JupyterLab workspace snapshots in a specific namespace, in several namespaces, or in all namespaces.
 
 No options/arguments are required.
 
 Optional Options/Arguments:
+\t-A, --all-namespaces\tList snapshots in all namespaces.
+\t-d, --dataset-version=\tOnly list snapshots that are tagged with this dataset version.
 \t-h, --help\t\tPrint help text.
-\t-n, --namespace=\tKubernetes namespace that Kubernetes VolumeSnapshot is located in. If not specified, namespace "default" will be used.
+\t-n, --namespace=\tKubernetes namespace that Kubernetes VolumeSnapshot is located in, or a comma-separated list of namespaces. If not specified, namespace "default" will be used.
+\t-o, --output=\t\tOutput format: table (default), json (a single array), ndjson (one JSON object per line) or csv.
 \t-w, --workspace-name=\tName of JupyterLab workspace to list snapshots for. If not specified, all VolumeSnapshots in namespace will be listed.
 
 Examples:
 \tnetapp_dataops_k8s_cli.py list jupyterlab-snapshots --workspace-name=mike
 \tnetapp_dataops_k8s_cli.py list jupyterlab-snapshots -n team2
+\tnetapp_dataops_k8s_cli.py list jupyterlab-snapshots -A
+\tnetapp_dataops_k8s_cli.py list jupyterlab-snapshots -A -o csv
 '''
 helpTextListVolumeSnapshots = '''
 Command: list volume-snapshots
 
-List all persistent volume snapshots in a specific namespace.
+List all persistent volume snapshots in a specific namespace, in several namespaces, or in all namespaces.
 
 No options/arguments are required.
 
 Optional Options/Arguments:
+\t-A, --all-namespaces\tList snapshots in all namespaces.
+\t-d, --dataset-version=\tOnly list snapshots that are tagged with this dataset version.
 \t-h, --help\t\tPrint help text.
-\t-n, --namespace=\tKubernetes namespace that Kubernetes VolumeSnapshot is located in. If not specified, namespace "default" will be used.
+\t-n, --namespace=\tKubernetes namespace that Kubernetes VolumeSnapshot is located in, or a comma-separated list of namespaces. If not specified, namespace "default" will be used.
+\t-o, --output=\t\tOutput format: table (default), json (a single array), ndjson (one JSON object per line) or csv.
 \t-p, --pvc-name=\t\tName of Kubernetes PersistentVolumeClaim (PVC) to list snapshots for. If not specified, all VolumeSnapshots in namespace will be listed.
 
 Examples:
 \tnetapp_dataops_k8s_cli.py list volume-snapshots --pvc-name=project1
 \tnetapp_dataops_k8s_cli.py list volume-snapshots -n team2
+\tnetapp_dataops_k8s_cli.py list volume-snapshots -n team1,team2
+\tnetapp_dataops_k8s_cli.py list volume-snapshots -n team1 -o json
 '''
 helpTextListVolumes = '''
 Command: list volumes
 
-List all persistent volumes in a specific namespace.
+List all persistent volumes in a specific namespace, in several namespaces, or in all namespaces.
 
 No options/arguments are required.
 
 Optional Options/Arguments:
+\t-A, --all-namespaces\tList volumes in all namespaces.
 \t-h, --help\t\tPrint help text.
-\t-n, --namespace=\tKubernetes namespace for which to retrieve list of volumes. If not specified, namespace "default" will be used.
+\t-n, --namespace=\tKubernetes namespace for which to retrieve list of volumes, or a comma-separated list of namespaces. If not specified, namespace "default" will be used.
+\t-o, --output=\t\tOutput format: table (default), json (a single array), ndjson (one JSON object per line) or csv.
 
 Examples:
 \tnetapp_dataops_k8s_cli.py list volumes -n team1
 \tnetapp_dataops_k8s_cli.py list volumes --namespace=team2
+\tnetapp_dataops_k8s_cli.py list volumes -n team1,team2
+\tnetapp_dataops_k8s_cli.py list volumes --all-namespaces
+\tnetapp_dataops_k8s_cli.py list volumes --all-namespaces --output=csv
+'''
+helpTextPruneVolumeSnapshots = '''
+Command: prune volume-snapshots
+
+Delete the VolumeSnapshots in a namespace that a retention policy does not keep. The policy is applied separately to the VolumeSnapshots of each persistent volume. VolumeSnapshots that are the source of a PersistentVolumeClaim (PVC) or of a StatefulSet, and VolumeSnapshots that are not ready to use yet, are always kept.
+
+Required Options/Arguments:
+\tAt least one of --keep-last, --keep-hourly, --keep-daily and --keep-weekly.
+
+Optional Options/Arguments:
+\t-c, --max-concurrency=\t\tMaximum number of deletion requests in flight at the same time. If not specified, 8 will be used.
+\t-d, --keep-daily=\t\tNumber of days for which to keep the most recent VolumeSnapshot.
+\t-h, --help\t\t\tPrint help text.
+\t-k, --keep-weekly=\t\tNumber of weeks for which to keep the most recent VolumeSnapshot.
+\t-l, --keep-last=\t\tNumber of most recent VolumeSnapshots to keep.
+\t-n, --namespace=\t\tKubernetes namespace that the VolumeSnapshots are located in. If not specified, namespace "default" will be used.
+\t-p, --pvc-name=\t\t\tOnly prune VolumeSnapshots of this Kubernetes PersistentVolumeClaim (PVC).
+\t-q, --max-deletions-per-second=\tMaximum number of deletion requests issued per second. If not specified, 10 will be used. Specify 0 to disable rate limiting.
+\t-r, --dry-run\t\t\tPrint which VolumeSnapshots would be kept and deleted, without deleting anything.
+\t-t, --timeout=\t\t\tMaximum number of seconds to wait for the VolumeSnapshots to be deleted. If not specified, the command will wait indefinitely.
+\t-u, --keep-hourly=\t\tNumber of hours for which to keep the most recent VolumeSnapshot.
+\t-w, --wait\t\t\tWait for the VolumeSnapshots to be deleted.
+\t-x, --prefix=\t\t\tOnly prune VolumeSnapshots whose names start with this prefix (e.g. "ntap-dsutil.").
+
+Examples:
+\tnetapp_dataops_k8s_cli.py prune volume-snapshots --keep-last=3 --keep-daily=7 --dry-run
+\tnetapp_dataops_k8s_cli.py prune volume-snapshots -n team1 -p project1 -l 5 -k 4 -x ntap-dsutil. -w
 '''
 helpTextPutS3Bucket = '''
 Command: put-s3 bucket
@@ -644,6 +809,40 @@ Examples:
 \tnetapp_dataops_k8s_cli.py restore volume-snapshot --snapshot-name=snap1
 \tnetapp_dataops_k8s_cli.py restore volume-snapshot -s ntap-dsutil.20210304151544 -n team1
 '''
+helpTextScaleTritonServer = '''
+Command: scale triton-server
+
+Scale an existing NVIDIA Triton Inference Server to a specific number of replicas. For servers whose replicas have their own model repository clones, the clones of removed replicas are deleted, and added replicas get new clones.
+
+Required Options/Arguments:
+\t-s, --server-name=\t\tName of NVIDIA Triton Inference Server to scale.
+\t-c, --replicas=\t\t\tNumber of replicas to scale the server to.
+
+Optional Options/Arguments:
+\t-h, --help\t\t\tPrint help text.
+\t-n, --namespace=\t\tKubernetes namespace that the server is located in. If not specified, namespace "default" will be used.
+\t-t, --timeout=\t\t\tMaximum number of seconds to wait for all replicas to be ready. If not specified, the command will wait indefinitely.
+\t-w, --wait\t\t\tWait for all replicas to be ready.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py scale triton-server --server-name=resnet --replicas=0
+\tnetapp_dataops_k8s_cli.py scale triton-server -s resnet -n team1 -c 2 -w
+'''
+helpTextServe = '''
+Command: serve
+
+Run a long-running agent that performs toolkit operations (e.g. create volume-snapshot, clone volume) on behalf of clients, such as pipeline steps, over an HTTP/JSON API. The agent keeps a single Kubernetes API session, so that a pipeline step can create a snapshot with one HTTP request instead of installing the toolkit. Clients can use the standard-library-only agent client, which can be downloaded from the agent at /v1/client. Clients must present the value of the NETAPP_DATAOPS_K8S_AGENT_TOKEN environment variable as a bearer token; the agent does not start if it is not set, unless --insecure is specified. The command keeps running until it is interrupted.
+
+Optional Options/Arguments:
+\t-a, --address=\t\tAddress to listen on. If not specified, 0.0.0.0 (all interfaces) will be used.
+\t-h, --help\t\tPrint help text.
+\t-i, --insecure\t\tAccept requests without a token. Anyone who can reach the agent can then run operations with its permissions.
+\t-p, --port=\t\tPort to listen on. If not specified, 8080 will be used.
+
+Examples:
+\tnetapp_dataops_k8s_cli.py serve
+\tnetapp_dataops_k8s_cli.py serve --address=127.0.0.1 --port=9000
+'''
 helpTextShowS3Job = '''
 Command: show s3-job
 
@@ -685,14 +884,197 @@ def getTarget(args: list) -> str:
 if __name__ == '__main__':
     import sys, getopt
 
+    # Enable profiling if requested
+    if "--profile" in sys.argv:
+        import atexit
+        from netapp_dataops.k8s.tracing import add_exporter, TraceRecorder
+        sys.argv.remove("--profile")
+        profileRecorder = add_exporter(TraceRecorder())
+        atexit.register(profileRecorder.print_summary)
+
     # Get desired action from command line args
     try:
         action = sys.argv[1]
     except:
         handleInvalidCommand()
 
-    # Invoke desired action
-    if action in ("backup-with-astra", "backup"):
+    # Invoke desired action. Toolkit modules are imported by the action that uses them rather than at the top of the
+    # script, so that the script starts quickly and each command only pays for the imports that it needs.
+    if action == "apply":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+            ServiceUnavailableError,
+            WaitTimeoutError,
+        )
+        from netapp_dataops.k8s.plan import (
+            apply_plan,
+            load_plan,
+            InvalidPlanError,
+        )
+
+        planFile = None
+        maxParallel = 4
+        stateFile = None
+
+        # Get command line options
+        try:
+            opts, args = getopt.getopt(sys.argv[2:], "hf:p:s:", ["help", "file=", "max-parallel=", "state-file="])
+        except:
+            handleInvalidCommand(helpText=helpTextApply, invalidOptArg=True)
+
+        # Parse command line options
+        try:
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextApply)
+                    sys.exit(0)
+                elif opt in ("-f", "--file"):
+                    planFile = arg
+                elif opt in ("-p", "--max-parallel"):
+                    maxParallel = int(arg)
+                elif opt in ("-s", "--state-file"):
+                    stateFile = arg
+        except ValueError:
+            handleInvalidCommand(helpText=helpTextApply, invalidOptArg=True)
+
+        # Check for required options
+        if not planFile or maxParallel < 1:
+            handleInvalidCommand(helpText=helpTextApply, invalidOptArg=True)
+
+        # Apply plan
+        try:
+            plan = load_plan(planFile)
+            apply_plan(plan, max_workers=maxParallel, state_file=stateFile or planFile + ".state", print_output=True)
+        except (OSError, InvalidPlanError) as err:
+            print("Error: " + str(err))
+            sys.exit(1)
+        except (InvalidConfigError, APIConnectionError, ServiceUnavailableError, WaitTimeoutError):
+            sys.exit(1)
+
+    elif action == "autoscale":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+        )
+        from netapp_dataops.k8s.autoscale import TritonServerAutoscaler
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("triton-server", "triton"):
+            server_name = None
+            namespace = "default"
+            min_replicas = 1
+            max_replicas = 4
+            target_queue_time_ms = 100
+            target_request_rate = None
+            interval = 15
+            scale_down_delay = 300
+            metrics_endpoints = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hs:n:a:z:q:r:i:d:e:",
+                                           ["help", "server-name=", "namespace=", "min-replicas=", "max-replicas=",
+                                            "target-queue-time=", "target-request-rate=", "interval=",
+                                            "scale-down-delay=", "metrics-endpoints="])
+            except:
+                handleInvalidCommand(helpText=helpTextAutoscaleTritonServer, invalidOptArg=True)
+
+            # Parse command line options
+            try:
+                for opt, arg in opts:
+                    if opt in ("-h", "--help"):
+                        print(helpTextAutoscaleTritonServer)
+                        sys.exit(0)
+                    elif opt in ("-s", "--server-name"):
+                        server_name = arg
+                    elif opt in ("-n", "--namespace"):
+                        namespace = arg
+                    elif opt in ("-a", "--min-replicas"):
+                        min_replicas = int(arg)
+                    elif opt in ("-z", "--max-replicas"):
+                        max_replicas = int(arg)
+                    elif opt in ("-q", "--target-queue-time"):
+                        target_queue_time_ms = float(arg)
+                    elif opt in ("-r", "--target-request-rate"):
+                        target_request_rate = float(arg)
+                    elif opt in ("-i", "--interval"):
+                        interval = float(arg)
+                    elif opt in ("-d", "--scale-down-delay"):
+                        scale_down_delay = float(arg)
+                    elif opt in ("-e", "--metrics-endpoints"):
+                        metrics_endpoints = arg.split(",")
+            except ValueError:
+                handleInvalidCommand(helpText=helpTextAutoscaleTritonServer, invalidOptArg=True)
+
+            # Check for required options
+            if not server_name or min_replicas < 0 or max_replicas < max(min_replicas, 1):
+                handleInvalidCommand(helpText=helpTextAutoscaleTritonServer, invalidOptArg=True)
+
+            # Autoscale Triton Server until interrupted
+            autoscaler = TritonServerAutoscaler(server_name=server_name, namespace=namespace,
+                                                min_replicas=min_replicas, max_replicas=max_replicas,
+                                                target_queue_time_ms=target_queue_time_ms,
+                                                target_request_rate=target_request_rate, interval=interval,
+                                                scale_down_delay=scale_down_delay,
+                                                metrics_endpoints=metrics_endpoints, print_output=True)
+            try:
+                autoscaler.evaluate()
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+            from time import sleep
+            print("Autoscaling Triton Server '" + server_name + "' in namespace '" + namespace + "'. Press Ctrl-C to exit.")
+            autoscaler.start()
+            try:
+                while True:
+                    sleep(60)
+            except KeyboardInterrupt:
+                autoscaler.stop()
+
+        else:
+            handleInvalidCommand()
+
+    elif action == "backfill":
+        from netapp_dataops.k8s import (
+            backfill_volume_snapshot_labels,
+            APIConnectionError,
+            InvalidConfigError,
+        )
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("volume-snapshot-labels", "volumesnapshot-labels", "snapshot-labels"):
+            namespace = "default"
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hn:", ["help", "namespace="])
+            except:
+                handleInvalidCommand(helpText=helpTextBackfillVolumeSnapshotLabels, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextBackfillVolumeSnapshotLabels)
+                    sys.exit(0)
+                elif opt in ("-n", "--namespace"):
+                    namespace = arg
+
+            # Label VolumeSnapshots
+            try:
+                backfill_volume_snapshot_labels(namespace=namespace, print_output=True)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
+    elif action in ("backup-with-astra", "backup"):
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -703,7 +1085,75 @@ if __name__ == '__main__':
         else:
             handleInvalidCommand()
 
+    elif action == "claim":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+            WaitTimeoutError,
+        )
+        from netapp_dataops.k8s.pool import (
+            claim_jupyter_lab,
+            PoolExhaustedError,
+        )
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("jupyterlab", "jupyter"):
+            poolName = None
+            claimedBy = None
+            namespace = "default"
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hl:n:t:u:",
+                                           ["help", "pool-name=", "namespace=", "timeout=", "claimed-by="])
+            except:
+                handleInvalidCommand(helpText=helpTextClaimJupyterLab, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextClaimJupyterLab)
+                    sys.exit(0)
+                elif opt in ("-l", "--pool-name"):
+                    poolName = arg
+                elif opt in ("-n", "--namespace"):
+                    namespace = arg
+                elif opt in ("-t", "--timeout"):
+                    try:
+                        timeout = float(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextClaimJupyterLab, invalidOptArg=True)
+                elif opt in ("-u", "--claimed-by"):
+                    claimedBy = arg
+
+            # Check for required options
+            if not poolName:
+                handleInvalidCommand(helpText=helpTextClaimJupyterLab, invalidOptArg=True)
+
+            # Claim JupyterLab workspace
+            try:
+                claim_jupyter_lab(pool_name=poolName, claimed_by=claimedBy, namespace=namespace, timeout=timeout,
+                                  print_output=True)
+            except (InvalidConfigError, APIConnectionError, PoolExhaustedError, WaitTimeoutError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
     elif action == "clone":
+        from netapp_dataops.k8s import (
+            clone_volume,
+            clone_volumes,
+            clone_jupyter_lab,
+            APIConnectionError,
+            InvalidConfigError,
+            WaitTimeoutError,
+        )
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -754,6 +1204,69 @@ if __name__ == '__main__':
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
+        elif target in ("volumes", "vols", "pvcs", "persistentvolumeclaims"):
+            newPvcNames = None
+            sourcePvcName = None
+            sourceSnapshotName = None
+            volumeSnapshotClass = "csi-snapclass"
+            namespace = "default"
+            maxWorkers = 8
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hp:c:n:s:t:v:w:",
+                                           ["help", "new-pvc-names=", "volume-snapshot-class=", "namespace=",
+                                            "source-snapshot-name=", "timeout=", "source-pvc-name=", "max-workers="])
+            except:
+                handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextCloneVolumes)
+                    sys.exit(0)
+                elif opt in ("-p", "--new-pvc-names"):
+                    newPvcNames = [pvcName.strip() for pvcName in arg.split(",") if pvcName.strip()]
+                elif opt in ("-c", "--volume-snapshot-class"):
+                    volumeSnapshotClass = arg
+                elif opt in ("-n", "--namespace"):
+                    namespace = arg
+                elif opt in ("-s", "--source-snapshot-name"):
+                    sourceSnapshotName = arg
+                elif opt in ("-t", "--timeout"):
+                    try:
+                        timeout = float(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+                elif opt in ("-v", "--source-pvc-name"):
+                    sourcePvcName = arg
+                elif opt in ("-w", "--max-workers"):
+                    try:
+                        maxWorkers = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Check for required options
+            if not newPvcNames or (not sourceSnapshotName and not sourcePvcName):
+                handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+            if sourceSnapshotName and sourcePvcName:
+                print(
+                    "Error: Both -s/--source-snapshot-name and -v/--source-pvc-name cannot be specified for the same operation.")
+                handleInvalidCommand(helpText=helpTextCloneVolumes, invalidOptArg=True)
+
+            # Clone volumes
+            try:
+                report = clone_volumes(new_pvc_names=newPvcNames, source_pvc_name=sourcePvcName,
+                                       source_snapshot_name=sourceSnapshotName, volume_snapshot_class=volumeSnapshotClass,
+                                       namespace=namespace, max_workers=maxWorkers, timeout=timeout, print_output=True)
+            except (InvalidConfigError, APIConnectionError, WaitTimeoutError):
+                sys.exit(1)
+
+            # Exit with an error code if any clone failed
+            if any(cloneDict["Status"] == "Failed" for cloneDict in report):
+                sys.exit(1)
+
         elif target in ("jupyterlab", "jupyter"):
             newWorkspaceName = None
             sourceWorkspaceName = None
@@ -833,6 +1346,17 @@ if __name__ == '__main__':
             handleInvalidCommand()
 
     elif action == "create":
+        from netapp_dataops.k8s import (
+            create_volume_snapshot,
+            create_volume,
+            create_triton_server,
+            create_jupyter_lab,
+            create_jupyter_lab_snapshot,
+            APIConnectionError,
+            CAConfigMap,
+            InvalidConfigError,
+        )
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -842,12 +1366,13 @@ if __name__ == '__main__':
             snapshotName = None
             volumeSnapshotClass = "csi-snapclass"
             namespace = "default"
+            datasetVersion = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hp:c:n:s:",
+                opts, args = getopt.getopt(sys.argv[3:], "hp:c:n:s:d:",
                                            ["help", "pvc-name=", "volume-snapshot-class=", "namespace=",
-                                            "snapshot-name="])
+                                            "snapshot-name=", "dataset-version="])
             except:
                 handleInvalidCommand(helpText=helpTextCreateVolumeSnapshot, invalidOptArg=True)
 
@@ -864,6 +1389,8 @@ if __name__ == '__main__':
                     namespace = arg
                 elif opt in ("-s", "--snapshot-name"):
                     snapshotName = arg
+                elif opt in ("-d", "--dataset-version"):
+                    datasetVersion = arg
 
             # Check for required options
             if not pvcName:
@@ -872,7 +1399,11 @@ if __name__ == '__main__':
             # Create snapshot
             try:
                 create_volume_snapshot(pvc_name=pvcName, snapshot_name=snapshotName,
-                                       volume_snapshot_class=volumeSnapshotClass, namespace=namespace, print_output=True)
+                                       volume_snapshot_class=volumeSnapshotClass, namespace=namespace, print_output=True,
+                                       dataset_version=datasetVersion)
+            except ValueError as err:
+                print("Error: " + str(err))
+                sys.exit(1)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -989,11 +1520,16 @@ if __name__ == '__main__':
             requestCpu = None
             load_balancer_service = False
             allocate_resource = None
+            replicas = 1
+            per_replica_model_clones = False
+            model_snapshot_name = None
+            volume_snapshot_class = "csi-snapclass"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hs:v:n:i:g:m:p:br:",
-                                           ["help", "server-name=", "model-repo-pvc-name=", "namespace=", "image=", "nvidia-gpu=", "memory=", "cpu=", "load-balancer", "allocate-resource="])
+                opts, args = getopt.getopt(sys.argv[3:], "hs:v:n:i:g:m:p:br:c:xt:a:",
+                                           ["help", "server-name=", "model-repo-pvc-name=", "namespace=", "image=", "nvidia-gpu=", "memory=", "cpu=", "load-balancer", "allocate-resource=",
+                                            "replicas=", "per-replica-model-clones", "model-snapshot-name=", "volume-snapshot-class="])
             except:
                 handleInvalidCommand(helpText=helpTextDeployTritonServer, invalidOptArg=True)
 
@@ -1020,10 +1556,21 @@ if __name__ == '__main__':
                     load_balancer_service = True
                 elif opt in ("-r", "--allocate-resource"):
                     allocate_resource = arg
+                elif opt in ("-c", "--replicas"):
+                    try:
+                        replicas = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextDeployTritonServer, invalidOptArg=True)
+                elif opt in ("-x", "--per-replica-model-clones"):
+                    per_replica_model_clones = True
+                elif opt in ("-t", "--model-snapshot-name"):
+                    model_snapshot_name = arg
+                elif opt in ("-a", "--volume-snapshot-class"):
+                    volume_snapshot_class = arg
 
 
             # Check for required options
-            if not server_name or not model_pvc_name:
+            if not server_name or not (model_pvc_name or (per_replica_model_clones and model_snapshot_name)):
                 handleInvalidCommand(helpText=helpTextDeployTritonServer, invalidOptArg=True)
 
             # Create JupyterLab workspace
@@ -1031,6 +1578,8 @@ if __name__ == '__main__':
                 create_triton_server(server_name=server_name,  model_pvc_name= model_pvc_name,
                                    load_balancer_service=load_balancer_service, namespace=namespace, server_image=server_image, request_cpu=requestCpu,
                                    request_memory=requestMemory, request_nvidia_gpu=requestNvidiaGpu, allocate_resource=allocate_resource,
+                                   replicas=replicas, per_replica_model_clones=per_replica_model_clones,
+                                   model_snapshot_name=model_snapshot_name, volume_snapshot_class=volume_snapshot_class,
                                    print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
@@ -1040,12 +1589,13 @@ if __name__ == '__main__':
             snapshotName = None
             volumeSnapshotClass = "csi-snapclass"
             namespace = "default"
+            datasetVersion = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hw:c:n:s:",
+                opts, args = getopt.getopt(sys.argv[3:], "hw:c:n:s:d:",
                                            ["help", "workspace-name=", "volume-snapshot-class=", "namespace=",
-                                            "snapshot-name="])
+                                            "snapshot-name=", "dataset-version="])
             except:
                 handleInvalidCommand(helpText=helpTextCreateJupyterLabSnapshot, invalidOptArg=True)
 
@@ -1062,6 +1612,8 @@ if __name__ == '__main__':
                     namespace = arg
                 elif opt in ("-s", "--snapshot-name"):
                     snapshotName = arg
+                elif opt in ("-d", "--dataset-version"):
+                    datasetVersion = arg
 
             # Check for required options
             if not workspaceName:
@@ -1070,11 +1622,17 @@ if __name__ == '__main__':
             # Create snapshot
             try:
                 create_jupyter_lab_snapshot(workspace_name=workspaceName, snapshot_name=snapshotName,
-                                            volume_snapshot_class=volumeSnapshotClass, namespace=namespace, print_output=True)
+                                            volume_snapshot_class=volumeSnapshotClass, namespace=namespace, print_output=True,
+                                            dataset_version=datasetVersion)
+            except ValueError as err:
+                print("Error: " + str(err))
+                sys.exit(1)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         elif target == "s3-secret":
+            from netapp_dataops.k8s.data_movers.s3 import S3ConfigSecret
+
             namespace = "default"
             secret_name = None
             access_key = None
@@ -1165,6 +1723,15 @@ if __name__ == '__main__':
             handleInvalidCommand()
 
     elif action in ("delete", "del", "rm"):
+        from netapp_dataops.k8s import (
+            delete_volume_snapshot,
+            delete_volume,
+            delete_jupyter_lab,
+            delete_triton_server,
+            APIConnectionError,
+            CAConfigMap,
+            InvalidConfigError,
+        )
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -1319,6 +1886,8 @@ if __name__ == '__main__':
                 sys.exit(1)
 
         elif target == "s3-secret":
+            from netapp_dataops.k8s.data_movers.s3 import S3ConfigSecret
+
             namespace = "default"
             secret_name = None
 
@@ -1362,6 +1931,8 @@ if __name__ == '__main__':
                 sys.exit(1)
 
         elif target == "s3-job":
+            from netapp_dataops.k8s.data_movers.s3 import DataMoverJob
+
             namespace = "default"
             job_name = None
 
@@ -1490,7 +2061,111 @@ if __name__ == '__main__':
         else:
             handleInvalidCommand()
 
+    elif action == "fill":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+            WaitTimeoutError,
+        )
+        from netapp_dataops.k8s.pool import JupyterLabWorkspacePool
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("jupyterlab-pool", "jupyter-pool"):
+            poolName = None
+            sourceSnapshotName = None
+            poolSize = None
+            namespace = "default"
+            requestNvidiaGpu = None
+            requestMemory = None
+            requestCpu = None
+            load_balancer_service = False
+            allocate_resource = None
+            keepFilled = False
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hl:s:z:n:g:m:p:br:kt:",
+                                           ["help", "pool-name=", "source-snapshot-name=", "pool-size=", "namespace=",
+                                            "nvidia-gpu=", "memory=", "cpu=", "load-balancer", "allocate-resource=",
+                                            "keep-filled", "timeout="])
+            except:
+                handleInvalidCommand(helpText=helpTextFillJupyterLabPool, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextFillJupyterLabPool)
+                    sys.exit(0)
+                elif opt in ("-l", "--pool-name"):
+                    poolName = arg
+                elif opt in ("-s", "--source-snapshot-name"):
+                    sourceSnapshotName = arg
+                elif opt in ("-z", "--pool-size"):
+                    try:
+                        poolSize = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextFillJupyterLabPool, invalidOptArg=True)
+                elif opt in ("-n", "--namespace"):
+                    namespace = arg
+                elif opt in ("-g", "--nvidia-gpu"):
+                    requestNvidiaGpu = arg
+                elif opt in ("-m", "--memory"):
+                    requestMemory = arg
+                elif opt in ("-p", "--cpu"):
+                    requestCpu = arg
+                elif opt in ("-b", "--load-balancer"):
+                    load_balancer_service = True
+                elif opt in ("-r", "--allocate-resource"):
+                    allocate_resource = arg
+                elif opt in ("-k", "--keep-filled"):
+                    keepFilled = True
+                elif opt in ("-t", "--timeout"):
+                    try:
+                        timeout = float(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextFillJupyterLabPool, invalidOptArg=True)
+
+            # Check for required options
+            if not poolName or not sourceSnapshotName or poolSize is None:
+                handleInvalidCommand(helpText=helpTextFillJupyterLabPool, invalidOptArg=True)
+
+            # Fill JupyterLab workspace pool
+            pool = JupyterLabWorkspacePool(pool_name=poolName, source_snapshot_name=sourceSnapshotName, size=poolSize,
+                                           namespace=namespace, load_balancer_service=load_balancer_service,
+                                           request_cpu=requestCpu, request_memory=requestMemory,
+                                           request_nvidia_gpu=requestNvidiaGpu, allocate_resource=allocate_resource,
+                                           timeout=timeout, print_output=True)
+            try:
+                pool.refill()
+                print("JupyterLab workspace pool '" + poolName + "' successfully filled.")
+            except (InvalidConfigError, APIConnectionError, WaitTimeoutError):
+                sys.exit(1)
+
+            # Keep refilling the pool in the background until interrupted
+            if keepFilled:
+                from time import sleep
+                print("Refilling JupyterLab workspace pool '" + poolName + "' as workspaces are claimed. Press Ctrl-C to exit.")
+                pool.start()
+                try:
+                    while True:
+                        sleep(60)
+                except KeyboardInterrupt:
+                    pool.stop()
+
+        else:
+            handleInvalidCommand()
+
     elif action == "get-s3":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+        )
+        from netapp_dataops.k8s.data_movers.s3 import S3DataMover
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -1714,6 +2389,21 @@ if __name__ == '__main__':
         print(helpTextStandard)
 
     elif action in ("list", "ls"):
+        from netapp_dataops.k8s import (
+            iter_jupyter_labs,
+            iter_jupyter_lab_snapshots,
+            iter_triton_servers,
+            iter_volumes,
+            iter_volume_snapshots,
+            list_jupyter_labs,
+            list_volume_snapshots,
+            list_jupyter_lab_snapshots,
+            list_volumes,
+            list_triton_servers,
+            APIConnectionError,
+            InvalidConfigError,
+        )
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -1721,10 +2411,13 @@ if __name__ == '__main__':
         if target in ("volume-snapshots", "volume-snapshot", "volumesnapshots", "volumesnapshot"):
             pvcName = None
             namespace = "default"
+            datasetVersion = None
+            allNamespaces = False
+            outputFormat = "table"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hp:n:", ["help", "pvc-name=", "namespace="])
+                opts, args = getopt.getopt(sys.argv[3:], "hp:n:d:Ao:", ["help", "pvc-name=", "namespace=", "dataset-version=", "all-namespaces", "output="])
             except:
                 handleInvalidCommand(helpText=helpTextListVolumeSnapshots, invalidOptArg=True)
 
@@ -1737,20 +2430,40 @@ if __name__ == '__main__':
                     pvcName = arg
                 elif opt in ("-n", "--namespace"):
                     namespace = arg
+                elif opt in ("-d", "--dataset-version"):
+                    datasetVersion = arg
+                elif opt in ("-A", "--all-namespaces"):
+                    allNamespaces = True
+                elif opt in ("-o", "--output"):
+                    outputFormat = arg
+
+            # Check command line options
+            if outputFormat not in ("table", "json", "ndjson", "csv"):
+                handleInvalidCommand(helpText=helpTextListVolumeSnapshots, invalidOptArg=True)
 
-            # List volumes
+            # List snapshots (rows are printed as each page is retrieved when listing a single namespace)
             try:
-                list_volume_snapshots(pvc_name=pvcName, namespace=namespace, print_output=True)
+                namespaces = namespace.split(",") if "," in namespace else None
+                if namespaces or allNamespaces:
+                    list_volume_snapshots(pvc_name=pvcName, dataset_version=datasetVersion, namespaces=namespaces,
+                                          all_namespaces=allNamespaces, print_output=True, output_format=outputFormat)
+                else:
+                    for _ in iter_volume_snapshots(pvc_name=pvcName, namespace=namespace,
+                                                   dataset_version=datasetVersion, print_output=True,
+                                                   output_format=outputFormat):
+                        pass
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         elif target in (
         "volume", "vol", "volumes", "vols", "pvc", "persistentvolumeclaim", "pvcs", "persistentvolumeclaims"):
             namespace = "default"
+            allNamespaces = False
+            outputFormat = "table"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hn:", ["help", "namespace="])
+                opts, args = getopt.getopt(sys.argv[3:], "hn:Ao:", ["help", "namespace=", "all-namespaces", "output="])
             except:
                 handleInvalidCommand(helpText=helpTextListVolumes, invalidOptArg=True)
 
@@ -1761,20 +2474,37 @@ if __name__ == '__main__':
                     sys.exit(0)
                 elif opt in ("-n", "--namespace"):
                     namespace = arg
+                elif opt in ("-A", "--all-namespaces"):
+                    allNamespaces = True
+                elif opt in ("-o", "--output"):
+                    outputFormat = arg
+
+            # Check command line options
+            if outputFormat not in ("table", "json", "ndjson", "csv"):
+                handleInvalidCommand(helpText=helpTextListVolumes, invalidOptArg=True)
 
-            # List volumes
+            # List volumes (rows are printed as each page is retrieved when listing a single namespace)
             try:
-                list_volumes(namespace=namespace, print_output=True)
+                namespaces = namespace.split(",") if "," in namespace else None
+                if namespaces or allNamespaces:
+                    list_volumes(namespaces=namespaces, all_namespaces=allNamespaces, print_output=True,
+                                 output_format=outputFormat)
+                else:
+                    for _ in iter_volumes(namespace=namespace, print_output=True, output_format=outputFormat):
+                        pass
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         elif target in ("jupyterlab-snapshots", "jupyterlab-snapshot", "jupyterlabsnapshots", "jupyterlabsnapshot"):
             workspaceName = None
             namespace = "default"
+            datasetVersion = None
+            allNamespaces = False
+            outputFormat = "table"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hw:n:", ["help", "workspace-name=", "namespace="])
+                opts, args = getopt.getopt(sys.argv[3:], "hw:n:d:Ao:", ["help", "workspace-name=", "namespace=", "dataset-version=", "all-namespaces", "output="])
             except:
                 handleInvalidCommand(helpText=helpTextListJupyterLabSnapshots, invalidOptArg=True)
 
@@ -1787,20 +2517,41 @@ if __name__ == '__main__':
                     workspaceName = arg
                 elif opt in ("-n", "--namespace"):
                     namespace = arg
+                elif opt in ("-d", "--dataset-version"):
+                    datasetVersion = arg
+                elif opt in ("-A", "--all-namespaces"):
+                    allNamespaces = True
+                elif opt in ("-o", "--output"):
+                    outputFormat = arg
+
+            # Check command line options
+            if outputFormat not in ("table", "json", "ndjson", "csv"):
+                handleInvalidCommand(helpText=helpTextListJupyterLabSnapshots, invalidOptArg=True)
 
-            # List JupyterLab snapshots
+            # List JupyterLab snapshots (rows are printed as each page is retrieved when listing a single namespace)
             try:
-                list_jupyter_lab_snapshots(workspace_name=workspaceName, namespace=namespace, print_output=True)
+                namespaces = namespace.split(",") if "," in namespace else None
+                if namespaces or allNamespaces:
+                    list_jupyter_lab_snapshots(workspace_name=workspaceName, dataset_version=datasetVersion,
+                                               namespaces=namespaces, all_namespaces=allNamespaces, print_output=True,
+                                               output_format=outputFormat)
+                else:
+                    for _ in iter_jupyter_lab_snapshots(workspace_name=workspaceName, namespace=namespace,
+                                                        dataset_version=datasetVersion, print_output=True,
+                                                        output_format=outputFormat):
+                        pass
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         elif target in ("jupyterlabs", "jupyters", "jupyterlab", "jupyter"):
             namespace = "default"
             include_astra_app_id = False
+            allNamespaces = False
+            outputFormat = "table"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hn:a", ["help", "namespace=", "include-astra-app-id"])
+                opts, args = getopt.getopt(sys.argv[3:], "hn:aAo:", ["help", "namespace=", "include-astra-app-id", "all-namespaces", "output="])
             except:
                 handleInvalidCommand(helpText=helpTextListJupyterLabs, invalidOptArg=True)
 
@@ -1813,19 +2564,36 @@ if __name__ == '__main__':
                     namespace = arg
                 elif opt in ("-a", "--include-astra-app-id"):
                     include_astra_app_id = True
+                elif opt in ("-A", "--all-namespaces"):
+                    allNamespaces = True
+                elif opt in ("-o", "--output"):
+                    outputFormat = arg
+
+            # Check command line options
+            if outputFormat not in ("table", "json", "ndjson", "csv"):
+                handleInvalidCommand(helpText=helpTextListJupyterLabs, invalidOptArg=True)
 
-            # List JupyterLab workspaces
+            # List JupyterLab workspaces (rows are printed as each page is retrieved when listing a single namespace)
             try:
-                list_jupyter_labs(namespace=namespace, include_astra_app_id=include_astra_app_id, print_output=True)
+                namespaces = namespace.split(",") if "," in namespace else None
+                if include_astra_app_id or namespaces or allNamespaces:
+                    list_jupyter_labs(namespace=namespace, include_astra_app_id=include_astra_app_id,
+                                      namespaces=namespaces, all_namespaces=allNamespaces, print_output=True,
+                                      output_format=outputFormat)
+                else:
+                    for _ in iter_jupyter_labs(namespace=namespace, print_output=True, output_format=outputFormat):
+                        pass
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         elif target in ("triton-servers", "triton_server", "triton"):
             namespace = "default"
+            allNamespaces = False
+            outputFormat = "table"
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hn:", ["help", "namespace="])
+                opts, args = getopt.getopt(sys.argv[3:], "hn:Ao:", ["help", "namespace=", "all-namespaces", "output="])
             except:
                 handleInvalidCommand(helpText=helpTextListTritonServers, invalidOptArg=True)
 
@@ -1836,17 +2604,129 @@ if __name__ == '__main__':
                     sys.exit(0)
                 elif opt in ("-n", "--namespace"):
                     namespace = arg
+                elif opt in ("-A", "--all-namespaces"):
+                    allNamespaces = True
+                elif opt in ("-o", "--output"):
+                    outputFormat = arg
+
+            # Check command line options
+            if outputFormat not in ("table", "json", "ndjson", "csv"):
+                handleInvalidCommand(helpText=helpTextListTritonServers, invalidOptArg=True)
 
-            # List JupyterLab workspaces
+            # List Triton servers (rows are printed as each page is retrieved when listing a single namespace)
             try:
-                list_triton_servers(namespace=namespace, print_output=True)
+                namespaces = namespace.split(",") if "," in namespace else None
+                if namespaces or allNamespaces:
+                    list_triton_servers(namespaces=namespaces, all_namespaces=allNamespaces, print_output=True,
+                                        output_format=outputFormat)
+                else:
+                    for _ in iter_triton_servers(namespace=namespace, print_output=True, output_format=outputFormat):
+                        pass
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
         else:
             handleInvalidCommand()
 
+    elif action == "prune":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+            WaitTimeoutError,
+        )
+        from netapp_dataops.k8s.retention import (
+            prune_volume_snapshots,
+            RetentionPolicy,
+        )
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("volume-snapshots", "volume-snapshot", "volumesnapshots", "volumesnapshot"):
+            keep_last = 0
+            keep_hourly = 0
+            keep_daily = 0
+            keep_weekly = 0
+            pvc_name = None
+            snapshot_name_prefix = None
+            namespace = "default"
+            dry_run = False
+            max_concurrency = 8
+            max_deletions_per_second = 10
+            wait = False
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hl:u:d:k:p:x:n:rc:q:wt:",
+                                           ["help", "keep-last=", "keep-hourly=", "keep-daily=", "keep-weekly=",
+                                            "pvc-name=", "prefix=", "namespace=", "dry-run", "max-concurrency=",
+                                            "max-deletions-per-second=", "wait", "timeout="])
+            except:
+                handleInvalidCommand(helpText=helpTextPruneVolumeSnapshots, invalidOptArg=True)
+
+            # Parse command line options
+            try:
+                for opt, arg in opts:
+                    if opt in ("-h", "--help"):
+                        print(helpTextPruneVolumeSnapshots)
+                        sys.exit(0)
+                    elif opt in ("-l", "--keep-last"):
+                        keep_last = int(arg)
+                    elif opt in ("-u", "--keep-hourly"):
+                        keep_hourly = int(arg)
+                    elif opt in ("-d", "--keep-daily"):
+                        keep_daily = int(arg)
+                    elif opt in ("-k", "--keep-weekly"):
+                        keep_weekly = int(arg)
+                    elif opt in ("-p", "--pvc-name"):
+                        pvc_name = arg
+                    elif opt in ("-x", "--prefix"):
+                        snapshot_name_prefix = arg
+                    elif opt in ("-n", "--namespace"):
+                        namespace = arg
+                    elif opt in ("-r", "--dry-run"):
+                        dry_run = True
+                    elif opt in ("-c", "--max-concurrency"):
+                        max_concurrency = int(arg)
+                    elif opt in ("-q", "--max-deletions-per-second"):
+                        max_deletions_per_second = float(arg)
+                    elif opt in ("-w", "--wait"):
+                        wait = True
+                    elif opt in ("-t", "--timeout"):
+                        timeout = float(arg)
+            except ValueError:
+                handleInvalidCommand(helpText=helpTextPruneVolumeSnapshots, invalidOptArg=True)
+
+            # Check for required options
+            try:
+                policy = RetentionPolicy(keep_last=keep_last, keep_hourly=keep_hourly, keep_daily=keep_daily,
+                                         keep_weekly=keep_weekly)
+            except ValueError:
+                handleInvalidCommand(helpText=helpTextPruneVolumeSnapshots, invalidOptArg=True)
+            if max_concurrency < 1 or max_deletions_per_second < 0:
+                handleInvalidCommand(helpText=helpTextPruneVolumeSnapshots, invalidOptArg=True)
+
+            # Prune VolumeSnapshots
+            try:
+                prune_volume_snapshots(policy=policy, pvc_name=pvc_name, snapshot_name_prefix=snapshot_name_prefix,
+                                       namespace=namespace, dry_run=dry_run, max_concurrency=max_concurrency,
+                                       max_deletions_per_second=max_deletions_per_second, wait=wait, timeout=timeout,
+                                       print_output=True)
+            except (InvalidConfigError, APIConnectionError, WaitTimeoutError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
     elif action in ("put-s3"):
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+        )
+        from netapp_dataops.k8s.data_movers.s3 import S3DataMover
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -2077,6 +2957,13 @@ if __name__ == '__main__':
             handleInvalidCommand()
 
     elif action in ("restore"):
+        from netapp_dataops.k8s import (
+            restore_jupyter_lab_snapshot,
+            restore_volume_snapshot,
+            APIConnectionError,
+            InvalidConfigError,
+        )
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -2160,7 +3047,120 @@ if __name__ == '__main__':
         else:
             handleInvalidCommand()
 
+    elif action == "scale":
+        from netapp_dataops.k8s import (
+            scale_triton_server,
+            APIConnectionError,
+            InvalidConfigError,
+            WaitTimeoutError,
+        )
+
+        # Get desired target from command line args
+        target = getTarget(sys.argv)
+
+        # Invoke desired action based on target
+        if target in ("triton-server", "triton"):
+            server_name = None
+            replicas = None
+            namespace = "default"
+            wait = False
+            timeout = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hs:c:n:wt:",
+                                           ["help", "server-name=", "replicas=", "namespace=", "wait", "timeout="])
+            except:
+                handleInvalidCommand(helpText=helpTextScaleTritonServer, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextScaleTritonServer)
+                    sys.exit(0)
+                elif opt in ("-s", "--server-name"):
+                    server_name = arg
+                elif opt in ("-c", "--replicas"):
+                    try:
+                        replicas = int(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextScaleTritonServer, invalidOptArg=True)
+                elif opt in ("-n", "--namespace"):
+                    namespace = arg
+                elif opt in ("-w", "--wait"):
+                    wait = True
+                elif opt in ("-t", "--timeout"):
+                    try:
+                        timeout = float(arg)
+                    except ValueError:
+                        handleInvalidCommand(helpText=helpTextScaleTritonServer, invalidOptArg=True)
+
+            # Check for required options
+            if not server_name or replicas is None or replicas < 0:
+                handleInvalidCommand(helpText=helpTextScaleTritonServer, invalidOptArg=True)
+
+            # Scale Triton Server
+            try:
+                scale_triton_server(server_name=server_name, replicas=replicas, namespace=namespace, wait=wait,
+                                    timeout=timeout, print_output=True)
+            except (InvalidConfigError, APIConnectionError, WaitTimeoutError):
+                sys.exit(1)
+
+        else:
+            handleInvalidCommand()
+
+    elif action == "serve":
+        from netapp_dataops.k8s import InvalidConfigError
+        from netapp_dataops.k8s.agent import DataOpsAgent
+
+        address = "0.0.0.0"
+        port = 8080
+        insecure = False
+
+        # Get command line options
+        try:
+            opts, args = getopt.getopt(sys.argv[2:], "ha:ip:", ["help", "address=", "insecure", "port="])
+        except:
+            handleInvalidCommand(helpText=helpTextServe, invalidOptArg=True)
+
+        # Parse command line options
+        try:
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextServe)
+                    sys.exit(0)
+                elif opt in ("-a", "--address"):
+                    address = arg
+                elif opt in ("-i", "--insecure"):
+                    insecure = True
+                elif opt in ("-p", "--port"):
+                    port = int(arg)
+        except ValueError:
+            handleInvalidCommand(helpText=helpTextServe, invalidOptArg=True)
+
+        # Run agent
+        try:
+            agent = DataOpsAgent(address=address, port=port, allow_unauthenticated=insecure, print_output=True)
+        except InvalidConfigError:
+            sys.exit(1)
+        except OSError as err:
+            print("Error: Unable to listen on " + address + ":" + str(port) + ": " + str(err))
+            sys.exit(1)
+        if not agent.token:
+            print("Warning: --insecure was specified and NETAPP_DATAOPS_K8S_AGENT_TOKEN is not set; requests will not be authenticated.")
+        print("Serving on " + agent.address + ".", flush=True)
+        try:
+            agent.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
     elif action == "show":
+        from netapp_dataops.k8s import (
+            APIConnectionError,
+            InvalidConfigError,
+        )
+        from netapp_dataops.k8s.data_movers.s3 import DataMoverJob
+
         # Get desired target from command line args
         target = getTarget(sys.argv)
 
@@ -2203,6 +3203,8 @@ if __name__ == '__main__':
                 sys.exit(1)
 
     elif action in ("version", "v", "-v", "--version"):
+        from netapp_dataops import k8s
+
         print("NetApp DataOps Toolkit for Kubernetes - version " + k8s.__version__)
 
     else:
@@ -0,0 +1,24 @@
+"""Shared fixtures for the tests, which run toolkit operations against the fake Kubernetes API server that is also used
+by the benchmarks (benchmarks/fake_api_server.py)."""
+import os
+import sys
+
+import pytest
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_PACKAGE_DIR, "benchmarks"))
+sys.path.insert(0, _PACKAGE_DIR)
+
+from fake_api_server import FakeKubernetesApiServer
+from netapp_dataops.k8s import DataOpsSession
+
+
+@pytest.fixture
+def server():
+    with FakeKubernetesApiServer() as server:
+        yield server
+
+
+@pytest.fixture
+def session(server):
+    return DataOpsSession(config_file=server.kubeconfig)
@@ -0,0 +1,70 @@
+"""Factories for the Kubernetes objects that the tests add to the fake API server."""
+from netapp_dataops.k8s import (
+    _get_jupyter_lab_labels,
+    _get_jupyter_lab_prefix,
+    _get_triton_deployment,
+    _get_triton_dev_labels,
+)
+
+
+def pvc(name: str, labels: dict = None, source_snapshot: str = None, size: str = "10Gi") -> dict:
+    pvc = {
+        "metadata": {"name": name, "labels": labels or {"created-by": "ntap-dsutil", "created-by-operation": "create-volume"}},
+        "spec": {"accessModes": ["ReadWriteMany"], "resources": {"requests": {"storage": size}},
+                 "storageClassName": "ontap-flexvol"},
+        "status": {"phase": "Bound", "accessModes": ["ReadWriteMany"], "capacity": {"storage": size}}
+    }
+    if source_snapshot:
+        pvc["spec"]["dataSource"] = {"apiGroup": "snapshot.storage.k8s.io", "kind": "VolumeSnapshot",
+                                     "name": source_snapshot}
+    return pvc
+
+
+def clone_pvc(name: str, source_pvc_name: str, source_snapshot: str) -> dict:
+    labels = {"created-by": "ntap-dsutil", "created-by-operation": "clone-volume", "source-pvc": source_pvc_name}
+    return pvc(name, labels=labels, source_snapshot=source_snapshot)
+
+
+def volume_snapshot(name: str, pvc_name: str, labels: dict = None,
+                    creation_time: str = "2024-01-01T00:00:00Z") -> dict:
+    metadata = {"name": name}
+    if labels is not None:
+        metadata["labels"] = labels
+    return {
+        "metadata": metadata,
+        "spec": {"volumeSnapshotClassName": "csi-snapclass", "source": {"persistentVolumeClaimName": pvc_name}},
+        "status": {"readyToUse": True, "restoreSize": "10Gi", "creationTime": creation_time}
+    }
+
+
+def add_workspace(server, workspace_name: str, namespace: str = "default", node_port: int = 30000):
+    # PVC, Service and ready Deployment of a JupyterLab workspace
+    name = _get_jupyter_lab_prefix() + workspace_name
+    labels = _get_jupyter_lab_labels(workspaceName=workspace_name)
+    server.state.add("persistentvolumeclaims", pvc(name, labels=labels), namespace=namespace)
+    server.state.add("services", {
+        "metadata": {"name": name, "labels": labels},
+        "spec": {"type": "NodePort", "selector": {"app": labels["app"]}, "clusterIP": "10.96.0.1",
+                 "ports": [{"name": "http", "port": 8888, "targetPort": 8888, "protocol": "TCP",
+                            "nodePort": node_port}]}
+    }, namespace=namespace)
+    server.state.add("deployments", {
+        "metadata": {"name": name, "labels": labels},
+        "spec": {"replicas": 1, "selector": {"matchLabels": {"app": labels["app"]}},
+                 "template": {"metadata": {"labels": labels},
+                              "spec": {"containers": [{"name": "jupyterlab",
+                                                       "image": "nvcr.io/nvidia/tensorflow:22.05-tf2-py3"}]}}},
+        "status": {"replicas": 1, "readyReplicas": 1, "availableReplicas": 1}
+    }, namespace=namespace)
+
+
+def add_triton_server(server, server_name: str, namespace: str = "default", replicas: int = 1):
+    # Deployment of a Triton Inference Server; its pods are started by the fake server's simulated controller
+    labels = _get_triton_dev_labels(server_name=server_name)
+    server.state.add("deployments", {
+        "metadata": {"name": _get_triton_deployment(server_name=server_name), "labels": labels},
+        "spec": {"replicas": replicas, "selector": {"matchLabels": {"app": labels["app"]}},
+                 "template": {"metadata": {"labels": labels},
+                              "spec": {"containers": [{"name": "triton",
+                                                       "image": "nvcr.io/nvidia/tritonserver:21.11-py3"}]}}},
+    }, namespace=namespace, simulate=True)
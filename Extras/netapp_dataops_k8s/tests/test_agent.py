@@ -0,0 +1,103 @@
+"""Status codes and error messages of the agent's HTTP/JSON API, through the agent client, against the fake API
+server."""
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from k8s_objects import pvc
+from netapp_dataops.k8s import InvalidConfigError
+from netapp_dataops.k8s.agent import DataOpsAgent
+from netapp_dataops.netapp_dataops_k8s_agent_client import (
+    DataOpsAgentClient,
+    DataOpsAgentError,
+)
+
+
+TOKEN = "secret"
+
+
+@pytest.fixture
+def agent(session):
+    with DataOpsAgent(address="127.0.0.1", port=0, token=TOKEN, session=session) as agent:
+        yield agent
+
+
+@pytest.fixture
+def client(agent):
+    return DataOpsAgentClient(url="http://" + agent.address, token=TOKEN, timeout=10)
+
+
+def _error_status(call, *args, **kwargs) -> int:
+    with pytest.raises(DataOpsAgentError) as err:
+        call(*args, **kwargs)
+    return err.value.status
+
+
+def test_agent_requires_a_token(session, monkeypatch):
+    monkeypatch.delenv("NETAPP_DATAOPS_K8S_AGENT_TOKEN", raising=False)
+
+    with pytest.raises(InvalidConfigError):
+        DataOpsAgent(address="127.0.0.1", port=0, session=session)
+
+
+def test_operations_are_run_with_the_agent_session(server, client):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+
+    client.create_volume_snapshot(pvc_name="data", snapshot_name="baseline")
+
+    assert [volumeDict["PersistentVolumeClaim (PVC) Name"] for volumeDict in client.list_volumes()] == ["data"]
+    assert ("default", "baseline") in server.state.objects["volumesnapshots"]
+
+
+def test_missing_or_wrong_token_is_unauthorized(server, agent):
+    server.state.reset_calls()
+
+    assert _error_status(DataOpsAgentClient(url="http://" + agent.address, timeout=10).list_volumes) == 401
+    assert _error_status(DataOpsAgentClient(url="http://" + agent.address, token="wrong", timeout=10).list_volumes) == 401
+    assert not server.state.calls
+
+
+def test_health_check_and_client_download_do_not_require_a_token(agent):
+    with urllib.request.urlopen("http://" + agent.address + "/healthz", timeout=10) as response:
+        assert json.loads(response.read()) == {"status": "ok"}
+    with urllib.request.urlopen("http://" + agent.address + "/v1/client", timeout=10) as response:
+        assert b"class DataOpsAgentClient" in response.read()
+
+
+@pytest.mark.parametrize("operation, args", [
+    ("create_volume", {"pvc_name": "data"}),
+    ("create_volume", {"pvc_name": "data", "volume_size": "1Gi", "size": "1Gi"}),
+    ("create_volume", {"pvc_name": "data", "volume_size": "1Gi", "session": None}),
+    ("create_jupyter_lab", {"workspace_name": "ws", "workspace_size": "1Gi"}),
+])
+def test_invalid_arguments_are_a_bad_request(server, client, operation, args):
+    server.state.reset_calls()
+
+    assert _error_status(client.call, operation, **args) == 400
+    assert not server.state.calls
+
+
+def test_malformed_request_body_is_a_bad_request(agent):
+    request = urllib.request.Request("http://" + agent.address + "/v1/operations/list_volumes", data=b"[1, 2]",
+                                     method="POST", headers={"Authorization": "Bearer " + TOKEN})
+
+    with pytest.raises(urllib.error.HTTPError) as err:
+        urllib.request.urlopen(request, timeout=10)
+    assert err.value.code == 400
+
+
+def test_unknown_operations_and_paths_are_not_found(client):
+    assert _error_status(client.call, "format_volume") == 404
+    assert _error_status(DataOpsAgentClient(url=client.url + "/v2", token=TOKEN, timeout=10).list_volumes) == 404
+
+
+def test_kubernetes_api_client_errors_are_passed_on(server, client):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+
+    with pytest.raises(DataOpsAgentError) as err:
+        client.create_volume(pvc_name="data", volume_size="1Gi")
+    assert err.value.status == 409
+    assert "already exists" in str(err.value)
+    assert _error_status(client.delete_volume_snapshot, snapshot_name="missing") == 404
@@ -0,0 +1,85 @@
+"""The asyncio coroutines against the fake API server: many operations run concurrently from one event loop, and the
+results match those of the synchronous functions."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("kubernetes_asyncio")
+
+from k8s_objects import pvc, volume_snapshot
+from netapp_dataops.k8s import (
+    list_volume_snapshots,
+    list_volumes,
+)
+from netapp_dataops.k8s import aio
+
+
+NAMESPACE = "async"
+
+
+def _run(server, coroutine_function):
+    # Run a coroutine function that receives an open AsyncDataOpsSession
+    async def _main():
+        async with aio.AsyncDataOpsSession(config_file=server.kubeconfig) as asyncSession:
+            return await coroutine_function(asyncSession)
+    return asyncio.run(_main())
+
+
+def test_concurrent_creates_match_sync_listing(server, session):
+    async def _create(asyncSession):
+        await asyncio.gather(*[aio.create_volume(pvc_name="volume-" + str(index), volume_size="1Gi",
+                                                 namespace=NAMESPACE, timeout=10, session=asyncSession)
+                               for index in range(5)])
+        await asyncio.gather(*[aio.create_volume_snapshot(pvc_name="volume-" + str(index),
+                                                          snapshot_name="snapshot-" + str(index),
+                                                          namespace=NAMESPACE, dataset_version="v" + str(index),
+                                                          timeout=10, session=asyncSession)
+                               for index in range(5)])
+        return (await aio.list_volumes(namespace=NAMESPACE, session=asyncSession),
+                await aio.list_volume_snapshots(namespace=NAMESPACE, session=asyncSession))
+
+    volumes, snapshots = _run(server, _create)
+
+    assert len(volumes) == 5
+    assert sorted(snapshot["VolumeSnapshot Name"] for snapshot in snapshots) == ["snapshot-" + str(index)
+                                                                               for index in range(5)]
+    assert volumes == list_volumes(namespace=NAMESPACE, session=session)
+    assert snapshots == list_volume_snapshots(namespace=NAMESPACE, session=session)
+    labels = server.state.objects["volumesnapshots"][(NAMESPACE, "snapshot-3")]["metadata"]["labels"]
+    assert labels["source-pvc"] == "volume-3"
+    assert labels["dataset-version"] == "v3"
+
+
+def test_clone_volumes_reports_failures_like_sync(server):
+    server.state.add("persistentvolumeclaims", pvc("source"), namespace=NAMESPACE)
+    server.state.add("volumesnapshots", volume_snapshot("source-snapshot", "source"), namespace=NAMESPACE)
+    server.state.add("persistentvolumeclaims", pvc("clone-1"), namespace=NAMESPACE)
+
+    report = _run(server, lambda asyncSession: aio.clone_volumes(
+        new_pvc_names=["clone-0", "clone-1"], source_snapshot_name="source-snapshot", namespace=NAMESPACE,
+        timeout=10, session=asyncSession))
+
+    assert [cloneDict["Status"] for cloneDict in report] == ["Bound", "Failed"]
+    assert report[1]["Error"].startswith("Kubernetes API Error: ")
+
+
+def test_delete_volume_waits_for_its_snapshots(server):
+    server.state.add("persistentvolumeclaims", pvc("data"), namespace=NAMESPACE)
+    server.state.add("volumesnapshots", volume_snapshot("unlabeled", "data"), namespace=NAMESPACE)
+    server.state.add("volumesnapshots", volume_snapshot("labeled", "data", labels={"source-pvc": "data"}),
+                     namespace=NAMESPACE)
+    server.state.add("volumesnapshots", volume_snapshot("other", "other", labels={"source-pvc": "other"}),
+                     namespace=NAMESPACE)
+
+    _run(server, lambda asyncSession: aio.delete_volume(pvc_name="data", namespace=NAMESPACE, timeout=10,
+                                                          session=asyncSession))
+
+    assert list(server.state.objects["persistentvolumeclaims"]) == []
+    assert list(server.state.objects["volumesnapshots"]) == [(NAMESPACE, "other")]
+
+
+def test_invalid_dataset_version_is_rejected_before_any_api_call(server):
+    with pytest.raises(ValueError):
+        _run(server, lambda asyncSession: aio.create_volume_snapshot(pvc_name="data", dataset_version="not/valid",
+                                                                     namespace=NAMESPACE, session=asyncSession))
+    assert not server.state.calls
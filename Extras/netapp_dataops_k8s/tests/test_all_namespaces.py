@@ -0,0 +1,70 @@
+"""Listing across namespaces, with one cluster-scoped list call where RBAC allows it and a fallback to listing each
+namespace when it is forbidden, against the fake API server."""
+import pytest
+
+from fake_api_server import FakeKubernetesApiServer
+from k8s_objects import add_workspace, pvc, volume_snapshot
+from netapp_dataops.k8s import (
+    DataOpsSession,
+    list_jupyter_labs,
+    list_volume_snapshots,
+    list_volumes,
+)
+
+
+@pytest.fixture
+def forbidden_server():
+    with FakeKubernetesApiServer(cluster_scoped_lists=False) as server:
+        yield server
+
+
+def _add_volumes(server):
+    for namespace in ("team-a", "team-b", "team-c"):
+        server.state.add("persistentvolumeclaims", pvc("data"), namespace=namespace)
+        server.state.add("volumesnapshots", volume_snapshot("snapshot", "data"), namespace=namespace)
+
+
+def _namespaces(rowsList: list) -> list:
+    return [rowDict["Namespace"] for rowDict in rowsList]
+
+
+def test_cluster_scoped_list_is_used_where_allowed(server, session):
+    _add_volumes(server)
+    server.state.reset_calls()
+
+    volumesList = list_volumes(all_namespaces=True, session=session)
+
+    assert _namespaces(volumesList) == ["team-a", "team-b", "team-c"]
+    assert server.state.calls == {"list persistentvolumeclaims": 1}
+
+
+def test_forbidden_cluster_scoped_list_falls_back_to_each_namespace(forbidden_server):
+    _add_volumes(forbidden_server)
+    session = DataOpsSession(config_file=forbidden_server.kubeconfig)
+    forbidden_server.state.reset_calls()
+
+    volumesList = list_volumes(all_namespaces=True, session=session)
+
+    assert _namespaces(volumesList) == ["team-a", "team-b", "team-c"]
+    assert forbidden_server.state.calls == {"list persistentvolumeclaims": 1 + 3, "list namespaces": 1}
+
+    # The forbidden cluster-scoped list is not attempted again by the same session
+    forbidden_server.state.reset_calls()
+    snapshotsList = list_volume_snapshots(all_namespaces=True, session=session)
+    list_volumes(namespaces=["team-a", "team-c"], session=session)
+
+    assert _namespaces(snapshotsList) == ["team-a", "team-b", "team-c"]
+    assert forbidden_server.state.calls["list persistentvolumeclaims"] == 3 + 2
+    assert forbidden_server.state.calls["list volumesnapshots"] == 1 + 3
+
+
+def test_listed_namespaces_are_limited_to_those_requested(forbidden_server):
+    _add_volumes(forbidden_server)
+    add_workspace(forbidden_server, "ws", namespace="team-b")
+    add_workspace(forbidden_server, "ws", namespace="team-c", node_port=30001)
+    session = DataOpsSession(config_file=forbidden_server.kubeconfig)
+
+    workspacesList = list_jupyter_labs(namespaces=["team-a", "team-b"], session=session)
+
+    assert _namespaces(workspacesList) == ["team-b"]
+    assert _namespaces(list_volumes(namespaces=["team-c"], session=session)) == ["team-c", "team-c"]
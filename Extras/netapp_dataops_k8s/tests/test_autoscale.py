@@ -0,0 +1,103 @@
+"""TritonServerAutoscaler.evaluate() against the fake API server and a fake Triton metrics endpoint."""
+import time
+
+import pytest
+
+from fake_triton_metrics_server import FakeTritonMetricsServer
+from k8s_objects import add_triton_server
+from netapp_dataops.k8s import _get_triton_deployment
+from netapp_dataops.k8s.autoscale import (
+    _WAKE_ANNOTATION,
+    request_triton_server_wake,
+    TritonServerAutoscaler,
+)
+
+
+SERVER_NAME = "resnet"
+
+
+@pytest.fixture
+def metrics_server():
+    with FakeTritonMetricsServer() as metricsServer:
+        yield metricsServer
+
+
+def _autoscaler(session, metrics_server, **kwargs) -> TritonServerAutoscaler:
+    return TritonServerAutoscaler(server_name=SERVER_NAME, metrics_endpoints=[metrics_server.endpoint],
+                                  session=session, **kwargs)
+
+
+def _deployment(server) -> dict:
+    return server.state.objects["deployments"][("default", _get_triton_deployment(server_name=SERVER_NAME))]
+
+
+def test_scales_up_on_queue_time(server, session, metrics_server):
+    add_triton_server(server, SERVER_NAME, replicas=1)
+    autoscaler = _autoscaler(session, metrics_server, target_queue_time_ms=100)
+
+    # The first scrape only provides a baseline
+    assert autoscaler.evaluate() == 1
+    metrics_server.record(requests=100, queue_time_ms=250)
+
+    assert autoscaler.evaluate() == 3
+    assert _deployment(server)["spec"]["replicas"] == 3
+    assert autoscaler.metrics()["queue_time_ms"] == pytest.approx(250)
+    assert autoscaler.metrics()["scale_ups"] == 1
+
+
+def test_scales_down_after_scale_down_delay(server, session, metrics_server):
+    add_triton_server(server, SERVER_NAME, replicas=3)
+    autoscaler = _autoscaler(session, metrics_server, target_queue_time_ms=100, scale_down_delay=0.5)
+    autoscaler.evaluate()
+
+    # 3 replicas were recommended at the baseline evaluation, within the scale-down delay
+    metrics_server.record(requests=100, queue_time_ms=10)
+    assert autoscaler.evaluate() == 3
+
+    time.sleep(0.6)
+    metrics_server.record(requests=100, queue_time_ms=10)
+    assert autoscaler.evaluate() == 1
+    assert _deployment(server)["spec"]["replicas"] == 1
+    assert autoscaler.metrics()["scale_downs"] == 1
+
+
+def test_scales_to_zero_when_idle_and_up_when_woken(server, session, metrics_server):
+    add_triton_server(server, SERVER_NAME, replicas=1)
+    autoscaler = _autoscaler(session, metrics_server, min_replicas=0, scale_down_delay=0)
+    autoscaler.evaluate()
+
+    assert autoscaler.evaluate() == 0
+    assert _deployment(server)["spec"]["replicas"] == 0
+    assert autoscaler.evaluate() == 0
+
+    # Another process requests the server; the autoscaler scales it up and acknowledges the request
+    request_triton_server_wake(server_name=SERVER_NAME, session=session)
+    assert _WAKE_ANNOTATION in _deployment(server)["metadata"]["annotations"]
+    assert autoscaler.evaluate() == 1
+    assert _deployment(server)["spec"]["replicas"] == 1
+    assert _WAKE_ANNOTATION not in _deployment(server)["metadata"].get("annotations", dict())
+
+
+def test_wake_scales_up_from_zero(server, session, metrics_server):
+    add_triton_server(server, SERVER_NAME, replicas=0)
+    autoscaler = _autoscaler(session, metrics_server, min_replicas=0, scale_down_delay=60)
+
+    assert autoscaler.wake() == 1
+    # The recommendation of the wake is kept for the scale-down delay, although the server is idle
+    autoscaler.evaluate()
+    assert autoscaler.evaluate() == 1
+
+
+def test_counter_reset_is_not_a_negative_rate(server, session, metrics_server):
+    add_triton_server(server, SERVER_NAME, replicas=1)
+    autoscaler = _autoscaler(session, metrics_server, target_queue_time_ms=100)
+    metrics_server.record(requests=1000, queue_time_ms=100)
+    autoscaler.evaluate()
+
+    # Triton was restarted: the counters since the restart are the deltas
+    metrics_server.reset()
+    metrics_server.record(requests=50, queue_time_ms=200)
+
+    assert autoscaler.evaluate() == 2
+    assert autoscaler.metrics()["request_rate"] > 0
+    assert autoscaler.metrics()["queue_time_ms"] == pytest.approx(200)
@@ -0,0 +1,101 @@
+"""ResourceCache against the fake API server: reads are served from memory while the cache is fresh, fall back to the
+API once it is stale, and the cache lists again when its watch can no longer be resumed."""
+import time
+
+import pytest
+
+from k8s_objects import pvc
+from netapp_dataops.k8s import (
+    _list_namespaced_objects,
+    _read_namespaced_object,
+    list_volumes,
+)
+from netapp_dataops.k8s.cache import (
+    disable_cache,
+    enable_cache,
+)
+
+
+NAMESPACE = "cached"
+
+
+def _wait_until(condition, timeout: float = 10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for the cache"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def populated_server(server):
+    for index in range(5):
+        server.state.add("persistentvolumeclaims", pvc("volume-" + str(index)), namespace=NAMESPACE)
+    return server
+
+
+def test_reads_are_served_from_the_cache(populated_server, session):
+    cache = enable_cache(namespace=NAMESPACE, kinds=["persistentvolumeclaims", "volumesnapshots"], timeout=10,
+                         session=session)
+    try:
+        populated_server.state.reset_calls()
+
+        volumes = list_volumes(namespace=NAMESPACE, session=session)
+        obj = _read_namespaced_object(kind="persistentvolumeclaims", name="volume-0", namespace=NAMESPACE,
+                                      session=session)
+
+        assert len(volumes) == 5
+        assert obj.metadata.name == "volume-0"
+        assert not any(call.startswith(("list ", "get ")) for call in populated_server.state.calls)
+        assert cache.metrics()["hits"] >= 2
+        assert cache.metrics()["stale"] == 0
+    finally:
+        disable_cache(session=session)
+
+
+def test_watch_events_update_the_cache(populated_server, session):
+    cache = enable_cache(namespace=NAMESPACE, kinds=["persistentvolumeclaims"], timeout=10, session=session)
+    try:
+        populated_server.state.add("persistentvolumeclaims", pvc("volume-new"), namespace=NAMESPACE)
+        populated_server.state.remove("persistentvolumeclaims", NAMESPACE, "volume-0")
+
+        def _names():
+            return {obj.metadata.name for obj in cache.list(kind="persistentvolumeclaims", namespace=NAMESPACE)}
+        _wait_until(lambda: "volume-new" in _names() and "volume-0" not in _names())
+        assert cache.metrics()["resources"]["persistentvolumeclaims"]["events"] >= 2
+    finally:
+        disable_cache(session=session)
+
+
+def test_stale_cache_falls_back_to_the_api(populated_server, session):
+    cache = enable_cache(namespace=NAMESPACE, kinds=["persistentvolumeclaims"], max_staleness=0, timeout=10,
+                         session=session)
+    try:
+        populated_server.state.reset_calls()
+
+        items = _list_namespaced_objects(kind="persistentvolumeclaims", namespace=NAMESPACE, session=session)
+
+        assert len(items) == 5
+        assert populated_server.state.calls["list persistentvolumeclaims"] == 1
+        assert cache.metrics()["stale"] == 1
+        assert cache.metrics()["hits"] == 0
+        assert not cache.is_synced()
+    finally:
+        disable_cache(session=session)
+
+
+def test_expired_watch_relists(populated_server, session):
+    cache = enable_cache(namespace=NAMESPACE, kinds=["persistentvolumeclaims"], watch_timeout=1, timeout=10,
+                         session=session)
+    try:
+        assert cache.metrics()["resources"]["persistentvolumeclaims"]["relists"] == 1
+
+        # Objects that change while the history is compacted are only seen by listing again
+        populated_server.state.expire_resource_versions()
+        _wait_until(lambda: cache.metrics()["resources"]["persistentvolumeclaims"]["relists"] >= 2)
+        populated_server.state.add("persistentvolumeclaims", pvc("volume-after-relist"), namespace=NAMESPACE)
+
+        _wait_until(lambda: cache.get(kind="persistentvolumeclaims", name="volume-after-relist",
+                                      namespace=NAMESPACE) is not None)
+        assert cache.is_synced()
+    finally:
+        disable_cache(session=session)
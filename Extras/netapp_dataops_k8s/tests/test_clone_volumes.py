@@ -0,0 +1,70 @@
+"""clone_volumes() reports the outcome of every clone: a clone that cannot be created or that does not bind in time is
+reported as failed, with its error, without failing the other clones."""
+import pytest
+
+from fake_api_server import FakeKubernetesApiServer
+from k8s_objects import pvc, volume_snapshot
+from netapp_dataops.k8s import (
+    clone_volumes,
+    DataOpsSession,
+)
+
+
+def _add_source(server):
+    server.state.add("persistentvolumeclaims", pvc("source"))
+    server.state.add("volumesnapshots", volume_snapshot("source-snapshot", "source"))
+
+
+def _statuses(report: list) -> dict:
+    return {cloneDict["PersistentVolumeClaim (PVC) Name"]: (cloneDict["Status"], cloneDict["Error"])
+            for cloneDict in report}
+
+
+def test_all_clones_bind(server, session):
+    _add_source(server)
+
+    report = clone_volumes(new_pvc_names=["clone-0", "clone-1", "clone-0"], source_snapshot_name="source-snapshot",
+                           timeout=10, session=session)
+
+    assert _statuses(report) == {"clone-0": ("Bound", ""), "clone-1": ("Bound", "")}
+    labels = server.state.objects["persistentvolumeclaims"][("default", "clone-1")]["metadata"]["labels"]
+    assert labels["source-pvc"] == "source"
+
+
+def test_clone_that_cannot_be_created_is_reported(server, session):
+    _add_source(server)
+    server.state.add("persistentvolumeclaims", pvc("clone-1"))
+
+    report = clone_volumes(new_pvc_names=["clone-0", "clone-1", "clone-2"], source_snapshot_name="source-snapshot",
+                           timeout=10, session=session)
+
+    statuses = _statuses(report)
+    assert [cloneDict["PersistentVolumeClaim (PVC) Name"] for cloneDict in report] == ["clone-0", "clone-1", "clone-2"]
+    assert statuses["clone-0"] == ("Bound", "")
+    assert statuses["clone-2"] == ("Bound", "")
+    assert statuses["clone-1"][0] == "Failed"
+    assert statuses["clone-1"][1].startswith("Kubernetes API Error: ")
+
+
+def test_clones_that_do_not_bind_in_time_are_reported():
+    with FakeKubernetesApiServer(bind_delay=30) as server:
+        _add_source(server)
+        session = DataOpsSession(config_file=server.kubeconfig)
+
+        report = clone_volumes(new_pvc_names=["clone-0", "clone-1"], source_snapshot_name="source-snapshot",
+                               timeout=0.5, session=session)
+
+    assert _statuses(report) == {
+        "clone-0": ("Failed", "Timed out waiting for Kubernetes to bind volume to PVC."),
+        "clone-1": ("Failed", "Timed out waiting for Kubernetes to bind volume to PVC.")
+    }
+
+
+def test_source_is_required(session):
+    with pytest.raises(ValueError):
+        clone_volumes(new_pvc_names=["clone-0"], session=session)
+
+
+def test_no_names_makes_no_api_calls(server, session):
+    assert clone_volumes(new_pvc_names=[], source_pvc_name="source", session=session) == []
+    assert not server.state.calls
@@ -0,0 +1,103 @@
+"""Arguments of the Kubeflow Pipelines component entrypoint, as passed by the component specifications, and the
+outputs that it writes, against the fake API server."""
+import json
+
+import pytest
+
+from k8s_objects import pvc, volume_snapshot
+import netapp_dataops.k8s
+from netapp_dataops.k8s import kfp
+
+
+@pytest.fixture
+def default_session(session, monkeypatch):
+    # Components use the process-wide default session, as they do in their containers
+    monkeypatch.setattr(netapp_dataops.k8s, "_default_session", session)
+    return session
+
+
+def _get_argv(name: str, inputs: dict, outputDir) -> list:
+    # Substitute the placeholders of the component's container arguments as Kubeflow Pipelines does, passing the
+    # default value of each input that is not specified
+    spec = kfp.get_component_spec(name)
+    defaults = {inputDict["name"]: inputDict.get("default") for inputDict in spec["inputs"]}
+    argv = [name]
+    for arg in spec["implementation"]["container"]["args"]:
+        if isinstance(arg, str):
+            argv.append(arg)
+        elif "inputValue" in arg:
+            argv.append(inputs.get(arg["inputValue"], defaults[arg["inputValue"]]))
+        else:
+            argv.append(str(outputDir / arg["outputPath"]))
+    return argv
+
+
+@pytest.mark.parametrize("value, valueType, expected", [
+    ("True", "Boolean", True),
+    ("false", "Boolean", False),
+    ("8", "Integer", 8),
+    ('["a", "b"]', "JsonArray", ["a", "b"]),
+    ("", "JsonArray", []),
+    ("", "String", None),
+    ("name", "String", "name"),
+])
+def test_input_values_are_parsed_by_type(value, valueType, expected):
+    assert kfp._parse_value(value, valueType) == expected
+
+
+def test_every_component_passes_each_input_and_output_once():
+    for name in kfp.COMPONENT_NAMES:
+        spec = kfp.get_component_spec(name)
+        placeholders = [arg for arg in spec["implementation"]["container"]["args"] if not isinstance(arg, str)]
+
+        assert spec["implementation"]["container"]["command"][-1] == name
+        assert [placeholder.get("inputValue") for placeholder in placeholders if "inputValue" in placeholder] == \
+            [inputDict["name"] for inputDict in spec["inputs"]]
+        assert [placeholder["outputPath"] for placeholder in placeholders if "outputPath" in placeholder] == \
+            [outputDict["name"] for outputDict in spec["outputs"]]
+
+
+def test_create_volume_snapshot_writes_generated_name(server, default_session, tmp_path):
+    server.state.add("persistentvolumeclaims", pvc("data"), namespace="team1")
+
+    assert kfp.main(_get_argv("create-volume-snapshot", {"pvc_name": "data", "namespace": "team1"}, tmp_path)) == 0
+
+    snapshotName = (tmp_path / "snapshot").read_text()
+    assert snapshotName.startswith("ntap-dsutil.")
+    assert ("team1", snapshotName) in server.state.objects["volumesnapshots"]
+
+
+def test_clone_volumes_parses_json_and_integer_inputs(server, default_session, tmp_path):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    server.state.add("volumesnapshots", volume_snapshot("baseline", "data"))
+
+    argv = _get_argv("clone-volumes", {"new_pvc_names": '["exp1", "exp2"]', "source_snapshot_name": "baseline",
+                                       "max_parallel": "2"}, tmp_path)
+
+    assert kfp.main(argv) == 0
+    assert json.loads((tmp_path / "pvcs").read_text()) == ["exp1", "exp2"]
+    assert {("default", "exp1"), ("default", "exp2")} <= set(server.state.objects["persistentvolumeclaims"])
+
+
+def test_namespace_defaults_to_the_namespace_of_the_step(server, default_session, tmp_path, monkeypatch):
+    namespaceFile = tmp_path / "namespace"
+    namespaceFile.write_text("pipelines\n")
+    monkeypatch.setattr(kfp, "_SERVICE_ACCOUNT_NAMESPACE_FILE", str(namespaceFile))
+    server.state.add("volumesnapshots", volume_snapshot("old", "data"), namespace="pipelines")
+
+    assert kfp.main(_get_argv("delete-volume-snapshot", {"snapshot_name": "old"}, tmp_path)) == 0
+    assert ("pipelines", "old") not in server.state.objects["volumesnapshots"]
+
+
+def test_invalid_arguments_and_failures_exit_nonzero(server, default_session, tmp_path, capsys):
+    assert kfp.main(["format-volume"]) == 1
+    assert kfp.main(_get_argv("clone-volumes", {"new_pvc_names": "[]", "max_parallel": "many"}, tmp_path)) == 1
+    with pytest.raises(SystemExit):
+        kfp.main(["delete-volume", "--namespace", "default"])
+    capsys.readouterr()
+
+    # Kubernetes API errors are reported with the message of the API response, and no outputs are written
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    assert kfp.main(_get_argv("clone-volume", {"new_pvc_name": "data", "source_pvc_name": "data"}, tmp_path)) == 1
+    assert "Error: persistentvolumeclaims \"data\" already exists" in capsys.readouterr().out
+    assert not (tmp_path / "pvc").exists()
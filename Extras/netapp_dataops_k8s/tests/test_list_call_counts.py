@@ -0,0 +1,79 @@
+"""Kubernetes API call counts of the volume listing functions, measured against the fake API server.
+
+Listing volumes must not make API calls per PVC or per clone (e.g. to check whether the source of a clone still
+exists), since the cost would then grow with the number of objects in the namespace.
+"""
+import pytest
+
+from fake_api_server import FakeKubernetesApiServer
+from k8s_objects import clone_pvc, pvc, volume_snapshot
+from netapp_dataops.k8s import (
+    DataOpsSession,
+    iter_volumes,
+    list_volumes,
+)
+
+
+NAMESPACE = "calls"
+SOURCES = 30
+CLONES_PER_SOURCE = 9
+
+
+@pytest.fixture(scope="module")
+def server():
+    # SOURCES source PVCs, each with a VolumeSnapshot that CLONES_PER_SOURCE clones were created from
+    with FakeKubernetesApiServer() as server:
+        for sourceIndex in range(SOURCES):
+            sourceName = "source-" + str(sourceIndex)
+            snapshotName = "snapshot-" + str(sourceIndex)
+            server.state.add("persistentvolumeclaims", pvc(sourceName), namespace=NAMESPACE)
+            server.state.add("volumesnapshots", volume_snapshot(snapshotName, sourceName), namespace=NAMESPACE)
+            for cloneIndex in range(CLONES_PER_SOURCE):
+                server.state.add("persistentvolumeclaims",
+                                 clone_pvc(sourceName + "-clone-" + str(cloneIndex), sourceName, snapshotName),
+                                 namespace=NAMESPACE)
+        # The source of this clone has been deleted
+        server.state.add("persistentvolumeclaims", clone_pvc("orphan", "deleted-source", "deleted-snapshot"),
+                         namespace=NAMESPACE)
+        yield server
+
+
+@pytest.fixture
+def session(server):
+    server.state.reset_calls()
+    return DataOpsSession(config_file=server.kubeconfig)
+
+
+def _get_volume(volumes: list, name: str) -> dict:
+    return next(volume for volume in volumes if volume["PersistentVolumeClaim (PVC) Name"] == name)
+
+
+def test_list_volumes_makes_one_list_call_per_kind(server, session):
+    volumes = list_volumes(namespace=NAMESPACE, session=session)
+
+    assert len(volumes) == SOURCES * (CLONES_PER_SOURCE + 1) + 1
+    assert dict(server.state.calls) == {"list persistentvolumeclaims": 1, "list volumesnapshots": 1}
+    assert _get_volume(volumes, "source-0-clone-0")["Source PVC"] == "source-0"
+    assert _get_volume(volumes, "source-0-clone-0")["Source VolumeSnapshot"] == "snapshot-0"
+    assert _get_volume(volumes, "orphan")["Source PVC"] == "*deleted*"
+    assert _get_volume(volumes, "orphan")["Source VolumeSnapshot"] == "*deleted*"
+
+
+@pytest.mark.parametrize("page_size", [50, 500])
+def test_iter_volumes_makes_list_calls_per_page_not_per_clone(server, session, page_size):
+    volumes = list(iter_volumes(namespace=NAMESPACE, page_size=page_size, session=session))
+
+    # The PVCs are listed once to iterate over them and once to index clone sources; VolumeSnapshots are listed once
+    pages = -(-len(volumes) // page_size)
+    assert dict(server.state.calls) == {"list persistentvolumeclaims": 2 * pages, "list volumesnapshots": 1}
+    assert volumes == list_volumes(namespace=NAMESPACE, session=session)
+
+
+def test_iter_volumes_without_clones_does_not_index_sources(server, session):
+    server.state.add("persistentvolumeclaims", pvc("plain"), namespace="plain")
+    server.state.reset_calls()
+
+    volumes = list(iter_volumes(namespace="plain", session=session))
+
+    assert [volume["PersistentVolumeClaim (PVC) Name"] for volume in volumes] == ["plain"]
+    assert dict(server.state.calls) == {"list persistentvolumeclaims": 1}
@@ -0,0 +1,99 @@
+"""Output formats of the list functions: rows are printed as tables, JSON, newline-delimited JSON or CSV as they are
+retrieved, and values are printed as they are (e.g. version strings are not parsed as numbers)."""
+import csv
+import io
+import json
+
+import pytest
+
+from k8s_objects import pvc
+from netapp_dataops.k8s import (
+    _print_rows,
+    _print_table,
+    _print_triton_servers_list,
+    list_volumes,
+)
+
+
+ROWS = [
+    {"Name": "model-a", "Version": "1.10", "Replicas": ["a-0", "a-1"]},
+    {"Name": "model-b", "Version": "007", "Replicas": []},
+]
+
+
+def _print_all(rows, outputFormat: str) -> list:
+    return list(_print_rows(iter(rows), outputFormat=outputFormat))
+
+
+def test_json_is_a_single_array(capsys):
+    assert _print_all(ROWS, "json") == ROWS
+    assert json.loads(capsys.readouterr().out) == ROWS
+
+    _print_all([], "json")
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_ndjson_is_one_object_per_line(capsys):
+    _print_all(ROWS, "ndjson")
+
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == ROWS
+
+
+def test_csv_writes_lists_as_json(capsys):
+    _print_all(ROWS, "csv")
+
+    csvRows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert [csvRow["Version"] for csvRow in csvRows] == ["1.10", "007"]
+    assert [json.loads(csvRow["Replicas"]) for csvRow in csvRows] == [["a-0", "a-1"], []]
+
+    _print_all([], "csv")
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("outputFormat", ["json", "ndjson", "csv"])
+def test_rows_are_printed_as_they_are_retrieved(capsys, outputFormat):
+    rows = _print_rows(iter(ROWS), outputFormat=outputFormat)
+
+    next(rows)
+    assert "model-a" in capsys.readouterr().out
+    next(rows)
+    assert "model-b" in capsys.readouterr().out
+
+
+def test_table_omits_lists_and_keeps_values_as_they_are(capsys):
+    rows = [{key: value for key, value in row.items() if key != "Replicas"} for row in ROWS]
+    _print_all(ROWS, "table")
+    streamedLines = capsys.readouterr().out.splitlines()
+    _print_table(rows)
+    tableLines = capsys.readouterr().out.splitlines()
+
+    for lines in (streamedLines, tableLines):
+        assert lines[0].split() == ["Name", "Version"]
+        assert lines[2].split() == ["model-a", "1.10"]
+        assert lines[3].split() == ["model-b", "007"]
+
+
+def test_unsupported_output_format_is_rejected():
+    with pytest.raises(ValueError):
+        _print_all(ROWS, "yaml")
+
+
+def test_triton_replicas_table_keeps_values_as_they_are(capsys):
+    replicaDetails = [{"Pod": "triton-0", "Model Repository Version": "1.10"},
+                      {"Pod": "triton-1", "Model Repository Version": "007"}]
+    _print_triton_servers_list([{"Server Name": "triton", "Model Repository": "per-replica",
+                                 "Replica Details": replicaDetails}])
+
+    replicaLines = capsys.readouterr().out.split("Replicas:")[1].strip().splitlines()
+    assert replicaLines[2].split() == ["triton", "triton-0", "1.10"]
+    assert replicaLines[3].split() == ["triton", "triton-1", "007"]
+
+
+def test_list_volumes_prints_requested_format(server, session, capsys):
+    for name in ("data", "models"):
+        server.state.add("persistentvolumeclaims", pvc(name))
+
+    volumesList = list_volumes(print_output=True, output_format="ndjson", session=session)
+
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == volumesList
+    assert [volumeDict["PersistentVolumeClaim (PVC) Name"] for volumeDict in volumesList] == ["data", "models"]
@@ -0,0 +1,106 @@
+"""Validation of plans before any step is run, and resuming a plan from its state file after a failed step, against
+the fake API server."""
+import json
+
+import pytest
+
+from k8s_objects import pvc
+from netapp_dataops.k8s import APIConnectionError
+from netapp_dataops.k8s.plan import (
+    _parse_plan,
+    apply_plan,
+    InvalidPlanError,
+    load_plan,
+)
+
+
+def _volume_step(name: str, pvcName: str, dependsOn: list = None) -> dict:
+    return {"name": name, "operation": "create volume", "depends_on": dependsOn or [],
+            "args": {"pvc_name": pvcName, "volume_size": "10Gi"}}
+
+
+@pytest.mark.parametrize("plan", [
+    [],
+    {"steps": {"name": "a"}},
+    {"steps": [{"name": "a"}]},
+    {"steps": [{"name": "a", "operation": "format volume"}]},
+    {"steps": [{"name": "a", "operation": "create_volume", "args": {"pvc_name": "a"}}]},
+    {"steps": [{"name": "a", "operation": "create_volume", "args": {"pvc_name": "a", "volume_size": "1Gi",
+                                                                      "size": "1Gi"}}]},
+    {"steps": [{"name": "a", "operation": "create_volume", "args": {"pvc_name": "a", "volume_size": "1Gi",
+                                                                      "print_output": True}}]},
+    {"steps": [{"name": "a", "operation": "create_jupyter_lab", "args": {"workspace_name": "a",
+                                                                           "workspace_size": "1Gi"}}]},
+    {"steps": [_volume_step("a", "a"), _volume_step("a", "b")]},
+    {"steps": [_volume_step("a", "a", dependsOn=["missing"])]},
+    {"steps": [_volume_step("a", "a", dependsOn=["c"]), _volume_step("b", "b", dependsOn=["a"]),
+               _volume_step("c", "c", dependsOn=["b"]), _volume_step("d", "d")]},
+])
+def test_invalid_plans_are_rejected_before_any_step_is_run(server, session, plan):
+    server.state.reset_calls()
+
+    with pytest.raises(InvalidPlanError):
+        apply_plan(plan, session=session)
+
+    assert not server.state.calls
+
+
+def test_operation_names_and_default_namespace_are_resolved():
+    steps = _parse_plan({"namespace": "team1", "steps": [
+        _volume_step("a", "a"),
+        {"name": "b", "operation": "Create Volume-Snapshot", "depends_on": "a",
+         "args": {"pvc_name": "a", "namespace": "team2"}},
+    ]})
+
+    assert [(step["operation"], step["args"]["namespace"], step["depends_on"]) for step in steps] == \
+        [("create_volume", "team1", []), ("create_volume_snapshot", "team2", ["a"])]
+
+
+def test_load_plan_rejects_invalid_yaml(tmp_path):
+    planFile = tmp_path / "plan.yaml"
+    planFile.write_text("steps: [\n")
+
+    with pytest.raises(InvalidPlanError):
+        load_plan(str(planFile))
+
+
+def test_failed_plan_resumes_from_state_file(server, session, tmp_path):
+    stateFile = str(tmp_path / "plan.yaml.state")
+    plan = {"steps": [_volume_step("first", "first"), _volume_step("taken", "taken", dependsOn=["first"]),
+                      _volume_step("last", "last", dependsOn=["taken"])]}
+    server.state.add("persistentvolumeclaims", pvc("taken"))
+
+    # The second step fails because its PVC already exists, so the third step is not started
+    with pytest.raises(APIConnectionError):
+        apply_plan(plan, state_file=stateFile, session=session)
+    with open(stateFile) as file:
+        assert list(json.load(file)["completed"]) == ["first"]
+
+    # Completed steps are skipped when the plan is applied again
+    server.state.remove("persistentvolumeclaims", "default", "taken")
+    server.state.reset_calls()
+    stepsList = apply_plan(plan, state_file=stateFile, session=session)
+
+    assert [(stepDict["Step"], stepDict["Status"]) for stepDict in stepsList] == \
+        [("first", "Skipped"), ("taken", "Completed"), ("last", "Completed")]
+    assert server.state.calls["create persistentvolumeclaims"] == 2
+
+    # Steps whose arguments have changed since they completed are run again
+    plan["steps"][0]["args"]["pvc_name"] = "renamed"
+    stepsList = apply_plan(plan, state_file=stateFile, session=session)
+
+    assert [stepDict["Status"] for stepDict in stepsList] == ["Completed", "Skipped", "Skipped"]
+    assert ("default", "renamed") in server.state.objects["persistentvolumeclaims"]
+
+
+def test_failed_step_is_reported_with_the_api_message(server, session, capsys):
+    server.state.add("persistentvolumeclaims", pvc("taken"))
+
+    with pytest.raises(APIConnectionError):
+        apply_plan({"steps": [_volume_step("taken", "taken"), _volume_step("after", "after", dependsOn=["taken"])]},
+                   print_output=True, session=session)
+
+    output = capsys.readouterr().out
+    assert "Error: Step 'taken' failed: " in output
+    assert "already exists" in output
+    assert "Not Started" in output
@@ -0,0 +1,108 @@
+"""RetentionPolicy.select() buckets, and protection of clone sources and unready VolumeSnapshots by the retention
+plan, against the fake API server."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from k8s_objects import clone_pvc, pvc, volume_snapshot
+from netapp_dataops.k8s.retention import (
+    plan_snapshot_retention,
+    prune_volume_snapshots,
+    RetentionPolicy,
+)
+
+
+NOW = datetime(2024, 3, 13, 12, 30, tzinfo=timezone.utc)  # A Wednesday
+
+
+def _timestamps(hours: list) -> dict:
+    # VolumeSnapshot names mapped to creation times the given numbers of hours before NOW
+    return {"snapshot-" + str(hour): NOW - timedelta(hours=hour) for hour in hours}
+
+
+def test_rules_must_keep_something():
+    with pytest.raises(ValueError):
+        RetentionPolicy()
+    with pytest.raises(ValueError):
+        RetentionPolicy(keep_last=1, keep_daily=-1)
+
+
+def test_keep_last_keeps_newest_with_ties_broken_by_name():
+    creationTimes = _timestamps([0, 1, 2, 3])
+    creationTimes["snapshot-tie"] = creationTimes["snapshot-1"]
+
+    selected = RetentionPolicy(keep_last=2).select(creation_times=creationTimes)
+
+    assert selected == {"snapshot-0": ["last 2"], "snapshot-tie": ["last 2"]}
+
+
+def test_hourly_daily_and_weekly_keep_newest_per_bucket():
+    # Every 6 hours for 3 weeks
+    creationTimes = _timestamps(list(range(0, 21 * 24, 6)))
+
+    selected = RetentionPolicy(keep_hourly=2, keep_daily=3, keep_weekly=3).select(creation_times=creationTimes)
+
+    # 12:30 and 06:30 today are in different hours; the newest of today, yesterday and the day before are kept
+    assert [name for name, rules in selected.items() if "hourly" in rules] == ["snapshot-0", "snapshot-6"]
+    assert [name for name, rules in selected.items() if "daily" in rules] == ["snapshot-0", "snapshot-18",
+                                                                             "snapshot-42"]
+    # ISO weeks start on Monday: the newest of this week, and of the Sundays that end the two weeks before it
+    assert [name for name, rules in selected.items() if "weekly" in rules] == ["snapshot-0", "snapshot-66",
+                                                                              "snapshot-234"]
+    assert selected["snapshot-0"] == ["hourly", "daily", "weekly"]
+
+
+def test_buckets_are_evaluated_in_utc():
+    localTimezone = timezone(timedelta(hours=-5))
+    creationTimes = {"late": datetime(2024, 3, 12, 22, 0, tzinfo=localTimezone),  # 03:00 UTC on March 13
+                     "early": datetime(2024, 3, 12, 20, 0, tzinfo=localTimezone)}  # 01:00 UTC on March 13
+
+    assert RetentionPolicy(keep_daily=2).select(creation_times=creationTimes) == {"late": ["daily"]}
+
+
+def test_plan_protects_clone_sources_and_unready_snapshots(server, session):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    for index in range(4):
+        server.state.add("volumesnapshots", volume_snapshot("snapshot-" + str(index), "data",
+                                                            creation_time="2024-01-0" + str(index + 1) + "T00:00:00Z"))
+    server.state.add("persistentvolumeclaims", clone_pvc("clone", "data", "snapshot-0"))
+    server.state.add("statefulsets", {
+        "metadata": {"name": "replicas"},
+        "spec": {"replicas": 2, "serviceName": "replicas", "selector": {"matchLabels": {"app": "replicas"}},
+                 "template": {"metadata": {"labels": {"app": "replicas"}},
+                              "spec": {"containers": [{"name": "main", "image": "busybox"}]}},
+                 "volumeClaimTemplates": [{"metadata": {"name": "data"},
+                                           "spec": pvc("data", source_snapshot="snapshot-1")["spec"]}]}
+    })
+    unready = volume_snapshot("snapshot-unready", "data")
+    unready["status"] = {"readyToUse": False}
+    server.state.add("volumesnapshots", unready)
+
+    plan = plan_snapshot_retention(policy=RetentionPolicy(keep_last=1), session=session)
+
+    actions = {planDict["VolumeSnapshot Name"]: (planDict["Action"], planDict["Reason"]) for planDict in plan}
+    assert actions == {
+        "snapshot-3": ("keep", "last 1"),
+        "snapshot-2": ("delete", ""),
+        "snapshot-1": ("keep", "clone source (StatefulSet replicas)"),
+        "snapshot-0": ("keep", "clone source (PVC clone)"),
+        "snapshot-unready": ("keep", "not ready"),
+    }
+
+
+def test_prune_deletes_only_what_the_plan_deletes(server, session):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    for index in range(3):
+        server.state.add("volumesnapshots", volume_snapshot("snapshot-" + str(index), "data",
+                                                            creation_time="2024-01-0" + str(index + 1) + "T00:00:00Z"))
+    server.state.add("volumesnapshots", volume_snapshot("other", "other-data"))
+
+    dryRun = prune_volume_snapshots(policy=RetentionPolicy(keep_last=1), pvc_name="data", dry_run=True,
+                                    session=session)
+    assert len(server.state.objects["volumesnapshots"]) == 4
+
+    plan = prune_volume_snapshots(policy=RetentionPolicy(keep_last=1), pvc_name="data", wait=True, timeout=10,
+                                  session=session)
+
+    assert plan == dryRun
+    assert sorted(name for _, name in server.state.objects["volumesnapshots"]) == ["other", "snapshot-2"]
@@ -0,0 +1,82 @@
+"""_run_steps(), the dependency graph runner behind the concurrent steps of create_jupyter_lab(), create_triton_server()
+and plan execution."""
+import threading
+
+import pytest
+
+from netapp_dataops.k8s import (
+    _run_steps,
+    tracing,
+)
+
+
+def test_steps_receive_the_results_of_their_dependencies():
+    order = list()
+
+    def _step(name: str, value):
+        def _func(results: dict):
+            order.append(name)
+            return value(results)
+        return _func
+
+    results = _run_steps({
+        "volume": (_step("volume", lambda results: "pvc"), []),
+        "service": (_step("service", lambda results: 30000), []),
+        "deployment": (_step("deployment", lambda results: results["volume"] + ":" + str(results["service"])),
+                       ["volume", "service"]),
+        "url": (_step("url", lambda results: "http://host:" + str(results["service"])), ["service", "not-a-step"]),
+    })
+
+    assert results == {"volume": "pvc", "service": 30000, "deployment": "pvc:30000", "url": "http://host:30000"}
+    assert order.index("deployment") > max(order.index("volume"), order.index("service"))
+    assert order.index("url") > order.index("service")
+
+
+def test_independent_steps_run_concurrently():
+    # Both steps must be running at the same time for the barrier to be passed
+    barrier = threading.Barrier(2, timeout=5)
+
+    results = _run_steps({"a": (lambda results: barrier.wait() is not None, []),
+                          "b": (lambda results: barrier.wait() is not None, [])}, maxWorkers=2)
+
+    assert results == {"a": True, "b": True}
+
+
+def test_dependency_cycle_is_rejected():
+    with pytest.raises(ValueError, match="a, b"):
+        _run_steps({"a": (lambda results: 1, ["b"]), "b": (lambda results: 2, ["a"]),
+                    "c": (lambda results: 3, [])})
+
+
+def test_failure_is_raised_and_dependent_steps_are_not_started():
+    started = list()
+
+    def _fail(results: dict):
+        started.append("fail")
+        raise RuntimeError("step failed")
+
+    def _dependent(results: dict):
+        started.append("dependent")
+
+    with pytest.raises(RuntimeError, match="step failed"):
+        _run_steps({"fail": (_fail, []), "dependent": (_dependent, ["fail"])})
+    assert started == ["fail"]
+
+
+def test_steps_run_within_the_callers_span():
+    def _step(results: dict):
+        with tracing.span("step"):
+            pass
+
+    recorder = tracing.add_exporter(tracing.TraceRecorder())
+    try:
+        with tracing.span("operation"):
+            _run_steps({"a": (_step, []), "b": (_step, ["a"])})
+    finally:
+        tracing.remove_exporter(recorder)
+
+    spans = recorder.spans
+    operationSpan = next(span for span in spans if span["name"] == "operation")
+    stepSpans = [span for span in spans if span["name"] == "step"]
+    assert len(stepSpans) == 2
+    assert all(span["parent_id"] == operationSpan["span_id"] for span in stepSpans)
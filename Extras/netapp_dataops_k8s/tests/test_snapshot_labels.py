@@ -0,0 +1,110 @@
+"""Selection of VolumeSnapshots by label, including VolumeSnapshots that were created before snapshots were labeled,
+and backfilling of their labels, against the fake API server."""
+import pytest
+
+from k8s_objects import add_workspace, pvc, volume_snapshot
+from netapp_dataops.k8s import (
+    _get_jupyter_lab_prefix,
+    _get_volume_snapshot_label_selectors,
+    _get_volume_snapshot_labels,
+    backfill_volume_snapshot_labels,
+    create_jupyter_lab_snapshot,
+    create_volume_snapshot,
+    list_jupyter_lab_snapshots,
+    list_volume_snapshots,
+)
+
+
+def _add_snapshots(server):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    server.state.add("persistentvolumeclaims", pvc("other"))
+    server.state.add("volumesnapshots", volume_snapshot("labeled", "data",
+                                                        labels=_get_volume_snapshot_labels("data", "create-volume-snapshot")))
+    server.state.add("volumesnapshots", volume_snapshot("unlabeled", "data"))
+    server.state.add("volumesnapshots", volume_snapshot("other-labeled", "other",
+                                                        labels=_get_volume_snapshot_labels("other", "create-volume-snapshot")))
+    server.state.add("volumesnapshots", volume_snapshot("other-unlabeled", "other"))
+
+
+def _names(snapshotsList: list) -> list:
+    return sorted(snapshotDict["VolumeSnapshot Name"] for snapshotDict in snapshotsList)
+
+
+@pytest.mark.parametrize("selectorArgs", [
+    {"pvcName": "data"},
+    {"pvcName": "data", "jupyterLabWorkspacesOnly": True},
+    {"jupyterLabWorkspacesOnly": True},
+])
+def test_selectors_are_disjoint(server, selectorArgs):
+    # A VolumeSnapshot that matched more than one selector would be listed more than once
+    labelSets = [dict(), {"source-pvc": "data"}, {"source-pvc": "other"}, {"jupyterlab-workspace-name": "ws"},
+                 {"source-pvc": "data", "jupyterlab-workspace-name": "ws"}]
+    for index, labels in enumerate(labelSets):
+        server.state.add("volumesnapshots", volume_snapshot("snapshot-" + str(index), "data", labels=labels))
+
+    selectedNames = list()
+    for labelSelector in _get_volume_snapshot_label_selectors(**selectorArgs):
+        items, _ = server.state.list(plural="volumesnapshots", namespace="default", labelSelector=labelSelector)
+        selectedNames.extend(item["metadata"]["name"] for item in items)
+
+    assert len(selectedNames) == len(set(selectedNames))
+
+
+def test_long_pvc_names_are_selected_client_side():
+    longName = "p" * 64
+
+    assert "source-pvc" not in _get_volume_snapshot_labels(longName, "create-volume-snapshot")
+    assert _get_volume_snapshot_label_selectors(pvcName=longName) == [None]
+
+
+def test_list_includes_unlabeled_snapshots_once(server, session):
+    _add_snapshots(server)
+
+    assert _names(list_volume_snapshots(pvc_name="data", session=session)) == ["labeled", "unlabeled"]
+    assert _names(list_volume_snapshots(session=session)) == ["labeled", "other-labeled", "other-unlabeled",
+                                                              "unlabeled"]
+
+
+def test_backfill_labels_unlabeled_snapshots(server, session):
+    _add_snapshots(server)
+    add_workspace(server, "ws")
+    server.state.add("volumesnapshots", volume_snapshot("workspace-unlabeled", _get_jupyter_lab_prefix() + "ws"))
+    preProvisioned = volume_snapshot("pre-provisioned", "data")
+    preProvisioned["spec"]["source"] = {"volumeSnapshotContentName": "content"}
+    server.state.add("volumesnapshots", preProvisioned)
+
+    labeledNames = backfill_volume_snapshot_labels(session=session)
+
+    assert sorted(labeledNames) == ["other-unlabeled", "unlabeled", "workspace-unlabeled"]
+    labels = server.state.objects["volumesnapshots"][("default", "workspace-unlabeled")]["metadata"]["labels"]
+    assert labels == {"source-pvc": _get_jupyter_lab_prefix() + "ws", "jupyterlab-workspace-name": "ws"}
+
+    # Backfilled VolumeSnapshots are selected by label, and are not labeled again
+    items, _ = server.state.list(plural="volumesnapshots", namespace="default", labelSelector="source-pvc=data")
+    assert sorted(item["metadata"]["name"] for item in items) == ["labeled", "unlabeled"]
+    assert _names(list_volume_snapshots(pvc_name="data", session=session)) == ["labeled", "unlabeled"]
+    assert _names(list_jupyter_lab_snapshots(session=session)) == ["workspace-unlabeled"]
+    assert backfill_volume_snapshot_labels(session=session) == []
+
+
+def test_dataset_version_is_labeled_and_selected(server, session):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    server.state.add("persistentvolumeclaims", pvc("other"))
+    create_volume_snapshot(pvc_name="data", snapshot_name="v1", dataset_version="2024.01-a", session=session)
+    create_volume_snapshot(pvc_name="other", snapshot_name="v2", dataset_version="2024.02", session=session)
+
+    assert _names(list_volume_snapshots(dataset_version="2024.01-a", session=session)) == ["v1"]
+
+
+@pytest.mark.parametrize("datasetVersion", ["-leading", "trailing.", "has space", "v" * 64, "a/b"])
+def test_invalid_dataset_versions_are_rejected_before_any_request(server, session, datasetVersion):
+    server.state.add("persistentvolumeclaims", pvc("data"))
+    add_workspace(server, "ws")
+    server.state.reset_calls()
+
+    with pytest.raises(ValueError):
+        create_volume_snapshot(pvc_name="data", dataset_version=datasetVersion, session=session)
+    with pytest.raises(ValueError):
+        create_jupyter_lab_snapshot(workspace_name="ws", dataset_version=datasetVersion, session=session)
+
+    assert not server.state.calls
@@ -0,0 +1,95 @@
+"""Spans that are recorded for traced generators, e.g. the iter_* functions.
+
+A generator's span covers its whole iteration, but it must only be the current span while the generator runs, so
+that spans and API requests of the caller between items are not attributed to the generator.
+"""
+import pytest
+
+from k8s_objects import pvc
+from netapp_dataops.k8s import (
+    iter_volumes,
+    tracing,
+)
+
+
+@pytest.fixture
+def recorder():
+    recorder = tracing.add_exporter(tracing.TraceRecorder())
+    yield recorder
+    tracing.remove_exporter(recorder)
+
+
+def _spans_by_name(recorder) -> dict:
+    return {span["name"]: span for span in recorder.spans}
+
+
+def test_generator_span_is_not_current_between_items(recorder):
+    @tracing.traced
+    def numbers():
+        with tracing.span("inside"):
+            yield 1
+        yield 2
+
+    with tracing.span("caller"):
+        for _ in numbers():
+            with tracing.span("loop-body"):
+                pass
+
+    spans = _spans_by_name(recorder)
+    assert spans["numbers"]["parent_id"] == spans["caller"]["span_id"]
+    assert spans["inside"]["parent_id"] == spans["numbers"]["span_id"]
+    assert spans["loop-body"]["parent_id"] == spans["caller"]["span_id"]
+    assert spans["numbers"]["status"] == "ok"
+
+
+def test_generator_span_ends_when_iteration_stops_early(recorder):
+    @tracing.traced
+    def numbers():
+        yield 1
+        yield 2
+
+    generator = numbers()
+    assert next(generator) == 1
+    generator.close()
+
+    assert tracing._current_span.get() is None
+    assert _spans_by_name(recorder)["numbers"]["status"] == "ok"
+
+
+def test_generator_span_records_errors_and_return_values(recorder):
+    @tracing.traced
+    def failing():
+        yield 1
+        raise ValueError("failed")
+
+    @tracing.traced
+    def returning():
+        received = yield 1
+        return received
+
+    with pytest.raises(ValueError):
+        list(failing())
+    generator = returning()
+    next(generator)
+    with pytest.raises(StopIteration) as stop:
+        generator.send("done")
+
+    assert stop.value.value == "done"
+    spans = _spans_by_name(recorder)
+    assert spans["failing"]["status"] == "error"
+    assert spans["returning"]["status"] == "ok"
+
+
+def test_requests_between_items_are_not_attributed_to_iter_volumes(recorder, server, session):
+    for index in range(3):
+        server.state.add("persistentvolumeclaims", pvc("volume-" + str(index)), namespace="traced")
+
+    for _ in iter_volumes(namespace="traced", page_size=1, session=session):
+        session.core_v1_api().list_namespaced_config_map(namespace="traced")
+
+    iterSpan = _spans_by_name(recorder)["iter_volumes"]
+    iterRequests = [request for request in recorder.requests if request["parent_id"] == iterSpan["span_id"]]
+    callerRequests = [request for request in recorder.requests if request["parent_id"] is None]
+    assert {request["resource"] for request in iterRequests} == {"persistentvolumeclaims"}
+    assert {request["resource"] for request in callerRequests} == {"configmaps"}
+    assert len(callerRequests) == 3